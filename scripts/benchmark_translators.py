@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""번역 엔진 벤치마크 스크립트
+
+같은 SRT 파일을 Argos Translate와 CTranslate2 NLLB/MarianMT 모델로 번역해
+엔진별 소요 시간과 초당 큐 수를 비교합니다.
+
+사용법:
+    python scripts/benchmark_translators.py <srt_path> --ct2-model <model_dir>
+
+예시:
+    python scripts/benchmark_translators.py input_subs/dQw4w9WgXcQ.srt \\
+        --ct2-model ~/models/nllb-200-distilled-600M-ct2 --target-lang ko
+    python scripts/benchmark_translators.py input_subs/dQw4w9WgXcQ.srt \\
+        --ct2-model ~/models/opus-mt-en-ko-ct2 --model-family marian --beam-size 1
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.application.ports.subtitle_translator import SubtitleTranslatorPort
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import parse_srt
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.argos_translator import (
+    DEFAULT_BATCH_SIZE,
+    ArgosTranslatorAdapter,
+)
+from src.infrastructure.translators.ctranslate2_translator import (
+    DEFAULT_BEAM_SIZE,
+    DEFAULT_MAX_BATCH_TOKENS,
+    MODEL_FAMILIES,
+    CTranslate2TranslatorAdapter,
+)
+
+# 벤치마크용 자리 표시 영상 ID (파일 이름에서 얻지 못한 경우)
+_PLACEHOLDER_VIDEO_ID = "benchmark00"
+
+
+def load_subtitle(srt_path: Path, source_lang: str) -> Subtitle:
+    """SRT 파일을 Subtitle로 읽기 (파일 이름이 영상 ID면 그대로 사용)
+
+    Raises:
+        FileNotFoundError: 파일이 없을 경우
+    """
+    if not srt_path.exists():
+        raise FileNotFoundError(f"자막 파일을 찾을 수 없습니다: {srt_path}")
+
+    try:
+        video_id = VideoId(srt_path.stem)
+    except ValueError:
+        video_id = VideoId(_PLACEHOLDER_VIDEO_ID)
+    return Subtitle(
+        video_id=video_id,
+        language=source_lang,
+        format="srt",
+        text=srt_path.read_text(encoding="utf-8"),
+        source="manual",
+    )
+
+
+def run_engine(
+    engine: SubtitleTranslatorPort,
+    subtitle: Subtitle,
+    target_lang: str,
+    repeat: int,
+) -> Tuple[float, Subtitle]:
+    """엔진으로 repeat회 번역하고 가장 짧은 소요 시간 반환
+
+    첫 실행에 모델 로딩이 포함되지 않도록 한 번 먼저 번역(예열)한다.
+    """
+    translated = engine.translate(subtitle, target_lang)
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        translated = engine.translate(subtitle, target_lang)
+        best = min(best, time.perf_counter() - started)
+    return best, translated
+
+
+def main() -> int:
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(
+        description="Argos Translate와 CTranslate2 모델의 자막 번역 속도 비교",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  %(prog)s input_subs/dQw4w9WgXcQ.srt --ct2-model ~/models/nllb-200-distilled-600M-ct2
+  %(prog)s input_subs/dQw4w9WgXcQ.srt --ct2-model ~/models/opus-mt-en-ko-ct2 --model-family marian
+  %(prog)s input_subs/dQw4w9WgXcQ.srt --ct2-model ~/models/nllb-ct2 --compute-type int8 --repeat 5
+        """
+    )
+    parser.add_argument("srt_path", type=Path, help="벤치마크할 SRT 파일")
+    parser.add_argument(
+        "--ct2-model",
+        type=Path,
+        required=True,
+        help="CTranslate2로 변환한 NLLB/MarianMT 모델 디렉터리"
+    )
+    parser.add_argument(
+        "--model-family",
+        choices=MODEL_FAMILIES,
+        default="nllb",
+        help="CTranslate2 모델 종류 (기본값: %(default)s)"
+    )
+    parser.add_argument("--source-lang", default="en", help="원본 언어 코드 (기본값: en)")
+    parser.add_argument("--target-lang", default="ko", help="목표 언어 코드 (기본값: ko)")
+    parser.add_argument(
+        "--beam-size",
+        type=int,
+        default=DEFAULT_BEAM_SIZE,
+        help="CTranslate2 빔 크기 (기본값: %(default)s)"
+    )
+    parser.add_argument(
+        "--max-batch-tokens",
+        type=int,
+        default=DEFAULT_MAX_BATCH_TOKENS,
+        help="CTranslate2 배치당 최대 토큰 수 (기본값: %(default)s)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="한 번에 번역할 줄 수 (두 엔진 공통, 기본값: %(default)s)"
+    )
+    parser.add_argument(
+        "--compute-type",
+        default="default",
+        help="CTranslate2 연산 타입 (예: int8, 기본값: %(default)s)"
+    )
+    parser.add_argument(
+        "--device",
+        default="cpu",
+        help="CTranslate2 장치 (cpu 또는 cuda, 기본값: %(default)s)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="엔진별 측정 반복 횟수 (최솟값 사용, 기본값: %(default)s)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help="엔진별 번역 결과 SRT를 저장할 디렉터리 (품질 비교용)"
+    )
+    args = parser.parse_args()
+
+    try:
+        subtitle = load_subtitle(args.srt_path, args.source_lang)
+        cue_count = len(parse_srt(subtitle.text))
+        engines: List[Tuple[str, SubtitleTranslatorPort]] = [
+            ("argos", ArgosTranslatorAdapter(batch_size=args.batch_size)),
+            (
+                f"ctranslate2-{args.model_family}",
+                CTranslate2TranslatorAdapter(
+                    model_dir=args.ct2_model.expanduser(),
+                    model_family=args.model_family,
+                    language_pair=(args.source_lang, args.target_lang),
+                    batch_size=args.batch_size,
+                    max_batch_tokens=args.max_batch_tokens,
+                    beam_size=args.beam_size,
+                    device=args.device,
+                    compute_type=args.compute_type,
+                ),
+            ),
+        ]
+
+        print(f"[벤치마크] {args.srt_path.name}: {cue_count}개 큐, "
+              f"{args.source_lang} -> {args.target_lang}, {args.repeat}회 반복")
+        baseline: Optional[float] = None
+        for name, engine in engines:
+            seconds, translated = run_engine(engine, subtitle, args.target_lang, args.repeat)
+            speedup = f", Argos 대비 {baseline / seconds:.2f}배" if baseline else ""
+            baseline = baseline or seconds
+            print(f"[{name}] {seconds:.2f}초, {cue_count / seconds:.1f} 큐/초{speedup}")
+
+            if args.output_dir:
+                args.output_dir.mkdir(parents=True, exist_ok=True)
+                output_path = args.output_dir / f"{args.srt_path.stem}.{name}.{args.target_lang}.srt"
+                output_path.write_text(translated.text, encoding="utf-8")
+                print(f"  -> {output_path}")
+        return 0
+
+    except (FileNotFoundError, ValueError, ImportError, RuntimeError) as e:
+        print(f"\n❌ 벤치마크 실패: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,14 +19,63 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 # ArgosTranslatorAdapter import
 from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+from src.infrastructure.translators.daemon_client import DaemonTranslatorClient
+from src.infrastructure.translators.srt_cues import (
+    SrtStreamWriter,
+    load_subtitle_text,
+    parse_srt_cues,
+)
+from src.infrastructure.translators.translation_journal import (
+    ResumableTranslatorAdapter,
+    journal_path_for,
+)
+from src.infrastructure.translators.translation_memory import (
+    CachingTranslatorAdapter,
+    SqliteTranslationMemory,
+)
+from src.application.ports.progress_sink import ProgressEvent, ProgressSink
 from src.domain.entities.subtitle import Subtitle
 from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.progress.progress_bus import ProgressBus
 
 # 경로 상수
 DOWNLOADS_DIR = PROJECT_ROOT / "downloads"
 INPUT_SUBS_DIR = PROJECT_ROOT / "input_subs"
 TRANSLATED_SUBS_DIR = PROJECT_ROOT / "translated_subs"
 FINAL_VIDEOS_DIR = PROJECT_ROOT / "final_videos"
+TRANSLATION_MEMORY_PATH = PROJECT_ROOT / "cache" / "translation_memory.sqlite3"
+# 번역 진행 상황을 로그 창에 반영하는 최대 빈도 (초당 횟수)
+PROGRESS_MAX_HZ = 4.0
+# 진행 막대는 큐 단위 "translate" 단계만 따라가며 0 ~ 90% 구간에 표시
+# (엔진 단계의 자체 백분율은 메시지로만 로그에 남김 - 두 척도가 섞여 막대가 튀지 않도록)
+PROGRESS_BAR_STAGE = "translate"
+PROGRESS_BAR_MAX = 90.0
+
+
+class SignalProgressSink(ProgressSink):
+    """병합된 진행 이벤트를 워커의 progress_signal로 넘기는 수신자
+
+    막대 값은 PROGRESS_BAR_STAGE 단계만 갱신하고, 다른 단계 이벤트는 마지막 값을 유지한다.
+    """
+
+    def __init__(self, worker):
+        self._worker = worker
+        self._percent = 0.0
+
+    def handle(self, event: ProgressEvent) -> None:
+        details = []
+        if event.done is not None and event.total is not None:
+            details.append(f"{event.done}/{event.total}")
+        if event.rate is not None:
+            details.append(f"{event.rate:.1f}개/초")
+        if event.eta_seconds is not None:
+            details.append(f"남은 시간 {event.eta_seconds:.0f}초")
+        message = event.message
+        if details:
+            message = f"{message} ({', '.join(details)})"
+        if event.stage == PROGRESS_BAR_STAGE and event.percent is not None:
+            self._percent = event.percent * PROGRESS_BAR_MAX / 100.0
+        self._worker.progress_signal.emit(message, self._percent)
 
 
 class TranslationWorkerThread(QThread):
@@ -34,11 +83,12 @@ class TranslationWorkerThread(QThread):
     progress_signal = pyqtSignal(str, float)  # message, percentage
     finished_signal = pyqtSignal(bool, str)
 
-    def __init__(self, video_id):
+    def __init__(self, video_id, translator=None):
         super().__init__()
         self.video_id = video_id
         self._is_running = True
-        self.translator = None
+        # 이전 번역에서 만든 어댑터를 넘겨받으면 언어 인덱스/로딩된 모델을 재사용
+        self.translator = translator
 
     def run(self):
         try:
@@ -50,8 +100,14 @@ class TranslationWorkerThread(QThread):
                 return
 
             # Lazy initialization: 번역 시작 시점에만 Argos 초기화
-            self.progress_signal.emit("Argos 번역 엔진 초기화 중...", 0.0)
-            self.translator = ArgosTranslatorAdapter()
+            # 번역 데몬이 실행 중이면 상주 모델을 사용해 로딩 시간 생략
+            if self.translator is None:
+                self.translator = DaemonTranslatorClient.connect()
+                if self.translator is not None:
+                    self.progress_signal.emit("번역 데몬에 연결되었습니다.", 0.0)
+            if self.translator is None:
+                self.progress_signal.emit("Argos 번역 엔진 초기화 중...", 0.0)
+                self.translator = ArgosTranslatorAdapter()
 
             self.progress_signal.emit("자막 파일 로딩 중...", 5.0)
 
@@ -63,16 +119,47 @@ class TranslationWorkerThread(QThread):
                 format="srt",
             )
 
+            total_cues = len(parse_srt_cues(load_subtitle_text(subtitle)))
+
             # 번역 실행
+            # 엔진/큐 진행 상황은 버스에서 병합해 PROGRESS_MAX_HZ 이하로만 GUI에 전달
+            # (큐마다 시그널 + QTextEdit.append가 일어나지 않도록)
+            bus = ProgressBus(max_hz=PROGRESS_MAX_HZ)
+            bus.subscribe(SignalProgressSink(self))
+            engine_callback = bus.callback("engine")
+
             def progress_callback(message: str, percent: float):
                 if self._is_running:
-                    self.progress_signal.emit(message, percent)
-
-            translated_subtitle = self.translator.translate(
-                subtitle=subtitle,
-                target_language="ko",
-                progress_callback=progress_callback
+                    engine_callback(message, percent)
+
+            # 번역 메모리 적중 큐는 모델 호출 없이 재사용
+            # 번역된 큐는 배치가 끝날 때마다 <id>.partial.srt에 기록 (완료 시 최종 파일로 교체)
+            # 완료 큐는 저널에도 기록되어, 취소/오류 후 다시 실행하면 이어서 번역
+            memory = SqliteTranslationMemory(TRANSLATION_MEMORY_PATH)
+            resumable = ResumableTranslatorAdapter(
+                CachingTranslatorAdapter(self.translator, memory),
+                journal_path_for(output_srt),
             )
+            writer = SrtStreamWriter(output_srt)
+            try:
+                for done, cue in enumerate(resumable.translate_stream(
+                    subtitle=subtitle,
+                    target_language="ko",
+                    progress_callback=progress_callback
+                ), start=1):
+                    if not self._is_running:
+                        break
+                    writer.write(cue)
+                    bus.publish("translate", done=done, total=total_cues, message="번역 중")
+                # 남은 진행 이벤트를 먼저 내보내 로그 순서 유지
+                bus.close()
+                self.progress_signal.emit(
+                    f"번역 메모리: 적중 {memory.stats.hits}개 / 미적중 {memory.stats.misses}개", 92.0
+                )
+            finally:
+                bus.close()
+                writer.close()
+                memory.close()
 
             if not self._is_running:
                 self.finished_signal.emit(False, "번역이 취소되었습니다.")
@@ -80,8 +167,7 @@ class TranslationWorkerThread(QThread):
 
             # 번역된 자막 저장
             self.progress_signal.emit("번역된 자막 저장 중...", 95.0)
-            output_srt.parent.mkdir(parents=True, exist_ok=True)
-            output_srt.write_text(translated_subtitle.text, encoding="utf-8")
+            writer.commit()
 
             # [Added] 소프트섭 편의를 위해 원본 영상 폴더로 자막 자동 복사 (VLC/플레이어 호환용)
             try:
@@ -183,6 +269,7 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 700, 600)
         self.video_id = None
         self.worker = None
+        self.argos_translator = None  # 영상 간 재사용되는 Argos 어댑터 (또는 번역 데몬 클라이언트)
         self.init_ui()
 
     def init_ui(self):
@@ -393,7 +480,7 @@ class MainWindow(QMainWindow):
         self.btn_start.setEnabled(False)
         self.update_status("Argos 번역 중...")
 
-        self.worker = TranslationWorkerThread(self.video_id)
+        self.worker = TranslationWorkerThread(self.video_id, translator=self.argos_translator)
         self.worker.progress_signal.connect(self.on_translation_progress)
         self.worker.finished_signal.connect(self.on_translation_finished)
         self.worker.start()
@@ -405,6 +492,8 @@ class MainWindow(QMainWindow):
 
     def on_translation_finished(self, success, message):
         """번역 완료 콜백"""
+        if self.worker is not None and self.worker.translator is not None:
+            self.argos_translator = self.worker.translator
         self.worker = None
         self.btn_cancel.setEnabled(False)
         self.btn_start.setEnabled(True)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""번역 모델 변형 관리 스크립트
+
+언어 쌍별로 원본/int8 양자화/경량(distilled) 모델 변형을 등록하고,
+번역 때 측정된 초당 큐 수를 확인합니다. 등록한 변형은
+translate_argos.py --model-variant <이름|fastest>로 선택합니다.
+
+사용법:
+    python scripts/model_variants.py add en ko int8 --compute-type int8
+    python scripts/model_variants.py add en ko distilled --model-path ~/models/en_ko_small
+    python scripts/model_variants.py list en ko
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.infrastructure.translators.model_registry import (
+    DEFAULT_MODEL_REGISTRY_PATH,
+    FASTEST_VARIANT,
+    ModelRegistry,
+    ModelVariant,
+)
+
+
+def main() -> int:
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(
+        description="번역 모델 변형 레지스트리 관리",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  %(prog)s add en ko full
+  %(prog)s add en ko int8 --compute-type int8
+  %(prog)s add en ko distilled --model-path ~/models/en_ko_small
+  %(prog)s list en ko
+        """
+    )
+    parser.add_argument(
+        "--registry",
+        type=Path,
+        default=DEFAULT_MODEL_REGISTRY_PATH,
+        help="레지스트리 파일 (기본값: %(default)s)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add_parser = subparsers.add_parser("add", help="모델 변형 등록 (같은 이름이면 설정 교체)")
+    add_parser.add_argument("source_lang", help="원본 언어 코드")
+    add_parser.add_argument("target_lang", help="목표 언어 코드")
+    add_parser.add_argument("name", help="변형 이름 (예: full, int8, distilled)")
+    add_parser.add_argument(
+        "--model-path",
+        type=Path,
+        help="CTranslate2 모델 디렉터리 (기본값: 설치된 Argos 패키지 모델)"
+    )
+    add_parser.add_argument(
+        "--compute-type",
+        help="CTranslate2 연산 타입 (예: int8, int8_float32)"
+    )
+
+    list_parser = subparsers.add_parser("list", help="언어 쌍의 변형과 측정 속도 출력")
+    list_parser.add_argument("source_lang", help="원본 언어 코드")
+    list_parser.add_argument("target_lang", help="목표 언어 코드")
+
+    args = parser.parse_args()
+    registry = ModelRegistry(args.registry)
+
+    try:
+        if args.command == "add":
+            registry.register(ModelVariant(
+                name=args.name,
+                source_language=args.source_lang,
+                target_language=args.target_lang,
+                model_path=str(args.model_path.expanduser()) if args.model_path else None,
+                compute_type=args.compute_type,
+            ))
+            print(f"[등록 완료] {args.source_lang} -> {args.target_lang}: {args.name}")
+            return 0
+
+        variants = registry.variants(args.source_lang, args.target_lang)
+        if not variants:
+            print(f"[변형 없음] {args.source_lang} -> {args.target_lang}")
+            return 0
+
+        fastest = registry.select(args.source_lang, args.target_lang, FASTEST_VARIANT)
+        for variant in variants:
+            speed = (
+                f"{variant.cues_per_second:.1f} 큐/초 ({variant.runs}회 측정)"
+                if variant.cues_per_second is not None else "미측정"
+            )
+            marker = " *" if variant == fastest else ""
+            print(
+                f"{variant.name}{marker}: {speed}, "
+                f"모델={variant.model_path or '패키지 기본'}, "
+                f"연산 타입={variant.compute_type or '기본'}"
+            )
+        return 0
+    except ValueError as e:
+        print(f"\n❌ 실패: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
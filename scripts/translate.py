@@ -3,18 +3,54 @@
 (수정됨) Gemini API를 사용한 자막 번역 스크립트
 input_subs/의 SRT 파일을 읽어 rules.md 규칙에 따라 번역 후 translated_subs/에 저장합니다.
 사용 가능한 모델을 자동 감지하여 404 오류 방지.
+큐를 토큰 예산 청크로 나눠 동시에 요청하고, 실패한 청크만 다시 요청합니다.
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
-import google.generativeai as genai
+from typing import List, Optional
 
 # 프로젝트 루트
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
 INPUT_SUBS_DIR = PROJECT_ROOT / "input_subs"
 TRANSLATED_SUBS_DIR = PROJECT_ROOT / "translated_subs"
 RULES_PATH = PROJECT_ROOT / "rules.md"
+TRANSLATION_MEMORY_PATH = PROJECT_ROOT / "cache" / "translation_memory.sqlite3"
+
+from src.application.ports.subtitle_translator import SubtitleTranslatorPort
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.glossary import (
+    GlossaryTranslatorAdapter,
+    load_glossary,
+    merge_glossaries,
+)
+from src.infrastructure.translators.llm_translator import (
+    DEFAULT_GEMINI_MODEL,
+    DEFAULT_MAX_CHUNK_TOKENS,
+    DEFAULT_MAX_CONCURRENCY,
+    ChunkedLlmTranslatorAdapter,
+    GeminiRestClient,
+)
+from src.infrastructure.translators.style_rules import (
+    StyleRuleEngine,
+    StyleRuleTranslatorAdapter,
+    format_rewrite_report,
+    load_style_rules,
+)
+from src.infrastructure.translators.translation_memory import (
+    CachingTranslatorAdapter,
+    SqliteTranslationMemory,
+)
+
+def progress_callback(message: str, percent: float) -> None:
+    """진행 상황 출력 콜백"""
+    print(f"[{percent:5.1f}%] {message}")
+
 
 def load_rules():
     """rules.md 파일 내용을 읽어 프롬프트에 사용할 규칙 텍스트를 반환"""
@@ -22,7 +58,7 @@ def load_rules():
         return "번역 원칙: 자연스러운 한국어 구어체(해요체)로 번역. 타임코드 유지."
     return RULES_PATH.read_text(encoding="utf-8")
 
-def pick_model_name():
+def pick_model_name(client: GeminiRestClient):
     """사용 가능한 Gemini 모델 중 generateContent를 지원하는 모델을 자동 선택"""
     # 1. 환경변수 지정이 있으면 최우선 사용
     env_model = os.getenv("GEMINI_MODEL")
@@ -32,11 +68,7 @@ def pick_model_name():
     try:
         # 2. 모델 목록 조회
         print("[모델 탐색] 사용 가능한 모델 검색 중...")
-        available_models = []
-        for m in genai.list_models():
-            if 'generateContent' in m.supported_generation_methods:
-                name = m.name.replace('models/', '')
-                available_models.append(name)
+        available_models = client.list_models()
         
         # 3. 우선순위대로 선택
         # flash (빠름/저렴) -> pro (똑똑함) -> 아무거나
@@ -55,12 +87,19 @@ def pick_model_name():
         print(f"[경고] 모델 목록 조회 실패 ({e}). 기본값 사용.")
         
     # 5. 최후의 수단 (Fallback) - 최신 모델명 사용
-    return "gemini-1.5-flash"
+    return DEFAULT_GEMINI_MODEL
 
 
-def translate_subtitle(video_id: str):
+def translate_subtitle(
+    video_id: str,
+    use_memory: bool = True,
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    apply_style_rules: bool = False,
+    glossary_paths: Optional[List[Path]] = None,
+):
     """
-    SRT 파일을 읽어 Gemini API로 번역
+    SRT 파일을 읽어 Gemini API로 번역 (번역 메모리 적중 큐는 API 호출 생략)
     """
     input_path = INPUT_SUBS_DIR / f"{video_id}.srt"
     output_path = TRANSLATED_SUBS_DIR / f"{video_id}.srt"
@@ -73,80 +112,112 @@ def translate_subtitle(video_id: str):
     if not api_key:
         raise ValueError("GEMINI_API_KEY 환경변수가 설정되지 않았습니다.")
     
-    genai.configure(api_key=api_key)
-    
     # 모델 자동 선택
-    model_name = pick_model_name()
+    model_name = pick_model_name(GeminiRestClient(api_key))
     print(f"[번역 시작] {input_path.name} -> {model_name}")
     
-    model = genai.GenerativeModel(model_name)
-    
-    srt_content = input_path.read_text(encoding="utf-8")
-    rules_content = load_rules()
-    
-    # 프롬프트 구성
-    prompt = f"""
-    당신은 전문 영상 번역가입니다. 아래 제공된 원본 SRT 자막을 한국어로 번역하세요.
-    
-    [번역 규칙]
-    {rules_content}
-    
-    [추가 지침]
-    1. 출력은 오직 번역된 SRT 내용만 포함해야 합니다. (마크다운 코드블록 등 제외)
-    2. 타임코드와 자막 번호는 원본 그대로 유지하세요.
-    3. 문체는 '해요체'를 기본으로 하되, 상황에 따라 자연스럽게 처리하세요.
-    
-    [원본 SRT]
-    {srt_content}
-    """
+    subtitle = Subtitle(
+        video_id=VideoId(video_id),
+        language="en",
+        format="srt",
+        text=input_path.read_text(encoding="utf-8"),
+    )
+    translator: SubtitleTranslatorPort = ChunkedLlmTranslatorAdapter(
+        GeminiRestClient(api_key, model=model_name),
+        rules=load_rules(),
+        max_chunk_tokens=max_chunk_tokens,
+        max_concurrency=max_concurrency,
+    )
+
+    memory = None
+    if use_memory:
+        memory = SqliteTranslationMemory(TRANSLATION_MEMORY_PATH)
+        translator = CachingTranslatorAdapter(translator, memory)
+
+    # 용어집 용어는 자리표시자로 보호해 요청하고 응답에 고정 번역어로 주입
+    glossary_adapter = None
+    if glossary_paths:
+        glossary = merge_glossaries([load_glossary(path) for path in glossary_paths])
+        print(f"[용어집] {len(glossary)}개 용어")
+        glossary_adapter = GlossaryTranslatorAdapter(translator, glossary)
+        translator = glossary_adapter
+
+    # rules.md 금칙어 대체표로 번역 결과 후처리 (캐시에는 원래 번역 저장)
+    style_adapter = None
+    if apply_style_rules:
+        style_adapter = StyleRuleTranslatorAdapter(
+            translator, StyleRuleEngine(load_style_rules(RULES_PATH))
+        )
+        translator = style_adapter
     
     try:
-        response = model.generate_content(prompt)
-        
-        # Safety Filter 체크 (Claude/Codex 공통 지적)
-        if not response.candidates:
-            raise ValueError("Gemini API가 빈 응답을 반환했습니다. (Safety Filter 차단 가능성)")
-        
-        # finish_reason 체크 (안전한 방식 - SDK 버전별 호환)
-        candidate = response.candidates[0]
-        finish_reason = getattr(candidate, 'finish_reason', None)
-        if finish_reason:
-            # Enum일 수도 있고 문자열/정수일 수도 있음
-            reason_str = getattr(finish_reason, 'name', str(finish_reason))
-            if reason_str.upper() == 'SAFETY':
-                raise ValueError(f"Gemini API가 안전 필터로 응답을 차단했습니다.")
-        
-        # 텍스트 추출
-        if not hasattr(response, 'text') or not response.text:
-            raise ValueError("Gemini API 응답에 텍스트가 없습니다.")
-            
-        translated_text = response.text
-        
-        # 마크다운 코드블록 제거 (혹시 포함될 경우)
-        translated_text = translated_text.replace("```srt", "").replace("```", "").strip()
-        
-        # 빈 결과 체크
-        if not translated_text:
-            raise ValueError("번역 결과가 비어 있습니다.")
+        translated_subtitle = translator.translate(subtitle, "ko", progress_callback)
         
         TRANSLATED_SUBS_DIR.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(translated_text, encoding="utf-8")
+        output_path.write_text(translated_subtitle.text, encoding="utf-8")
         print(f"[번역 완료] {output_path}")
+        if memory is not None:
+            print(f"[번역 메모리] 적중 {memory.stats.hits}개 / 미적중 {memory.stats.misses}개")
+        if glossary_adapter is not None:
+            print(
+                f"[용어집] {glossary_adapter.injected_terms}개 용어 주입"
+                f" (응답에서 빠져 큐 끝에 붙인 용어 {glossary_adapter.missing_terms}개)"
+            )
+        if style_adapter is not None:
+            print(f"[금칙어 대체] {len(style_adapter.rewrites)}곳 수정")
+            for line in format_rewrite_report(style_adapter.rewrites):
+                print(f"  {line}")
         return output_path
         
     except Exception as e:
         print(f"[오류] 번역 중 에러 발생: {e}", file=sys.stderr)
         raise
+    finally:
+        if memory is not None:
+            memory.close()
 
 def main():
-    if len(sys.argv) < 2:
-        print("사용법: python scripts/translate.py <video_id>")
-        sys.exit(1)
-        
-    video_id = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Gemini API 기반 자막 번역")
+    parser.add_argument("video_id", help="번역할 비디오 ID")
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="번역 메모리(캐시)를 사용하지 않음",
+    )
+    parser.add_argument(
+        "--max-chunk-tokens",
+        type=int,
+        default=DEFAULT_MAX_CHUNK_TOKENS,
+        help="요청(청크)당 원문 토큰 예산 (기본값: %(default)s)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="동시에 보낼 청크 요청 수 (기본값: %(default)s)",
+    )
+    parser.add_argument(
+        "--style-rules",
+        action="store_true",
+        help="rules.md 금칙어 대체표로 번역 결과 후처리 (예: ~것이다 -> ~거예요, 수정 위치 출력)",
+    )
+    parser.add_argument(
+        "--glossary",
+        type=Path,
+        action="append",
+        help="용어집 파일 (원문<TAB>번역어 TSV 또는 rules.md), 여러 번 지정 가능",
+    )
+    args = parser.parse_args()
     
     try:
-        translate_subtitle(video_id)
+        translate_subtitle(
+            args.video_id,
+            use_memory=not args.no_memory,
+            max_chunk_tokens=args.max_chunk_tokens,
+            max_concurrency=args.concurrency,
+            apply_style_rules=args.style_rules,
+            glossary_paths=args.glossary,
+        )
     except Exception as e:
         print(f"❌ 실패: {e}")
         sys.exit(1)
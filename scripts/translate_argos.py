@@ -10,12 +10,14 @@
 예시:
     python scripts/translate_argos.py dQw4w9WgXcQ
     python scripts/translate_argos.py dQw4w9WgXcQ --source-lang en --target-lang ko
+    python scripts/translate_argos.py dQw4w9WgXcQ --target-lang ko,ja,zh
 """
 from __future__ import annotations
 
 import argparse
 import sys
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 # 프로젝트 루트를 sys.path에 추가
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -24,10 +26,53 @@ sys.path.insert(0, str(PROJECT_ROOT))
 # 경로 상수
 INPUT_SUBS_DIR = PROJECT_ROOT / "input_subs"
 TRANSLATED_SUBS_DIR = PROJECT_ROOT / "translated_subs"
+TRANSLATION_MEMORY_PATH = PROJECT_ROOT / "cache" / "translation_memory.sqlite3"
+RULES_PATH = PROJECT_ROOT / "rules.md"
 
+from src.application.ports.subtitle_translator import SubtitleTranslatorPort
+from src.application.use_cases.translate_subtitles import TranslateSubtitlesUseCase
 from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import format_srt, parse_srt
 from src.domain.value_objects.video_id import VideoId
-from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+from src.infrastructure.progress.progress_bus import (
+    ConsoleProgressSink,
+    ProgressBus,
+    ProgressMetricsSink,
+)
+from src.infrastructure.translators.argos_translator import (
+    DEFAULT_BATCH_SIZE,
+    ArgosTranslatorAdapter,
+)
+from src.infrastructure.translators.cue_classifier import load_sound_tags
+from src.infrastructure.translators.daemon_client import DaemonTranslatorClient
+from src.infrastructure.translators.glossary import (
+    Glossary,
+    GlossaryTranslatorAdapter,
+    load_glossary,
+    merge_glossaries,
+)
+from src.infrastructure.translators.model_registry import (
+    DEFAULT_MODEL_REGISTRY_PATH,
+    FASTEST_VARIANT,
+    ModelRegistry,
+)
+from src.infrastructure.translators.srt_cues import SrtStreamWriter, parse_srt_cues
+from src.infrastructure.translators.style_rules import (
+    StyleRewrite,
+    StyleRuleEngine,
+    StyleRuleTranslatorAdapter,
+    format_rewrite_report,
+    load_style_rules,
+)
+from src.infrastructure.translators.translation_daemon import DEFAULT_DAEMON_URL
+from src.infrastructure.translators.translation_journal import (
+    ResumableTranslatorAdapter,
+    journal_path_for,
+)
+from src.infrastructure.translators.translation_memory import (
+    CachingTranslatorAdapter,
+    SqliteTranslationMemory,
+)
 
 
 def progress_callback(message: str, percent: float) -> None:
@@ -35,34 +80,18 @@ def progress_callback(message: str, percent: float) -> None:
     print(f"[{percent:5.1f}%] {message}")
 
 
-def translate_subtitle(
-    video_id: str,
-    source_lang: str = "en",
-    target_lang: str = "ko",
-) -> Path:
-    """SRT 파일을 Argos Translate로 번역
-
-    Args:
-        video_id: 비디오 ID
-        source_lang: 원본 언어 코드 (기본값: "en")
-        target_lang: 목표 언어 코드 (기본값: "ko")
-
-    Returns:
-        번역된 자막 파일 경로
+def load_input_subtitle(video_id: str, source_lang: str) -> Subtitle:
+    """input_subs/<video_id>.srt를 읽어 검증된 Subtitle 생성
 
     Raises:
         FileNotFoundError: 입력 파일이 없을 경우
-        ValueError: 번역 실패 시
+        ValueError: 자막 객체 생성 실패 시
     """
     input_path = INPUT_SUBS_DIR / f"{video_id}.srt"
-    output_path = TRANSLATED_SUBS_DIR / f"{video_id}.srt"
-
     if not input_path.exists():
         raise FileNotFoundError(f"입력 자막을 찾을 수 없습니다: {input_path}")
 
     print(f"[번역 시작] {input_path.name}")
-    print(f"[번역 엔진] Argos Translate (로컬)")
-    print(f"[언어 방향] {source_lang} -> {target_lang}")
 
     # SRT 파일 읽기
     srt_content = input_path.read_text(encoding="utf-8")
@@ -79,38 +108,428 @@ def translate_subtitle(
         subtitle.validate()
     except Exception as e:
         raise ValueError(f"자막 객체 생성 실패: {e}")
+    return subtitle
+
+
+def create_engine(
+    use_daemon: bool,
+    daemon_url: str,
+    batch_size: int,
+    refresh_index: bool,
+    workers: int,
+    threads_per_worker: int,
+    merge_sentences: bool,
+    max_batch_tokens: int = 0,
+    protect_markup: bool = False,
+    fast_path: bool = False,
+    sound_tags_path: Optional[Path] = None,
+    inter_threads: int = 0,
+    intra_threads: int = 0,
+    compute_type: Optional[str] = None,
+    model_variant: Optional[str] = None,
+    model_registry_path: Path = DEFAULT_MODEL_REGISTRY_PATH,
+    autotune: bool = False,
+) -> Tuple[SubtitleTranslatorPort, Optional[ArgosTranslatorAdapter]]:
+    """번역 데몬 클라이언트 또는 로컬 ArgosTranslatorAdapter 생성
+
+    데몬은 자체 엔진 설정으로 번역하므로, 데몬 사용 시 로컬 엔진 옵션은 받지 않는다.
+
+    Returns:
+        (번역 엔진, 로컬 어댑터 - 데몬 사용 시 None, 사용 후 close() 필요)
+
+    Raises:
+        ValueError: 데몬 사용 시 로컬 엔진 옵션이 지정된 경우, 데몬에 연결할 수 없는 경우
+    """
+    if use_daemon:
+        local_options = [
+            option for option, is_set in (
+                ("--batch-size", batch_size != DEFAULT_BATCH_SIZE),
+                ("--refresh-index", refresh_index),
+                ("--workers", workers != 1),
+                ("--threads-per-worker", threads_per_worker != 0),
+                ("--merge-sentences", merge_sentences),
+                ("--max-batch-tokens", max_batch_tokens != 0),
+                ("--protect-markup", protect_markup),
+                ("--fast-path", fast_path),
+                ("--sound-tags", sound_tags_path is not None),
+                ("--inter-threads", inter_threads != 0),
+                ("--intra-threads", intra_threads != 0),
+                ("--compute-type", compute_type is not None),
+                ("--model-variant", model_variant is not None),
+                ("--autotune", autotune),
+            ) if is_set
+        ]
+        if local_options:
+            raise ValueError(
+                f"--daemon은 데몬 설정으로 번역하므로 {', '.join(local_options)} 옵션과 "
+                "함께 쓸 수 없습니다 (데몬 실행 시 지정하거나 --daemon 없이 실행)"
+            )
+        engine = DaemonTranslatorClient.connect(daemon_url)
+        if engine is None:
+            raise ValueError(f"번역 데몬에 연결할 수 없습니다: {daemon_url}")
+        print(f"[번역 엔진] 번역 데몬 {daemon_url} ({engine.engine_version})")
+        return engine, None
+
+    print(f"[번역 엔진] Argos Translate (로컬)")
+    adapter = ArgosTranslatorAdapter(
+        batch_size=batch_size,
+        refresh_package_index=refresh_index,
+        workers=workers,
+        threads_per_worker=threads_per_worker,
+        merge_sentences=merge_sentences,
+        max_batch_tokens=max_batch_tokens,
+        protect_markup=protect_markup,
+        fast_path=fast_path,
+        sound_tags=load_sound_tags(sound_tags_path) if sound_tags_path else None,
+        inter_threads=inter_threads,
+        intra_threads=intra_threads,
+        compute_type=compute_type,
+        model_registry=ModelRegistry(model_registry_path) if model_variant else None,
+        model_variant=model_variant,
+    )
+    return adapter, adapter
+
+
+def autotune_adapter(
+    adapter: ArgosTranslatorAdapter, subtitle: Subtitle, target_lang: str
+) -> None:
+    """자막 샘플로 CTranslate2 스레드/연산 타입 자동 튜닝 (결과는 호스트별로 캐시)"""
+    config = adapter.autotune_threading(
+        [cue.text for cue in parse_srt(subtitle.text)], subtitle.language, target_lang
+    )
+    print(
+        f"[스레드 튜닝] inter_threads={config.inter_threads}, "
+        f"intra_threads={config.intra_threads}, compute_type={config.compute_type}"
+    )
+
+
+def check_language_pair(
+    engine: SubtitleTranslatorPort, source_lang: str, target_lang: str
+) -> None:
+    """언어 쌍 지원 확인 (미지원 시 설치 안내 출력)
+
+    Raises:
+        ValueError: 지원하지 않는 언어 쌍
+    """
+    if not engine.is_language_pair_supported(source_lang, target_lang):
+        print(f"\n[오류] {source_lang} -> {target_lang} 번역이 지원되지 않습니다.")
+        print("[안내] 언어 패키지를 설치해야 합니다.")
+        print(f"[명령] python -m argostranslate.package install --from-code {source_lang} --to-code {target_lang}")
+        raise ValueError(f"Unsupported language pair: {source_lang} -> {target_lang}")
+
+
+def load_glossaries(paths: List[Path], target_lang: str) -> Glossary:
+    """용어집 파일들을 읽어 하나로 합침 (뒤의 파일이 같은 용어를 덮어씀)
+
+    Raises:
+        FileNotFoundError: 용어집 파일이 없을 경우
+        ValueError: 형식이 잘못된 경우
+    """
+    glossary = merge_glossaries([load_glossary(path, target_lang) for path in paths])
+    print(f"[용어집] {len(glossary)}개 용어 ({target_lang})")
+    return glossary
+
+
+def print_style_rewrites(rewrites: List[StyleRewrite]) -> None:
+    """금칙어 대체 결과 출력"""
+    print(f"[금칙어 대체] {len(rewrites)}곳 수정")
+    for line in format_rewrite_report(rewrites):
+        print(f"  {line}")
+
+
+def translate_subtitle(
+    video_id: str,
+    source_lang: str = "en",
+    target_lang: str = "ko",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    use_memory: bool = True,
+    refresh_index: bool = False,
+    workers: int = 1,
+    threads_per_worker: int = 0,
+    merge_sentences: bool = False,
+    max_batch_tokens: int = 0,
+    protect_markup: bool = False,
+    fast_path: bool = False,
+    sound_tags_path: Optional[Path] = None,
+    inter_threads: int = 0,
+    intra_threads: int = 0,
+    compute_type: Optional[str] = None,
+    autotune: bool = False,
+    model_variant: Optional[str] = None,
+    model_registry_path: Path = DEFAULT_MODEL_REGISTRY_PATH,
+    style_rules: bool = False,
+    glossary_paths: Optional[List[Path]] = None,
+    resume: bool = True,
+    use_daemon: bool = False,
+    daemon_url: str = DEFAULT_DAEMON_URL,
+    progress_hz: float = 0.0,
+) -> Path:
+    """SRT 파일을 Argos Translate로 번역
+
+    Args:
+        video_id: 비디오 ID
+        source_lang: 원본 언어 코드 (기본값: "en")
+        target_lang: 목표 언어 코드 (기본값: "ko")
+        batch_size: 한 번의 모델 호출로 번역할 큐 개수
+        use_memory: 번역 메모리(캐시) 사용 여부
+        refresh_index: 번역 전 Argos 패키지 인덱스 갱신 여부 (네트워크 필요)
+        workers: 샤드 번역 프로세스 수
+        threads_per_worker: 워커당 CTranslate2 스레드 수 (0이면 자동)
+        merge_sentences: 조각 큐를 문장 단위로 합쳐 번역할지 여부
+        max_batch_tokens: 배치당 패딩 포함 최대 토큰 수 (0이면 길이 버킷팅 안 함)
+        protect_markup: 태그/화자 이름/URL/음표를 번역 입력에서 제외하고 복원할지 여부
+        fast_path: 효과음 태그/음표/숫자/기호만 있는 큐를 모델 없이 처리할지 여부
+        sound_tags_path: 효과음 태그 변환표 JSON 파일 (None이면 기본 변환표)
+        inter_threads: CTranslate2 병렬 배치 수 (0이면 Argos 설정)
+        intra_threads: 배치당 CTranslate2 연산 스레드 수 (0이면 Argos 설정)
+        compute_type: CTranslate2 연산 타입 (예: "int8", None이면 Argos 설정)
+        autotune: 번역 전 스레드/연산 타입 자동 튜닝 여부 (로컬 엔진만, 결과 캐시)
+        model_variant: 모델 변형 이름 또는 "fastest" (None이면 패키지 모델)
+        model_registry_path: 모델 변형 레지스트리 파일
+        style_rules: rules.md 금칙어 대체표로 번역 결과를 후처리할지 여부
+        glossary_paths: 용어집 파일 (TSV 또는 rules.md, 용어를 보호했다가 고정 번역어로 주입)
+        resume: 중단된 번역의 저널이 있으면 이어서 번역할지 여부
+        use_daemon: 실행 중인 번역 데몬으로 번역할지 여부 (opt-in)
+            (데몬 사용 시 batch_size/workers 등 로컬 엔진 옵션은 지정할 수 없음)
+        daemon_url: 번역 데몬 URL
+        progress_hz: 진행 상황을 병합해 초당 이 횟수 이하로 출력하고 끝나면 단계별 요약 출력
+            (큐 수/속도/남은 시간 포함, 0이면 엔진 콜백을 그대로 출력)
+
+    Returns:
+        번역된 자막 파일 경로
+
+    Raises:
+        FileNotFoundError: 입력 파일이 없을 경우
+        ValueError: 번역 실패 시
+    """
+    output_path = TRANSLATED_SUBS_DIR / f"{video_id}.srt"
+    subtitle = load_input_subtitle(video_id, source_lang)
+    print(f"[언어 방향] {source_lang} -> {target_lang}")
 
-    # ArgosTranslatorAdapter 생성 및 번역
+    # 번역 데몬이 실행 중이면 상주 모델 사용, 아니면 ArgosTranslatorAdapter 생성
+    adapter = None
+    memory = None
     try:
-        adapter = ArgosTranslatorAdapter()
+        engine, adapter = create_engine(
+            use_daemon=use_daemon,
+            daemon_url=daemon_url,
+            batch_size=batch_size,
+            refresh_index=refresh_index,
+            workers=workers,
+            threads_per_worker=threads_per_worker,
+            merge_sentences=merge_sentences,
+            max_batch_tokens=max_batch_tokens,
+            protect_markup=protect_markup,
+            fast_path=fast_path,
+            sound_tags_path=sound_tags_path,
+            inter_threads=inter_threads,
+            intra_threads=intra_threads,
+            compute_type=compute_type,
+            model_variant=model_variant,
+            model_registry_path=model_registry_path,
+            autotune=autotune,
+        )
+        check_language_pair(engine, source_lang, target_lang)
+        if autotune and adapter is not None:
+            autotune_adapter(adapter, subtitle, target_lang)
 
-        # 언어 쌍 지원 확인
-        if not adapter.is_language_pair_supported(source_lang, target_lang):
-            print(f"\n[오류] {source_lang} -> {target_lang} 번역이 지원되지 않습니다.")
-            print("[안내] 언어 패키지를 설치해야 합니다.")
-            print(f"[명령] python -m argostranslate.package install --from-code {source_lang} --to-code {target_lang}")
-            raise ValueError(f"Unsupported language pair: {source_lang} -> {target_lang}")
+        translator = engine
+        if use_memory:
+            memory = SqliteTranslationMemory(TRANSLATION_MEMORY_PATH)
+            translator = CachingTranslatorAdapter(engine, memory)
 
-        translated_subtitle = adapter.translate(
-            subtitle,
-            target_language=target_lang,
-            progress_callback=progress_callback
+        # 용어집 용어는 번역 전 자리표시자로 보호하고 번역 후 고정 번역어로 주입
+        glossary_adapter = None
+        if glossary_paths:
+            glossary_adapter = GlossaryTranslatorAdapter(
+                translator, load_glossaries(glossary_paths, target_lang)
+            )
+            translator = glossary_adapter
+
+        # rules.md 금칙어 대체 후처리 (캐시에는 원래 번역 저장, 저널에는 후처리 결과 기록)
+        style_adapter = None
+        if style_rules:
+            style_adapter = StyleRuleTranslatorAdapter(
+                translator, StyleRuleEngine(load_style_rules(RULES_PATH))
+            )
+            translator = style_adapter
+
+        # 완료 큐를 <id>.journal.jsonl에 기록 - 중단 후 재실행 시 이어서 번역
+        resumable = ResumableTranslatorAdapter(
+            translator, journal_path_for(output_path), resume=resume
         )
 
-        # 번역된 자막 검증
-        translated_subtitle.validate()
+        # 진행 상황 버스: 엔진 메시지와 큐 진행을 병합해 progress_hz 이하로 출력
+        bus = None
+        metrics = ProgressMetricsSink()
+        callback = progress_callback
+        if progress_hz > 0:
+            bus = ProgressBus(max_hz=progress_hz)
+            bus.subscribe(ConsoleProgressSink())
+            bus.subscribe(metrics)
+            callback = bus.callback("engine")
+        total_cues = len(parse_srt_cues(subtitle.text))
+
+        # 번역된 큐를 배치가 끝날 때마다 <id>.partial.srt에 기록하고 완료 시 교체
+        try:
+            with SrtStreamWriter(output_path) as writer:
+                for done, cue in enumerate(resumable.translate_stream(
+                    subtitle,
+                    target_language=target_lang,
+                    progress_callback=callback
+                ), start=1):
+                    writer.write(cue)
+                    if bus is not None:
+                        bus.publish("translate", done=done, total=total_cues)
+
+                # 번역된 자막 검증 (실패하면 최종 파일로 교체하지 않고 부분 파일만 남김)
+                subtitle.with_translation(
+                    writer.partial_path.read_text(encoding="utf-8"), target_lang
+                ).validate()
+        finally:
+            if bus is not None:
+                bus.close()
+
+        for line in metrics.summary():
+            print(f"[진행 요약] {line}")
+        if resumable.resumed_cues:
+            print(f"[이어서 번역] 이전 작업에서 {resumable.resumed_cues}개 큐 복구")
+        if glossary_adapter is not None:
+            print(
+                f"[용어집] {glossary_adapter.injected_terms}개 용어 주입"
+                f" (모델이 빠뜨려 큐 끝에 붙인 용어 {glossary_adapter.missing_terms}개)"
+            )
+        if style_adapter is not None:
+            print_style_rewrites(style_adapter.rewrites)
+        if adapter is not None:
+            print(f"[문장 병합] 번역 단위 {adapter.last_stats.merge_saved}개 감소")
+            print(f"[중복 제거] 동일 큐 {adapter.last_stats.dedup_saved}개 번역 생략")
+            if adapter.last_stats.padded_tokens:
+                print(f"[패딩 비율] {adapter.last_stats.padding_ratio:.1%}")
+            if adapter.last_stats.protected_chars:
+                print(f"[마크업 보호] 번역 입력 {adapter.last_stats.protected_chars}자 감소")
+            if adapter.last_stats.fast_path_cues:
+                print(f"[빠른 경로] 효과음/기호 큐 {adapter.last_stats.fast_path_cues}개 모델 생략")
+
+        if memory is not None:
+            print(
+                f"[번역 메모리] 적중 {memory.stats.hits}개 / "
+                f"미적중 {memory.stats.misses}개"
+            )
 
     except Exception as e:
         raise ValueError(f"번역 실패: {e}")
-
-    # 번역된 자막 저장
-    TRANSLATED_SUBS_DIR.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(translated_subtitle.text, encoding="utf-8")
+    finally:
+        # 번역 메모리 연결과 샤드 번역 워커 프로세스 정리 (오류가 나도 닫음)
+        if memory is not None:
+            memory.close()
+        if adapter is not None:
+            adapter.close()
 
     print(f"\n[번역 완료] {output_path}")
     return output_path
 
 
+def translate_subtitle_many(
+    video_id: str,
+    source_lang: str,
+    target_langs: List[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    refresh_index: bool = False,
+    workers: int = 1,
+    threads_per_worker: int = 0,
+    merge_sentences: bool = False,
+    max_batch_tokens: int = 0,
+    protect_markup: bool = False,
+    fast_path: bool = False,
+    sound_tags_path: Optional[Path] = None,
+    inter_threads: int = 0,
+    intra_threads: int = 0,
+    compute_type: Optional[str] = None,
+    autotune: bool = False,
+    model_variant: Optional[str] = None,
+    model_registry_path: Path = DEFAULT_MODEL_REGISTRY_PATH,
+    style_rules: bool = False,
+    glossary_paths: Optional[List[Path]] = None,
+    use_daemon: bool = False,
+    daemon_url: str = DEFAULT_DAEMON_URL,
+) -> List[Path]:
+    """SRT 파일을 여러 목표 언어로 한 번에 번역 (translated_subs/<id>.<언어>.srt)
+
+    파싱과 중간 언어(영어) 번역을 목표 언어들이 공유한다.
+    번역 메모리와 이어서 번역(저널)은 단일 목표 언어 번역에서만 사용한다.
+
+    Returns:
+        번역된 자막 파일 경로 리스트 (target_langs 순서)
+
+    Raises:
+        FileNotFoundError: 입력 파일이 없을 경우
+        ValueError: 번역 실패 시
+    """
+    subtitle = load_input_subtitle(video_id, source_lang)
+    print(f"[언어 방향] {source_lang} -> {', '.join(target_langs)}")
+
+    adapter = None
+    try:
+        engine, adapter = create_engine(
+            use_daemon=use_daemon,
+            daemon_url=daemon_url,
+            batch_size=batch_size,
+            refresh_index=refresh_index,
+            workers=workers,
+            threads_per_worker=threads_per_worker,
+            merge_sentences=merge_sentences,
+            max_batch_tokens=max_batch_tokens,
+            protect_markup=protect_markup,
+            fast_path=fast_path,
+            sound_tags_path=sound_tags_path,
+            inter_threads=inter_threads,
+            intra_threads=intra_threads,
+            compute_type=compute_type,
+            model_variant=model_variant,
+            model_registry_path=model_registry_path,
+            autotune=autotune,
+        )
+        for target_lang in target_langs:
+            check_language_pair(engine, source_lang, target_lang)
+        if autotune and adapter is not None:
+            autotune_adapter(adapter, subtitle, target_langs[0])
+
+        if glossary_paths:
+            # 용어집 언어(첫 목표 언어)에는 고정 번역어, 나머지 언어에는 원문 용어를 넣음
+            engine = GlossaryTranslatorAdapter(
+                engine, load_glossaries(glossary_paths, target_langs[0])
+            )
+
+        translated_subtitles = TranslateSubtitlesUseCase(engine).execute_many(
+            subtitle,
+            target_languages=target_langs,
+            progress_callback=progress_callback,
+        )
+    except Exception as e:
+        raise ValueError(f"번역 실패: {e}")
+    finally:
+        if adapter is not None:
+            adapter.close()
+
+    style_engine = StyleRuleEngine(load_style_rules(RULES_PATH)) if style_rules else None
+
+    TRANSLATED_SUBS_DIR.mkdir(parents=True, exist_ok=True)
+    output_paths = []
+    for target_lang, translated_subtitle in translated_subtitles.items():
+        output_text = translated_subtitle.text
+        if style_engine is not None and target_lang == style_engine.language:
+            cues, rewrites = style_engine.apply(parse_srt(output_text))
+            output_text = format_srt(cues)
+            print_style_rewrites(rewrites)
+
+        output_path = TRANSLATED_SUBS_DIR / f"{video_id}.{target_lang}.srt"
+        output_path.write_text(output_text, encoding="utf-8")
+        print(f"[번역 완료] {output_path}")
+        output_paths.append(output_path)
+    return output_paths
+
+
 def main() -> int:
     """메인 실행 함수"""
     parser = argparse.ArgumentParser(
@@ -121,6 +540,7 @@ def main() -> int:
   %(prog)s dQw4w9WgXcQ
   %(prog)s dQw4w9WgXcQ --source-lang en --target-lang ko
   %(prog)s video123 --source-lang en --target-lang ja
+  %(prog)s video123 --target-lang ko,ja,zh
         """
     )
     parser.add_argument(
@@ -135,16 +555,212 @@ def main() -> int:
     parser.add_argument(
         "--target-lang",
         default="ko",
-        help="목표 언어 코드 (기본값: ko)"
+        help="목표 언어 코드, 쉼표로 여러 개 지정 가능 (기본값: ko, 예: ko,ja,zh)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"한 번의 모델 호출로 번역할 큐 개수 (기본값: {DEFAULT_BATCH_SIZE})"
+    )
+
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="번역 메모리(캐시)를 사용하지 않음"
+    )
+
+    parser.add_argument(
+        "--refresh-index",
+        action="store_true",
+        help="번역 전 Argos 패키지 인덱스 갱신 (네트워크 필요, 하루 1회)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="샤드 번역 프로세스 수 (기본값: 1, 멀티코어 장비에서 증가)"
+    )
+    parser.add_argument(
+        "--threads-per-worker",
+        type=int,
+        default=0,
+        help="워커 프로세스당 CTranslate2 스레드 수 (기본값: 0=자동)"
+    )
+
+    parser.add_argument(
+        "--merge-sentences",
+        action="store_true",
+        help="조각난 큐를 문장 단위로 합쳐 번역 (자동 생성 자막/Whisper 권장)"
+    )
+
+    parser.add_argument(
+        "--max-batch-tokens",
+        type=int,
+        default=0,
+        help="배치당 패딩 포함 최대 토큰 수, 길이가 비슷한 줄끼리 묶어 번역 (기본값: 0=사용 안 함)"
+    )
+
+    parser.add_argument(
+        "--protect-markup",
+        action="store_true",
+        help="<i>, {\\an8}, 화자 이름(JOHN:), URL, 음표를 번역하지 않고 그대로 유지"
+    )
+
+    parser.add_argument(
+        "--fast-path",
+        action="store_true",
+        help="[Music], ♪♪, (laughs), 숫자/기호 큐를 모델 없이 처리 ([음악], [웃음] 등으로 변환)"
+    )
+    parser.add_argument(
+        "--sound-tags",
+        type=Path,
+        help='효과음 태그 변환표 JSON 파일 (예: {"ko": {"door slams": "[문 닫히는 소리]"}})'
+    )
+
+    parser.add_argument(
+        "--inter-threads",
+        type=int,
+        default=0,
+        help="CTranslate2 병렬 배치 수 (기본값: 0=Argos 설정)"
+    )
+    parser.add_argument(
+        "--intra-threads",
+        type=int,
+        default=0,
+        help="배치당 CTranslate2 연산 스레드 수 (기본값: 0=Argos 설정)"
+    )
+    parser.add_argument(
+        "--compute-type",
+        help="CTranslate2 연산 타입 (예: int8, int8_float32, float32, 기본값: Argos 설정)"
+    )
+    parser.add_argument(
+        "--autotune",
+        action="store_true",
+        help="자막 샘플로 가장 빠른 스레드/연산 타입을 찾아 적용 (결과는 호스트별로 캐시)"
+    )
+
+    parser.add_argument(
+        "--model-variant",
+        help=(
+            "모델 변형 이름 (scripts/model_variants.py로 등록), "
+            f"'{FASTEST_VARIANT}'이면 측정된 가장 빠른 변형 (대량 번역용, 미측정 변형을 먼저 시도)"
+        )
+    )
+    parser.add_argument(
+        "--model-registry",
+        type=Path,
+        default=DEFAULT_MODEL_REGISTRY_PATH,
+        help="모델 변형 레지스트리 파일 (기본값: %(default)s)"
+    )
+
+    parser.add_argument(
+        "--style-rules",
+        action="store_true",
+        help="rules.md 금칙어 대체표로 번역 결과 후처리 (예: ~것이다 -> ~거예요, 수정 위치 출력)"
+    )
+
+    parser.add_argument(
+        "--glossary",
+        type=Path,
+        action="append",
+        help=(
+            "용어집 파일 (원문<TAB>번역어 TSV 또는 rules.md의 기술 용어 표), 여러 번 지정 가능. "
+            "여러 목표 언어면 첫 번째 언어의 용어집으로 사용"
+        )
+    )
+
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="중단된 번역 저널을 무시하고 처음부터 번역"
+    )
+
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help=(
+            "실행 중인 번역 데몬(scripts/translation_daemon.py)으로 번역 "
+            "(엔진 옵션은 데몬 설정을 따르며 로컬 엔진 옵션과 함께 쓸 수 없음)"
+        )
+    )
+    parser.add_argument(
+        "--daemon-url",
+        default=DEFAULT_DAEMON_URL,
+        help=f"번역 데몬 URL (기본값: {DEFAULT_DAEMON_URL})"
+    )
+
+    parser.add_argument(
+        "--progress-hz",
+        type=float,
+        default=0.0,
+        help=(
+            "진행 상황을 병합해 초당 이 횟수 이하로 출력 (큐 수/속도/남은 시간 포함, "
+            "단일 목표 언어만, 기본값: 0 = 엔진 콜백을 그대로 출력)"
+        )
     )
 
     args = parser.parse_args()
 
+    target_langs = [lang.strip() for lang in args.target_lang.split(",") if lang.strip()]
+    if not target_langs:
+        parser.error("--target-lang에 목표 언어를 하나 이상 지정해야 합니다")
+
     try:
+        if len(target_langs) > 1:
+            translate_subtitle_many(
+                video_id=args.video_id,
+                source_lang=args.source_lang,
+                target_langs=target_langs,
+                batch_size=args.batch_size,
+                refresh_index=args.refresh_index,
+                workers=args.workers,
+                threads_per_worker=args.threads_per_worker,
+                merge_sentences=args.merge_sentences,
+                max_batch_tokens=args.max_batch_tokens,
+                protect_markup=args.protect_markup,
+                fast_path=args.fast_path,
+                sound_tags_path=args.sound_tags,
+                inter_threads=args.inter_threads,
+                intra_threads=args.intra_threads,
+                compute_type=args.compute_type,
+                autotune=args.autotune,
+                model_variant=args.model_variant,
+                model_registry_path=args.model_registry,
+                style_rules=args.style_rules,
+                glossary_paths=args.glossary,
+                use_daemon=args.daemon,
+                daemon_url=args.daemon_url,
+            )
+            return 0
+
         translate_subtitle(
             video_id=args.video_id,
             source_lang=args.source_lang,
-            target_lang=args.target_lang,
+            target_lang=target_langs[0],
+            batch_size=args.batch_size,
+            use_memory=not args.no_memory,
+            refresh_index=args.refresh_index,
+            workers=args.workers,
+            threads_per_worker=args.threads_per_worker,
+            merge_sentences=args.merge_sentences,
+            max_batch_tokens=args.max_batch_tokens,
+            protect_markup=args.protect_markup,
+            fast_path=args.fast_path,
+            sound_tags_path=args.sound_tags,
+            inter_threads=args.inter_threads,
+            intra_threads=args.intra_threads,
+            compute_type=args.compute_type,
+            autotune=args.autotune,
+            model_variant=args.model_variant,
+            model_registry_path=args.model_registry,
+            style_rules=args.style_rules,
+            glossary_paths=args.glossary,
+            resume=not args.no_resume,
+            use_daemon=args.daemon,
+            daemon_url=args.daemon_url,
+            progress_hz=args.progress_hz,
         )
         return 0
     except Exception as e:
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""2단계 자막 번역 스크립트 (즉시 초안 + 백그라운드 정제)
+
+Argos Translate(int8)로 전체 초안을 바로 translated_subs/<video_id>.srt에 저장한 뒤,
+고품질 엔진(Gemini 또는 CTranslate2 NLLB/MarianMT)으로 다시 번역하며
+정제된 큐를 같은 파일에 원자적으로 교체합니다.
+큐별 출처(draft/refined)는 translated_subs/<video_id>.provenance.json에 기록합니다.
+
+사용법:
+    python scripts/translate_tiered.py <video_id> --refine gemini
+    python scripts/translate_tiered.py <video_id> --refine ctranslate2 --ct2-model <model_dir>
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# 경로 상수
+INPUT_SUBS_DIR = PROJECT_ROOT / "input_subs"
+TRANSLATED_SUBS_DIR = PROJECT_ROOT / "translated_subs"
+RULES_PATH = PROJECT_ROOT / "rules.md"
+
+from src.application.ports.subtitle_translator import SubtitleTranslatorPort
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+from src.infrastructure.translators.ctranslate2_translator import (
+    DEFAULT_BEAM_SIZE,
+    MODEL_FAMILIES,
+    CTranslate2TranslatorAdapter,
+)
+from src.infrastructure.translators.llm_translator import (
+    DEFAULT_GEMINI_MODEL,
+    ChunkedLlmTranslatorAdapter,
+    GeminiRestClient,
+)
+from src.infrastructure.translators.style_rules import (
+    StyleRuleEngine,
+    StyleRuleTranslatorAdapter,
+    load_style_rules,
+)
+from src.infrastructure.translators.tiered_translation import (
+    DEFAULT_SWAP_EVERY,
+    TieredTranslator,
+)
+
+# 정제 진행 상황 출력 간격(초)
+_REPORT_INTERVAL_SECONDS = 5.0
+
+
+def progress_callback(message: str, percent: float) -> None:
+    """진행 상황 출력 콜백"""
+    print(f"[{percent:5.1f}%] {message}")
+
+
+def create_refiner(args: argparse.Namespace) -> SubtitleTranslatorPort:
+    """정제 번역기 생성
+
+    Raises:
+        ValueError: 필요한 옵션/환경변수가 없을 경우
+    """
+    if args.refine == "gemini":
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY 환경변수가 설정되지 않았습니다.")
+        rules = RULES_PATH.read_text(encoding="utf-8") if RULES_PATH.exists() else ""
+        refiner: SubtitleTranslatorPort = ChunkedLlmTranslatorAdapter(
+            GeminiRestClient(api_key, model=os.getenv("GEMINI_MODEL", DEFAULT_GEMINI_MODEL)),
+            rules=rules,
+            target_languages=[args.target_lang],
+        )
+    else:
+        if args.ct2_model is None:
+            raise ValueError("--refine ctranslate2에는 --ct2-model이 필요합니다.")
+        refiner = CTranslate2TranslatorAdapter(
+            model_dir=args.ct2_model.expanduser(),
+            model_family=args.model_family,
+            language_pair=(args.source_lang, args.target_lang),
+            beam_size=args.beam_size,
+        )
+
+    # rules.md 금칙어 대체표로 정제 결과 후처리
+    if args.style_rules:
+        refiner = StyleRuleTranslatorAdapter(
+            refiner, StyleRuleEngine(load_style_rules(RULES_PATH))
+        )
+    return refiner
+
+
+def main() -> int:
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(
+        description="즉시 초안(Argos) + 백그라운드 정제(Gemini/NLLB) 2단계 자막 번역",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  %(prog)s dQw4w9WgXcQ --refine gemini
+  %(prog)s dQw4w9WgXcQ --refine ctranslate2 --ct2-model ~/models/nllb-200-distilled-600M-ct2
+        """
+    )
+    parser.add_argument("video_id", help="번역할 비디오 ID")
+    parser.add_argument("--source-lang", default="en", help="원본 언어 코드 (기본값: en)")
+    parser.add_argument("--target-lang", default="ko", help="목표 언어 코드 (기본값: ko)")
+    parser.add_argument(
+        "--draft-compute-type",
+        default="int8",
+        help="초안 Argos 모델의 CTranslate2 연산 타입 (기본값: %(default)s)"
+    )
+    parser.add_argument(
+        "--refine",
+        choices=("gemini", "ctranslate2"),
+        required=True,
+        help="정제 엔진 (gemini: GEMINI_API_KEY 필요, ctranslate2: --ct2-model 필요)"
+    )
+    parser.add_argument(
+        "--ct2-model",
+        type=Path,
+        help="정제용 CTranslate2 NLLB/MarianMT 모델 디렉터리"
+    )
+    parser.add_argument(
+        "--model-family",
+        choices=MODEL_FAMILIES,
+        default="nllb",
+        help="CTranslate2 모델 종류 (기본값: %(default)s)"
+    )
+    parser.add_argument(
+        "--beam-size",
+        type=int,
+        default=DEFAULT_BEAM_SIZE,
+        help="CTranslate2 빔 크기 (기본값: %(default)s)"
+    )
+    parser.add_argument(
+        "--style-rules",
+        action="store_true",
+        help="rules.md 금칙어 대체표로 정제 결과 후처리 (예: ~것이다 -> ~거예요)"
+    )
+    parser.add_argument(
+        "--swap-every",
+        type=int,
+        default=DEFAULT_SWAP_EVERY,
+        help="정제된 큐를 몇 개 모을 때마다 파일을 교체할지 (기본값: %(default)s)"
+    )
+    args = parser.parse_args()
+
+    input_path = INPUT_SUBS_DIR / f"{args.video_id}.srt"
+    output_path = TRANSLATED_SUBS_DIR / f"{args.video_id}.srt"
+    draft = None
+    try:
+        if not input_path.exists():
+            raise FileNotFoundError(f"입력 자막을 찾을 수 없습니다: {input_path}")
+        subtitle = Subtitle(
+            video_id=VideoId(args.video_id),
+            language=args.source_lang,
+            format="srt",
+            text=input_path.read_text(encoding="utf-8"),
+        )
+
+        refiner = create_refiner(args)
+        draft = ArgosTranslatorAdapter(compute_type=args.draft_compute_type)
+        tiered = TieredTranslator(draft, refiner, swap_every=args.swap_every)
+
+        print(f"[초안 번역] Argos ({args.draft_compute_type}) -> {output_path}")
+        job = tiered.translate(subtitle, args.target_lang, output_path, progress_callback)
+        print(f"[초안 완료] {job.total_cues}개 큐 저장, 정제 시작 ({args.refine})")
+
+        while not job.wait(timeout=_REPORT_INTERVAL_SECONDS):
+            print(f"[정제 중] {job.refined_cues}/{job.total_cues}개 큐 교체")
+
+        if job.error is not None:
+            print(
+                f"[정제 중단] {job.refined_cues}/{job.total_cues}개 큐만 정제됨: {job.error}",
+                file=sys.stderr,
+            )
+            return 1
+        print(f"[정제 완료] {job.refined_cues}개 큐 교체 ({job.file.provenance_path.name})")
+        return 0
+
+    except KeyboardInterrupt:
+        print("\n[중단] 초안과 지금까지 정제된 큐는 파일에 남아 있습니다.", file=sys.stderr)
+        return 130
+    except Exception as e:
+        print(f"\n❌ 실패: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if draft is not None:
+            draft.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
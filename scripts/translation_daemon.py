@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""로컬 번역 데몬 실행 스크립트
+
+Argos 번역 모델을 메모리에 상주시킨 채 localhost HTTP로 번역 요청을 받습니다.
+gui_app.py는 데몬이 실행 중이면 자동으로, translate_argos.py는 --daemon 지정 시
+데몬을 사용하여 실행할 때마다 모델을 다시 로드하지 않습니다.
+
+사용법:
+    python scripts/translation_daemon.py [--pair en:ko] [--port 8765]
+
+예시:
+    python scripts/translation_daemon.py
+    python scripts/translation_daemon.py --pair en:ko --pair en:ja --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Tuple
+
+# 프로젝트 루트를 sys.path에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.infrastructure.translators.argos_translator import (
+    DEFAULT_BATCH_SIZE,
+    ArgosTranslatorAdapter,
+)
+from src.infrastructure.translators.cue_classifier import load_sound_tags
+from src.infrastructure.translators.translation_daemon import (
+    DEFAULT_BATCH_WINDOW_MS,
+    DEFAULT_DAEMON_HOST,
+    DEFAULT_DAEMON_PORT,
+    DEFAULT_MAX_BATCH_TEXTS,
+    TranslationDaemon,
+)
+
+
+def parse_language_pair(value: str) -> Tuple[str, str]:
+    """"en:ko" 형식 언어 쌍 파싱"""
+    source, sep, target = value.partition(":")
+    if not sep or not source or not target:
+        raise argparse.ArgumentTypeError(f"언어 쌍 형식이 잘못되었습니다 (예: en:ko): {value}")
+    return source, target
+
+
+def main() -> int:
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(
+        description="Argos 모델을 상주시키는 로컬 번역 데몬",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  %(prog)s
+  %(prog)s --pair en:ko --pair en:ja
+  %(prog)s --port 9000 --workers 4
+        """
+    )
+    parser.add_argument(
+        "--pair",
+        dest="pairs",
+        action="append",
+        type=parse_language_pair,
+        help="시작 시 미리 로드할 언어 쌍 (여러 번 지정 가능, 기본값: en:ko)"
+    )
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_DAEMON_HOST,
+        help=f"바인딩 주소 (기본값: {DEFAULT_DAEMON_HOST})"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_DAEMON_PORT,
+        help=f"포트 (기본값: {DEFAULT_DAEMON_PORT})"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"한 번의 모델 호출로 번역할 큐 개수 (기본값: {DEFAULT_BATCH_SIZE})"
+    )
+    parser.add_argument(
+        "--batch-window-ms",
+        type=int,
+        default=DEFAULT_BATCH_WINDOW_MS,
+        help=f"여러 클라이언트 요청을 모으는 시간 창 (기본값: {DEFAULT_BATCH_WINDOW_MS}ms)"
+    )
+    parser.add_argument(
+        "--max-batch-texts",
+        type=int,
+        default=DEFAULT_MAX_BATCH_TEXTS,
+        help=f"한 번에 번역할 최대 텍스트 수 (기본값: {DEFAULT_MAX_BATCH_TEXTS})"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="샤드 번역 프로세스 수 (기본값: 1)"
+    )
+    parser.add_argument(
+        "--max-batch-tokens",
+        type=int,
+        default=0,
+        help="배치당 패딩 포함 최대 토큰 수, 길이가 비슷한 줄끼리 묶어 번역 (기본값: 0=사용 안 함)"
+    )
+    parser.add_argument(
+        "--protect-markup",
+        action="store_true",
+        help="<i>, {\\an8}, 화자 이름(JOHN:), URL, 음표를 번역하지 않고 그대로 유지"
+    )
+    parser.add_argument(
+        "--fast-path",
+        action="store_true",
+        help="[Music], ♪♪, (laughs), 숫자/기호 큐를 모델 없이 처리"
+    )
+    parser.add_argument(
+        "--sound-tags",
+        type=Path,
+        help="효과음 태그 변환표 JSON 파일 (기본 변환표에 덮어씀)"
+    )
+    parser.add_argument(
+        "--inter-threads",
+        type=int,
+        default=0,
+        help="CTranslate2 병렬 배치 수 (기본값: 0=Argos 설정)"
+    )
+    parser.add_argument(
+        "--intra-threads",
+        type=int,
+        default=0,
+        help="배치당 CTranslate2 연산 스레드 수 (기본값: 0=Argos 설정)"
+    )
+    parser.add_argument(
+        "--compute-type",
+        help="CTranslate2 연산 타입 (예: int8, 기본값: Argos 설정)"
+    )
+
+    args = parser.parse_args()
+    pairs = args.pairs or [("en", "ko")]
+
+    adapter = ArgosTranslatorAdapter(
+        batch_size=args.batch_size,
+        workers=args.workers,
+        max_batch_tokens=args.max_batch_tokens,
+        protect_markup=args.protect_markup,
+        fast_path=args.fast_path,
+        sound_tags=load_sound_tags(args.sound_tags) if args.sound_tags else None,
+        inter_threads=args.inter_threads,
+        intra_threads=args.intra_threads,
+        compute_type=args.compute_type,
+    )
+    daemon = TranslationDaemon(
+        adapter,
+        host=args.host,
+        port=args.port,
+        batch_window_ms=args.batch_window_ms,
+        max_batch_texts=args.max_batch_texts,
+    )
+
+    try:
+        print("[모델 로딩] " + ", ".join(f"{s} -> {t}" for s, t in pairs))
+        daemon.warm_up(pairs)
+        print(f"[데몬 시작] {daemon.url} ({daemon.engine_version})")
+        print("[안내] Ctrl+C로 종료")
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[데몬 종료]")
+    except ValueError as e:
+        print(f"\n[오류] {e}", file=sys.stderr)
+        return 1
+    finally:
+        daemon.shutdown()
+        adapter.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""AsyncSubtitleTranslatorPort - Interface for asyncio-based subtitle translation."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.application.ports.subtitle_translator import ProgressCallback
+from src.domain.entities.subtitle import Subtitle
+
+
+class AsyncSubtitleTranslatorPort(ABC):
+    """asyncio 이벤트 루프용 자막 번역 인터페이스
+
+    translate_async는 이벤트 루프를 막지 않아야 하며,
+    작업(Task)이 취소되면 가능한 빨리 번역을 중단해야 한다.
+    """
+
+    @abstractmethod
+    async def translate_async(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Subtitle:
+        """자막을 대상 언어로 번역하여 새로운 Subtitle 반환
+
+        Args:
+            subtitle: 원본 자막 (Subtitle 객체)
+            target_language: 목표 언어 코드 (예: "en", "ko", "ja")
+            progress_callback: 진행 상황 콜백 함수 (이벤트 루프 스레드에서 호출)
+
+        Returns:
+            번역된 Subtitle 객체
+
+        Raises:
+            ValueError: 지원하지 않는 언어 또는 자막 형식
+            RuntimeError: 번역 엔진 오류
+            asyncio.CancelledError: 작업이 취소된 경우
+        """
+        pass
+
+    @abstractmethod
+    async def list_supported_languages_async(self) -> List[str]:
+        """지원하는 언어 목록 반환
+
+        Returns:
+            언어 코드 리스트
+        """
+        pass
+
+    @abstractmethod
+    async def is_language_pair_supported_async(
+        self,
+        source_language: str,
+        target_language: str
+    ) -> bool:
+        """특정 언어 쌍의 번역 지원 여부 확인
+
+        Args:
+            source_language: 원본 언어 코드
+            target_language: 목표 언어 코드
+
+        Returns:
+            지원 여부 (True/False)
+        """
+        pass
@@ -0,0 +1,39 @@
+"""ProgressSink - Interface for receiving structured progress events."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class ProgressEvent:
+    """한 단계의 진행 상황 스냅샷"""
+    stage: str  # 예: "download", "extract", "translate"
+    message: str = ""
+    done: Optional[int] = None  # 처리한 단위 수 (예: 큐)
+    total: Optional[int] = None  # 전체 단위 수 (모르면 None)
+    percent: Optional[float] = None  # done/total이 있으면 그것으로 계산
+    rate: Optional[float] = None  # 초당 처리 단위 수 (단계 시작 이후 평균)
+    eta_seconds: Optional[float] = None  # 남은 예상 시간
+    elapsed_seconds: float = 0.0  # 단계 시작 이후 경과 시간
+
+
+class ProgressSink(ABC):
+    """진행 이벤트 수신 인터페이스 (CLI 출력, GUI 갱신, 메트릭 수집 등)
+
+    ProgressBus(src.infrastructure.progress)의 전달 스레드에서 호출되므로, 작업 스레드를 막지 않지만
+    GUI처럼 스레드가 정해진 대상은 구현체가 직접 넘겨야 한다 (예: Qt 시그널).
+    """
+
+    @abstractmethod
+    def handle(self, event: ProgressEvent) -> None:
+        """진행 이벤트 처리
+
+        Args:
+            event: 병합된 최신 진행 상황
+        """
+        pass
+
+    def close(self) -> None:
+        """버스 종료 시 호출 (기본 구현은 아무것도 하지 않음)"""
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Callable, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 
 from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, parse_srt
 
 
 # Progress callback: (message: str, percent: float) -> None
@@ -14,6 +15,10 @@ ProgressCallback = Callable[[str, float], None]
 class SubtitleTranslatorPort(ABC):
     """자막 번역 인터페이스"""
 
+    # 한 인스턴스의 translate/translate_stream을 여러 스레드에서 동시에 호출해도 되는지
+    # (통계/모델 캐시 등 호출 간 상태를 잠금 없이 공유하는 구현체는 False)
+    thread_safe: bool = False
+
     @abstractmethod
     def translate(
         self,
@@ -37,6 +42,67 @@ class SubtitleTranslatorPort(ABC):
         """
         pass
 
+    def translate_stream(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Iterator[SubtitleCue]:
+        """번역된 큐를 원본 순서대로 완료되는 즉시 yield
+
+        기본 구현은 translate() 완료 후 결과를 큐 단위로 나눠 yield한다.
+        배치 단위로 결과를 낼 수 있는 구현체는 이 메서드를 재정의한다.
+
+        Args:
+            subtitle: 원본 자막 (SRT)
+            target_language: 목표 언어 코드
+            progress_callback: 진행 상황 콜백 함수
+
+        Yields:
+            번역된 SubtitleCue (번호/타임스탬프는 원본 유지)
+
+        Raises:
+            ValueError: 지원하지 않는 언어 또는 자막 형식
+            RuntimeError: 번역 엔진 오류
+        """
+        translated = self.translate(subtitle, target_language, progress_callback)
+        if translated.text is not None:
+            translated_text = translated.text
+        else:
+            translated_text = translated.file_path.read_text(encoding="utf-8")
+        yield from parse_srt(translated_text)
+
+    def translate_many(
+        self,
+        subtitle: Subtitle,
+        target_languages: List[str],
+        progress_callback: Optional[ProgressCallback] = None
+    ) -> Dict[str, Subtitle]:
+        """자막을 여러 목표 언어로 번역
+
+        기본 구현은 목표 언어마다 translate()를 차례로 호출한다.
+        파싱/중간 언어 번역을 공유할 수 있는 구현체는 이 메서드를 재정의한다.
+
+        Args:
+            subtitle: 원본 자막 (SRT)
+            target_languages: 목표 언어 코드 리스트 (중복은 무시)
+            progress_callback: 진행 상황 콜백 함수
+
+        Returns:
+            {목표 언어: 번역된 Subtitle} (target_languages 순서)
+
+        Raises:
+            ValueError: 지원하지 않는 언어 또는 자막 형식
+            RuntimeError: 번역 엔진 오류
+        """
+        targets = list(dict.fromkeys(target_languages))
+        if not targets:
+            raise ValueError("At least one target language is required")
+        return {
+            target: self.translate(subtitle, target, progress_callback)
+            for target in targets
+        }
+
     @abstractmethod
     def list_supported_languages(self) -> List[str]:
         """지원하는 언어 목록 반환
@@ -1,7 +1,7 @@
 """TranslateSubtitlesUseCase - 자막 번역 유스케이스."""
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, List, Optional
 
 from src.application.ports.subtitle_translator import (
     ProgressCallback,
@@ -54,3 +54,39 @@ class TranslateSubtitlesUseCase:
         translated_subtitle.validate()
 
         return translated_subtitle
+
+    def execute_many(
+        self,
+        subtitle: Subtitle,
+        target_languages: List[str],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Subtitle]:
+        """여러 목표 언어로 자막 번역 실행 (원본 검증/파싱은 한 번만)
+
+        Args:
+            subtitle: 원본 자막 객체
+            target_languages: 목표 언어 코드 리스트
+            progress_callback: 진행 상황 콜백 함수
+
+        Returns:
+            {목표 언어: 번역된 Subtitle}
+
+        Raises:
+            ValueError: 지원하지 않는 언어 또는 형식
+            RuntimeError: 번역 엔진 오류
+        """
+        # 자막 유효성 검증
+        subtitle.validate()
+
+        # 번역 실행
+        translated_subtitles = self._subtitle_translator.translate_many(
+            subtitle=subtitle,
+            target_languages=target_languages,
+            progress_callback=progress_callback,
+        )
+
+        # 번역된 자막 유효성 검증
+        for translated_subtitle in translated_subtitles.values():
+            translated_subtitle.validate()
+
+        return translated_subtitles
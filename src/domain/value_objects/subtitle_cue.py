@@ -0,0 +1,45 @@
+"""SubtitleCue - Value Object for a single SRT cue."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+
+@dataclass(frozen=True, slots=True)
+class SubtitleCue:
+    """SRT 큐 하나 (번호, 타임스탬프, 텍스트)"""
+    number: str
+    timestamp: str
+    text: str
+    # 이 큐를 만든 번역 단계 (예: "draft", "refined", SRT에는 기록하지 않음)
+    provenance: Optional[str] = None
+
+    def to_srt(self) -> str:
+        """SRT 블록 문자열 (빈 줄 구분자 제외)"""
+        return f"{self.number}\n{self.timestamp}\n{self.text}"
+
+
+def parse_srt(srt_text: str) -> List[SubtitleCue]:
+    """SRT 텍스트를 큐 리스트로 파싱 (번호/타임스탬프/텍스트가 없는 블록은 건너뜀)"""
+    cues = []
+    # SRT 큐는 빈 줄로 구분됨
+    blocks = re.split(r"\n\n+", srt_text.strip())
+
+    for block in blocks:
+        lines = block.strip().split("\n")
+        if len(lines) < 3:
+            continue  # 유효하지 않은 큐 건너뛰기
+
+        cues.append(SubtitleCue(
+            number=lines[0].strip(),
+            timestamp=lines[1].strip(),
+            text="\n".join(lines[2:]).strip(),
+        ))
+
+    return cues
+
+
+def format_srt(cues: Sequence[SubtitleCue]) -> str:
+    """큐 리스트를 SRT 텍스트로 조립"""
+    return "\n\n".join(cue.to_srt() for cue in cues) + "\n"
@@ -0,0 +1,258 @@
+"""Progress Bus - 작업 스레드의 진행 상황을 병합해 일정 빈도 이하로 여러 수신자에게 전달하는 이벤트 버스."""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, TextIO
+
+from src.application.ports.progress_sink import ProgressEvent, ProgressSink
+from src.application.ports.subtitle_translator import ProgressCallback
+
+# 수신자에게 전달하는 최대 빈도 (초당 횟수)
+DEFAULT_MAX_HZ = 10.0
+
+
+@dataclass(slots=True)
+class _StageClock:
+    started: float
+    start_done: int
+
+
+class ProgressBus:
+    """진행 상황 이벤트 버스
+
+    - publish()는 단계별 최신 상태만 덮어쓰고 바로 반환한다 (작업 스레드를 막지 않음).
+    - 전달 스레드가 초당 max_hz번 이하로 단계별 최신 이벤트를 모든 수신자에게 보낸다.
+      그 사이의 중간 갱신은 병합되어 버려진다.
+    - done/total이 있으면 단계 시작 이후 평균 처리 속도와 남은 예상 시간을 계산한다.
+    - close()는 남은 이벤트를 모두 전달한 뒤 수신자를 닫는다.
+
+    기존 ProgressCallback을 받는 포트에는 callback(stage)를 넘긴다.
+    """
+
+    def __init__(self, max_hz: float = DEFAULT_MAX_HZ) -> None:
+        """
+        Args:
+            max_hz: 수신자에게 전달하는 최대 빈도 (초당 횟수)
+
+        Raises:
+            ValueError: max_hz가 0 이하인 경우
+        """
+        if max_hz <= 0:
+            raise ValueError("max_hz must be positive")
+
+        self._interval = 1.0 / max_hz
+        self._sinks: List[ProgressSink] = []
+        self._pending: Dict[str, ProgressEvent] = {}
+        self._clocks: Dict[str, _StageClock] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._published = 0
+        self._delivered = 0
+        self._sink_errors = 0
+        self._thread = threading.Thread(
+            target=self._dispatch_loop, name="progress-bus", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def published(self) -> int:
+        """publish()로 받은 갱신 수"""
+        return self._published
+
+    @property
+    def delivered(self) -> int:
+        """수신자에게 전달한 이벤트 수 (수신자 하나 기준)"""
+        return self._delivered
+
+    @property
+    def sink_errors(self) -> int:
+        """수신자가 예외를 낸 횟수 (예외는 전달을 멈추지 않음)"""
+        return self._sink_errors
+
+    def subscribe(self, sink: ProgressSink) -> None:
+        """수신자 추가"""
+        with self._condition:
+            self._sinks.append(sink)
+
+    def publish(
+        self,
+        stage: str,
+        done: Optional[int] = None,
+        total: Optional[int] = None,
+        message: str = "",
+        percent: Optional[float] = None,
+    ) -> None:
+        """단계의 진행 상황 갱신 (병합 후 전달 스레드가 보냄)
+
+        Args:
+            stage: 단계 이름
+            done: 처리한 단위 수
+            total: 전체 단위 수
+            message: 표시할 메시지 (비어 있으면 이전 메시지 유지)
+            percent: 진행률 (done/total이 있으면 무시)
+        """
+        now = time.monotonic()
+        with self._condition:
+            if self._closed:
+                return
+            clock = self._clocks.get(stage)
+            if clock is None:
+                clock = _StageClock(now, done or 0)
+                self._clocks[stage] = clock
+            elapsed = now - clock.started
+
+            rate = eta = None
+            if done is not None:
+                if elapsed > 0 and done > clock.start_done:
+                    rate = (done - clock.start_done) / elapsed
+                if total:
+                    percent = 100.0 * done / total
+                    if rate:
+                        eta = max(total - done, 0) / rate
+
+            previous = self._pending.get(stage)
+            if not message and previous is not None:
+                message = previous.message
+            self._pending[stage] = ProgressEvent(
+                stage=stage,
+                message=message,
+                done=done,
+                total=total,
+                percent=percent,
+                rate=rate,
+                eta_seconds=eta,
+                elapsed_seconds=elapsed,
+            )
+            self._published += 1
+            self._condition.notify()
+
+    def callback(self, stage: str) -> ProgressCallback:
+        """기존 (message, percent) 콜백을 이 버스의 stage 갱신으로 바꾸는 어댑터"""
+        def progress_callback(message: str, percent: float) -> None:
+            self.publish(stage, message=message, percent=percent)
+        return progress_callback
+
+    def close(self) -> None:
+        """남은 이벤트를 전달하고 전달 스레드와 수신자 종료"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        for sink in self._sinks:
+            try:
+                sink.close()
+            except Exception:
+                self._sink_errors += 1
+
+    def __enter__(self) -> "ProgressBus":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _dispatch_loop(self) -> None:
+        last_dispatch = -self._interval
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                # 전달 간격이 남았으면 기다리는 동안 들어온 갱신을 병합
+                remaining = last_dispatch + self._interval - time.monotonic()
+                if remaining > 0 and not self._closed:
+                    self._condition.wait(remaining)
+                    continue
+                events = list(self._pending.values())
+                self._pending.clear()
+                sinks = list(self._sinks)
+                last_dispatch = time.monotonic()
+
+            for event in events:
+                for sink in sinks:
+                    try:
+                        sink.handle(event)
+                    except Exception:
+                        # 수신자 하나의 오류가 다른 수신자/작업을 멈추지 않도록 함
+                        self._sink_errors += 1
+                self._delivered += 1
+
+
+def format_progress_event(event: ProgressEvent) -> str:
+    """진행 이벤트를 한 줄로 표시 (예: "[translate]  42.0% 120/286 35.1/s 남은 시간 5s 메시지")"""
+    parts = [f"[{event.stage}]"]
+    if event.percent is not None:
+        parts.append(f"{event.percent:5.1f}%")
+    if event.done is not None and event.total is not None:
+        parts.append(f"{event.done}/{event.total}")
+    if event.rate is not None:
+        parts.append(f"{event.rate:.1f}/s")
+    if event.eta_seconds is not None:
+        parts.append(f"남은 시간 {event.eta_seconds:.0f}s")
+    if event.message:
+        parts.append(event.message)
+    return " ".join(parts)
+
+
+class ConsoleProgressSink(ProgressSink):
+    """진행 이벤트를 한 줄씩 출력하는 CLI 수신자"""
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """
+        Args:
+            stream: 출력 스트림 (None이면 sys.stdout)
+        """
+        self._stream = stream
+
+    def handle(self, event: ProgressEvent) -> None:
+        stream = self._stream or sys.stdout
+        print(format_progress_event(event), file=stream, flush=True)
+
+
+class ProgressMetricsSink(ProgressSink):
+    """단계별 마지막 이벤트와 전달 횟수를 모으는 메트릭 수신자"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latest: Dict[str, ProgressEvent] = {}
+        self._counts: Dict[str, int] = {}
+
+    def handle(self, event: ProgressEvent) -> None:
+        with self._lock:
+            self._latest[event.stage] = event
+            self._counts[event.stage] = self._counts.get(event.stage, 0) + 1
+
+    def latest(self, stage: str) -> Optional[ProgressEvent]:
+        """단계의 마지막 이벤트 (없으면 None)"""
+        with self._lock:
+            return self._latest.get(stage)
+
+    def counts(self) -> Dict[str, int]:
+        """{단계: 전달받은 이벤트 수}"""
+        with self._lock:
+            return dict(self._counts)
+
+    def summary(self) -> List[str]:
+        """단계별 요약 줄 목록 (예: "translate: 286/286 8.1s 35.2/s (갱신 33회)")"""
+        with self._lock:
+            latest = dict(self._latest)
+            counts = dict(self._counts)
+
+        lines = []
+        for stage, event in latest.items():
+            parts = [f"{stage}:"]
+            if event.done is not None:
+                parts.append(f"{event.done}/{event.total}" if event.total else str(event.done))
+            elif event.percent is not None:
+                parts.append(f"{event.percent:.1f}%")
+            parts.append(f"{event.elapsed_seconds:.1f}s")
+            if event.rate is not None:
+                parts.append(f"{event.rate:.1f}/s")
+            parts.append(f"(갱신 {counts[stage]}회)")
+            lines.append(" ".join(parts))
+        return lines
@@ -1,6 +1,80 @@
 """Infrastructure translators module."""
 from __future__ import annotations
 
-from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+from typing import TYPE_CHECKING
 
-__all__ = ["ArgosTranslatorAdapter"]
+from src.infrastructure.translators.async_translators import (
+    AsyncDaemonTranslatorClient,
+    ExecutorTranslatorAdapter,
+)
+from src.infrastructure.translators.ctranslate2_translator import (
+    CTranslate2TranslatorAdapter,
+)
+from src.infrastructure.translators.daemon_client import DaemonTranslatorClient
+from src.infrastructure.translators.engine_router import TranslatorRouter
+from src.infrastructure.translators.glossary import (
+    Glossary,
+    GlossaryTranslatorAdapter,
+)
+from src.infrastructure.translators.llm_translator import (
+    ChunkedLlmTranslatorAdapter,
+    GeminiRestClient,
+)
+from src.infrastructure.translators.model_registry import ModelRegistry, ModelVariant
+from src.infrastructure.translators.style_rules import (
+    StyleRuleEngine,
+    StyleRuleTranslatorAdapter,
+)
+from src.infrastructure.translators.tiered_translation import (
+    TieredSubtitleFile,
+    TieredTranslator,
+)
+from src.infrastructure.translators.translation_memory import (
+    CachingTranslatorAdapter,
+    SqliteTranslationMemory,
+)
+from src.infrastructure.translators.translation_daemon import TranslationDaemon
+from src.infrastructure.translators.translation_journal import (
+    ResumableTranslatorAdapter,
+    TranslationJournal,
+)
+
+if TYPE_CHECKING:
+    from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+__all__ = [
+    "ArgosTranslatorAdapter",
+    "AsyncDaemonTranslatorClient",
+    "CTranslate2TranslatorAdapter",
+    "CachingTranslatorAdapter",
+    "ChunkedLlmTranslatorAdapter",
+    "DaemonTranslatorClient",
+    "ExecutorTranslatorAdapter",
+    "GeminiRestClient",
+    "Glossary",
+    "GlossaryTranslatorAdapter",
+    "ModelRegistry",
+    "ModelVariant",
+    "ResumableTranslatorAdapter",
+    "SqliteTranslationMemory",
+    "StyleRuleEngine",
+    "StyleRuleTranslatorAdapter",
+    "TieredSubtitleFile",
+    "TieredTranslator",
+    "TranslationDaemon",
+    "TranslationJournal",
+    "TranslatorRouter",
+]
+
+
+def __getattr__(name: str):
+    """ArgosTranslatorAdapter는 처음 접근할 때 import
+
+    argostranslate가 없는 설치(NLLB/Gemini 전용 등)에서도 다른 어댑터를 쓸 수 있도록
+    Argos 모듈은 패키지 import 시점에 불러오지 않는다.
+    """
+    if name == "ArgosTranslatorAdapter":
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        return ArgosTranslatorAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,23 @@
 """ArgosTranslatorAdapter - Argos Translate 기반 자막 번역 어댑터."""
 from __future__ import annotations
 
-import re
-from typing import List, Optional
+import hashlib
+import importlib.metadata
+import math
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
 
 try:
     import argostranslate.package
+    import argostranslate.settings
     import argostranslate.translate
+    from argostranslate.translate import CompositeTranslation, PackageTranslation
 except ImportError:
     raise ImportError(
         "argostranslate is not installed. "
@@ -18,19 +29,271 @@ from src.application.ports.subtitle_translator import (
     SubtitleTranslatorPort,
 )
 from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, format_srt
+from src.infrastructure.translators.batch_scheduler import (
+    padded_token_count,
+    plan_length_buckets,
+)
+from src.infrastructure.translators.cue_classifier import FastPathClassifier
+from src.infrastructure.translators.model_registry import ModelRegistry, ModelVariant
+from src.infrastructure.translators.markup_protector import (
+    protect_text,
+    restore_text,
+)
+from src.infrastructure.translators.sentence_merger import (
+    SentenceGroup,
+    merge_cues_into_sentences,
+    redistribute_translation,
+    split_sentences,
+)
+from src.infrastructure.translators.srt_cues import (
+    deduplicate_texts,
+    load_subtitle_text,
+    parse_srt_cues,
+    reassemble_srt,
+)
+from src.infrastructure.translators.thread_tuning import (
+    DEFAULT_AUTOTUNE_CACHE_PATH,
+    DEFAULT_AUTOTUNE_SAMPLE_SIZE,
+    AutotuneCache,
+    ThreadingConfig,
+    autotune,
+    candidate_configs,
+    default_threads_per_worker,
+    host_key,
+)
+
+# 한 번에 CTranslate2로 보내는 큐 개수 (Argos 내부 배치 크기와 동일)
+DEFAULT_BATCH_SIZE = 32
+
+# 패키지 인덱스 갱신 주기 (opt-in 시에만 사용)
+DEFAULT_INDEX_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_INDEX_STAMP_PATH = (
+    Path.home() / ".cache" / "youtube-subtitle-translator" / "argos_package_index.stamp"
+)
+
+# 직접 패키지가 없는 언어 쌍에서 Argos가 경유하는 중간 언어
+PIVOT_LANGUAGE = "en"
+# 중간 언어 번역 결과를 보관할 최대 문서 수
+_PIVOT_CACHE_DOCUMENTS = 16
+
+# 샤드 번역 시 워커당 샤드 수 (진행 상황 보고 단위)
+_SHARDS_PER_WORKER = 4
+
+# 길이 버킷팅 시 한 번에 정렬할 범위 (batch_size의 배수, 스트리밍 단위)
+_BUCKET_WINDOW_BATCHES = 8
+
+# Argos apply_packaged_translation과 동일한 디코딩 설정
+_ARGOS_BEAM_SIZE = 4
+_ARGOS_LENGTH_PENALTY = 0.2
+
+
+@dataclass(slots=True)
+class TranslationStats:
+    """마지막 translate 호출의 처리 통계"""
+    cues: int = 0
+    sentences: int = 0  # 문장 병합 후 번역 단위 수
+    model_inputs: int = 0  # 중복 제거 후 모델에 전달된 텍스트 수
+    real_tokens: int = 0  # 모델에 전달된 실제 토큰 수 (현재 프로세스 배치 기준)
+    padded_tokens: int = 0  # 배치 패딩을 포함한 토큰 수
+    protected_chars: int = 0  # 마크업 보호로 모델 입력에서 줄어든 글자 수
+    fast_path_cues: int = 0  # 모델 없이 규칙으로 처리된 큐 수
+
+    @property
+    def merge_saved(self) -> int:
+        """문장 병합으로 줄어든 번역 단위 수"""
+        return self.cues - self.sentences
+
+    @property
+    def dedup_saved(self) -> int:
+        """중복 제거로 생략된 번역 수"""
+        return self.sentences - self.model_inputs
+
+    @property
+    def padding_ratio(self) -> float:
+        """패딩 포함 토큰 중 패딩 비율 (배치가 없으면 0.0)"""
+        if not self.padded_tokens:
+            return 0.0
+        return (self.padded_tokens - self.real_tokens) / self.padded_tokens
 
 
 class ArgosTranslatorAdapter(SubtitleTranslatorPort):
     """Argos Translate 로컬 번역엔진 어댑터"""
 
-    def __init__(self) -> None:
-        """Argos Translate 초기화"""
-        # 설치된 패키지 업데이트 (초기화 시 한 번만)
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        refresh_package_index: bool = False,
+        index_ttl_seconds: float = DEFAULT_INDEX_TTL_SECONDS,
+        index_stamp_path: Path = DEFAULT_INDEX_STAMP_PATH,
+        workers: int = 1,
+        threads_per_worker: int = 0,
+        merge_sentences: bool = False,
+        max_batch_tokens: int = 0,
+        protect_markup: bool = False,
+        fast_path: bool = False,
+        sound_tags: Optional[Dict[str, Dict[str, str]]] = None,
+        inter_threads: int = 0,
+        intra_threads: int = 0,
+        compute_type: Optional[str] = None,
+        model_registry: Optional[ModelRegistry] = None,
+        model_variant: Optional[str] = None,
+    ) -> None:
+        """Argos Translate 초기화
+
+        생성 시에는 네트워크에 접근하지 않는다. 패키지 인덱스 갱신은
+        refresh_package_index=True일 때만 첫 번역 직전에 수행되며,
+        마지막 갱신 후 index_ttl_seconds가 지나지 않았으면 생략한다.
+
+        Args:
+            batch_size: 한 번의 모델 호출로 번역할 큐 개수
+            refresh_package_index: 첫 번역 시 패키지 인덱스 갱신 여부 (opt-in)
+            index_ttl_seconds: 패키지 인덱스 갱신 주기 (초)
+            index_stamp_path: 마지막 갱신 시각을 기록하는 파일 경로
+            workers: 샤드 번역 프로세스 수 (1이면 현재 프로세스에서 번역)
+            threads_per_worker: 워커 프로세스당 CTranslate2 스레드 수
+                (0이면 코어 수 / workers, 워커끼리 코어를 나눠 씀)
+            merge_sentences: 조각 큐를 문장 단위로 합쳐 번역 후 재분배할지 여부
+            max_batch_tokens: 배치당 패딩 포함 최대 토큰 수 (0이면 길이 버킷팅 안 함)
+                - 지정 시 batch_size × 8개 범위를 토큰 길이 순으로 묶어 번역
+            protect_markup: 태그, {\\an8}, 화자 이름, URL, 음표를 모델 입력에서 제외하고
+                번역 후 그대로 복원할지 여부
+            fast_path: 효과음 태그/음표/숫자/기호만 있는 큐를 모델 없이 처리할지 여부
+            sound_tags: 빠른 경로의 {목표 언어: {태그: 변환 결과}} 표
+                (None이면 cue_classifier.DEFAULT_SOUND_TAGS)
+            inter_threads: CTranslate2 병렬 배치 수 (0이면 Argos 설정)
+            intra_threads: 배치당 CTranslate2 연산 스레드 수 (0이면 Argos 설정)
+            compute_type: CTranslate2 연산 타입 (예: "int8", "float32", None이면 Argos 설정)
+                - 스레드 수는 현재 프로세스 번역에만 적용되며,
+                  샤드 워커는 threads_per_worker를 따른다 (연산 타입은 공통)
+            model_registry: 모델 변형 레지스트리 (None이면 model_variant 지정 시 기본 경로)
+            model_variant: 사용할 모델 변형 이름 또는 "fastest" (None이면 패키지 모델)
+                - 변형이 등록되지 않은 언어 쌍은 패키지 모델을 사용
+                - 직접 번역 쌍은 번역이 끝날 때마다 변형의 초당 큐 수를 기록
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if threads_per_worker < 0:
+            raise ValueError("threads_per_worker cannot be negative")
+        if max_batch_tokens < 0:
+            raise ValueError("max_batch_tokens cannot be negative")
+        if inter_threads < 0 or intra_threads < 0:
+            raise ValueError("inter_threads and intra_threads cannot be negative")
+        self._batch_size = batch_size
+        self._refresh_package_index = refresh_package_index
+        self._index_ttl_seconds = index_ttl_seconds
+        self._index_stamp_path = index_stamp_path
+        self._index_refresh_checked = False
+        self._workers = workers
+        self._threads_per_worker = threads_per_worker
+        self._merge_sentences = merge_sentences
+        self._max_batch_tokens = max_batch_tokens
+        self._protect_markup = protect_markup
+        self._fast_path = FastPathClassifier(sound_tags) if fast_path else None
+        self._threading = ThreadingConfig(inter_threads, intra_threads, compute_type)
+        self._model_variant = model_variant
+        self._model_registry = model_registry
+        if model_variant is not None and model_registry is None:
+            self._model_registry = ModelRegistry()
+        # {(원본, 목표): 선택된 변형} - 작업 중에는 같은 변형을 유지
+        self._variant_choices: Dict[Tuple[str, str], Optional[ModelVariant]] = {}
+        self.last_stats = TranslationStats()
+
+        # 샤드 번역용 프로세스 풀 (언어 쌍별로 모델을 한 번 로딩해 유지)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_language_pair: Optional[Tuple[str, str]] = None
+
+        # 언어 쌍 인덱스 (패키지 변경 시에만 재구성)
+        self._languages: Optional[Dict[str, object]] = None
+        self._translations: Dict[Tuple[str, str], Optional[object]] = {}
+        self._packages_signature: Optional[Tuple] = None
+
+        # {(원본 언어, 문서 해시): 중간 언어 번역} - 같은 문서의 다른 목표 언어는 2단계만 번역
+        self._pivot_cache: "OrderedDict[Tuple[str, str], List[str]]" = OrderedDict()
+        self._pivot_cache_lock = threading.Lock()
+
+        # {(모델 경로, 설정): CTranslate2 Translator} - 스레드/연산 타입 또는 모델 변형 지정 시 사용
+        self._ct2_models: Dict[Tuple[str, ThreadingConfig], object] = {}
+        self._ct2_models_lock = threading.Lock()
+
+    @property
+    def threading_config(self) -> ThreadingConfig:
+        """현재 CTranslate2 스레드/연산 타입 설정"""
+        return self._threading
+
+    @property
+    def engine_version(self) -> str:
+        """번역 메모리 캐시 키에 쓰이는 엔진 버전 문자열 (언어 쌍과 무관한 설정까지)
+
+        언어 쌍별 패키지/모델 변형까지 구분하려면 engine_version_for()를 사용한다.
+        """
+        parts = [_argos_package_version(), f"ct2-{self._effective_compute_type(None)}"]
+        if self._model_variant is not None:
+            parts.append(f"variant-{self._model_variant}")
+        return "/".join(parts + self._output_option_tags())
+
+    def engine_version_for(self, source_language: str, target_language: str) -> str:
+        """언어 쌍별 캐시 키 엔진 버전
+
+        경로의 단계마다 패키지 버전, 선택된 모델 변형(이름/모델 경로)과
+        실제 CTranslate2 연산 타입을 포함해 모델이 바뀌면 캐시가 갈리게 한다.
+        지원하지 않는 언어 쌍이면 engine_version을 반환한다.
+        """
         try:
-            argostranslate.package.update_package_index()
-        except Exception as e:
-            # 패키지 인덱스 업데이트 실패 시 경고만 출력하고 계속 진행
-            print(f"Warning: Failed to update package index: {e}")
+            hops = self._plan_hops(source_language, target_language)
+        except ValueError:
+            return self.engine_version
+
+        parts = [_argos_package_version()]
+        for hop in hops:
+            translation = self._resolve_translation(*hop)
+            pkg = translation.pkg if isinstance(translation, PackageTranslation) else None
+            package_version = getattr(pkg, "package_version", None)
+            if not isinstance(package_version, str):
+                package_version = "unknown"
+            hop_id = f"{hop[0]}-{hop[1]}@{package_version}"
+            variant = self._select_variant(hop)
+            if variant is not None:
+                hop_id += f"+{variant.name}"
+                if variant.model_path:
+                    hop_id += f"({variant.model_path})"
+            parts.append(f"{hop_id}/ct2-{self._effective_compute_type(variant)}")
+        return "/".join(parts + self._output_option_tags())
+
+    def plan_sentence_groups(self, cues: List[dict]) -> Optional[List[SentenceGroup]]:
+        """문장 병합 계획 (merge_sentences=False면 None)
+
+        번역 메모리처럼 큐 일부만 다시 요청하는 래퍼가 병합 묶음 단위로
+        캐시하고 연속한 큐를 함께 요청할 수 있도록 공개한다.
+
+        Args:
+            cues: parse_srt_cues 결과
+        """
+        if not self._merge_sentences:
+            return None
+        return merge_cues_into_sentences(cues)
+
+    def _effective_compute_type(self, variant: Optional[ModelVariant]) -> str:
+        """실제로 쓰이는 CTranslate2 연산 타입 (모델 변형 > 어댑터 설정 > Argos 설정)"""
+        if variant is not None and variant.compute_type:
+            return variant.compute_type
+        if self._threading.compute_type:
+            return self._threading.compute_type
+        compute_type = getattr(argostranslate.settings, "compute_type", None)
+        return compute_type if isinstance(compute_type, str) else "default"
+
+    def _output_option_tags(self) -> List[str]:
+        """번역 결과를 바꾸는 어댑터 옵션 표시 (캐시 키용)"""
+        tags = []
+        if self._merge_sentences:
+            tags.append("merge")
+        if self._protect_markup:
+            tags.append("markup")
+        if self._fast_path is not None:
+            tags.append(f"fast-{self._fast_path.table_digest}")
+        return tags
 
     def translate(
         self,
@@ -57,61 +320,59 @@ class ArgosTranslatorAdapter(SubtitleTranslatorPort):
             ValueError: 지원하지 않는 언어 쌍
             RuntimeError: 번역 엔진 오류
         """
+        translated_cues = list(
+            self.translate_stream(subtitle, target_language, progress_callback)
+        )
+
         if progress_callback:
-            progress_callback("번역 준비 중...", 0.0)
+            progress_callback("번역 완료, 재조립 중...", 90.0)
 
-        # 자막 텍스트 확인
-        if subtitle.text is None:
-            if subtitle.file_path is None:
-                raise ValueError("Subtitle must have either text or file_path")
-            # 파일에서 텍스트 읽기
-            subtitle_text = subtitle.file_path.read_text(encoding="utf-8")
-        else:
-            subtitle_text = subtitle.text
+        # SRT 재조립
+        translated_srt = format_srt(translated_cues)
+
+        if progress_callback:
+            progress_callback("번역 완료!", 100.0)
 
-        # subtitle_text가 비어있거나 공백만 있는지 검증
-        if not subtitle_text or not subtitle_text.strip():
-            raise ValueError("Subtitle text cannot be empty or whitespace only")
+        # 번역된 Subtitle 객체 반환
+        return subtitle.with_translation(translated_srt, target_language)
 
-        # 언어 쌍 지원 확인
-        source_lang = subtitle.language
-        if not self.is_language_pair_supported(source_lang, target_language):
-            raise ValueError(
-                f"Translation from {source_lang} to {target_language} is not supported. "
-                f"You may need to install the language package."
-            )
+    def translate_stream(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterator[SubtitleCue]:
+        """번역된 큐를 배치(또는 샤드)가 끝날 때마다 원본 순서대로 yield
+
+        Args:
+            subtitle: 원본 자막 객체
+            target_language: 목표 언어 코드
+            progress_callback: 진행 상황 콜백 (0% ~ 90% 구간)
+
+        Yields:
+            번역된 SubtitleCue
 
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍
+            RuntimeError: 번역 엔진 오류
+        """
         if progress_callback:
-            progress_callback("번역 모델 로딩 중...", 10.0)
-
-        # Argos 번역 객체 가져오기
-        installed_languages = argostranslate.translate.get_installed_languages()
-        source_lang_obj = None
-        target_lang_obj = None
-
-        for lang in installed_languages:
-            if lang.code == source_lang:
-                source_lang_obj = lang
-            if lang.code == target_language:
-                target_lang_obj = lang
-
-        if source_lang_obj is None:
-            raise RuntimeError(
-                f"Source language {source_lang} is not installed"
-            )
+            progress_callback("번역 준비 중...", 0.0)
 
-        if target_lang_obj is None:
-            raise RuntimeError(
-                f"Target language {target_language} is not installed"
-            )
+        # opt-in 시에만 패키지 인덱스 갱신 (어댑터당 최초 1회, TTL 적용)
+        if self._refresh_package_index and not self._index_refresh_checked:
+            self._index_refresh_checked = True
+            self.refresh_package_index()
 
-        translator = source_lang_obj.get_translation(target_lang_obj)
-        if translator is None:
-            raise RuntimeError(
-                f"Failed to get translator for {source_lang} -> {target_language}"
-            )
+        # 자막 텍스트 확인 (비어있거나 공백만 있으면 ValueError)
+        subtitle_text = load_subtitle_text(subtitle)
+
+        # 언어 쌍 확인 및 번역 경로 결정 (중간 언어 경유 시 두 단계)
+        source_lang = subtitle.language
+        hops = self._plan_hops(source_lang, target_language)
 
         if progress_callback:
+            progress_callback("번역 모델 준비 완료", 10.0)
             progress_callback("자막 파싱 중...", 20.0)
 
         # SRT 큐 파싱
@@ -121,35 +382,95 @@ class ArgosTranslatorAdapter(SubtitleTranslatorPort):
         if not cues:
             raise ValueError("No valid subtitle cues found after parsing")
 
+        translated_texts = self._iter_translated_cues(hops, cues, progress_callback)
+        # 번역 제너레이터를 먼저 두어 마지막 큐 이후의 마무리(처리 속도 기록)까지 실행
+        for translated_text, cue in zip(translated_texts, cues):
+            yield SubtitleCue(
+                number=cue["number"],
+                timestamp=cue["timestamp"],
+                text=translated_text,
+            )
+
+    def translate_many(
+        self,
+        subtitle: Subtitle,
+        target_languages: List[str],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Subtitle]:
+        """한 번의 파싱으로 여러 목표 언어로 번역
+
+        - 자막 파싱/문장 병합/중복 제거는 한 번만 수행
+        - 중간 언어(영어)를 경유하는 쌍은 1단계(원본 -> 영어) 결과를 공유
+          (목표 언어에 영어가 있으면 그 결과도 재사용)
+        - 목표 언어별 2단계 번역은 스레드로 동시에 실행
+          (workers > 1이면 프로세스 풀이 이미 병렬화하므로 순차 실행)
+
+        Args:
+            subtitle: 원본 자막 객체
+            target_languages: 목표 언어 코드 리스트 (중복은 무시)
+            progress_callback: 진행 상황 콜백
+
+        Returns:
+            {목표 언어: 번역된 Subtitle} (target_languages 순서)
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍 또는 빈 자막
+            RuntimeError: 번역 엔진 오류
+        """
+        targets = list(dict.fromkeys(target_languages))
+        if not targets:
+            raise ValueError("At least one target language is required")
+
         if progress_callback:
-            progress_callback(f"번역 중... ({len(cues)}개 큐)", 30.0)
-
-        # 각 큐의 텍스트 번역
-        translated_cues = []
-        for i, cue in enumerate(cues):
-            translated_text = translator.translate(cue["text"])
-            translated_cues.append({
-                "number": cue["number"],
-                "timestamp": cue["timestamp"],
-                "text": translated_text,
-            })
-
-            # 진행 상황 업데이트 (30% ~ 90%)
-            if progress_callback and i % 10 == 0:
-                percent = 30.0 + (60.0 * (i + 1) / len(cues))
-                progress_callback(f"번역 중... ({i + 1}/{len(cues)})", percent)
+            progress_callback("번역 준비 중...", 0.0)
+
+        if self._refresh_package_index and not self._index_refresh_checked:
+            self._index_refresh_checked = True
+            self.refresh_package_index()
+
+        subtitle_text = load_subtitle_text(subtitle)
+        source_lang = subtitle.language
+        # 모든 언어 쌍을 먼저 확인해 일부만 번역된 채 실패하지 않도록 함
+        routes = {target: self._plan_hops(source_lang, target) for target in targets}
 
         if progress_callback:
-            progress_callback("번역 완료, 재조립 중...", 90.0)
+            progress_callback("자막 파싱 중...", 20.0)
 
-        # SRT 재조립
-        translated_srt = self._reassemble_srt(translated_cues)
+        cues = self._parse_srt_cues(subtitle_text)
+        if not cues:
+            raise ValueError("No valid subtitle cues found after parsing")
+
+        # 빠른 경로는 모든 목표 언어에서 해당하는 텍스트만 적용해 1단계 입력을 공유
+        groups, unique_texts, text_indices, fast = self._prepare_units(cues, targets)
+        model_texts = [text for i, text in enumerate(unique_texts) if i not in fast]
+
+        # 공유되는 1단계 번역(원본 -> 중간 언어)을 먼저 수행해 캐시에 올려둠
+        shared_hops = {route[0] for route in routes.values() if len(route) > 1}
+        for hop in shared_hops:
+            self._translate_hop(hop, model_texts, progress_callback)
+
+        def translate_target(target: str) -> Subtitle:
+            texts = model_texts
+            for hop in routes[target]:
+                texts = self._translate_hop(hop, texts)
+            position = targets.index(target)
+            fast_texts = {i: results[position] for i, results in fast.items()}
+            translations = self._merge_fast_path(len(unique_texts), fast_texts, texts)
+            translated_cues = self._redistribute(cues, groups, text_indices, translations)
+            return subtitle.with_translation(format_srt(translated_cues), target)
+
+        results: Dict[str, Subtitle] = {}
+        concurrency = 1 if self._workers > 1 else len(targets)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for target, translated in zip(targets, executor.map(translate_target, targets)):
+                results[target] = translated
+                if progress_callback:
+                    percent = 30.0 + 60.0 * len(results) / len(targets)
+                    progress_callback(f"번역 완료: {target} ({len(results)}/{len(targets)})", percent)
 
         if progress_callback:
             progress_callback("번역 완료!", 100.0)
-
-        # 번역된 Subtitle 객체 반환
-        return subtitle.with_translation(translated_srt, target_language)
+        return results
 
     def list_supported_languages(self) -> List[str]:
         """설치된 언어 패키지 목록 반환
@@ -157,8 +478,7 @@ class ArgosTranslatorAdapter(SubtitleTranslatorPort):
         Returns:
             언어 코드 리스트
         """
-        installed_languages = argostranslate.translate.get_installed_languages()
-        return sorted([lang.code for lang in installed_languages])
+        return sorted(self._installed_languages())
 
     def is_language_pair_supported(
         self, source_language: str, target_language: str
@@ -172,63 +492,781 @@ class ArgosTranslatorAdapter(SubtitleTranslatorPort):
         Returns:
             지원 여부
         """
-        installed_languages = argostranslate.translate.get_installed_languages()
-        source_lang_obj = None
-        target_lang_obj = None
+        return self._resolve_translation(source_language, target_language) is not None
+
+    def translate_texts(
+        self, texts: List[str], source_language: str, target_language: str
+    ) -> List[str]:
+        """SRT 없이 큐 텍스트 목록만 번역 (번역 데몬 등에서 사용)
+
+        동일한 텍스트는 한 번만 번역하며, 배치/샤드 설정은 translate()와 같다.
+
+        Args:
+            texts: 번역할 큐 텍스트 리스트
+            source_language: 원본 언어 코드
+            target_language: 목표 언어 코드
+
+        Returns:
+            입력과 같은 순서의 번역 텍스트 리스트
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍
+        """
+        hops = self._plan_hops(source_language, target_language)
+
+        unique_texts, text_indices = deduplicate_texts(texts)
+        fast = {
+            i: results[0]
+            for i, results in self._classify_fast_path(unique_texts, [target_language]).items()
+        }
+        translated = [text for i, text in enumerate(unique_texts) if i not in fast]
+        for hop in hops:
+            translated = self._translate_hop(hop, translated)
+        translated = self._merge_fast_path(len(unique_texts), fast, translated)
+        return [translated[i] for i in text_indices]
 
-        for lang in installed_languages:
-            if lang.code == source_language:
-                source_lang_obj = lang
-            if lang.code == target_language:
-                target_lang_obj = lang
+    def refresh_package_index(self, force: bool = False) -> bool:
+        """원격 패키지 인덱스 갱신 (네트워크 접근)
+
+        마지막 성공 갱신 후 TTL이 지나지 않았으면 force=True가 아닌 한 생략한다.
+        실패 시 경고만 출력하고 계속 진행한다.
+
+        Args:
+            force: TTL과 관계없이 갱신
+
+        Returns:
+            실제로 갱신에 성공했는지 여부
+        """
+        if not force and self._is_package_index_fresh():
+            return False
 
-        if source_lang_obj is None or target_lang_obj is None:
+        try:
+            argostranslate.package.update_package_index()
+        except Exception as e:
+            # 패키지 인덱스 업데이트 실패 시 경고만 출력하고 계속 진행
+            print(f"Warning: Failed to update package index: {e}")
             return False
 
-        translator = source_lang_obj.get_translation(target_lang_obj)
-        return translator is not None
+        try:
+            self._index_stamp_path.parent.mkdir(parents=True, exist_ok=True)
+            self._index_stamp_path.touch()
+        except OSError as e:
+            print(f"Warning: Failed to record package index refresh: {e}")
+        return True
 
-    def _parse_srt_cues(self, srt_text: str) -> List[dict]:
-        """SRT 텍스트를 큐 단위로 파싱
+    def _is_package_index_fresh(self) -> bool:
+        """마지막 인덱스 갱신이 TTL 이내인지 확인"""
+        try:
+            last_refresh = self._index_stamp_path.stat().st_mtime
+        except OSError:
+            return False
+        return time.time() - last_refresh < self._index_ttl_seconds
+
+    def invalidate_language_index(self) -> None:
+        """언어/번역 객체 인덱스 폐기 (다음 조회 시 재구성)
+
+        패키지 디렉토리 변경은 자동 감지되므로, 같은 프로세스에서
+        패키지를 설치/삭제한 직후 즉시 반영이 필요할 때만 호출한다.
+        """
+        self._languages = None
+        self._translations = {}
+        self._packages_signature = None
+
+    def _installed_languages(self) -> Dict[str, object]:
+        """{언어 코드: Argos Language} 인덱스 반환
+
+        get_installed_languages()는 패키지 메타데이터를 다시 읽으므로
+        패키지 디렉토리가 바뀌었을 때만 인덱스를 재구성한다.
+        """
+        signature = self._current_packages_signature()
+        if self._languages is None or signature != self._packages_signature:
+            self._languages = {
+                lang.code: lang
+                for lang in argostranslate.translate.get_installed_languages()
+            }
+            self._translations = {}
+            self._packages_signature = signature
+        return self._languages
+
+    def _resolve_translation(
+        self, source_language: str, target_language: str
+    ) -> Optional[object]:
+        """(원본, 목표) 언어 쌍의 Argos 번역 객체 반환 (미지원 시 None)
+
+        번역 객체는 로딩된 모델을 내부에 보관하므로 인덱스에 캐시해
+        같은 어댑터로 번역하는 이후 호출(다른 영상 포함)에서 재사용한다.
+        """
+        languages = self._installed_languages()
+        key = (source_language, target_language)
+        if key not in self._translations:
+            source_lang_obj = languages.get(source_language)
+            target_lang_obj = languages.get(target_language)
+            translation = None
+            if source_lang_obj is not None and target_lang_obj is not None:
+                translation = source_lang_obj.get_translation(target_lang_obj)
+            self._translations[key] = translation
+        return self._translations[key]
+
+    def _current_packages_signature(self) -> Optional[Tuple]:
+        """설치 패키지 디렉토리의 (경로, 수정 시각) 목록 - 패키지 변경 감지용"""
+        package_dirs = getattr(argostranslate.settings, "package_dirs", None)
+        if not isinstance(package_dirs, (list, tuple)):
+            return None
+
+        signature = []
+        for package_dir in package_dirs:
+            path = Path(package_dir)
+            mtime = path.stat().st_mtime_ns if path.exists() else None
+            signature.append((str(path), mtime))
+        return tuple(signature)
+
+    def _iter_translated_cues(
+        self,
+        hops: List[Tuple[str, str]],
+        cues: List[dict],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterator[str]:
+        """큐 목록을 번역해 큐별 번역 텍스트를 순서대로 yield
 
-        SRT 형식:
-        1
-        00:00:00,000 --> 00:00:02,000
-        First subtitle text
+        1. (옵션) 조각 큐를 문장 단위로 병합
+        2. 동일한 텍스트는 한 번만 번역하고 결과를 공유
+           (빠른 경로 사용 시 효과음 태그 등은 모델 없이 처리)
+        3. 중간 언어 경유 시 1단계 결과는 문서 단위 캐시에서 재사용
+        4. 병합된 문장의 번역은 원래 큐들에 표시 시간 비율로 재분배
 
-        2
-        00:00:02,500 --> 00:00:05,000
-        Second subtitle text
+        고유 텍스트는 첫 등장 순서로 번역되므로, 마지막 단계의 배치가
+        끝날 때마다 앞쪽 큐부터 순서대로 내보낼 수 있다.
 
         Args:
-            srt_text: SRT 형식 텍스트
+            hops: _plan_hops 결과
+            cues: parse_srt_cues 결과
+            progress_callback: 진행 상황 콜백
+
+        Yields:
+            cues 순서의 번역 텍스트
+        """
+        groups, unique_texts, text_indices, fast_results = self._prepare_units(
+            cues, [hops[-1][1]]
+        )
+        fast = {i: results[0] for i, results in fast_results.items()}
+
+        if progress_callback:
+            progress_callback(
+                f"번역 중... ({len(cues)}개 큐, 문장 병합으로 "
+                f"{self.last_stats.merge_saved}개, 중복 제거로 "
+                f"{self.last_stats.dedup_saved}개 절약)",
+                30.0,
+            )
+
+        # 중간 언어까지의 단계는 한 번에 번역 (캐시 적용)
+        texts = [text for i, text in enumerate(unique_texts) if i not in fast]
+        for hop in hops[:-1]:
+            texts = self._translate_hop(hop, texts, progress_callback)
+
+        # 마지막 단계는 배치 단위로 번역하며, 준비된 문장부터 순서대로 내보냄
+        last_hop = hops[-1]
+        model_translations: List[str] = []
+        unique_translations: List[str] = []
+        next_group = 0
+        model_position = 0
+
+        def ready_groups() -> Iterator[str]:
+            nonlocal next_group, model_position
+            # 빠른 경로 결과와 모델 번역을 고유 텍스트 순서대로 이어 붙임
+            while len(unique_translations) < len(unique_texts):
+                index = len(unique_translations)
+                if index in fast:
+                    unique_translations.append(fast[index])
+                elif model_position < len(model_translations):
+                    unique_translations.append(model_translations[model_position])
+                    model_position += 1
+                else:
+                    break
+            while (
+                next_group < len(groups)
+                and text_indices[next_group] < len(unique_translations)
+            ):
+                group = groups[next_group]
+                yield from redistribute_translation(
+                    unique_translations[text_indices[next_group]], group.durations
+                )
+                next_group += 1
+
+        yield from ready_groups()
+        if not texts:
+            return
+
+        # 모델 변형 처리 속도 = 모델에 보낸 텍스트 수 / 번역 시간
+        # (모델 로딩과 yield로 멈춰 있는 시간은 제외)
+        translation = self._resolve_translation(*last_hop)
+        variant = self._select_variant(last_hop)
+        measure = variant is not None and len(hops) == 1 and self._warm_up(
+            translation, last_hop, texts
+        )
+        batches = self._iter_translated_batches(
+            translation, texts, progress_callback, language_pair=last_hop
+        )
+        busy_seconds = 0.0
+        while True:
+            start = time.perf_counter()
+            batch = next(batches, None)
+            busy_seconds += time.perf_counter() - start
+            if batch is None:
+                break
+            model_translations.extend(batch)
+            yield from ready_groups()
+
+        if measure and busy_seconds > 0:
+            self._model_registry.record_throughput(variant, len(texts) / busy_seconds)
+
+    def _warm_up(
+        self, translation: object, language_pair: Tuple[str, str], texts: List[str]
+    ) -> bool:
+        """처리 속도 측정 전에 모델을 미리 로딩
+
+        샤드 워커는 첫 작업에서 모델을 로딩하므로 풀이 이미 떠 있을 때만 측정한다.
 
         Returns:
-            큐 리스트 [{"number": str, "timestamp": str, "text": str}, ...]
+            로딩 시간을 빼고 측정할 수 있으면 True
+        """
+        if self._uses_shards(language_pair, texts):
+            return self._pool is not None and self._pool_language_pair == language_pair
+        if not isinstance(translation, PackageTranslation):
+            return False
+        self._get_ctranslate2_translator(translation)
+        return True
+
+    def _uses_shards(
+        self, language_pair: Optional[Tuple[str, str]], texts: List[str]
+    ) -> bool:
+        """프로세스 풀로 샤드 번역할지 여부"""
+        return (
+            self._workers > 1
+            and language_pair is not None
+            and len(texts) > self._batch_size
+        )
+
+    def _prepare_units(
+        self, cues: List[dict], target_languages: List[str]
+    ) -> Tuple[List[SentenceGroup], List[str], List[int], Dict[int, List[str]]]:
+        """큐를 번역 단위로 변환 (문장 병합 + 중복 제거 + 빠른 경로) 후 last_stats 갱신
+
+        Returns:
+            (문장 묶음, 고유 텍스트, 각 묶음이 가리키는 고유 텍스트 인덱스,
+             {빠른 경로 고유 텍스트 인덱스: 목표 언어 순서의 결과})
         """
-        cues = []
-        # SRT 큐는 빈 줄로 구분됨
-        blocks = re.split(r"\n\n+", srt_text.strip())
+        groups = self.plan_sentence_groups(cues)
+        if groups is None:
+            groups = [
+                SentenceGroup((i,), cue["text"], (0,)) for i, cue in enumerate(cues)
+            ]
+
+        unique_texts, text_indices = deduplicate_texts([group.text for group in groups])
+        self.last_stats = TranslationStats(
+            cues=len(cues),
+            sentences=len(groups),
+            model_inputs=len(unique_texts),
+        )
 
-        for block in blocks:
-            lines = block.strip().split("\n")
-            if len(lines) < 3:
-                continue  # 유효하지 않은 큐 건너뛰기
+        fast = self._classify_fast_path(unique_texts, target_languages)
+        self.last_stats.fast_path_cues = sum(
+            len(group.cue_indices)
+            for group, text_index in zip(groups, text_indices)
+            if text_index in fast
+        )
+        return groups, unique_texts, text_indices, fast
 
-            number = lines[0].strip()
-            timestamp = lines[1].strip()
-            text = "\n".join(lines[2:]).strip()
+    def _classify_fast_path(
+        self, texts: List[str], target_languages: List[str]
+    ) -> Dict[int, List[str]]:
+        """모델 없이 처리할 수 있는 텍스트 판별 (fast_path=False면 빈 dict)
 
-            cues.append({
-                "number": number,
-                "timestamp": timestamp,
-                "text": text,
-            })
+        모든 목표 언어에서 빠른 경로 대상인 텍스트만 포함한다.
+
+        Returns:
+            {텍스트 인덱스: target_languages 순서의 결과}
+        """
+        if self._fast_path is None:
+            return {}
+
+        fast: Dict[int, List[str]] = {}
+        for index, text in enumerate(texts):
+            results = [self._fast_path.classify(text, target) for target in target_languages]
+            if all(result is not None for result in results):
+                fast[index] = results
+        return fast
+
+    @staticmethod
+    def _merge_fast_path(
+        total: int, fast: Dict[int, str], model_translations: List[str]
+    ) -> List[str]:
+        """빠른 경로 결과와 모델 번역(빠른 경로 제외 순서)을 원래 순서로 합침"""
+        model_iter = iter(model_translations)
+        return [fast[i] if i in fast else next(model_iter) for i in range(total)]
+
+    def _plan_hops(
+        self, source_language: str, target_language: str
+    ) -> List[Tuple[str, str]]:
+        """언어 쌍 번역 경로 결정
+
+        직접 패키지가 없어 Argos가 중간 언어를 경유하는 쌍(CompositeTranslation)은
+        [(원본, 중간), (중간, 목표)] 두 단계로 나눠 중간 결과를 공유할 수 있게 한다.
+
+        Returns:
+            [(원본, 목표)] 또는 [(원본, 중간 언어), (중간 언어, 목표)]
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍
+        """
+        translator = self._resolve_translation(source_language, target_language)
+        if translator is None:
+            raise ValueError(
+                f"Translation from {source_language} to {target_language} is not supported. "
+                f"You may need to install the language package."
+            )
+
+        if (
+            isinstance(translator, CompositeTranslation)
+            and PIVOT_LANGUAGE not in (source_language, target_language)
+            and self._resolve_translation(source_language, PIVOT_LANGUAGE) is not None
+            and self._resolve_translation(PIVOT_LANGUAGE, target_language) is not None
+        ):
+            hops = [(source_language, PIVOT_LANGUAGE), (PIVOT_LANGUAGE, target_language)]
+        else:
+            hops = [(source_language, target_language)]
 
-        return cues
+        # 모델 변형 이름이 잘못되었으면 번역 시작 전에 실패
+        for hop in hops:
+            self._select_variant(hop)
+        return hops
+
+    def _select_variant(self, language_pair: Tuple[str, str]) -> Optional[ModelVariant]:
+        """언어 쌍에 사용할 모델 변형 (model_variant 미지정 또는 미등록 쌍이면 None)
+
+        Raises:
+            ValueError: 등록된 변형 중 model_variant 이름이 없는 경우
+        """
+        if self._model_registry is None or self._model_variant is None:
+            return None
+        if language_pair not in self._variant_choices:
+            self._variant_choices[language_pair] = self._model_registry.select(
+                *language_pair, self._model_variant
+            )
+        return self._variant_choices[language_pair]
+
+    def _translate_hop(
+        self,
+        hop: Tuple[str, str],
+        texts: List[str],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[str]:
+        """번역 경로의 한 단계를 번역
+
+        중간 언어로의 번역 결과는 (원본 언어, 텍스트 목록 해시) 키로 캐시해
+        같은 문서를 다른 목표 언어로 번역할 때 1단계를 다시 하지 않는다.
+
+        Args:
+            hop: (원본, 목표) 언어 코드
+            texts: 번역할 고유 텍스트 리스트
+            progress_callback: 진행 상황 콜백 (중간 언어 단계 안내용)
+        """
+        translator = self._resolve_translation(*hop)
+        if hop[1] != PIVOT_LANGUAGE:
+            return self._translate_texts(translator, texts, language_pair=hop)
+
+        key = (hop[0], _hash_texts(texts))
+        with self._pivot_cache_lock:
+            cached = self._pivot_cache.get(key)
+            if cached is not None:
+                self._pivot_cache.move_to_end(key)
+        if cached is not None:
+            if progress_callback:
+                progress_callback(f"중간 언어 번역 재사용 ({hop[0]} -> {hop[1]})", 30.0)
+            return cached
+
+        if progress_callback:
+            progress_callback(f"중간 언어 번역 중... ({hop[0]} -> {hop[1]})", 30.0)
+        translated = self._translate_texts(translator, texts, language_pair=hop)
+        with self._pivot_cache_lock:
+            self._pivot_cache[key] = translated
+            while len(self._pivot_cache) > _PIVOT_CACHE_DOCUMENTS:
+                self._pivot_cache.popitem(last=False)
+        return translated
+
+    def _redistribute(
+        self,
+        cues: List[dict],
+        groups: List[SentenceGroup],
+        text_indices: List[int],
+        unique_translations: List[str],
+    ) -> List[SubtitleCue]:
+        """고유 텍스트 번역 결과를 원래 큐 순서의 SubtitleCue로 펼침"""
+        texts: List[str] = []
+        for group, text_index in zip(groups, text_indices):
+            texts.extend(
+                redistribute_translation(unique_translations[text_index], group.durations)
+            )
+        return [
+            SubtitleCue(number=cue["number"], timestamp=cue["timestamp"], text=text)
+            for cue, text in zip(cues, texts)
+        ]
+
+    def autotune_threading(
+        self,
+        sample_texts: List[str],
+        source_language: str,
+        target_language: str,
+        cache_path: Path = DEFAULT_AUTOTUNE_CACHE_PATH,
+        candidates: Optional[List[ThreadingConfig]] = None,
+    ) -> ThreadingConfig:
+        """샘플 큐로 스레드/연산 타입 후보를 벤치마크해 가장 빠른 설정을 적용
+
+        결과는 호스트, 엔진 버전, 언어 쌍별로 cache_path에 저장되며,
+        캐시가 있으면 벤치마크 없이 바로 적용한다. 모델 로딩 시간은 측정에서 제외한다.
+
+        Args:
+            sample_texts: 벤치마크용 큐 텍스트 (앞쪽 최대 64개 고유 텍스트 사용)
+            source_language: 원본 언어 코드
+            target_language: 목표 언어 코드 (중간 언어 경유 시 마지막 단계로 측정)
+            cache_path: 튜닝 결과 캐시 파일 경로
+            candidates: 후보 설정 (None이면 코어 수 기준 candidate_configs())
+
+        Returns:
+            적용된 ThreadingConfig
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍, 패키지 번역이 아닌 경우, 샘플이 없는 경우
+        """
+        last_hop = self._plan_hops(source_language, target_language)[-1]
+        translation = self._resolve_translation(*last_hop)
+        if not isinstance(translation, PackageTranslation):
+            raise ValueError(
+                f"Auto-tuning requires an installed package for {last_hop[0]} -> {last_hop[1]}"
+            )
+
+        sample = [text for text in dict.fromkeys(sample_texts) if text.strip()]
+        sample = sample[:DEFAULT_AUTOTUNE_SAMPLE_SIZE]
+        if not sample:
+            raise ValueError("Auto-tuning needs at least one sample text")
+
+        def benchmark(config: ThreadingConfig) -> float:
+            self._threading = config
+            self._get_ctranslate2_translator(translation)
+            start = time.perf_counter()
+            self._translate_model_batch(translation, sample)
+            return len(sample) / max(time.perf_counter() - start, 1e-9)
+
+        original = self._threading
+        try:
+            best = autotune(
+                benchmark,
+                candidates or candidate_configs(),
+                AutotuneCache(cache_path),
+                f"{host_key()}|{_argos_package_version()}|{last_hop[0]}-{last_hop[1]}",
+            )
+        except BaseException:
+            self._threading = original
+            raise
+
+        # 선택되지 않은 설정으로 로딩한 모델은 메모리에서 해제
+        self._threading = best
+        with self._ct2_models_lock:
+            self._ct2_models = {
+                key: model for key, model in self._ct2_models.items() if key[1] == best
+            }
+        self.last_stats = TranslationStats()
+        return best
+
+    def close(self) -> None:
+        """샤드 번역 프로세스 풀 종료 (workers > 1일 때 사용 후 호출)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+            self._pool_language_pair = None
+
+    def _translate_texts(
+        self,
+        translator: object,
+        texts: List[str],
+        progress_callback: Optional[ProgressCallback] = None,
+        language_pair: Optional[Tuple[str, str]] = None,
+    ) -> List[str]:
+        """텍스트 목록 전체를 번역 (_iter_translated_batches 결과를 이어 붙임)
+
+        Returns:
+            입력과 같은 순서의 번역 텍스트 리스트
+        """
+        translated: List[str] = []
+        for batch in self._iter_translated_batches(
+            translator, texts, progress_callback, language_pair
+        ):
+            translated.extend(batch)
+        return translated
+
+    def _iter_translated_batches(
+        self,
+        translator: object,
+        texts: List[str],
+        progress_callback: Optional[ProgressCallback] = None,
+        language_pair: Optional[Tuple[str, str]] = None,
+    ) -> Iterator[List[str]]:
+        """텍스트 목록을 batch_size 단위(길이 버킷팅 시 그 8배)로 번역해 결과를 순서대로 yield
+
+        진행 상황은 배치가 끝날 때마다 30% ~ 90% 구간으로 보고한다.
+        workers > 1이고 language_pair가 주어지면 프로세스 풀로 샤드 번역한다.
+
+        Args:
+            translator: Argos 번역 객체
+            texts: 번역할 텍스트 리스트
+            progress_callback: 진행 상황 콜백
+            language_pair: (원본, 목표) 언어 코드 - 샤드 번역 워커 초기화용
+
+        Yields:
+            배치(또는 샤드)별 번역 텍스트 리스트
+        """
+        if self._uses_shards(language_pair, texts):
+            yield from self._iter_sharded(language_pair, texts, progress_callback)
+            return
+
+        # 길이 버킷팅 시에는 더 넓은 범위를 한 번에 넘겨 길이가 비슷한 입력끼리 묶음
+        window = self._batch_size
+        if self._max_batch_tokens:
+            window *= _BUCKET_WINDOW_BATCHES
+
+        total = len(texts)
+        for start in range(0, total, window):
+            batch = texts[start:start + window]
+            translated = self._translate_batch(translator, batch)
+
+            if progress_callback:
+                done = start + len(batch)
+                percent = 30.0 + (60.0 * done / total)
+                progress_callback(f"번역 중... ({done}/{total})", percent)
+
+            yield translated
+
+    def _iter_sharded(
+        self,
+        language_pair: Tuple[str, str],
+        texts: List[str],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterator[List[str]]:
+        """연속 구간 샤드로 나누어 프로세스 풀에서 번역하고 샤드 순서대로 yield
+
+        진행 상황은 샤드가 (순서대로) 끝날 때마다 30% ~ 90% 구간으로 보고한다.
+        """
+        batch_count = math.ceil(len(texts) / self._batch_size)
+        shards = _split_into_shards(
+            texts, min(self._workers * _SHARDS_PER_WORKER, batch_count)
+        )
+        pool = self._get_pool(language_pair)
+
+        done = 0
+        total = len(texts)
+        for shard_result in pool.map(_translate_shard, shards):
+            done += len(shard_result)
+            if progress_callback:
+                percent = 30.0 + (60.0 * done / total)
+                progress_callback(f"번역 중... ({done}/{total}, 워커 {self._workers}개)", percent)
+            yield shard_result
+
+    def _get_pool(self, language_pair: Tuple[str, str]) -> ProcessPoolExecutor:
+        """언어 쌍에 맞게 초기화된 프로세스 풀 반환 (쌍이 바뀌면 재생성)"""
+        if self._pool is not None and self._pool_language_pair != language_pair:
+            self.close()
+
+        if self._pool is None:
+            variant = self._select_variant(language_pair)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_shard_worker,
+                initargs=(
+                    *language_pair,
+                    self._batch_size,
+                    self._threads_per_worker or default_threads_per_worker(self._workers),
+                    self._max_batch_tokens,
+                    self._protect_markup,
+                    self._threading.compute_type,
+                    self._model_registry.path if self._model_registry else None,
+                    variant.name if variant else None,
+                ),
+            )
+            self._pool_language_pair = language_pair
+        return self._pool
+
+    def _translate_batch(self, translator: object, texts: List[str]) -> List[str]:
+        """한 배치 번역
+
+        protect_markup이 켜져 있으면 마크업을 자리표시자로 바꾼 줄만 모델에 보내고
+        (마크업/숫자/기호뿐인 줄은 생략) 번역 후 원본 마크업을 복원한다.
+        """
+        if not self._protect_markup:
+            return self._translate_model_batch(translator, texts)
+
+        protected = [protect_text(text) for text in texts]
+        model_texts = [
+            line.text for lines in protected for line in lines if line.needs_translation
+        ]
+        self.last_stats.protected_chars += (
+            sum(len(text) for text in texts) - sum(len(text) for text in model_texts)
+        )
+
+        translations = iter(
+            self._translate_model_batch(translator, model_texts) if model_texts else []
+        )
+        return [restore_text(lines, translations) for lines in protected]
+
+    def _translate_model_batch(self, translator: object, texts: List[str]) -> List[str]:
+        """번역 모델로 한 배치 번역
+
+        단일 패키지 번역(PackageTranslation)은 CTranslate2에 배치로 직접 전달하고,
+        그 외(피벗 번역 등)는 큐마다 translator.translate를 호출한다.
+        """
+        if isinstance(translator, PackageTranslation):
+            return self._translate_package_batch(translator, texts)
+        return [translator.translate(text) for text in texts]
+
+    def _translate_package_batch(
+        self, translator: "PackageTranslation", texts: List[str]
+    ) -> List[str]:
+        """PackageTranslation의 CTranslate2 모델로 배치 번역
+
+        Argos와 동일하게 여러 줄 큐는 줄 단위로, 한 줄에 문장이 여럿이면
+        문장 단위로 나눠 번역한 뒤 다시 합친다 (split_sentences, Argos의
+        apply_packaged_translation 문장 분리와 같은 목적).
+        빈 줄은 모델에 보내지 않는다. max_batch_tokens가 지정되면 문장을
+        토큰 길이 순으로 버킷팅해 여러 번 호출하고 원래 순서로 되돌린다.
+        각 호출은 CTranslate2 병렬 번역기(inter_threads) 수만큼 나눠
+        (max_batch_size) 동시에 처리되도록 한다.
+        패딩 통계는 last_stats에 누적한다.
+        """
+        pkg = translator.pkg
+        target_prefix = getattr(pkg, "target_prefix", "") or ""
+
+        lines: List[str] = []
+        line_counts: List[int] = []
+        for text in texts:
+            text_lines = text.split("\n")
+            lines.extend(text_lines)
+            line_counts.append(len(text_lines))
+
+        # 모델 입력 단위: 빈 줄이 아닌 줄의 각 문장 (segment_lines[k]는 문장 k의 줄 위치)
+        segments: List[str] = []
+        segment_lines: List[int] = []
+        for i, line in enumerate(lines):
+            if line.strip():
+                for sentence in split_sentences(line.strip()):
+                    segments.append(sentence)
+                    segment_lines.append(i)
+
+        translated_lines = list(lines)
+        translated_segments: List[str] = [""] * len(segments)
+        if segments:
+            tokenized = [pkg.tokenizer.encode(segment) for segment in segments]
+            lengths = [len(tokens) for tokens in tokenized]
+            if self._max_batch_tokens:
+                buckets = plan_length_buckets(
+                    lengths, self._batch_size, self._max_batch_tokens
+                )
+            else:
+                buckets = [list(range(len(tokenized)))]
+
+            model = self._get_ctranslate2_translator(translator)
+            for bucket in buckets:
+                bucket_tokens = [tokenized[k] for k in bucket]
+                results = model.translate_batch(
+                    bucket_tokens,
+                    target_prefix=(
+                        [[target_prefix]] * len(bucket_tokens) if target_prefix else None
+                    ),
+                    replace_unknowns=True,
+                    max_batch_size=_parallel_batch_size(model, len(bucket_tokens)),
+                    beam_size=_ARGOS_BEAM_SIZE,
+                    num_hypotheses=1,
+                    length_penalty=_ARGOS_LENGTH_PENALTY,
+                )
+                bucket_lengths = [lengths[k] for k in bucket]
+                self.last_stats.real_tokens += sum(bucket_lengths)
+                self.last_stats.padded_tokens += padded_token_count(bucket_lengths)
+
+                for k, result in zip(bucket, results):
+                    decoded = pkg.tokenizer.decode(result.hypotheses[0])
+                    if target_prefix and decoded.startswith(target_prefix):
+                        decoded = decoded[len(target_prefix):]
+                    translated_segments[k] = decoded.strip()
+
+            sentences_by_line: Dict[int, List[str]] = {}
+            for line_index, sentence in zip(segment_lines, translated_segments):
+                sentences_by_line.setdefault(line_index, []).append(sentence)
+            for line_index, sentences in sentences_by_line.items():
+                translated_lines[line_index] = " ".join(sentences)
+
+        translated: List[str] = []
+        offset = 0
+        for count in line_counts:
+            translated.append("\n".join(translated_lines[offset:offset + count]))
+            offset += count
+        return translated
+
+    def _get_ctranslate2_translator(self, translator: "PackageTranslation") -> object:
+        """PackageTranslation의 CTranslate2 Translator 반환
+
+        스레드/연산 타입과 모델 변형을 지정하지 않았으면 Argos가 공유하는
+        Translator를 (미로딩 시 Argos 설정으로) 사용하고, 지정했으면
+        (모델 경로, 설정)별로 따로 로딩한다.
+        """
+        pkg = translator.pkg
+        variant = self._select_variant((pkg.from_code, pkg.to_code))
+        config = self._threading
+        if variant is not None and variant.compute_type:
+            config = replace(config, compute_type=variant.compute_type)
+
+        if variant is None and config.is_default:
+            if translator.translator is None:
+                translator.translator = self._load_ctranslate2_translator(
+                    Path(pkg.package_path) / "model", config
+                )
+            return translator.translator
+
+        model_path = Path(pkg.package_path) / "model"
+        if variant is not None and variant.model_path:
+            model_path = Path(variant.model_path)
+        key = (str(model_path), config)
+        with self._ct2_models_lock:
+            model = self._ct2_models.get(key)
+            if model is None:
+                model = self._load_ctranslate2_translator(model_path, config)
+                self._ct2_models[key] = model
+        return model
+
+    @staticmethod
+    def _load_ctranslate2_translator(model_path: Path, config: ThreadingConfig) -> object:
+        """CTranslate2 Translator 로딩 (설정에서 0/None인 값은 Argos 설정 사용)"""
+        import ctranslate2
+
+        settings = argostranslate.settings
+        return ctranslate2.Translator(
+            str(model_path),
+            device=getattr(settings, "device", "cpu"),
+            inter_threads=config.inter_threads or getattr(settings, "inter_threads", 1),
+            intra_threads=config.intra_threads or getattr(settings, "intra_threads", 0),
+            compute_type=config.compute_type or getattr(settings, "compute_type", "default"),
+        )
+
+    def _parse_srt_cues(self, srt_text: str) -> List[dict]:
+        """SRT 텍스트를 큐 단위로 파싱 (srt_cues.parse_srt_cues 위임)
+
+        Args:
+            srt_text: SRT 형식 텍스트
+
+        Returns:
+            큐 리스트 [{"number": str, "timestamp": str, "text": str}, ...]
+        """
+        return parse_srt_cues(srt_text)
 
     def _reassemble_srt(self, cues: List[dict]) -> str:
-        """큐 리스트를 SRT 형식으로 재조립
+        """큐 리스트를 SRT 형식으로 재조립 (srt_cues.reassemble_srt 위임)
 
         Args:
             cues: 큐 리스트
@@ -236,9 +1274,95 @@ class ArgosTranslatorAdapter(SubtitleTranslatorPort):
         Returns:
             SRT 형식 텍스트
         """
-        srt_blocks = []
-        for cue in cues:
-            block = f"{cue['number']}\n{cue['timestamp']}\n{cue['text']}"
-            srt_blocks.append(block)
+        return reassemble_srt(cues)
+
+
+def _argos_package_version() -> str:
+    """설치된 argostranslate 버전 표시 (예: "argostranslate-1.9.6")"""
+    try:
+        version = importlib.metadata.version("argostranslate")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    return f"argostranslate-{version}"
+
+
+def _hash_texts(texts: List[str]) -> str:
+    """텍스트 목록의 SHA-256 해시 (중간 언어 캐시 키)"""
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _split_into_shards(texts: List[str], shard_count: int) -> List[List[str]]:
+    """텍스트 목록을 크기가 고른 연속 구간 shard_count개로 분할"""
+    shard_count = max(1, min(shard_count, len(texts)))
+    base, extra = divmod(len(texts), shard_count)
+    shards = []
+    start = 0
+    for i in range(shard_count):
+        end = start + base + (1 if i < extra else 0)
+        shards.append(texts[start:end])
+        start = end
+    return shards
+
+
+def _parallel_batch_size(model: object, count: int) -> int:
+    """count개 입력이 CTranslate2 병렬 번역기 수(inter_threads)만큼 나뉘는 max_batch_size
+
+    한 번에 한 배치만 넘기면 번역기 하나만 일하므로 inter_threads > 1이 효과가 없다.
+    """
+    translators = getattr(model, "num_translators", None)
+    if not isinstance(translators, int) or translators < 1:
+        translators = 1
+    return max(1, math.ceil(count / translators))
+
+
+# 샤드 번역 워커 프로세스 전역 상태 (워커 수명 동안 모델 1회 로딩)
+_worker_adapter: Optional[ArgosTranslatorAdapter] = None
+_worker_translation: Optional[object] = None
+
+
+def _init_shard_worker(
+    source_language: str,
+    target_language: str,
+    batch_size: int,
+    threads_per_worker: int,
+    max_batch_tokens: int = 0,
+    protect_markup: bool = False,
+    compute_type: Optional[str] = None,
+    model_registry_path: Optional[Path] = None,
+    model_variant: Optional[str] = None,
+) -> None:
+    """샤드 번역 워커 초기화: 스레드 수 설정 후 번역 객체 조회
+
+    모델 변형은 부모 프로세스가 고른 이름으로 전달받아 같은 변형을 사용한다.
+    """
+    global _worker_adapter, _worker_translation
+
+    if threads_per_worker > 0:
+        # CTranslate2 로딩 전에 적용되어야 하므로 Argos 설정을 직접 변경
+        argostranslate.settings.inter_threads = 1
+        argostranslate.settings.intra_threads = threads_per_worker
+
+    _worker_adapter = ArgosTranslatorAdapter(
+        batch_size=batch_size,
+        max_batch_tokens=max_batch_tokens,
+        protect_markup=protect_markup,
+        compute_type=compute_type,
+        model_registry=ModelRegistry(model_registry_path) if model_registry_path else None,
+        model_variant=model_variant,
+    )
+    _worker_translation = _worker_adapter._resolve_translation(
+        source_language, target_language
+    )
+    if _worker_translation is None:
+        raise RuntimeError(
+            f"Failed to get translator for {source_language} -> {target_language}"
+        )
+
 
-        return "\n\n".join(srt_blocks) + "\n"
+def _translate_shard(texts: List[str]) -> List[str]:
+    """워커 프로세스에서 샤드 하나를 배치 번역"""
+    return _worker_adapter._translate_texts(_worker_translation, texts)
@@ -0,0 +1,312 @@
+"""Async Translators - AsyncSubtitleTranslatorPort 구현체."""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import List, Optional
+from urllib.parse import urlencode, urlparse
+
+from src.application.ports.async_subtitle_translator import AsyncSubtitleTranslatorPort
+from src.application.ports.subtitle_translator import (
+    ProgressCallback,
+    SubtitleTranslatorPort,
+)
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, format_srt, parse_srt
+from src.infrastructure.translators.daemon_client import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_TIMEOUT_SECONDS,
+)
+from src.infrastructure.translators.srt_cues import load_subtitle_text
+from src.infrastructure.translators.translation_daemon import DEFAULT_DAEMON_URL
+
+# 동시에 번역할 최대 자막 수 (thread_safe가 아닌 번역기는 1만 허용)
+DEFAULT_MAX_CONCURRENCY = 1
+
+
+class ExecutorTranslatorAdapter(AsyncSubtitleTranslatorPort):
+    """동기 SubtitleTranslatorPort를 executor에서 실행하는 비동기 어댑터
+
+    - 동시 번역 수는 세마포어로 max_concurrency개로 제한한다.
+      ArgosTranslatorAdapter처럼 호출 간 상태(last_stats, 모델 변형 선택, 프로세스 풀,
+      번역 캐시)를 잠금 없이 공유하는 번역기는 thread_safe가 False이므로 1개씩만 실행한다.
+      동시에 번역하려면 DaemonTranslatorClient처럼 thread_safe인 번역기를 쓴다.
+    - Task가 취소되면 취소 이벤트를 세우고, 작업 스레드는 translate_stream의
+      다음 큐(Argos는 다음 배치) 경계에서 번역을 멈춘다.
+    """
+
+    def __init__(
+        self,
+        translator: SubtitleTranslatorPort,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Args:
+            translator: 실제 번역을 수행할 동기 포트 구현체 (예: ArgosTranslatorAdapter)
+            max_concurrency: 동시에 번역할 최대 자막 수 (thread_safe가 아닌 번역기는 1)
+            executor: 작업 실행기 (None이면 max_concurrency 크기의 스레드 풀 생성)
+
+        Raises:
+            ValueError: max_concurrency가 1 미만이거나, thread_safe가 아닌 번역기에 1보다 큰 경우
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_concurrency > 1 and not getattr(translator, "thread_safe", False):
+            raise ValueError(
+                f"{type(translator).__name__} is not thread-safe; "
+                "use max_concurrency=1 or a thread-safe translator such as DaemonTranslatorClient"
+            )
+
+        self._translator = translator
+        self._max_concurrency = max_concurrency
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="translation"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def translate_async(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Subtitle:
+        """executor에서 번역하고 결과를 기다림 (이벤트 루프는 막지 않음)
+
+        Raises:
+            ValueError: 지원하지 않는 언어 또는 자막 형식
+            RuntimeError: 번역 엔진 오류
+            asyncio.CancelledError: 작업이 취소된 경우
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        # 진행 상황 콜백은 이벤트 루프 스레드에서 호출되도록 전달
+        thread_callback = None
+        if progress_callback:
+            def thread_callback(message: str, percent: float) -> None:
+                loop.call_soon_threadsafe(progress_callback, message, percent)
+
+        async with self._semaphore:
+            cancel_event = threading.Event()
+            future = asyncio.wrap_future(self._executor.submit(
+                self._translate_until_cancelled,
+                subtitle,
+                target_language,
+                thread_callback,
+                cancel_event,
+            ))
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                cancel_event.set()
+                # 작업 스레드가 진행 중인 배치를 마치고 멈출 때까지 기다린 뒤 슬롯 반환
+                await asyncio.wait({future})
+                raise
+
+    async def list_supported_languages_async(self) -> List[str]:
+        """내부 번역기의 지원 언어 목록"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._translator.list_supported_languages
+        )
+
+    async def is_language_pair_supported_async(
+        self, source_language: str, target_language: str
+    ) -> bool:
+        """내부 번역기의 언어 쌍 지원 여부"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            self._translator.is_language_pair_supported,
+            source_language,
+            target_language,
+        )
+
+    def close(self) -> None:
+        """직접 만든 스레드 풀 종료"""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    def _translate_until_cancelled(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback],
+        cancel_event: threading.Event,
+    ) -> Optional[Subtitle]:
+        """작업 스레드에서 스트림 번역 (취소 이벤트가 서면 None 반환)"""
+        translated_cues: List[SubtitleCue] = []
+        for cue in self._translator.translate_stream(
+            subtitle, target_language, progress_callback
+        ):
+            if cancel_event.is_set():
+                return None
+            translated_cues.append(cue)
+
+        if progress_callback:
+            progress_callback("번역 완료!", 100.0)
+        return subtitle.with_translation(format_srt(translated_cues), target_language)
+
+
+class AsyncDaemonTranslatorClient(AsyncSubtitleTranslatorPort):
+    """번역 데몬의 네이티브 asyncio HTTP 클라이언트
+
+    스레드 없이 asyncio 스트림으로 HTTP/1.1 요청을 보내므로,
+    하나의 이벤트 루프에서 여러 자막의 번역을 동시에 진행할 수 있다.
+    한 자막의 청크 요청도 동시에 보내 데몬이 함께 배치 처리하게 한다.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_DAEMON_URL,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> None:
+        """
+        Args:
+            base_url: 데몬 URL (예: "http://127.0.0.1:8765")
+            chunk_size: 요청당 큐 수
+            timeout: 요청 타임아웃(초)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        url = urlparse(base_url)
+        if url.scheme != "http" or not url.hostname:
+            raise ValueError(f"Unsupported daemon URL: {base_url}")
+
+        self._host = url.hostname
+        self._port = url.port or 80
+        self._chunk_size = chunk_size
+        self._timeout = timeout
+
+    async def translate_async(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Subtitle:
+        """큐를 chunk_size개씩 나눠 동시에 요청하고 결과를 원래 순서로 조립
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍 또는 자막 형식
+            RuntimeError: 데몬 연결/번역 오류
+        """
+        if progress_callback:
+            progress_callback("번역 데몬에 요청 중...", 0.0)
+
+        cues = parse_srt(load_subtitle_text(subtitle))
+        if not cues:
+            raise ValueError("No valid subtitle cues found after parsing")
+
+        chunks = [
+            cues[start:start + self._chunk_size]
+            for start in range(0, len(cues), self._chunk_size)
+        ]
+        done = 0
+
+        async def translate_chunk(chunk: List[SubtitleCue]) -> List[str]:
+            nonlocal done
+            translations = (await self._request("POST", "/translate", {
+                "source_language": subtitle.language,
+                "target_language": target_language,
+                "texts": [cue.text for cue in chunk],
+            }))["translations"]
+            if len(translations) != len(chunk):
+                raise RuntimeError(
+                    f"Daemon returned {len(translations)} translations for "
+                    f"{len(chunk)} requested cues"
+                )
+            done += len(chunk)
+            if progress_callback:
+                progress_callback(
+                    f"번역 중... ({done}/{len(cues)})", 10.0 + 80.0 * done / len(cues)
+                )
+            return translations
+
+        results = await asyncio.gather(*(translate_chunk(chunk) for chunk in chunks))
+
+        translated_cues = [
+            SubtitleCue(number=cue.number, timestamp=cue.timestamp, text=text)
+            for chunk, translations in zip(chunks, results)
+            for cue, text in zip(chunk, translations)
+        ]
+        if progress_callback:
+            progress_callback("번역 완료!", 100.0)
+        return subtitle.with_translation(format_srt(translated_cues), target_language)
+
+    async def engine_version_for_async(
+        self, source_language: str, target_language: str
+    ) -> str:
+        """데몬 엔진의 언어 쌍별 버전 (동기 클라이언트/직접 사용과 같은 캐시 키)"""
+        query = urlencode({"source": source_language, "target": target_language})
+        return (await self._request("GET", f"/health?{query}"))["engine_version"]
+
+    async def list_supported_languages_async(self) -> List[str]:
+        """데몬 엔진의 지원 언어 목록"""
+        return (await self._request("GET", "/languages"))["languages"]
+
+    async def is_language_pair_supported_async(
+        self, source_language: str, target_language: str
+    ) -> bool:
+        """데몬 엔진의 언어 쌍 지원 여부"""
+        query = urlencode({"source": source_language, "target": target_language})
+        return (await self._request("GET", f"/supports?{query}"))["supported"]
+
+    async def _request(
+        self, method: str, path: str, payload: Optional[dict] = None
+    ) -> dict:
+        """JSON 요청/응답 (요청마다 새 연결, Connection: close)
+
+        Raises:
+            ValueError: 데몬이 400을 반환한 경우
+            RuntimeError: 그 외 HTTP 오류 또는 타임아웃
+            OSError: 연결 실패
+        """
+        try:
+            return await asyncio.wait_for(
+                self._send(method, path, payload), timeout=self._timeout
+            )
+        except asyncio.TimeoutError as e:
+            raise RuntimeError(
+                f"Translation daemon did not respond within {self._timeout}s"
+            ) from e
+
+    async def _send(self, method: str, path: str, payload: Optional[dict]) -> dict:
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        reader, writer = await asyncio.open_connection(self._host, self._port)
+        try:
+            head = (
+                f"{method} {path} HTTP/1.1\r\n"
+                f"Host: {self._host}:{self._port}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            )
+            writer.write(head.encode("ascii") + body)
+            await writer.drain()
+            response = await reader.read()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+        header_bytes, _, response_body = response.partition(b"\r\n\r\n")
+        status_line = header_bytes.split(b"\r\n", 1)[0].decode("ascii", "replace")
+        try:
+            status = int(status_line.split(" ")[1])
+            data = json.loads(response_body.decode("utf-8"))
+        except (IndexError, ValueError) as e:
+            raise RuntimeError(f"Invalid response from translation daemon: {status_line}") from e
+
+        if status == 400:
+            raise ValueError(data.get("error", "Bad request"))
+        if status != 200:
+            raise RuntimeError(
+                f"Translation daemon error ({status}): {data.get('error', status_line)}"
+            )
+        return data
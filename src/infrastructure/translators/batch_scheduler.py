@@ -0,0 +1,40 @@
+"""Batch Scheduler - 토큰 길이가 비슷한 입력끼리 묶어 패딩 낭비를 줄이는 배치 계획."""
+from __future__ import annotations
+
+from typing import List, Sequence
+
+
+def plan_length_buckets(
+    lengths: Sequence[int], max_batch_size: int, max_batch_tokens: int
+) -> List[List[int]]:
+    """입력을 토큰 길이 순으로 정렬해 토큰 예산 안에서 배치로 묶음
+
+    배치의 패딩 포함 토큰 수(배치 크기 × 최장 길이)가 max_batch_tokens를
+    넘지 않도록 채운다. 혼자서 예산을 넘는 입력은 단독 배치가 된다.
+
+    Args:
+        lengths: 입력별 토큰 수
+        max_batch_size: 배치당 최대 입력 수
+        max_batch_tokens: 배치당 패딩 포함 최대 토큰 수
+
+    Returns:
+        배치별 입력 인덱스 리스트 (짧은 입력의 배치부터)
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    batches: List[List[int]] = []
+    current: List[int] = []
+    for index in order:
+        # 오름차순이므로 새 입력의 길이가 곧 배치의 최장 길이
+        padded = (len(current) + 1) * max(lengths[index], 1)
+        if current and (len(current) >= max_batch_size or padded > max_batch_tokens):
+            batches.append(current)
+            current = []
+        current.append(index)
+    if current:
+        batches.append(current)
+    return batches
+
+
+def padded_token_count(lengths: Sequence[int]) -> int:
+    """한 배치로 번역할 때의 패딩 포함 토큰 수"""
+    return len(lengths) * max(lengths, default=0)
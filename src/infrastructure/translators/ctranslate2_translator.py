@@ -0,0 +1,365 @@
+"""CTranslate2TranslatorAdapter - CTranslate2 변환 NLLB/MarianMT 모델 기반 자막 번역 어댑터."""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.application.ports.subtitle_translator import (
+    ProgressCallback,
+    SubtitleTranslatorPort,
+)
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, format_srt
+from src.infrastructure.translators.srt_cues import (
+    deduplicate_texts,
+    load_subtitle_text,
+    parse_srt_cues,
+)
+
+MODEL_FAMILIES = ("nllb", "marian")
+
+# 한 번의 translate_batch 호출로 보내는 최대 줄 수 (스트리밍/진행 상황 단위)
+DEFAULT_BATCH_SIZE = 64
+# 배치당 최대 토큰 수 (CTranslate2 batch_type="tokens"로 내부 분할)
+DEFAULT_MAX_BATCH_TOKENS = 2048
+DEFAULT_BEAM_SIZE = 4
+
+# ISO 639-1 -> NLLB-200 언어 코드 (NLLB 코드를 직접 넘겨도 됨)
+NLLB_LANGUAGE_CODES: Dict[str, str] = {
+    "ar": "arb_Arab",
+    "de": "deu_Latn",
+    "en": "eng_Latn",
+    "es": "spa_Latn",
+    "fr": "fra_Latn",
+    "hi": "hin_Deva",
+    "id": "ind_Latn",
+    "it": "ita_Latn",
+    "ja": "jpn_Jpan",
+    "ko": "kor_Hang",
+    "pt": "por_Latn",
+    "ru": "rus_Cyrl",
+    "th": "tha_Thai",
+    "vi": "vie_Latn",
+    "zh": "zho_Hans",
+}
+
+# CTranslate2 변환 시 함께 복사되는 SentencePiece 모델 파일 이름
+_NLLB_TOKENIZER = "sentencepiece.bpe.model"
+_MARIAN_SOURCE_TOKENIZER = "source.spm"
+_MARIAN_TARGET_TOKENIZER = "target.spm"
+_EOS_TOKEN = "</s>"
+
+
+class CTranslate2TranslatorAdapter(SubtitleTranslatorPort):
+    """CTranslate2로 변환한 seq2seq 모델(NLLB-200, MarianMT) 어댑터
+
+    - NLLB: 하나의 다국어 모델, 원본 언어 토큰 + 목표 언어 prefix로 방향 지정
+    - MarianMT: 언어 쌍별 모델 (language_pair로 지원 쌍 지정)
+
+    큐는 줄 단위로 SentencePiece 토큰화한 뒤 batch_size줄씩 translate_batch에
+    넘기고, CTranslate2가 max_batch_tokens 기준으로 내부 배치를 나눈다.
+    모델은 첫 번역 시 로딩한다.
+    """
+
+    def __init__(
+        self,
+        model_dir: Path,
+        model_family: str = "nllb",
+        language_pair: Optional[Tuple[str, str]] = None,
+        source_tokenizer: Optional[Path] = None,
+        target_tokenizer: Optional[Path] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS,
+        beam_size: int = DEFAULT_BEAM_SIZE,
+        device: str = "cpu",
+        compute_type: str = "default",
+        inter_threads: int = 1,
+        intra_threads: int = 0,
+        language_codes: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Args:
+            model_dir: CTranslate2 모델 디렉터리 (ct2-transformers-converter 출력)
+            model_family: "nllb" 또는 "marian"
+            language_pair: MarianMT 모델의 (원본, 목표) 언어 코드 (marian 필수)
+            source_tokenizer: 원본 SentencePiece 모델 (기본값: model_dir 안의 기본 파일)
+            target_tokenizer: 목표 SentencePiece 모델 (NLLB는 원본과 공유)
+            batch_size: 한 번의 translate_batch 호출로 번역할 줄 수
+            max_batch_tokens: CTranslate2 내부 배치당 최대 토큰 수
+            beam_size: 빔 크기 (1이면 greedy)
+            device: "cpu" 또는 "cuda"
+            compute_type: CTranslate2 연산 타입 (예: "int8")
+            inter_threads: 병렬 배치 수
+            intra_threads: 배치당 연산 스레드 수 (0이면 자동)
+            language_codes: NLLB 언어 코드 표 (None이면 NLLB_LANGUAGE_CODES)
+        """
+        if model_family not in MODEL_FAMILIES:
+            raise ValueError(f"Unsupported model family: {model_family}")
+        if model_family == "marian" and language_pair is None:
+            raise ValueError("language_pair is required for MarianMT models")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_batch_tokens < 1:
+            raise ValueError("max_batch_tokens must be at least 1")
+        if beam_size < 1:
+            raise ValueError("beam_size must be at least 1")
+
+        self._model_dir = Path(model_dir)
+        self._model_family = model_family
+        self._language_pair = language_pair
+        if model_family == "nllb":
+            self._source_tokenizer_path = Path(source_tokenizer or self._model_dir / _NLLB_TOKENIZER)
+            self._target_tokenizer_path = Path(target_tokenizer or self._source_tokenizer_path)
+        else:
+            self._source_tokenizer_path = Path(
+                source_tokenizer or self._model_dir / _MARIAN_SOURCE_TOKENIZER
+            )
+            self._target_tokenizer_path = Path(
+                target_tokenizer or self._model_dir / _MARIAN_TARGET_TOKENIZER
+            )
+        self._batch_size = batch_size
+        self._max_batch_tokens = max_batch_tokens
+        self._beam_size = beam_size
+        self._device = device
+        self._compute_type = compute_type
+        self._inter_threads = inter_threads
+        self._intra_threads = intra_threads
+        self._language_codes = dict(NLLB_LANGUAGE_CODES if language_codes is None else language_codes)
+
+        self._translator: Optional[object] = None
+        self._source_sp: Optional[object] = None
+        self._target_sp: Optional[object] = None
+        self._load_lock = threading.Lock()
+
+    @property
+    def engine_version(self) -> str:
+        """번역 메모리 캐시 키에 쓰이는 엔진 버전 문자열
+
+        연산 타입("default"는 장치에 따라 달라짐)과 빔 크기도 번역 결과를 바꾸므로 포함한다.
+        """
+        return (
+            f"ctranslate2-{self._model_family}-{self._model_dir.name}"
+            f"/{self._device}-{self._compute_type}/beam-{self._beam_size}"
+        )
+
+    def translate(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Subtitle:
+        """자막을 대상 언어로 번역
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍 또는 빈 자막
+            RuntimeError: 번역 엔진 오류
+        """
+        translated_cues = list(
+            self.translate_stream(subtitle, target_language, progress_callback)
+        )
+        if progress_callback:
+            progress_callback("번역 완료, 재조립 중...", 90.0)
+            progress_callback("번역 완료!", 100.0)
+        return subtitle.with_translation(format_srt(translated_cues), target_language)
+
+    def translate_stream(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterator[SubtitleCue]:
+        """번역된 큐를 배치가 끝날 때마다 원본 순서대로 yield
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍 또는 빈 자막
+            RuntimeError: 번역 엔진 오류
+        """
+        if progress_callback:
+            progress_callback("번역 준비 중...", 0.0)
+
+        subtitle_text = load_subtitle_text(subtitle)
+        self._check_language_pair(subtitle.language, target_language)
+        self._load_model()
+
+        if progress_callback:
+            progress_callback("번역 모델 준비 완료", 10.0)
+            progress_callback("자막 파싱 중...", 20.0)
+
+        cues = parse_srt_cues(subtitle_text)
+        if not cues:
+            raise ValueError("No valid subtitle cues found after parsing")
+
+        unique_texts, text_indices = deduplicate_texts([cue["text"] for cue in cues])
+        unique_translations: List[str] = []
+        next_cue = 0
+        for start in range(0, len(unique_texts), self._batch_size):
+            batch = unique_texts[start:start + self._batch_size]
+            unique_translations.extend(
+                self._translate_batch(batch, subtitle.language, target_language)
+            )
+            if progress_callback:
+                done = len(unique_translations)
+                progress_callback(
+                    f"번역 중... ({done}/{len(unique_texts)})",
+                    30.0 + 60.0 * done / len(unique_texts),
+                )
+
+            # 번역이 끝난 고유 텍스트까지의 큐를 순서대로 내보냄
+            while next_cue < len(cues) and text_indices[next_cue] < len(unique_translations):
+                cue = cues[next_cue]
+                yield SubtitleCue(
+                    number=cue["number"],
+                    timestamp=cue["timestamp"],
+                    text=unique_translations[text_indices[next_cue]],
+                )
+                next_cue += 1
+
+    def translate_texts(
+        self, texts: List[str], source_language: str, target_language: str
+    ) -> List[str]:
+        """SRT 없이 큐 텍스트 목록만 번역 (번역 데몬 등에서 사용)
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍
+        """
+        self._check_language_pair(source_language, target_language)
+        self._load_model()
+
+        unique_texts, text_indices = deduplicate_texts(texts)
+        translated: List[str] = []
+        for start in range(0, len(unique_texts), self._batch_size):
+            translated.extend(self._translate_batch(
+                unique_texts[start:start + self._batch_size], source_language, target_language
+            ))
+        return [translated[i] for i in text_indices]
+
+    def list_supported_languages(self) -> List[str]:
+        """지원 언어 목록 (NLLB는 언어 코드 표, MarianMT는 모델의 언어 쌍)"""
+        if self._model_family == "marian":
+            return sorted(set(self._language_pair))
+        return sorted(self._language_codes)
+
+    def is_language_pair_supported(
+        self, source_language: str, target_language: str
+    ) -> bool:
+        """언어 쌍 지원 여부"""
+        if self._model_family == "marian":
+            return (source_language, target_language) == tuple(self._language_pair)
+        return (
+            source_language != target_language
+            and self._nllb_code(source_language) is not None
+            and self._nllb_code(target_language) is not None
+        )
+
+    def _check_language_pair(self, source_language: str, target_language: str) -> None:
+        if not self.is_language_pair_supported(source_language, target_language):
+            raise ValueError(
+                f"Translation from {source_language} to {target_language} is not supported "
+                f"by the {self._model_family} model in {self._model_dir}"
+            )
+
+    def _nllb_code(self, language: str) -> Optional[str]:
+        """ISO 639-1 코드를 NLLB 코드로 변환 (NLLB 형식 "kor_Hang"은 그대로)"""
+        if "_" in language:
+            return language
+        return self._language_codes.get(language)
+
+    def _load_model(self) -> None:
+        """CTranslate2 Translator와 SentencePiece 토크나이저 로딩 (최초 1회)
+
+        Raises:
+            ImportError: ctranslate2/sentencepiece 미설치
+            RuntimeError: 모델 또는 토크나이저 로딩 실패
+        """
+        with self._load_lock:
+            if self._translator is not None:
+                return
+            try:
+                import ctranslate2
+                import sentencepiece
+            except ImportError as exc:
+                raise ImportError(
+                    "ctranslate2 and sentencepiece packages are required. "
+                    "Install via: pip install ctranslate2 sentencepiece"
+                ) from exc
+
+            try:
+                source_sp = sentencepiece.SentencePieceProcessor(
+                    model_file=str(self._source_tokenizer_path)
+                )
+                target_sp = source_sp
+                if self._target_tokenizer_path != self._source_tokenizer_path:
+                    target_sp = sentencepiece.SentencePieceProcessor(
+                        model_file=str(self._target_tokenizer_path)
+                    )
+                translator = ctranslate2.Translator(
+                    str(self._model_dir),
+                    device=self._device,
+                    compute_type=self._compute_type,
+                    inter_threads=self._inter_threads,
+                    intra_threads=self._intra_threads,
+                )
+            except (OSError, RuntimeError, ValueError) as e:
+                raise RuntimeError(f"Failed to load model from {self._model_dir}: {e}") from e
+
+            self._source_sp = source_sp
+            self._target_sp = target_sp
+            self._translator = translator
+
+    def _translate_batch(
+        self, texts: List[str], source_language: str, target_language: str
+    ) -> List[str]:
+        """한 배치 번역
+
+        여러 줄 큐는 줄 단위로 번역한 뒤 다시 합치고, 빈 줄은 모델에 보내지 않는다.
+        """
+        lines: List[str] = []
+        line_counts: List[int] = []
+        for text in texts:
+            text_lines = text.split("\n")
+            lines.extend(text_lines)
+            line_counts.append(len(text_lines))
+
+        line_indices = [i for i, line in enumerate(lines) if line.strip()]
+        translated_lines = list(lines)
+        if line_indices:
+            sources, target_prefix = self._encode(
+                [lines[i] for i in line_indices], source_language, target_language
+            )
+            results = self._translator.translate_batch(
+                sources,
+                target_prefix=target_prefix,
+                beam_size=self._beam_size,
+                num_hypotheses=1,
+                max_batch_size=self._max_batch_tokens,
+                batch_type="tokens",
+            )
+            for i, result in zip(line_indices, results):
+                translated_lines[i] = self._decode(result.hypotheses[0], target_language)
+
+        translated: List[str] = []
+        position = 0
+        for count in line_counts:
+            translated.append("\n".join(translated_lines[position:position + count]))
+            position += count
+        return translated
+
+    def _encode(
+        self, lines: List[str], source_language: str, target_language: str
+    ) -> Tuple[List[List[str]], Optional[List[List[str]]]]:
+        """줄 목록을 모델 입력 토큰과 목표 언어 prefix로 변환"""
+        tokenized = self._source_sp.encode(lines, out_type=str)
+        if self._model_family == "marian":
+            return [tokens + [_EOS_TOKEN] for tokens in tokenized], None
+
+        source_code = self._nllb_code(source_language)
+        target_code = self._nllb_code(target_language)
+        sources = [[source_code] + tokens + [_EOS_TOKEN] for tokens in tokenized]
+        return sources, [[target_code]] * len(sources)
+
+    def _decode(self, tokens: List[str], target_language: str) -> str:
+        """출력 토큰을 텍스트로 변환 (NLLB 목표 언어 토큰 제거)"""
+        if self._model_family == "nllb" and tokens and tokens[0] == self._nllb_code(target_language):
+            tokens = tokens[1:]
+        return self._target_sp.decode(tokens).strip()
@@ -0,0 +1,117 @@
+"""Cue Classifier - 번역 모델이 필요 없는 큐(효과음 태그, 음표, 숫자, 기호)를 규칙으로 판별."""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+
+# 목표 언어별 효과음 태그 변환표 (rules.md 6. 비언어 표현)
+DEFAULT_SOUND_TAGS: Dict[str, Dict[str, str]] = {
+    "ko": {
+        "music": "[음악]",
+        "music playing": "[음악]",
+        "applause": "[박수]",
+        "applauding": "[박수]",
+        "clapping": "[박수]",
+        "laughter": "[웃음]",
+        "laughs": "[웃음]",
+        "laughing": "[웃음]",
+        "chuckles": "[웃음]",
+        "sighs": "[한숨]",
+        "sigh": "[한숨]",
+        "silence": "[침묵]",
+        "inaudible": "[불명확]",
+        "indistinct": "[불명확]",
+    },
+}
+
+# 줄 전체가 하나의 효과음 태그: "[Music]", "(laughs)", "♪ [Music] ♪", "- [Applause]"
+_SOUND_TAG_RE = re.compile(
+    r"^(?P<before>[♪♫\s-]*)[\[(]\s*(?P<tag>[^\[\]()]+?)\s*[\])](?P<after>[♪♫\s]*)$"
+)
+_LETTER_RE = re.compile(r"[^\W\d_]")
+_SPACES_RE = re.compile(r"\s+")
+
+
+class FastPathClassifier:
+    """번역 모델을 거치지 않아도 되는 큐 판별기
+
+    - 글자가 없는 줄(음표, 숫자, 문장 부호, 빈 줄)은 그대로 통과
+    - 효과음 태그만 있는 줄은 변환표에 있으면 바로 변환 (없으면 모델로 번역)
+    """
+
+    def __init__(
+        self, sound_tags: Optional[Mapping[str, Mapping[str, str]]] = None
+    ) -> None:
+        """
+        Args:
+            sound_tags: {목표 언어: {태그: 변환 결과}} (None이면 DEFAULT_SOUND_TAGS)
+                - 태그는 대소문자/공백을 구분하지 않음 (예: "Music", "music playing")
+        """
+        table = DEFAULT_SOUND_TAGS if sound_tags is None else sound_tags
+        self._sound_tags = {
+            language: {_normalize_tag(tag): text for tag, text in tags.items()}
+            for language, tags in table.items()
+        }
+
+    @property
+    def table_digest(self) -> str:
+        """정규화한 효과음 태그 변환표의 짧은 해시 (캐시 키용, 표가 같으면 같은 값)"""
+        encoded = json.dumps(self._sound_tags, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:12]
+
+    def classify(self, text: str, target_language: str) -> Optional[str]:
+        """큐 텍스트의 빠른 경로 결과
+
+        여러 줄 큐는 모든 줄이 빠른 경로 대상일 때만 변환한다.
+
+        Args:
+            text: 큐 텍스트
+            target_language: 목표 언어 코드
+
+        Returns:
+            변환(또는 그대로 통과)된 텍스트, 모델 번역이 필요하면 None
+        """
+        tags = self._sound_tags.get(target_language, {})
+        lines = []
+        for line in text.split("\n"):
+            if _LETTER_RE.search(line) is None:
+                lines.append(line)
+                continue
+
+            match = _SOUND_TAG_RE.match(line)
+            if match is None:
+                return None
+            mapped = tags.get(_normalize_tag(match.group("tag")))
+            if mapped is None:
+                return None
+            lines.append(f"{match.group('before')}{mapped}{match.group('after')}")
+        return "\n".join(lines)
+
+
+def load_sound_tags(path: Path) -> Dict[str, Dict[str, str]]:
+    """JSON 파일에서 효과음 태그 변환표 로드
+
+    기본 변환표에 파일 내용을 언어별로 덮어쓴다.
+    형식: {"ko": {"music": "[음악]", "door slams": "[문 닫히는 소리]"}}
+
+    Raises:
+        FileNotFoundError: 파일이 없을 경우
+        ValueError: 형식이 잘못된 경우
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or not all(
+        isinstance(tags, dict) for tags in data.values()
+    ):
+        raise ValueError(f"Invalid sound tag table: {path}")
+
+    table = {language: dict(tags) for language, tags in DEFAULT_SOUND_TAGS.items()}
+    for language, tags in data.items():
+        table.setdefault(language, {}).update(tags)
+    return table
+
+
+def _normalize_tag(tag: str) -> str:
+    return _SPACES_RE.sub(" ", tag.strip().lower())
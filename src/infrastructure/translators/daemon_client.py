@@ -0,0 +1,193 @@
+"""Daemon Client - TranslationDaemon에 번역을 위임하는 SubtitleTranslatorPort 구현체."""
+from __future__ import annotations
+
+import json
+import urllib.error
+import urllib.request
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from src.application.ports.subtitle_translator import (
+    ProgressCallback,
+    SubtitleTranslatorPort,
+)
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, format_srt, parse_srt
+from src.infrastructure.translators.srt_cues import load_subtitle_text
+from src.infrastructure.translators.translation_daemon import DEFAULT_DAEMON_URL
+
+# 한 번의 HTTP 요청으로 보낼 큐 수 (요청마다 스트림으로 yield)
+DEFAULT_CHUNK_SIZE = 128
+DEFAULT_TIMEOUT_SECONDS = 600.0
+# 데몬 실행 여부 확인용 짧은 타임아웃
+_PROBE_TIMEOUT_SECONDS = 0.5
+
+
+class DaemonTranslatorClient(SubtitleTranslatorPort):
+    """로컬 번역 데몬(scripts/translation_daemon.py)의 HTTP 클라이언트
+
+    모델이 데몬에 상주하므로 호출마다 모델을 다시 로드하지 않는다.
+    요청마다 연결을 따로 열고 동시 요청은 데몬이 모아 처리하므로 여러 스레드에서 써도 된다.
+    """
+
+    thread_safe = True
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_DAEMON_URL,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> None:
+        """
+        Args:
+            base_url: 데몬 URL (예: "http://127.0.0.1:8765")
+            chunk_size: 요청당 큐 수
+            timeout: 요청 타임아웃(초)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self._base_url = base_url.rstrip("/")
+        self._chunk_size = chunk_size
+        self._timeout = timeout
+        self._engine_version: Optional[str] = None
+        self._pair_versions: Dict[Tuple[str, str], str] = {}
+
+    @classmethod
+    def connect(cls, base_url: str = DEFAULT_DAEMON_URL, **kwargs) -> Optional["DaemonTranslatorClient"]:
+        """데몬이 실행 중이면 클라이언트를, 아니면 None 반환
+
+        Args:
+            base_url: 데몬 URL
+            **kwargs: DaemonTranslatorClient 생성자 인자
+        """
+        client = cls(base_url, **kwargs)
+        try:
+            client._engine_version = client._request(
+                "GET", "/health", timeout=_PROBE_TIMEOUT_SECONDS
+            )["engine_version"]
+        except (OSError, RuntimeError, KeyError):
+            return None
+        return client
+
+    @property
+    def engine_version(self) -> str:
+        """데몬 엔진 버전 (번역 메모리 캐시 키에 사용)"""
+        if self._engine_version is None:
+            self._engine_version = self._request("GET", "/health")["engine_version"]
+        return self._engine_version
+
+    def engine_version_for(self, source_language: str, target_language: str) -> str:
+        """데몬 엔진의 언어 쌍별 버전 (같은 엔진을 직접 쓸 때와 같은 캐시 키)"""
+        key = (source_language, target_language)
+        if key not in self._pair_versions:
+            query = urlencode({"source": source_language, "target": target_language})
+            self._pair_versions[key] = self._request(
+                "GET", f"/health?{query}"
+            )["engine_version"]
+        return self._pair_versions[key]
+
+    def translate(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Subtitle:
+        """데몬으로 자막 번역
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍 또는 자막 형식
+            RuntimeError: 데몬 연결/번역 오류
+        """
+        translated_cues = list(
+            self.translate_stream(subtitle, target_language, progress_callback)
+        )
+        if progress_callback:
+            progress_callback("번역 완료!", 100.0)
+        return subtitle.with_translation(format_srt(translated_cues), target_language)
+
+    def translate_stream(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterator[SubtitleCue]:
+        """chunk_size개 큐씩 데몬에 요청하고 응답이 올 때마다 yield
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍 또는 자막 형식
+            RuntimeError: 데몬 연결/번역 오류
+        """
+        if progress_callback:
+            progress_callback("번역 데몬에 요청 중...", 0.0)
+
+        cues = parse_srt(load_subtitle_text(subtitle))
+        if not cues:
+            raise ValueError("No valid subtitle cues found after parsing")
+
+        total = len(cues)
+        for start in range(0, total, self._chunk_size):
+            chunk = cues[start:start + self._chunk_size]
+            translations = self._request("POST", "/translate", {
+                "source_language": subtitle.language,
+                "target_language": target_language,
+                "texts": [cue.text for cue in chunk],
+            })["translations"]
+            if len(translations) != len(chunk):
+                raise RuntimeError(
+                    f"Daemon returned {len(translations)} translations for "
+                    f"{len(chunk)} requested cues"
+                )
+
+            if progress_callback:
+                done = start + len(chunk)
+                progress_callback(f"번역 중... ({done}/{total})", 10.0 + 80.0 * done / total)
+
+            for cue, translated_text in zip(chunk, translations):
+                yield SubtitleCue(
+                    number=cue.number, timestamp=cue.timestamp, text=translated_text
+                )
+
+    def list_supported_languages(self) -> List[str]:
+        """데몬 엔진의 지원 언어 목록"""
+        return self._request("GET", "/languages")["languages"]
+
+    def is_language_pair_supported(
+        self, source_language: str, target_language: str
+    ) -> bool:
+        """데몬 엔진의 언어 쌍 지원 여부"""
+        query = urlencode({"source": source_language, "target": target_language})
+        return self._request("GET", f"/supports?{query}")["supported"]
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> dict:
+        """JSON 요청/응답
+
+        Raises:
+            ValueError: 데몬이 400을 반환한 경우 (잘못된 요청/지원하지 않는 언어 쌍)
+            RuntimeError: 그 외 HTTP 오류
+            OSError: 연결 실패
+        """
+        data = None if payload is None else json.dumps(payload).encode("utf-8")
+        request = urllib.request.Request(
+            self._base_url + path,
+            data=data,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=timeout or self._timeout) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read().decode("utf-8"))["error"]
+            except (ValueError, KeyError):
+                message = e.reason
+            if e.code == 400:
+                raise ValueError(message) from e
+            raise RuntimeError(f"Translation daemon error ({e.code}): {message}") from e
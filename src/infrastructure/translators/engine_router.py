@@ -0,0 +1,286 @@
+"""Engine Router - 언어 쌍별 처리 속도/실패율을 보고 마감 시간 안에 끝낼 번역 엔진을 고르는 라우터."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.application.ports.subtitle_translator import (
+    ProgressCallback,
+    SubtitleTranslatorPort,
+)
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, format_srt
+from src.infrastructure.translators.srt_cues import load_subtitle_text, parse_srt_cues
+
+# 엔진/언어 쌍별로 기억할 최근 작업 수
+DEFAULT_STATS_WINDOW = 20
+# 이 비율 이상 실패한 엔진은 다른 후보가 있으면 건너뜀
+DEFAULT_MAX_FAILURE_RATE = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class EngineStats:
+    """최근 작업 기준 엔진 통계 (한 언어 쌍)"""
+    runs: int
+    failures: int
+    cues_per_second: Optional[float]  # 성공한 작업의 큐 수 합 / 번역 시간 합 (측정 없으면 None)
+
+    @property
+    def failure_rate(self) -> float:
+        """최근 작업 중 실패 비율"""
+        return self.failures / self.runs if self.runs else 0.0
+
+    def estimate_seconds(self, cue_count: int) -> Optional[float]:
+        """큐 cue_count개 번역 예상 시간 (측정 없으면 None)"""
+        if not self.cues_per_second:
+            return None
+        return cue_count / self.cues_per_second
+
+
+@dataclass(frozen=True, slots=True)
+class _Run:
+    cues: int
+    seconds: float
+    succeeded: bool
+
+
+class TranslatorRouter(SubtitleTranslatorPort):
+    """여러 번역 엔진 중 작업마다 하나를 골라 번역하는 SubtitleTranslatorPort
+
+    - (엔진, 언어 쌍)별로 최근 작업의 초당 큐 수와 실패를 기록한다.
+      측정 시간에는 호스트 부하가 그대로 반영되므로 별도 부하 측정은 하지 않는다.
+    - 엔진은 선호 순서(보통 품질 순)로 받는다. 언어 쌍을 지원하지 않거나
+      실패율이 높은 엔진은 건너뛰고, deadline_seconds가 있으면
+      예상 시간이 마감 안에 드는 첫 엔진을 고른다 (아무도 못 맞추면 가장 빠른 엔진).
+    - 측정 기록이 없는 엔진은 마감을 맞춘다고 보고 시도해 처리 속도를 잰다.
+    - 고른 엔진이 아직 큐를 내보내기 전에 실패하면 (RuntimeError뿐 아니라 모델/의존성
+      누락의 OSError, ImportError 등 모든 Exception) 실패로 기록하고 다음 후보로 넘어간다.
+    - 마감 시간은 생성 시 기본값을 정하고 translate/translate_stream 호출마다 바꿀 수 있다.
+    - 번역 메모리는 라우터를 감쌀 수 없다 (엔진마다 CachingTranslatorAdapter로 감싸 넘긴다).
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[SubtitleTranslatorPort],
+        deadline_seconds: Optional[float] = None,
+        stats_window: int = DEFAULT_STATS_WINDOW,
+        max_failure_rate: float = DEFAULT_MAX_FAILURE_RATE,
+    ) -> None:
+        """
+        Args:
+            engines: 번역 엔진 목록 (선호 순서, engine_version 또는 클래스 이름으로 구분)
+            deadline_seconds: 작업당 기본 마감 시간(초) (None이면 선호 순서대로 선택)
+            stats_window: 엔진/언어 쌍별로 기억할 최근 작업 수
+            max_failure_rate: 이 비율 이상 실패한 엔진은 다른 후보가 있으면 건너뜀
+
+        Raises:
+            ValueError: 엔진이 없거나 이름이 겹치는 경우, 잘못된 설정값
+        """
+        if not engines:
+            raise ValueError("At least one translation engine is required")
+        if stats_window < 1:
+            raise ValueError("stats_window must be at least 1")
+        _check_deadline(deadline_seconds)
+
+        self._engines: Dict[str, SubtitleTranslatorPort] = {}
+        for engine in engines:
+            name = _engine_name(engine)
+            if name in self._engines:
+                raise ValueError(f"Duplicate translation engine: {name}")
+            self._engines[name] = engine
+
+        self._deadline_seconds = deadline_seconds
+        self._stats_window = stats_window
+        self._max_failure_rate = max_failure_rate
+        self._runs: Dict[Tuple[str, str, str], Deque[_Run]] = {}
+        self._lock = threading.Lock()
+        self.last_engine: Optional[str] = None
+
+    @property
+    def engine_names(self) -> List[str]:
+        """등록된 엔진 이름 (선호 순서)"""
+        return list(self._engines)
+
+    def stats(self, engine_name: str, source_language: str, target_language: str) -> EngineStats:
+        """(엔진, 언어 쌍)의 최근 작업 통계"""
+        with self._lock:
+            runs = list(self._runs.get((engine_name, source_language, target_language), ()))
+        measured = [run for run in runs if run.succeeded and run.seconds > 0]
+        seconds = sum(run.seconds for run in measured)
+        return EngineStats(
+            runs=len(runs),
+            failures=sum(1 for run in runs if not run.succeeded),
+            cues_per_second=sum(run.cues for run in measured) / seconds if seconds else None,
+        )
+
+    def record(
+        self,
+        engine_name: str,
+        source_language: str,
+        target_language: str,
+        cue_count: int,
+        seconds: float,
+        succeeded: bool = True,
+    ) -> None:
+        """작업 결과 기록 (오래된 기록은 stats_window개를 넘으면 버림)"""
+        key = (engine_name, source_language, target_language)
+        with self._lock:
+            runs = self._runs.setdefault(key, deque(maxlen=self._stats_window))
+            runs.append(_Run(cue_count, seconds, succeeded))
+
+    def rank(
+        self,
+        source_language: str,
+        target_language: str,
+        cue_count: int,
+        deadline_seconds: Optional[float] = None,
+    ) -> List[str]:
+        """작업에 시도할 엔진 이름 순서 (첫 번째가 선택된 엔진)
+
+        Args:
+            deadline_seconds: 이 작업의 마감 시간(초) (None이면 생성 시 기본값)
+
+        Raises:
+            ValueError: 언어 쌍을 지원하는 엔진이 없거나 마감 시간이 잘못된 경우
+        """
+        _check_deadline(deadline_seconds)
+        deadline = self._deadline_seconds if deadline_seconds is None else deadline_seconds
+        supported = [
+            name for name, engine in self._engines.items()
+            if engine.is_language_pair_supported(source_language, target_language)
+        ]
+        if not supported:
+            raise ValueError(
+                f"No translation engine supports {source_language} -> {target_language}"
+            )
+
+        stats = {
+            name: self.stats(name, source_language, target_language) for name in supported
+        }
+        healthy = [name for name in supported if stats[name].failure_rate < self._max_failure_rate]
+        unhealthy = sorted(
+            (name for name in supported if name not in healthy),
+            key=lambda name: stats[name].failure_rate,
+        )
+
+        if deadline is None:
+            return healthy + unhealthy
+
+        def meets_deadline(name: str) -> bool:
+            estimate = stats[name].estimate_seconds(cue_count)
+            return estimate is None or estimate <= deadline
+
+        on_time = [name for name in healthy if meets_deadline(name)]
+        # 마감을 못 맞추는 엔진은 빠른 순서로
+        late = sorted(
+            (name for name in healthy if name not in on_time),
+            key=lambda name: stats[name].estimate_seconds(cue_count),
+        )
+        return on_time + late + unhealthy
+
+    def translate(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> Subtitle:
+        """선택된 엔진으로 번역
+
+        Args:
+            deadline_seconds: 이 작업의 마감 시간(초) (None이면 생성 시 기본값)
+
+        Raises:
+            ValueError: 지원하는 엔진이 없거나 파싱 가능한 큐가 없는 경우
+            RuntimeError: 모든 후보 엔진이 실패한 경우
+        """
+        translated_cues = list(
+            self.translate_stream(
+                subtitle, target_language, progress_callback, deadline_seconds
+            )
+        )
+        return subtitle.with_translation(format_srt(translated_cues), target_language)
+
+    def translate_stream(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> Iterator[SubtitleCue]:
+        """선택된 엔진의 스트림을 그대로 yield (첫 큐 전에 실패하면 다음 후보로)
+
+        Args:
+            deadline_seconds: 이 작업의 마감 시간(초) (None이면 생성 시 기본값)
+
+        Raises:
+            ValueError: 지원하는 엔진이 없거나 파싱 가능한 큐가 없는 경우
+            RuntimeError: 모든 후보 엔진이 실패한 경우
+            Exception: 큐를 내보낸 뒤 엔진이 실패한 경우 (엔진의 예외 그대로)
+        """
+        cues = parse_srt_cues(load_subtitle_text(subtitle))
+        if not cues:
+            raise ValueError("No valid subtitle cues found after parsing")
+
+        source_language = subtitle.language
+        errors: List[str] = []
+        ranked = self.rank(source_language, target_language, len(cues), deadline_seconds)
+        for name in ranked:
+            self.last_engine = name
+            if progress_callback:
+                progress_callback(f"번역 엔진 선택: {name}", 0.0)
+
+            # yield로 멈춰 있는 시간을 빼고 번역에 걸린 시간만 측정
+            busy_seconds = 0.0
+            emitted = 0
+            try:
+                stream = self._engines[name].translate_stream(
+                    subtitle, target_language, progress_callback
+                )
+                while True:
+                    start = time.perf_counter()
+                    cue = next(stream, None)
+                    busy_seconds += time.perf_counter() - start
+                    if cue is None:
+                        break
+                    emitted += 1
+                    yield cue
+            except Exception as e:
+                self.record(
+                    name, source_language, target_language, emitted, busy_seconds, False
+                )
+                if emitted:
+                    raise
+                errors.append(f"{name}: {e}")
+                continue
+
+            self.record(name, source_language, target_language, emitted, busy_seconds)
+            return
+
+        raise RuntimeError("All translation engines failed: " + "; ".join(errors))
+
+    def list_supported_languages(self) -> List[str]:
+        """모든 엔진이 지원하는 언어의 합집합 (등록 순서)"""
+        languages: Dict[str, None] = {}
+        for engine in self._engines.values():
+            languages.update(dict.fromkeys(engine.list_supported_languages()))
+        return list(languages)
+
+    def is_language_pair_supported(self, source_language: str, target_language: str) -> bool:
+        """한 엔진이라도 언어 쌍을 지원하면 True"""
+        return any(
+            engine.is_language_pair_supported(source_language, target_language)
+            for engine in self._engines.values()
+        )
+
+
+def _check_deadline(deadline_seconds: Optional[float]) -> None:
+    if deadline_seconds is not None and deadline_seconds <= 0:
+        raise ValueError("deadline_seconds must be positive")
+
+
+def _engine_name(engine: SubtitleTranslatorPort) -> str:
+    return getattr(engine, "engine_version", type(engine).__name__)
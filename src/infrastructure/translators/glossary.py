@@ -0,0 +1,394 @@
+"""Glossary - 용어집을 트라이로 컴파일해 번역 전 용어를 자리표시자로 보호하고 번역 후 고정 번역어로 주입."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from src.application.ports.subtitle_translator import (
+    ProgressCallback,
+    SubtitleTranslatorPort,
+)
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, format_srt
+from src.infrastructure.translators.rules_document import read_markdown_table
+from src.infrastructure.translators.srt_cues import load_subtitle_text, parse_srt_cues
+
+# rules.md에서 용어집으로 읽을 섹션 제목 (4. 용어 통일)
+GLOSSARY_SECTION = "기술 용어"
+
+# 자리표시자 "⟪0⟫" (마크업 보호의 "⟦0⟧"와 구분, 모델이 공백을 끼워 넣어도 복원)
+_PLACEHOLDER = "⟪{}⟫"
+_PLACEHOLDER_RE = re.compile(r"⟪\s*(\d+)\s*⟫")
+# 트라이 노드에서 용어 끝을 표시하는 키 (한 글자 키와 겹치지 않음)
+_TERM_END = ""
+
+
+@dataclass(frozen=True, slots=True)
+class GlossaryProtectedText:
+    """용어를 자리표시자로 바꾼 텍스트"""
+    text: str  # 번역 입력
+    sources: Tuple[str, ...]  # 자리표시자 번호 순 원문 용어 (원문 표기 그대로)
+    targets: Tuple[str, ...]  # 자리표시자 번호 순 고정 번역어
+
+    def inject(self, translated: str, restore_source: bool = False) -> Tuple[str, int]:
+        """번역 결과의 자리표시자를 고정 번역어(또는 원문 용어)로 교체
+
+        모델이 자리표시자를 빠뜨리면 해당 용어를 끝에 원래 순서대로 붙이고,
+        중복된 자리표시자는 제거한다.
+
+        Args:
+            translated: 자리표시자가 포함된 번역 결과
+            restore_source: True면 번역어 대신 원문 용어로 복원 (용어집 언어가 아닌 목표 언어)
+
+        Returns:
+            (용어가 주입된 텍스트, 빠져서 끝에 붙인 용어 수)
+        """
+        terms = self.sources if restore_source else self.targets
+        used = set()
+
+        def replace(match: re.Match) -> str:
+            index = int(match.group(1))
+            if index >= len(terms) or index in used:
+                return ""
+            used.add(index)
+            return terms[index]
+
+        body = _PLACEHOLDER_RE.sub(replace, translated)
+        missing = [term for index, term in enumerate(terms) if index not in used]
+        if missing:
+            body = " ".join([body.rstrip(), *missing])
+        return body, len(missing)
+
+
+class Glossary:
+    """원문 용어 -> 고정 번역어 용어집
+
+    용어를 글자 단위 트라이로 한 번 컴파일하고, 텍스트의 각 위치에서
+    가장 긴 용어를 찾는다 (비용은 텍스트 길이 × 최장 용어 길이).
+    영문/숫자로 시작하거나 끝나는 용어는 단어 경계에서만 일치한다 ("AI"는 "said"와 불일치).
+    """
+
+    def __init__(
+        self,
+        terms: Mapping[str, str],
+        target_language: str = "ko",
+        case_sensitive: bool = False,
+    ) -> None:
+        """
+        Args:
+            terms: {원문 용어: 고정 번역어}
+            target_language: 번역어의 언어 코드
+            case_sensitive: 대소문자 구분 여부 (기본값: 구분 안 함)
+        """
+        self._target_language = target_language
+        self._case_sensitive = case_sensitive
+        self._terms = {
+            source.strip(): target.strip() for source, target in terms.items() if source.strip()
+        }
+        self._root: Dict[str, dict] = {}
+        for source, target in self._terms.items():
+            node = self._root
+            for char in source:
+                node = node.setdefault(self._fold(char), {})
+            node[_TERM_END] = target
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    @property
+    def terms(self) -> Dict[str, str]:
+        """{원문 용어: 고정 번역어}"""
+        return dict(self._terms)
+
+    @property
+    def case_sensitive(self) -> bool:
+        """대소문자 구분 여부"""
+        return self._case_sensitive
+
+    @property
+    def target_language(self) -> str:
+        """번역어의 언어 코드"""
+        return self._target_language
+
+    def find(self, text: str) -> List[Tuple[int, int, str]]:
+        """텍스트에서 겹치지 않는 용어 위치 (왼쪽부터, 같은 위치에서는 가장 긴 용어)
+
+        Returns:
+            (시작, 끝, 고정 번역어) 리스트
+        """
+        matches: List[Tuple[int, int, str]] = []
+        position = 0
+        length = len(text)
+        while position < length:
+            match = self._match_at(text, position) if self._root else None
+            if match is None:
+                position += 1
+                continue
+            end, target = match
+            matches.append((position, end, target))
+            position = end
+        return matches
+
+    def protect(self, text: str) -> GlossaryProtectedText:
+        """용어를 자리표시자로 교체"""
+        parts: List[str] = []
+        sources: List[str] = []
+        targets: List[str] = []
+        previous = 0
+        for start, end, target in self.find(text):
+            parts.append(text[previous:start])
+            parts.append(_PLACEHOLDER.format(len(targets)))
+            sources.append(text[start:end])
+            targets.append(target)
+            previous = end
+        parts.append(text[previous:])
+        return GlossaryProtectedText("".join(parts), tuple(sources), tuple(targets))
+
+    def _match_at(self, text: str, start: int) -> Optional[Tuple[int, str]]:
+        """start에서 시작하는 가장 긴 용어 (끝 위치, 고정 번역어)"""
+        if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+            return None
+
+        node = self._root
+        best: Optional[Tuple[int, str]] = None
+        position = start
+        while position < len(text):
+            node = node.get(self._fold(text[position]))
+            if node is None:
+                break
+            position += 1
+            if _TERM_END in node and not (
+                position < len(text)
+                and _is_word_char(text[position - 1])
+                and _is_word_char(text[position])
+            ):
+                best = (position, node[_TERM_END])
+        return best
+
+    def _fold(self, char: str) -> str:
+        return char if self._case_sensitive else char.lower()
+
+
+def load_glossary(path: Path, target_language: str = "ko") -> Glossary:
+    """용어집 파일 로드
+
+    - .md: rules.md의 "기술 용어" 표 (| 원문 | 번역 | 비고 |, 번역이 여러 개면 첫 번째 사용)
+    - 그 외: TSV ("원문 용어<TAB>고정 번역어", 빈 줄과 "#" 주석 무시)
+
+    Raises:
+        FileNotFoundError: 파일이 없을 경우
+        ValueError: 형식이 잘못된 경우
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".md":
+        terms = {
+            cells[0]: cells[1].split(",")[0].strip()
+            for cells in read_markdown_table(path, GLOSSARY_SECTION)
+            if len(cells) >= 2 and cells[0] and cells[1]
+        }
+        return Glossary(terms, target_language)
+
+    terms = {}
+    for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        columns = line.split("\t")
+        if len(columns) < 2 or not columns[0].strip() or not columns[1].strip():
+            raise ValueError(f"Invalid glossary line {line_number} in {path}: {line!r}")
+        terms[columns[0].strip()] = columns[1].strip()
+    return Glossary(terms, target_language)
+
+
+def merge_glossaries(glossaries: Sequence[Glossary]) -> Glossary:
+    """여러 용어집을 하나로 합침 (뒤의 용어집이 같은 용어를 덮어씀)
+
+    Raises:
+        ValueError: 용어집이 없거나 번역어 언어가 서로 다를 경우
+    """
+    if not glossaries:
+        raise ValueError("At least one glossary is required")
+    languages = {glossary.target_language for glossary in glossaries}
+    if len(languages) > 1:
+        raise ValueError(f"Glossaries target different languages: {sorted(languages)}")
+
+    terms: Dict[str, str] = {}
+    for glossary in glossaries:
+        terms.update(glossary.terms)
+    return Glossary(terms, glossaries[0].target_language, glossaries[0].case_sensitive)
+
+
+class GlossaryTranslatorAdapter(SubtitleTranslatorPort):
+    """번역 전 용어집 용어를 보호하고 번역 후 고정 번역어를 주입하는 SubtitleTranslatorPort 래퍼
+
+    용어집 언어가 아닌 목표 언어로 번역할 때는 용어를 보호하지 않는다
+    (translate_many에서는 보호한 입력을 공유하고 원문 용어로 복원).
+    """
+
+    def __init__(self, translator: SubtitleTranslatorPort, glossary: Glossary) -> None:
+        """
+        Args:
+            translator: 실제 번역을 수행할 포트 구현체
+            glossary: 용어집
+        """
+        self._translator = translator
+        self._glossary = glossary
+        self._injected_terms = 0
+        self._missing_terms = 0
+
+    @property
+    def engine_version(self) -> str:
+        """내부 번역기의 엔진 버전 (자리표시자 번역은 용어와 무관하게 캐시 가능)"""
+        return getattr(self._translator, "engine_version", type(self._translator).__name__)
+
+    @property
+    def injected_terms(self) -> int:
+        """마지막 번역에서 주입한 용어 수"""
+        return self._injected_terms
+
+    @property
+    def missing_terms(self) -> int:
+        """마지막 번역에서 모델이 자리표시자를 빠뜨려 큐 끝에 붙인 용어 수"""
+        return self._missing_terms
+
+    def translate(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Subtitle:
+        """용어를 보호해 번역하고 고정 번역어 주입
+
+        Raises:
+            ValueError: 자막 내용이 없거나 파싱 가능한 큐가 없는 경우
+            RuntimeError: 내부 번역기가 요청과 다른 개수의 큐를 반환한 경우
+        """
+        translated_cues = list(
+            self.translate_stream(subtitle, target_language, progress_callback)
+        )
+        return subtitle.with_translation(format_srt(translated_cues), target_language)
+
+    def translate_stream(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterator[SubtitleCue]:
+        """내부 번역기 스트림의 큐마다 고정 번역어를 주입해 yield
+
+        Raises:
+            ValueError: 자막 내용이 없거나 파싱 가능한 큐가 없는 경우
+            RuntimeError: 내부 번역기가 요청과 다른 개수의 큐를 반환한 경우
+        """
+        self._injected_terms = 0
+        self._missing_terms = 0
+        if target_language != self._glossary.target_language:
+            yield from self._translator.translate_stream(
+                subtitle, target_language, progress_callback
+            )
+            return
+
+        request, protected = self._protect(subtitle)
+        stream = self._translator.translate_stream(request, target_language, progress_callback)
+        for cue in self._inject_cues(stream, protected):
+            yield cue
+
+    def translate_many(
+        self,
+        subtitle: Subtitle,
+        target_languages: List[str],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Subtitle]:
+        """용어집 언어만 보호한 입력으로, 나머지 언어는 원본 그대로 번역
+
+        자리표시자는 용어집 언어에만 보내고, 다른 언어는 원문 용어가 문맥 안에서
+        번역되도록 원본 자막을 내부 번역기의 translate_many로 한 번에 보낸다.
+        """
+        targets = list(dict.fromkeys(target_languages))
+        if not targets:
+            raise ValueError("At least one target language is required")
+        glossary_target = self._glossary.target_language
+        other_targets = [target for target in targets if target != glossary_target]
+
+        self._injected_terms = 0
+        self._missing_terms = 0
+        results: Dict[str, Subtitle] = {}
+        if glossary_target in targets:
+            results[glossary_target] = self.translate(
+                subtitle, glossary_target, progress_callback
+            )
+        if other_targets:
+            results.update(
+                self._translator.translate_many(subtitle, other_targets, progress_callback)
+            )
+        return {target: results[target] for target in targets}
+
+    def list_supported_languages(self) -> List[str]:
+        """내부 번역기의 지원 언어 목록"""
+        return self._translator.list_supported_languages()
+
+    def is_language_pair_supported(
+        self, source_language: str, target_language: str
+    ) -> bool:
+        """내부 번역기의 언어 쌍 지원 여부"""
+        return self._translator.is_language_pair_supported(
+            source_language, target_language
+        )
+
+    def _protect(self, subtitle: Subtitle) -> Tuple[Subtitle, List[GlossaryProtectedText]]:
+        """큐 텍스트의 용어를 자리표시자로 바꾼 요청 자막 생성
+
+        Raises:
+            ValueError: 자막 내용이 없거나 파싱 가능한 큐가 없는 경우
+        """
+        cues = parse_srt_cues(load_subtitle_text(subtitle))
+        if not cues:
+            raise ValueError("No valid subtitle cues found after parsing")
+
+        protected = [self._glossary.protect(cue["text"]) for cue in cues]
+        request_cues = [
+            SubtitleCue(number=cue["number"], timestamp=cue["timestamp"], text=item.text)
+            for cue, item in zip(cues, protected)
+        ]
+        request = Subtitle(
+            video_id=subtitle.video_id,
+            language=subtitle.language,
+            format="srt",
+            text=format_srt(request_cues),
+            source=subtitle.source,
+        )
+        return request, protected
+
+    def _inject_cues(
+        self,
+        stream: Iterator[SubtitleCue],
+        protected: List[GlossaryProtectedText],
+    ) -> Iterator[SubtitleCue]:
+        """번역된 큐에 용어 주입
+
+        Raises:
+            RuntimeError: 번역된 큐 개수가 요청과 다른 경우
+        """
+        count = 0
+        for cue in stream:
+            if count >= len(protected):
+                raise RuntimeError(
+                    f"Translator returned more cues than requested ({len(protected)})"
+                )
+            item = protected[count]
+            count += 1
+            text, missing = item.inject(cue.text)
+            self._injected_terms += len(item.targets)
+            self._missing_terms += missing
+            yield SubtitleCue(number=cue.number, timestamp=cue.timestamp, text=text)
+
+        if count != len(protected):
+            raise RuntimeError(
+                f"Translator returned {count} cues for {len(protected)} requested"
+            )
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
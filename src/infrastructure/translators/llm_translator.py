@@ -0,0 +1,452 @@
+"""LLM Translator - 큐를 토큰 예산 청크로 나눠 LLM(Gemini REST API)에 동시 요청하는 자막 번역 어댑터."""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import time
+import urllib.error
+import urllib.request
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from src.application.ports.subtitle_translator import (
+    ProgressCallback,
+    SubtitleTranslatorPort,
+)
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, format_srt
+from src.infrastructure.translators.srt_cues import load_subtitle_text, parse_srt_cues
+
+DEFAULT_GEMINI_BASE_URL = "https://generativelanguage.googleapis.com"
+DEFAULT_GEMINI_MODEL = "gemini-1.5-flash"
+DEFAULT_TIMEOUT_SECONDS = 120.0
+
+# 청크당 원문 토큰 예산 (출력은 보통 원문보다 길어 출력 한도에 여유를 둠)
+DEFAULT_MAX_CHUNK_TOKENS = 1500
+# 동시에 보내는 청크 요청 수
+DEFAULT_MAX_CONCURRENCY = 4
+# 청크당 최대 요청 횟수 (첫 요청 포함)
+DEFAULT_MAX_ATTEMPTS = 3
+# 재요청 대기 시간(초), 시도마다 두 배
+DEFAULT_RETRY_DELAY_SECONDS = 1.0
+
+# 프롬프트에 쓰는 목표 언어 이름
+LANGUAGE_NAMES: Dict[str, str] = {
+    "en": "영어",
+    "ja": "일본어",
+    "ko": "한국어",
+    "zh": "중국어",
+}
+
+# 큐 표식 줄: "[[12]] 00:00:01,000 --> 00:00:02,500"
+_MARKER_RE = re.compile(r"^\[\[(\d+)\]\][ \t]*(.*?)[ \t]*$", re.MULTILINE)
+_CODE_FENCE_RE = re.compile(r"^```[a-zA-Z]*[ \t]*$", re.MULTILINE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class LlmClient(ABC):
+    """프롬프트 하나를 보내고 응답 텍스트를 받는 LLM 클라이언트"""
+
+    @property
+    @abstractmethod
+    def engine_version(self) -> str:
+        """번역 메모리 캐시 키에 쓰이는 모델 식별자 (예: "gemini/gemini-1.5-flash")"""
+
+    @abstractmethod
+    def generate(self, prompt: str) -> str:
+        """프롬프트 응답 텍스트 반환
+
+        Raises:
+            ValueError: 재시도해도 소용없는 요청 오류 (잘못된 API 키/요청)
+            RuntimeError: 일시적 오류 (요청 한도, 서버 오류, 차단/빈 응답)
+            OSError: 연결 실패
+        """
+
+
+class GeminiRestClient(LlmClient):
+    """Gemini generateContent REST API 클라이언트 (urllib, SDK 불필요)"""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = DEFAULT_GEMINI_MODEL,
+        base_url: str = DEFAULT_GEMINI_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        temperature: float = 0.2,
+    ) -> None:
+        """
+        Args:
+            api_key: Gemini API 키
+            model: 모델 이름 (예: "gemini-1.5-flash")
+            base_url: API 주소 (테스트에서는 로컬 모의 서버)
+            timeout: 요청 타임아웃(초)
+            temperature: 생성 온도
+        """
+        if not api_key:
+            raise ValueError("api_key cannot be empty")
+
+        self._api_key = api_key
+        self._model = model
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._temperature = temperature
+
+    @property
+    def engine_version(self) -> str:
+        return f"gemini/{self._model}"
+
+    def generate(self, prompt: str) -> str:
+        payload = {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generationConfig": {"temperature": self._temperature},
+        }
+        response = self._request(
+            "POST", f"/v1beta/models/{self._model}:generateContent", payload
+        )
+
+        block_reason = response.get("promptFeedback", {}).get("blockReason")
+        if block_reason:
+            raise RuntimeError(f"Gemini blocked the prompt: {block_reason}")
+        candidates = response.get("candidates") or []
+        if not candidates:
+            raise RuntimeError("Gemini returned no candidates")
+
+        candidate = candidates[0]
+        if candidate.get("finishReason") == "SAFETY":
+            raise RuntimeError("Gemini blocked the response by the safety filter")
+        parts = candidate.get("content", {}).get("parts", [])
+        text = "".join(part.get("text", "") for part in parts)
+        if not text.strip():
+            raise RuntimeError("Gemini returned an empty response")
+        return text
+
+    def list_models(self) -> List[str]:
+        """generateContent를 지원하는 모델 이름 목록"""
+        response = self._request("GET", "/v1beta/models")
+        return [
+            model["name"].replace("models/", "")
+            for model in response.get("models", [])
+            if "generateContent" in model.get("supportedGenerationMethods", [])
+        ]
+
+    def _request(self, method: str, path: str, payload: Optional[dict] = None) -> dict:
+        """JSON 요청/응답
+
+        Raises:
+            ValueError: 4xx 응답 (429 제외)
+            RuntimeError: 429/5xx 응답 또는 JSON이 아닌 응답
+            OSError: 연결 실패
+        """
+        data = None if payload is None else json.dumps(payload).encode("utf-8")
+        request = urllib.request.Request(
+            self._base_url + path,
+            data=data,
+            method=method,
+            headers={"Content-Type": "application/json", "x-goog-api-key": self._api_key},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read().decode("utf-8"))["error"]["message"]
+            except (ValueError, KeyError, TypeError):
+                message = e.reason
+            if 400 <= e.code < 500 and e.code != 429:
+                raise ValueError(f"Gemini API error ({e.code}): {message}") from e
+            raise RuntimeError(f"Gemini API error ({e.code}): {message}") from e
+        except ValueError as e:
+            raise RuntimeError(f"Gemini API returned invalid JSON: {e}") from e
+
+
+@dataclass(frozen=True, slots=True)
+class CueChunk:
+    """한 번의 LLM 요청으로 번역할 연속된 큐 묶음"""
+    index: int
+    cue_ids: List[int]  # 파일 전체 기준 큐 위치 (1부터), 프롬프트 표식에 사용
+    timestamps: List[str]
+    texts: List[str]
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사 (ASCII는 4자당 1토큰, 그 외 문자는 1자당 1토큰)"""
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return (len(text) - non_ascii) // 4 + non_ascii + 1
+
+
+def plan_chunks(cues: Sequence[dict], max_chunk_tokens: int) -> List[CueChunk]:
+    """큐를 원래 순서대로 토큰 예산 안의 청크로 분할
+
+    예산을 넘는 큐 하나는 단독 청크가 된다.
+
+    Args:
+        cues: parse_srt_cues 결과
+        max_chunk_tokens: 청크당 원문 토큰 예산
+
+    Returns:
+        CueChunk 리스트
+    """
+    chunks: List[CueChunk] = []
+    ids: List[int] = []
+    tokens = 0
+    for position, cue in enumerate(cues, start=1):
+        cost = estimate_tokens(_format_cue(position, cue["timestamp"], cue["text"]))
+        if ids and tokens + cost > max_chunk_tokens:
+            chunks.append(_make_chunk(len(chunks), ids, cues))
+            ids, tokens = [], 0
+        ids.append(position)
+        tokens += cost
+    if ids:
+        chunks.append(_make_chunk(len(chunks), ids, cues))
+    return chunks
+
+
+def parse_chunk_response(response: str, chunk: CueChunk) -> List[str]:
+    """LLM 응답에서 청크 큐의 번역문 추출 및 검증
+
+    큐 표식의 번호와 타임스탬프가 요청과 같은 순서로 모두 돌아와야 한다.
+
+    Returns:
+        chunk.cue_ids 순서의 번역문
+
+    Raises:
+        RuntimeError: 큐 번호/타임스탬프가 일치하지 않거나 번역문이 빈 경우
+    """
+    response = _CODE_FENCE_RE.sub("", response)
+    matches = list(_MARKER_RE.finditer(response))
+    returned_ids = [int(match.group(1)) for match in matches]
+    if returned_ids != chunk.cue_ids:
+        missing = sorted(set(chunk.cue_ids) - set(returned_ids))
+        unexpected = sorted(set(returned_ids) - set(chunk.cue_ids))
+        raise RuntimeError(
+            f"Cue IDs do not round-trip (missing {missing}, unexpected {unexpected})"
+        )
+
+    translations: List[str] = []
+    for i, match in enumerate(matches):
+        expected = chunk.timestamps[i]
+        if _WHITESPACE_RE.sub(" ", match.group(2)) != _WHITESPACE_RE.sub(" ", expected):
+            raise RuntimeError(
+                f"Timestamp of cue {chunk.cue_ids[i]} changed: {match.group(2)!r} != {expected!r}"
+            )
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(response)
+        text = "\n".join(
+            line.strip() for line in response[match.end():end].strip().split("\n") if line.strip()
+        )
+        if not text and chunk.texts[i].strip():
+            raise RuntimeError(f"Cue {chunk.cue_ids[i]} has an empty translation")
+        translations.append(text)
+    return translations
+
+
+class ChunkedLlmTranslatorAdapter(SubtitleTranslatorPort):
+    """LLM 기반 자막 번역 어댑터
+
+    - 큐를 토큰 예산 청크로 나누고 각 큐에 "[[번호]] 타임스탬프" 표식을 붙여 요청
+    - 청크를 max_concurrency개까지 동시에 요청
+    - 응답의 큐 번호/타임스탬프가 그대로 돌아왔는지 검증하고,
+      실패한 청크만 max_attempts회까지 다시 요청
+    - 앞선 청크가 모두 끝나면 그 큐를 원래 순서대로 스트림으로 내보냄
+    """
+
+    def __init__(
+        self,
+        client: LlmClient,
+        rules: str = "",
+        target_languages: Sequence[str] = ("ko",),
+        max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY_SECONDS,
+    ) -> None:
+        """
+        Args:
+            client: LLM 클라이언트 (예: GeminiRestClient)
+            rules: 프롬프트에 넣을 번역 규칙 (rules.md 내용)
+            target_languages: 지원 목표 언어 (규칙이 해당 언어 기준이므로 기본값은 한국어)
+            max_chunk_tokens: 청크당 원문 토큰 예산
+            max_concurrency: 동시 요청 수
+            max_attempts: 청크당 최대 요청 횟수
+            retry_delay: 재요청 전 대기 시간(초), 시도마다 두 배
+        """
+        if max_chunk_tokens < 1:
+            raise ValueError("max_chunk_tokens must be at least 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self._client = client
+        self._rules = rules
+        self._target_languages = list(target_languages)
+        self._max_chunk_tokens = max_chunk_tokens
+        self._max_concurrency = max_concurrency
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+
+    @property
+    def engine_version(self) -> str:
+        """번역 메모리 캐시 키에 쓰이는 엔진 버전 문자열
+
+        프롬프트에 들어가는 규칙이 바뀌면 번역도 달라지므로 규칙 내용의 해시를 포함한다
+        (예: "gemini/gemini-1.5-flash+rules-1a2b3c4d5e6f").
+        """
+        if not self._rules.strip():
+            return self._client.engine_version
+        digest = hashlib.sha256(self._rules.strip().encode("utf-8")).hexdigest()[:12]
+        return f"{self._client.engine_version}+rules-{digest}"
+
+    def translate(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Subtitle:
+        """자막을 대상 언어로 번역
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍, 빈 자막 또는 API 요청 오류
+            RuntimeError: 재요청 후에도 실패한 청크가 있는 경우
+        """
+        translated_cues = list(
+            self.translate_stream(subtitle, target_language, progress_callback)
+        )
+        if progress_callback:
+            progress_callback("번역 완료, 재조립 중...", 90.0)
+            progress_callback("번역 완료!", 100.0)
+        return subtitle.with_translation(format_srt(translated_cues), target_language)
+
+    def translate_stream(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterator[SubtitleCue]:
+        """완료된 청크의 큐를 원본 순서대로 yield
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍, 빈 자막 또는 API 요청 오류
+            RuntimeError: 재요청 후에도 실패한 청크가 있는 경우
+        """
+        if progress_callback:
+            progress_callback("번역 준비 중...", 0.0)
+
+        subtitle_text = load_subtitle_text(subtitle)
+        if not self.is_language_pair_supported(subtitle.language, target_language):
+            raise ValueError(
+                f"Translation from {subtitle.language} to {target_language} is not supported."
+            )
+
+        cues = parse_srt_cues(subtitle_text)
+        if not cues:
+            raise ValueError("No valid subtitle cues found after parsing")
+        chunks = plan_chunks(cues, self._max_chunk_tokens)
+        if progress_callback:
+            progress_callback(f"자막 파싱 완료 ({len(cues)}개 큐, {len(chunks)}개 청크)", 20.0)
+
+        results: Dict[int, List[str]] = {}
+        next_chunk = 0
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, len(chunks)),
+            thread_name_prefix="llm-chunk",
+        )
+        try:
+            pending: Dict[Future, CueChunk] = {
+                executor.submit(
+                    self._translate_chunk, chunk, subtitle.language, target_language
+                ): chunk
+                for chunk in chunks
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = pending.pop(future)
+                    results[chunk.index] = future.result()
+
+                if progress_callback:
+                    progress_callback(
+                        f"번역 중... ({len(results)}/{len(chunks)} 청크)",
+                        20.0 + 70.0 * len(results) / len(chunks),
+                    )
+
+                # 앞선 청크가 모두 끝난 구간만 순서대로 내보냄
+                while next_chunk in results:
+                    chunk = chunks[next_chunk]
+                    for cue_id, text in zip(chunk.cue_ids, results.pop(next_chunk)):
+                        cue = cues[cue_id - 1]
+                        yield SubtitleCue(
+                            number=cue["number"], timestamp=cue["timestamp"], text=text
+                        )
+                    next_chunk += 1
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def list_supported_languages(self) -> List[str]:
+        """지원 목표 언어 목록"""
+        return list(self._target_languages)
+
+    def is_language_pair_supported(
+        self, source_language: str, target_language: str
+    ) -> bool:
+        """언어 쌍 지원 여부 (원본 언어는 제한 없음)"""
+        return source_language != target_language and target_language in self._target_languages
+
+    def _translate_chunk(
+        self, chunk: CueChunk, source_language: str, target_language: str
+    ) -> List[str]:
+        """청크 하나 번역 (일시적 오류/검증 실패 시 이 청크만 재요청)
+
+        Raises:
+            ValueError: API 요청 오류 (재시도하지 않음)
+            RuntimeError: max_attempts회 모두 실패한 경우
+        """
+        prompt = self._build_prompt(chunk, source_language, target_language)
+        last_error: Optional[Exception] = None
+        for attempt in range(self._max_attempts):
+            if attempt:
+                time.sleep(self._retry_delay * 2 ** (attempt - 1))
+            try:
+                return parse_chunk_response(self._client.generate(prompt), chunk)
+            except (RuntimeError, OSError) as e:
+                last_error = e
+        raise RuntimeError(
+            f"Chunk {chunk.index + 1} (cues {chunk.cue_ids[0]}-{chunk.cue_ids[-1]}) "
+            f"failed after {self._max_attempts} attempts: {last_error}"
+        ) from last_error
+
+    def _build_prompt(
+        self, chunk: CueChunk, source_language: str, target_language: str
+    ) -> str:
+        source_name = LANGUAGE_NAMES.get(source_language, source_language)
+        target_name = LANGUAGE_NAMES.get(target_language, target_language)
+        cue_blocks = "\n\n".join(
+            _format_cue(cue_id, timestamp, text)
+            for cue_id, timestamp, text in zip(chunk.cue_ids, chunk.timestamps, chunk.texts)
+        )
+        rules = f"\n[번역 규칙]\n{self._rules.strip()}\n" if self._rules.strip() else ""
+        return f"""당신은 전문 영상 번역가입니다. 아래 {source_name} 자막 큐를 {target_name}로 번역하세요.
+{rules}
+[출력 형식]
+1. 각 큐는 "[[번호]] 타임스탬프" 표식 줄로 시작합니다. 표식 줄은 한 글자도 바꾸지 말고 그대로 출력하세요.
+2. 표식 줄 다음 줄부터 그 큐의 번역문만 쓰세요. 큐를 합치거나 나누거나 빠뜨리지 마세요.
+3. 설명이나 마크다운 코드블록 없이 번역된 큐만 출력하세요.
+
+[자막 큐]
+{cue_blocks}
+"""
+
+
+def _format_cue(cue_id: int, timestamp: str, text: str) -> str:
+    return f"[[{cue_id}]] {timestamp}\n{text}"
+
+
+def _make_chunk(index: int, ids: List[int], cues: Sequence[dict]) -> CueChunk:
+    return CueChunk(
+        index=index,
+        cue_ids=list(ids),
+        timestamps=[cues[i - 1]["timestamp"] for i in ids],
+        texts=[cues[i - 1]["text"] for i in ids],
+    )
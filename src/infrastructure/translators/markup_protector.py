@@ -0,0 +1,104 @@
+"""Markup Protector - 자막 마크업을 자리표시자로 바꿔 번역 모델 입력에서 제외하고 복원."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+# 줄 앞뒤의 마크업: HTML 태그(<i>, <font ...>), ASS 태그({\an8}), 음표
+_TAG = r"<[^<>\n]+>|\{\\[^{}\n]*\}|[♪♫]+"
+# 줄 앞: 마크업, 대화 대시("- "), 화자 이름("JOHN:", "DR. SMITH:")
+_LEADING_RE = re.compile(
+    rf"^(?:\s+|{_TAG}|-\s+|[A-Z][A-Z0-9 .'&-]*[A-Z0-9.]:\s+|[A-Z]:\s+)+"
+)
+_TRAILING_RE = re.compile(rf"(?:\s+|{_TAG})+$")
+# 줄 중간: 마크업과 URL은 자리표시자로 치환
+_INLINE_RE = re.compile(rf"{_TAG}|(?:https?://|www\.)[^\s<>]+")
+
+# 자리표시자 "⟦0⟧" (모델이 공백을 끼워 넣어도 복원)
+_PLACEHOLDER = "⟦{}⟧"
+_PLACEHOLDER_RE = re.compile(r"⟦\s*(\d+)\s*⟧")
+_TRANSLATABLE_RE = re.compile(r"[^\W\d_]")
+
+
+@dataclass(frozen=True, slots=True)
+class ProtectedLine:
+    """마크업을 분리한 자막 한 줄"""
+    prefix: str
+    text: str  # 모델 입력 (줄 중간 마크업은 자리표시자)
+    suffix: str
+    spans: Tuple[str, ...]  # 자리표시자 번호 순 원본 마크업
+
+    @property
+    def needs_translation(self) -> bool:
+        """번역할 글자가 남아 있는지 여부 (마크업/숫자/기호뿐이면 False)"""
+        return _TRANSLATABLE_RE.search(_PLACEHOLDER_RE.sub("", self.text)) is not None
+
+    def restore(self, translated: str) -> str:
+        """번역 결과의 자리표시자를 원본 마크업으로 되돌리고 앞뒤 마크업을 붙임
+
+        모델이 자리표시자를 빠뜨리면 해당 마크업을 줄 끝에 원래 순서대로 붙이고,
+        중복된 자리표시자는 제거한다.
+        """
+        used = set()
+
+        def replace(match: re.Match) -> str:
+            index = int(match.group(1))
+            if index >= len(self.spans) or index in used:
+                return ""
+            used.add(index)
+            return self.spans[index]
+
+        body = _PLACEHOLDER_RE.sub(replace, translated.strip())
+        missing = "".join(
+            span for index, span in enumerate(self.spans) if index not in used
+        )
+        return f"{self.prefix}{body}{missing}{self.suffix}"
+
+
+def protect_line(line: str) -> ProtectedLine:
+    """자막 한 줄에서 마크업, 화자 이름, URL을 분리
+
+    Args:
+        line: 줄바꿈이 없는 자막 텍스트
+
+    Returns:
+        ProtectedLine (restore로 원본 마크업을 정확히 복원)
+    """
+    leading = _LEADING_RE.match(line)
+    prefix = leading.group(0) if leading else ""
+    rest = line[len(prefix):]
+
+    trailing = _TRAILING_RE.search(rest)
+    suffix = trailing.group(0) if trailing else ""
+    core = rest[:len(rest) - len(suffix)]
+
+    spans: List[str] = []
+
+    def replace(match: re.Match) -> str:
+        spans.append(match.group(0))
+        return _PLACEHOLDER.format(len(spans) - 1)
+
+    text = _INLINE_RE.sub(replace, core)
+    return ProtectedLine(prefix, text, suffix, tuple(spans))
+
+
+def protect_text(text: str) -> List[ProtectedLine]:
+    """여러 줄 자막 텍스트를 줄 단위로 protect_line"""
+    return [protect_line(line) for line in text.split("\n")]
+
+
+def restore_text(lines: List[ProtectedLine], translations: Iterator[str]) -> str:
+    """protect_text 결과를 번역문으로 복원
+
+    Args:
+        lines: protect_text 결과
+        translations: needs_translation인 줄의 번역문 (줄 순서대로)
+
+    Returns:
+        마크업이 복원된 여러 줄 텍스트
+    """
+    return "\n".join(
+        line.restore(next(translations) if line.needs_translation else line.text)
+        for line in lines
+    )
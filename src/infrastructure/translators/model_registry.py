@@ -0,0 +1,151 @@
+"""Model Registry - 언어 쌍별 번역 모델 변형(원본/int8/경량) 등록과 처리 속도 기록."""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_MODEL_REGISTRY_PATH = (
+    Path.home() / ".cache" / "youtube-subtitle-translator" / "model_registry.json"
+)
+
+# 측정된 변형 중 가장 빠른 것을 고르는 선택자 (대량 번역용)
+FASTEST_VARIANT = "fastest"
+# 처리 속도 이동 평균 가중치 (최근 측정 비중)
+_THROUGHPUT_SMOOTHING = 0.3
+
+
+@dataclass(frozen=True, slots=True)
+class ModelVariant:
+    """한 언어 쌍의 번역 모델 변형
+
+    model_path가 없으면 설치된 Argos 패키지의 모델을 사용하고,
+    있으면 그 CTranslate2 모델 디렉터리를 사용한다 (토크나이저는 패키지 것을 공유).
+    """
+    name: str  # 예: "full", "int8", "distilled"
+    source_language: str
+    target_language: str
+    model_path: Optional[str] = None
+    compute_type: Optional[str] = None  # 예: "int8" (None이면 어댑터 설정)
+    cues_per_second: Optional[float] = None  # 측정된 처리 속도 (모델 입력 수/초, 이동 평균)
+    runs: int = 0  # 처리 속도 측정 횟수
+
+
+class ModelRegistry:
+    """모델 변형 레지스트리 (JSON 파일에 저장)
+
+    - 같은 언어 쌍에 여러 변형을 등록하고 작업마다 이름으로 선택한다.
+    - 번역이 끝날 때마다 변형별 초당 큐 수를 기록한다.
+    - FASTEST_VARIANT로 선택하면 아직 측정되지 않은 변형을 먼저 시도하고
+      (여럿이면 마지막으로 등록된 변형), 모두 측정되었으면 가장 빠른 것을 고른다.
+    """
+
+    def __init__(self, path: Path = DEFAULT_MODEL_REGISTRY_PATH) -> None:
+        """
+        Args:
+            path: 레지스트리 JSON 파일 경로 (없으면 빈 레지스트리)
+        """
+        self._path = Path(path)
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """레지스트리 파일 경로"""
+        return self._path
+
+    def register(self, variant: ModelVariant) -> None:
+        """변형 등록 (같은 이름이 있으면 측정 기록은 유지하고 설정만 교체)
+
+        Raises:
+            ValueError: 변형 이름이 비어 있거나 선택자 이름과 같은 경우
+        """
+        if not variant.name or variant.name == FASTEST_VARIANT:
+            raise ValueError(f"Invalid model variant name: {variant.name!r}")
+
+        with self._lock:
+            entries = self._load()
+            variants = entries.setdefault(_pair_key(variant), [])
+            for index, existing in enumerate(variants):
+                if existing["name"] == variant.name:
+                    variants[index] = {
+                        **asdict(variant),
+                        "cues_per_second": existing.get("cues_per_second"),
+                        "runs": existing.get("runs", 0),
+                    }
+                    break
+            else:
+                variants.append(asdict(variant))
+            self._save(entries)
+
+    def variants(self, source_language: str, target_language: str) -> List[ModelVariant]:
+        """언어 쌍의 변형 목록 (등록 순서)"""
+        entries = self._load().get(f"{source_language}-{target_language}", [])
+        return [ModelVariant(**entry) for entry in entries]
+
+    def select(
+        self, source_language: str, target_language: str, name: str
+    ) -> Optional[ModelVariant]:
+        """이름(또는 FASTEST_VARIANT)으로 변형 선택
+
+        Returns:
+            선택된 변형 (언어 쌍에 등록된 변형이 없으면 None)
+
+        Raises:
+            ValueError: 등록된 변형 중 해당 이름이 없는 경우
+        """
+        variants = self.variants(source_language, target_language)
+        if not variants:
+            return None
+
+        if name == FASTEST_VARIANT:
+            # 나중에 등록된 변형도 한 번은 측정되도록 미측정 변형부터 선택
+            unmeasured = [v for v in variants if v.cues_per_second is None]
+            if unmeasured:
+                return unmeasured[-1]
+            return max(variants, key=lambda v: v.cues_per_second)
+
+        for variant in variants:
+            if variant.name == name:
+                return variant
+        raise ValueError(
+            f"Model variant '{name}' is not registered for "
+            f"{source_language} -> {target_language}"
+        )
+
+    def record_throughput(self, variant: ModelVariant, cues_per_second: float) -> None:
+        """번역 처리 속도(초당 큐 수) 기록 (이동 평균으로 누적)"""
+        with self._lock:
+            entries = self._load()
+            for entry in entries.get(_pair_key(variant), []):
+                if entry["name"] != variant.name:
+                    continue
+                previous = entry.get("cues_per_second")
+                if previous is None:
+                    entry["cues_per_second"] = round(cues_per_second, 2)
+                else:
+                    entry["cues_per_second"] = round(
+                        previous + _THROUGHPUT_SMOOTHING * (cues_per_second - previous), 2
+                    )
+                entry["runs"] = entry.get("runs", 0) + 1
+                self._save(entries)
+                return
+
+    def _load(self) -> Dict[str, List[dict]]:
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self, entries: Dict[str, List[dict]]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(entries, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(temp_path, self._path)
+
+
+def _pair_key(variant: ModelVariant) -> str:
+    return f"{variant.source_language}-{variant.target_language}"
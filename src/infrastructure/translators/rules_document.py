@@ -0,0 +1,51 @@
+"""Rules Document - rules.md의 마크다운 표를 섹션 제목으로 찾아 읽기."""
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import List
+
+_HEADING_RE = re.compile(r"^#{1,6}\s*(?P<title>.+?)\s*$")
+_TABLE_SEPARATOR_RE = re.compile(r"^\|?[\s:|-]+\|?$")
+
+
+def read_markdown_table(path: Path, section: str) -> List[List[str]]:
+    """섹션 제목 아래 첫 마크다운 표의 본문 행 읽기
+
+    다음 제목이나 구분선("---")이 나오면 섹션이 끝난 것으로 본다.
+
+    Args:
+        path: 마크다운 파일 (예: rules.md)
+        section: 섹션 제목 ("#" 제외, 예: "금칙어 대체 가이드")
+
+    Returns:
+        행마다 앞뒤 공백을 제거한 셀 리스트 (머리글 행 제외)
+
+    Raises:
+        FileNotFoundError: 파일이 없을 경우
+        ValueError: 섹션이 없는 경우
+    """
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    start = next(
+        (
+            i + 1 for i, line in enumerate(lines)
+            if (match := _HEADING_RE.match(line)) and match.group("title") == section
+        ),
+        None,
+    )
+    if start is None:
+        raise ValueError(f"Section '{section}' not found in {path}")
+
+    rows: List[List[str]] = []
+    header_seen = False
+    for line in lines[start:]:
+        line = line.strip()
+        if _HEADING_RE.match(line) or line == "---":
+            break
+        if not line.startswith("|") or _TABLE_SEPARATOR_RE.match(line):
+            continue
+        if not header_seen:
+            header_seen = True
+            continue
+        rows.append([cell.strip() for cell in line.strip("|").split("|")])
+    return rows
@@ -0,0 +1,198 @@
+"""Sentence Merger - 조각난 큐를 문장 단위로 합치고 번역 결과를 다시 분배."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from src.infrastructure.translators.srt_cues import parse_srt_timestamp
+
+# 이 간격(ms)보다 멀리 떨어진 큐는 같은 문장으로 보지 않음
+DEFAULT_MAX_GAP_MS = 1000
+# 한 문장으로 합칠 최대 큐 수 / 최대 글자 수
+DEFAULT_MAX_CUES_PER_SENTENCE = 3
+DEFAULT_MAX_SENTENCE_CHARS = 200
+
+# 문장 종결 부호 (뒤따르는 닫는 따옴표/괄호 허용)
+_SENTENCE_END_RE = re.compile(r"[.!?…。？！♪]['\"”’)\]]*$")
+# 화자 전환("- 대사") 또는 효과음 태그("[Music]", "(laughs)")는 독립 큐로 취급
+_STANDALONE_RE = re.compile(r"^(-|\[.*\]$|\(.*\)$)")
+# 한 줄 안의 문장 경계: 종결 부호(+닫는 따옴표/괄호) 뒤 공백, 다음 문장은 대문자/숫자/여는 부호로 시작
+_SENTENCE_BOUNDARY_RE = re.compile(r"[.!?…]['\"”’)\]]*(\s+)(?=[A-Z0-9\"“‘'(\[¿¡])")
+# 마침표가 문장 끝이 아닌 흔한 약어 (소문자 비교)
+_ABBREVIATIONS = frozenset({
+    "mr.", "mrs.", "ms.", "dr.", "prof.", "st.", "jr.", "sr.", "vs.", "etc.",
+    "e.g.", "i.e.", "no.", "u.s.", "u.k.", "a.m.", "p.m.",
+})
+
+
+@dataclass(frozen=True, slots=True)
+class SentenceGroup:
+    """하나의 번역 단위로 합쳐진 연속 큐 묶음"""
+    cue_indices: Tuple[int, ...]
+    text: str
+    durations: Tuple[int, ...]  # 각 큐의 표시 시간(ms), 재분배 비율로 사용
+
+
+def merge_cues_into_sentences(
+    cues: Sequence[dict],
+    max_gap_ms: int = DEFAULT_MAX_GAP_MS,
+    max_cues: int = DEFAULT_MAX_CUES_PER_SENTENCE,
+    max_chars: int = DEFAULT_MAX_SENTENCE_CHARS,
+) -> List[SentenceGroup]:
+    """문장 부호와 큐 간격을 기준으로 조각 큐를 문장 단위로 병합
+
+    다음 중 하나면 현재 큐에서 문장을 끝낸다.
+    - 텍스트가 문장 종결 부호로 끝남
+    - 다음 큐까지의 간격이 max_gap_ms 초과 (또는 타임스탬프 해석 불가)
+    - 묶음이 max_cues / max_chars 한도에 도달
+    - 현재 또는 다음 큐가 화자 전환/효과음 태그
+
+    단일 큐 묶음은 원본 텍스트(줄바꿈 포함)를 그대로 유지한다.
+
+    Args:
+        cues: parse_srt_cues 결과
+        max_gap_ms: 같은 문장으로 볼 최대 큐 간격
+        max_cues: 한 문장으로 합칠 최대 큐 수
+        max_chars: 한 문장의 최대 글자 수
+
+    Returns:
+        원래 큐 순서를 유지하는 SentenceGroup 리스트
+    """
+    times = [parse_srt_timestamp(cue["timestamp"]) for cue in cues]
+    groups: List[SentenceGroup] = []
+    current: List[int] = []
+
+    def flush() -> None:
+        if not current:
+            return
+        if len(current) == 1:
+            text = cues[current[0]]["text"]
+        else:
+            text = " ".join(_flatten(cues[i]["text"]) for i in current)
+        durations = tuple(_duration(times[i]) for i in current)
+        groups.append(SentenceGroup(tuple(current), text, durations))
+        current.clear()
+
+    for i, cue in enumerate(cues):
+        current.append(i)
+        text = _flatten(cue["text"])
+        merged_chars = sum(len(_flatten(cues[j]["text"])) for j in current)
+
+        is_last = i == len(cues) - 1
+        ends_sentence = (
+            is_last
+            or _SENTENCE_END_RE.search(text) is not None
+            or _STANDALONE_RE.match(text) is not None
+            or _STANDALONE_RE.match(_flatten(cues[i + 1]["text"])) is not None
+            or len(current) >= max_cues
+            or merged_chars >= max_chars
+            or _gap(times[i], times[i + 1]) is None
+            or _gap(times[i], times[i + 1]) > max_gap_ms
+        )
+        if ends_sentence:
+            flush()
+
+    flush()
+    return groups
+
+
+def split_sentences(text: str) -> List[str]:
+    """한 줄을 문장 단위로 나눔 (Argos 번역 전 문장 분리와 같은 목적)
+
+    종결 부호 뒤 공백에서 나누되, 다음 문장이 대문자/숫자/여는 부호로 시작할 때만 나누고
+    흔한 약어("Mr.", "e.g." 등) 뒤에서는 나누지 않는다.
+
+    Args:
+        text: 한 줄 텍스트
+
+    Returns:
+        문장 리스트 (나눌 곳이 없으면 [text])
+    """
+    sentences: List[str] = []
+    start = 0
+    for match in _SENTENCE_BOUNDARY_RE.finditer(text):
+        end = match.start(1)
+        words = text[start:end].split()
+        if words and words[-1].lower() in _ABBREVIATIONS:
+            continue
+        sentences.append(text[start:end].strip())
+        start = match.end()
+    sentences.append(text[start:].strip())
+    return [sentence for sentence in sentences if sentence] or [text]
+
+
+def redistribute_translation(translated: str, durations: Sequence[int]) -> List[str]:
+    """번역된 문장을 원래 큐들의 표시 시간 비율로 나눔
+
+    띄어쓰기가 있으면 단어 경계에서, 없으면(일본어/중국어 등) 글자 단위로 나눈다.
+    각 큐에는 가능한 한 최소 한 단위가 배정된다.
+
+    Args:
+        translated: 번역된 문장
+        durations: 원래 큐들의 표시 시간(ms)
+
+    Returns:
+        durations와 같은 길이의 텍스트 리스트
+    """
+    count = len(durations)
+    if count == 1:
+        return [translated]
+
+    flat = _flatten(translated)
+    tokens = flat.split(" ")
+    separator = " "
+    if len(tokens) < count:
+        tokens = list(flat.replace(" ", ""))
+        separator = ""
+    if len(tokens) < count:
+        # 나눌 단위가 부족하면 앞 큐부터 한 단위씩 배정하고 나머지는 말줄임표
+        return tokens + ["…"] * (count - len(tokens))
+
+    total_duration = sum(durations)
+    weights = (
+        [d / total_duration for d in durations]
+        if total_duration > 0
+        else [1 / count] * count
+    )
+
+    # 누적 글자 수 기준으로 각 큐의 끝 위치를 정하고, 큐마다 최소 1토큰 보장
+    token_lengths = [len(token) for token in tokens]
+    total_chars = sum(token_lengths)
+    pieces: List[str] = []
+    start = 0
+    cumulative_weight = 0.0
+    for k in range(count - 1):
+        cumulative_weight += weights[k]
+        target_chars = total_chars * cumulative_weight
+        end = start + 1
+        consumed = sum(token_lengths[:end])
+        max_end = len(tokens) - (count - 1 - k)
+        while end < max_end and consumed + token_lengths[end] / 2 <= target_chars:
+            consumed += token_lengths[end]
+            end += 1
+        pieces.append(separator.join(tokens[start:end]))
+        start = end
+    pieces.append(separator.join(tokens[start:]))
+    return pieces
+
+
+def _flatten(text: str) -> str:
+    """여러 줄 텍스트를 한 줄로 합침"""
+    return " ".join(line.strip() for line in text.split("\n") if line.strip())
+
+
+def _duration(time_range: Optional[Tuple[int, int]]) -> int:
+    """큐 표시 시간(ms) - 해석 불가 시 0"""
+    if time_range is None:
+        return 0
+    return max(0, time_range[1] - time_range[0])
+
+
+def _gap(
+    current: Optional[Tuple[int, int]], following: Optional[Tuple[int, int]]
+) -> Optional[int]:
+    """현재 큐 끝과 다음 큐 시작 사이 간격(ms) - 해석 불가 시 None"""
+    if current is None or following is None:
+        return None
+    return following[0] - current[1]
@@ -0,0 +1,180 @@
+"""SRT 큐 파싱/재조립 공용 함수."""
+from __future__ import annotations
+
+import os
+import re
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, format_srt, parse_srt
+
+_WHITESPACE_RE = re.compile(r"[^\S\n]+")
+_TIMESTAMP_RE = re.compile(
+    r"(\d+):(\d{2}):(\d{2})[,.](\d{3})\s*-->\s*(\d+):(\d{2}):(\d{2})[,.](\d{3})"
+)
+
+
+def load_subtitle_text(subtitle: Subtitle) -> str:
+    """Subtitle의 SRT 텍스트 반환 (text가 없으면 file_path에서 읽음)
+
+    Raises:
+        ValueError: text/file_path가 모두 없거나 내용이 비어있는 경우
+    """
+    if subtitle.text is None:
+        if subtitle.file_path is None:
+            raise ValueError("Subtitle must have either text or file_path")
+        subtitle_text = subtitle.file_path.read_text(encoding="utf-8")
+    else:
+        subtitle_text = subtitle.text
+
+    if not subtitle_text or not subtitle_text.strip():
+        raise ValueError("Subtitle text cannot be empty or whitespace only")
+
+    return subtitle_text
+
+
+def parse_srt_cues(srt_text: str) -> List[dict]:
+    """SRT 텍스트를 큐 단위로 파싱
+
+    SRT 형식:
+    1
+    00:00:00,000 --> 00:00:02,000
+    First subtitle text
+
+    2
+    00:00:02,500 --> 00:00:05,000
+    Second subtitle text
+
+    Args:
+        srt_text: SRT 형식 텍스트
+
+    Returns:
+        큐 리스트 [{"number": str, "timestamp": str, "text": str}, ...]
+    """
+    return [
+        {"number": cue.number, "timestamp": cue.timestamp, "text": cue.text}
+        for cue in parse_srt(srt_text)
+    ]
+
+
+def reassemble_srt(cues: List[dict]) -> str:
+    """큐 리스트를 SRT 형식으로 재조립
+
+    Args:
+        cues: 큐 리스트
+
+    Returns:
+        SRT 형식 텍스트
+    """
+    return format_srt([
+        SubtitleCue(number=cue["number"], timestamp=cue["timestamp"], text=cue["text"])
+        for cue in cues
+    ])
+
+
+class SrtStreamWriter:
+    """번역된 큐를 도착 순서대로 부분 SRT 파일에 기록하는 writer
+
+    번역 중에는 "<이름>.partial.srt"에 큐마다 즉시 기록(flush)하므로
+    미리보기 등 후속 단계가 번역 완료 전에 읽을 수 있다.
+    commit() 시 최종 경로로 원자적으로 교체된다.
+    """
+
+    def __init__(self, output_path: Path) -> None:
+        """
+        Args:
+            output_path: 최종 SRT 파일 경로
+        """
+        self.output_path = output_path
+        self.partial_path = output_path.with_name(f"{output_path.stem}.partial.srt")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.partial_path.open("w", encoding="utf-8")
+        self._count = 0
+
+    def __enter__(self) -> "SrtStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.close()
+
+    @property
+    def count(self) -> int:
+        """기록한 큐 수"""
+        return self._count
+
+    def write(self, cue: SubtitleCue) -> None:
+        """큐 하나를 기록하고 즉시 flush"""
+        if self._count:
+            self._file.write("\n")
+        self._file.write(cue.to_srt() + "\n")
+        self._file.flush()
+        self._count += 1
+
+    def commit(self) -> Path:
+        """부분 파일을 닫고 최종 경로로 교체"""
+        self.close()
+        os.replace(self.partial_path, self.output_path)
+        return self.output_path
+
+    def close(self) -> None:
+        """파일만 닫음 (부분 파일은 남겨둠)"""
+        if not self._file.closed:
+            self._file.close()
+
+
+def parse_srt_timestamp(timestamp: str) -> Optional[Tuple[int, int]]:
+    """SRT 타임스탬프 줄을 (시작, 끝) 밀리초로 변환
+
+    Args:
+        timestamp: "00:00:01,000 --> 00:00:02,500" 형식 문자열
+
+    Returns:
+        (start_ms, end_ms) 또는 형식이 맞지 않으면 None
+    """
+    match = _TIMESTAMP_RE.search(timestamp)
+    if match is None:
+        return None
+
+    h1, m1, s1, ms1, h2, m2, s2, ms2 = (int(value) for value in match.groups())
+    start = ((h1 * 60 + m1) * 60 + s1) * 1000 + ms1
+    end = ((h2 * 60 + m2) * 60 + s2) * 1000 + ms2
+    return start, end
+
+
+def normalize_cue_text(text: str) -> str:
+    """캐시/중복 비교용 큐 텍스트 정규화
+
+    NFC 정규화 후 줄마다 공백을 축약하고 앞뒤 공백과 빈 줄을 제거한다.
+    줄바꿈은 자막 표시 형태이므로 유지한다.
+    """
+    lines = (
+        _WHITESPACE_RE.sub(" ", line).strip()
+        for line in unicodedata.normalize("NFC", text).split("\n")
+    )
+    return "\n".join(line for line in lines if line)
+
+
+def deduplicate_texts(texts: Sequence[str]) -> Tuple[List[str], List[int]]:
+    """정규화 기준으로 동일한 텍스트를 하나로 합침
+
+    Args:
+        texts: 큐 텍스트 리스트
+
+    Returns:
+        (첫 등장 순서의 고유 정규화 텍스트, 각 입력 텍스트가 가리키는 고유 텍스트 인덱스)
+    """
+    unique: List[str] = []
+    positions: Dict[str, int] = {}
+    mapping: List[int] = []
+    for text in texts:
+        key = normalize_cue_text(text)
+        if key not in positions:
+            positions[key] = len(unique)
+            unique.append(key)
+        mapping.append(positions[key])
+    return unique, mapping
@@ -0,0 +1,269 @@
+"""Style Rules - rules.md 금칙어 대체표를 하나의 정규식으로 컴파일해 번역 결과를 후처리."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.application.ports.subtitle_translator import (
+    ProgressCallback,
+    SubtitleTranslatorPort,
+)
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, format_srt
+from src.infrastructure.translators.rules_document import read_markdown_table
+
+# rules.md에서 대체표를 읽을 섹션 제목
+STYLE_RULES_SECTION = "금칙어 대체 가이드"
+
+
+# 절/문장 끝 판단: 닫는 따옴표/괄호 뒤에 문장 부호, 쉼표 또는 줄 끝
+_CLAUSE_END = r"(?=['\"”’)\]]*(?:[.!?…,]|[ \t]*$))"
+
+
+@dataclass(frozen=True, slots=True)
+class StyleRule:
+    """금칙어 하나와 대체 표현 ("~것이다" -> "~거예요"의 "~"는 제외하고 저장)
+
+    금칙어는 대부분 어미이므로 기본적으로 절/문장 끝에서만 바꾼다.
+    "에 있어서"처럼 문장 중간에 오는 표현은 preceding으로 바로 앞에 올 말을
+    지정해 다른 뜻("집에 있어서 못 가요")과 구분한다.
+    """
+    pattern: str
+    replacement: str
+    clause_end: bool = True  # 절/문장 끝(문장 부호, 쉼표, 줄 끝 앞)에서만 적용
+    preceding: Tuple[str, ...] = ()  # 비어 있지 않으면 이 말 바로 뒤에서만 적용
+
+    def to_regex(self) -> str:
+        """문맥 조건을 포함한 정규식 (일치 부분은 금칙어만)"""
+        regex = re.escape(self.pattern)
+        if self.preceding:
+            # 길이가 다른 앞말은 각각 고정 길이 lookbehind로 나열
+            lookbehinds = "|".join(f"(?<={re.escape(word)})" for word in self.preceding)
+            regex = f"(?:{lookbehinds}){regex}"
+        if self.clause_end:
+            regex += _CLAUSE_END
+        return regex
+
+
+@dataclass(frozen=True, slots=True)
+class StyleRewrite:
+    """후처리로 바뀐 부분 하나 (보고용)"""
+    cue_number: str
+    start: int  # 원본 큐 텍스트 기준 위치
+    original: str
+    replacement: str
+
+
+class StyleRuleEngine:
+    """금칙어 대체 엔진
+
+    모든 금칙어를 긴 것부터 나열한 하나의 정규식으로 컴파일해
+    큐 텍스트를 한 번만 훑으며 치환한다. 같은 위치에서는 가장 긴 금칙어가,
+    겹치는 경우에는 먼저 시작하는 금칙어가 적용된다.
+    규칙의 문맥 조건(절 끝, 앞말)을 만족하지 않는 곳은 바꾸지 않는다.
+    """
+
+    def __init__(self, rules: Sequence[StyleRule], language: str = "ko") -> None:
+        """
+        Args:
+            rules: 금칙어 대체 규칙 (같은 금칙어가 여러 번 나오면 마지막 규칙 사용)
+            language: 규칙을 적용할 목표 언어 코드
+        """
+        by_pattern: Dict[str, StyleRule] = {rule.pattern: rule for rule in rules if rule.pattern}
+        self._rules: List[StyleRule] = sorted(
+            by_pattern.values(), key=lambda rule: len(rule.pattern), reverse=True
+        )
+        self._language = language
+        self._regex: Optional[re.Pattern] = (
+            re.compile(
+                "|".join(f"(?P<r{i}>{rule.to_regex()})" for i, rule in enumerate(self._rules)),
+                re.MULTILINE,
+            )
+            if self._rules else None
+        )
+
+    @property
+    def language(self) -> str:
+        """규칙을 적용할 목표 언어 코드"""
+        return self._language
+
+    @property
+    def rule_count(self) -> int:
+        """컴파일된 금칙어 수"""
+        return len(self._rules)
+
+    def rewrite(self, text: str, cue_number: str = "") -> Tuple[str, List[StyleRewrite]]:
+        """큐 텍스트 하나에 금칙어 대체 적용
+
+        Returns:
+            (후처리된 텍스트, 바뀐 부분 목록)
+        """
+        if self._regex is None:
+            return text, []
+
+        rewrites: List[StyleRewrite] = []
+
+        def replace(match: re.Match) -> str:
+            replacement = self._rules[int(match.lastgroup[1:])].replacement
+            rewrites.append(StyleRewrite(cue_number, match.start(), match.group(0), replacement))
+            return replacement
+
+        return self._regex.sub(replace, text), rewrites
+
+    def apply(
+        self, cues: Sequence[SubtitleCue]
+    ) -> Tuple[List[SubtitleCue], List[StyleRewrite]]:
+        """모든 큐에 금칙어 대체 적용 (큐마다 한 번씩 훑음)
+
+        Returns:
+            (후처리된 큐 리스트, 모든 큐의 바뀐 부분 목록 - 큐 순서)
+        """
+        rewritten: List[SubtitleCue] = []
+        rewrites: List[StyleRewrite] = []
+        for cue in cues:
+            text, cue_rewrites = self.rewrite(cue.text, cue.number)
+            rewritten.append(
+                SubtitleCue(number=cue.number, timestamp=cue.timestamp, text=text)
+                if cue_rewrites else cue
+            )
+            rewrites.extend(cue_rewrites)
+        return rewritten, rewrites
+
+
+def load_style_rules(path: Path, section: str = STYLE_RULES_SECTION) -> List[StyleRule]:
+    """rules.md의 금칙어 대체표 파싱
+
+    형식 (| 금칙어 | 대체 표현 | 적용 조건 | 표, 대체 표현이 여러 개면 첫 번째 사용):
+        ### 금칙어 대체 가이드
+        | 금칙어 | 대체 표현 | 적용 조건 |
+        |--------|----------|----------|
+        | ~것이다 | ~거예요, ~이에요 | 문장 끝 |
+        | ~에 있어서 | ~에서, ~할 때 | 앞말: 교육, 경우 |
+
+    적용 조건 (비어 있거나 열이 없으면 "문장 끝"):
+        문장 끝: 절/문장 끝에서만 적용
+        앞말: a, b: 나열한 말 바로 뒤에서만 적용 (문장 중간 포함)
+        어디서나: 문맥 조건 없이 적용
+
+    Raises:
+        FileNotFoundError: 파일이 없을 경우
+        ValueError: 대체표 섹션이 없거나 적용 조건을 알 수 없는 경우
+    """
+    rules: List[StyleRule] = []
+    for cells in read_markdown_table(path, section):
+        if len(cells) < 2 or not cells[0] or not cells[1]:
+            continue
+        replacement = cells[1].split(",")[0].strip()
+        condition = cells[2] if len(cells) > 2 else ""
+        rules.append(
+            StyleRule(
+                _strip_tilde(cells[0]),
+                _strip_tilde(replacement),
+                **_parse_condition(condition),
+            )
+        )
+    return rules
+
+
+class StyleRuleTranslatorAdapter(SubtitleTranslatorPort):
+    """번역 결과에 금칙어 대체를 적용하는 SubtitleTranslatorPort 래퍼
+
+    목표 언어가 규칙 언어와 같을 때만 적용하고,
+    마지막 번역에서 바뀐 부분은 rewrites로 확인한다.
+    """
+
+    def __init__(self, translator: SubtitleTranslatorPort, engine: StyleRuleEngine) -> None:
+        """
+        Args:
+            translator: 실제 번역을 수행할 포트 구현체
+            engine: 금칙어 대체 엔진
+        """
+        self._translator = translator
+        self._engine = engine
+        self._rewrites: List[StyleRewrite] = []
+
+    @property
+    def engine_version(self) -> str:
+        """내부 번역기의 엔진 버전 (후처리는 캐시 키에 영향 없음)"""
+        return getattr(self._translator, "engine_version", type(self._translator).__name__)
+
+    @property
+    def rewrites(self) -> List[StyleRewrite]:
+        """마지막 번역에서 바뀐 부분 목록"""
+        return list(self._rewrites)
+
+    def translate(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Subtitle:
+        """번역 후 금칙어 대체"""
+        translated_cues = list(
+            self.translate_stream(subtitle, target_language, progress_callback)
+        )
+        return subtitle.with_translation(format_srt(translated_cues), target_language)
+
+    def translate_stream(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterator[SubtitleCue]:
+        """내부 번역기 스트림의 큐마다 금칙어 대체 후 yield"""
+        self._rewrites = []
+        stream = self._translator.translate_stream(subtitle, target_language, progress_callback)
+        if target_language != self._engine.language:
+            yield from stream
+            return
+
+        for cue in stream:
+            text, rewrites = self._engine.rewrite(cue.text, cue.number)
+            self._rewrites.extend(rewrites)
+            yield SubtitleCue(number=cue.number, timestamp=cue.timestamp, text=text)
+
+    def list_supported_languages(self) -> List[str]:
+        """내부 번역기의 지원 언어 목록"""
+        return self._translator.list_supported_languages()
+
+    def is_language_pair_supported(
+        self, source_language: str, target_language: str
+    ) -> bool:
+        """내부 번역기의 언어 쌍 지원 여부"""
+        return self._translator.is_language_pair_supported(
+            source_language, target_language
+        )
+
+
+def format_rewrite_report(rewrites: Sequence[StyleRewrite]) -> List[str]:
+    """바뀐 부분 보고 줄 목록 (예: "#12: 것이다 -> 거예요")"""
+    return [
+        f"#{rewrite.cue_number}: {rewrite.original} -> {rewrite.replacement}"
+        for rewrite in rewrites
+    ]
+
+
+def _strip_tilde(expression: str) -> str:
+    return expression.lstrip("~").strip()
+
+
+def _parse_condition(condition: str) -> dict:
+    """대체표의 적용 조건 셀을 StyleRule 인자로 변환
+
+    Raises:
+        ValueError: 알 수 없는 적용 조건
+    """
+    condition = condition.strip()
+    if condition in ("", "문장 끝"):
+        return {"clause_end": True}
+    if condition == "어디서나":
+        return {"clause_end": False}
+    if condition.startswith("앞말:"):
+        words = tuple(
+            word.strip() for word in condition[len("앞말:"):].split(",") if word.strip()
+        )
+        if words:
+            return {"clause_end": False, "preceding": words}
+    raise ValueError(f"Unknown style rule condition: {condition}")
@@ -0,0 +1,147 @@
+"""Thread Tuning - CTranslate2 스레드/연산 타입 설정 자동 튜닝과 디스크 캐시."""
+from __future__ import annotations
+
+import json
+import os
+import platform
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+# 호스트별 튜닝 결과 캐시 파일
+DEFAULT_AUTOTUNE_CACHE_PATH = (
+    Path.home() / ".cache" / "youtube-subtitle-translator" / "ctranslate2_autotune.json"
+)
+# 튜닝에 사용할 샘플 큐 수
+DEFAULT_AUTOTUNE_SAMPLE_SIZE = 64
+# 기본 후보 연산 타입 ("default"는 모델 저장 타입, "int8"은 CPU 양자화)
+DEFAULT_COMPUTE_TYPES = ("default", "int8")
+
+
+@dataclass(frozen=True, slots=True)
+class ThreadingConfig:
+    """CTranslate2 Translator 생성 설정 (0/None이면 Argos 설정값 사용)"""
+    inter_threads: int = 0
+    intra_threads: int = 0
+    compute_type: Optional[str] = None
+
+    @property
+    def is_default(self) -> bool:
+        """Argos 설정을 그대로 따르는지 여부"""
+        return self == ThreadingConfig()
+
+
+def candidate_configs(
+    cpu_count: Optional[int] = None,
+    compute_types: Sequence[str] = DEFAULT_COMPUTE_TYPES,
+) -> List[ThreadingConfig]:
+    """코어 수에 맞는 inter × intra 스레드 조합 후보
+
+    inter_threads × intra_threads가 코어 수를 넘지 않는 조합만 만들어
+    동시 작업 간 과다 구독을 피한다.
+
+    Args:
+        cpu_count: 사용할 코어 수 (None이면 os.cpu_count())
+        compute_types: 후보 연산 타입
+
+    Returns:
+        ThreadingConfig 리스트 (inter_threads 오름차순)
+    """
+    cores = max(cpu_count or os.cpu_count() or 1, 1)
+    inter_options = sorted({1, 2, 4, cores} & set(range(1, cores + 1)))
+    return [
+        ThreadingConfig(inter, max(cores // inter, 1), compute_type)
+        for inter in inter_options
+        for compute_type in compute_types
+    ]
+
+
+def default_threads_per_worker(workers: int, cpu_count: Optional[int] = None) -> int:
+    """샤드 워커 프로세스당 CTranslate2 스레드 수 기본값
+
+    워커마다 모든 코어를 쓰면 워커 수만큼 과다 구독되므로 코어를 워커 수로 나눈다.
+
+    Args:
+        workers: 샤드 워커 프로세스 수
+        cpu_count: 사용할 코어 수 (None이면 os.cpu_count())
+
+    Returns:
+        워커당 스레드 수 (최소 1)
+    """
+    cores = max(cpu_count or os.cpu_count() or 1, 1)
+    return max(1, cores // max(workers, 1))
+
+
+def host_key() -> str:
+    """튜닝 결과를 구분하는 호스트 식별자 (이름, 아키텍처, 코어 수)"""
+    return f"{platform.node()}/{platform.machine()}/{os.cpu_count()}"
+
+
+class AutotuneCache:
+    """튜닝 결과 JSON 캐시 {키: {"inter_threads", "intra_threads", "compute_type", "cues_per_second"}}"""
+
+    def __init__(self, path: Path = DEFAULT_AUTOTUNE_CACHE_PATH) -> None:
+        self._path = Path(path)
+
+    def get(self, key: str) -> Optional[ThreadingConfig]:
+        """캐시된 설정 조회 (파일이 없거나 손상되었으면 None)"""
+        entry = self._load().get(key)
+        if not isinstance(entry, dict):
+            return None
+        try:
+            return ThreadingConfig(
+                inter_threads=int(entry["inter_threads"]),
+                intra_threads=int(entry["intra_threads"]),
+                compute_type=entry.get("compute_type"),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def put(self, key: str, config: ThreadingConfig, cues_per_second: float) -> None:
+        """설정 저장 (임시 파일에 쓴 뒤 교체)"""
+        entries = self._load()
+        entries[key] = {**asdict(config), "cues_per_second": round(cues_per_second, 2)}
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+        os.replace(temp_path, self._path)
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+
+def autotune(
+    benchmark: Callable[[ThreadingConfig], float],
+    candidates: Sequence[ThreadingConfig],
+    cache: AutotuneCache,
+    cache_key: str,
+) -> ThreadingConfig:
+    """후보 설정을 벤치마크해 가장 빠른 설정을 반환 (캐시에 있으면 벤치마크 생략)
+
+    Args:
+        benchmark: 설정을 받아 초당 처리 큐 수를 반환하는 함수
+        candidates: 후보 설정
+        cache: 결과 캐시
+        cache_key: 호스트/엔진/언어 쌍을 구분하는 캐시 키
+
+    Returns:
+        가장 빠른 ThreadingConfig
+
+    Raises:
+        ValueError: 후보가 없을 경우
+    """
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    if not candidates:
+        raise ValueError("At least one threading candidate is required")
+
+    results = [(benchmark(config), config) for config in candidates]
+    best_rate, best_config = max(results, key=lambda result: result[0])
+    cache.put(cache_key, best_config, best_rate)
+    return best_config
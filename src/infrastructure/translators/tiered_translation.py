@@ -0,0 +1,258 @@
+"""Tiered Translation - 빠른 엔진의 초안을 즉시 저장하고 고품질 엔진 번역으로 큐를 교체하는 2단계 번역."""
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.application.ports.subtitle_translator import (
+    ProgressCallback,
+    SubtitleTranslatorPort,
+)
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, format_srt
+
+DRAFT_TIER = "draft"
+REFINED_TIER = "refined"
+
+# 정제된 큐를 몇 개 모을 때마다 파일을 교체할지
+DEFAULT_SWAP_EVERY = 16
+
+
+def provenance_path_for(output_path: Path) -> Path:
+    """SRT 파일의 큐별 출처 기록 경로 (<이름>.provenance.json)"""
+    return output_path.with_name(f"{output_path.stem}.provenance.json")
+
+
+def read_provenance(output_path: Path) -> List[Optional[str]]:
+    """큐 순서대로 출처 목록 읽기 (기록이 없으면 빈 리스트)"""
+    try:
+        data = json.loads(provenance_path_for(output_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    return [entry.get("provenance") for entry in data.get("cues", [])]
+
+
+class TieredSubtitleFile:
+    """큐 단위로 교체 가능한 번역 SRT 파일
+
+    교체할 때마다 전체 SRT와 출처 기록(<이름>.provenance.json)을
+    임시 파일에 쓴 뒤 os.replace로 바꾸므로, 읽는 쪽은 항상 완전한 파일을 본다.
+    """
+
+    def __init__(self, output_path: Path, engines: Optional[Dict[str, str]] = None) -> None:
+        """
+        Args:
+            output_path: 번역 SRT 파일 경로
+            engines: {출처: 엔진 버전} (출처 기록에 함께 저장)
+        """
+        self.output_path = Path(output_path)
+        self.provenance_path = provenance_path_for(self.output_path)
+        self._engines = dict(engines or {})
+        self._cues: List[SubtitleCue] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cues(self) -> List[SubtitleCue]:
+        """현재 파일 내용 (큐 리스트 사본)"""
+        with self._lock:
+            return list(self._cues)
+
+    def write(self, cues: Iterable[SubtitleCue]) -> None:
+        """전체 큐를 기록 (초안)"""
+        with self._lock:
+            self._cues = list(cues)
+            self._flush()
+
+    def replace(self, replacements: Dict[int, SubtitleCue]) -> None:
+        """{큐 위치: 새 큐}로 일부 큐를 교체하고 파일을 원자적으로 바꿈
+
+        Raises:
+            IndexError: 기록된 큐 범위를 벗어난 위치
+        """
+        if not replacements:
+            return
+        with self._lock:
+            for index, cue in replacements.items():
+                if not 0 <= index < len(self._cues):
+                    raise IndexError(f"Cue index {index} is out of range")
+                self._cues[index] = cue
+            self._flush()
+
+    def _flush(self) -> None:
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        provenance = {
+            "engines": self._engines,
+            "cues": [
+                {"number": cue.number, "provenance": cue.provenance} for cue in self._cues
+            ],
+        }
+        _atomic_write(self.output_path, format_srt(self._cues))
+        _atomic_write(
+            self.provenance_path, json.dumps(provenance, indent=2, ensure_ascii=False)
+        )
+
+
+class TieredTranslationJob:
+    """백그라운드 정제 작업 상태"""
+
+    def __init__(self, file: TieredSubtitleFile, total_cues: int) -> None:
+        self.file = file
+        self.total_cues = total_cues
+        self._refined_cues = 0
+        self._error: Optional[BaseException] = None
+        self._done = threading.Event()
+
+    @property
+    def refined_cues(self) -> int:
+        """지금까지 정제되어 파일에 반영된 큐 수"""
+        return self._refined_cues
+
+    @property
+    def done(self) -> bool:
+        """정제 작업이 끝났는지 여부 (실패 포함)"""
+        return self._done.is_set()
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """정제 실패 원인 (실패해도 초안은 파일에 남음)"""
+        return self._error
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """정제 작업 종료 대기
+
+        Returns:
+            timeout 안에 끝났으면 True
+        """
+        return self._done.wait(timeout)
+
+
+class TieredTranslator:
+    """2단계 번역기
+
+    1. 초안 엔진(예: Argos int8)으로 전체 자막을 번역해 즉시 파일에 기록
+    2. 정제 엔진(예: LLM, NLLB)으로 백그라운드에서 다시 번역하며
+       swap_every개 큐마다 파일의 해당 큐를 원자적으로 교체
+
+    각 큐의 provenance에 어느 단계가 만든 줄인지("draft"/"refined") 기록한다.
+    """
+
+    def __init__(
+        self,
+        draft_translator: SubtitleTranslatorPort,
+        refine_translator: SubtitleTranslatorPort,
+        swap_every: int = DEFAULT_SWAP_EVERY,
+    ) -> None:
+        """
+        Args:
+            draft_translator: 빠른 초안 번역기
+            refine_translator: 고품질 정제 번역기
+            swap_every: 정제된 큐를 몇 개 모을 때마다 파일을 교체할지
+        """
+        if swap_every < 1:
+            raise ValueError("swap_every must be at least 1")
+
+        self._draft_translator = draft_translator
+        self._refine_translator = refine_translator
+        self._swap_every = swap_every
+
+    def translate(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        output_path: Path,
+        progress_callback: Optional[ProgressCallback] = None,
+        refine_progress_callback: Optional[ProgressCallback] = None,
+    ) -> TieredTranslationJob:
+        """초안을 번역해 저장한 뒤 정제 작업을 백그라운드로 시작
+
+        Args:
+            subtitle: 원본 자막
+            target_language: 목표 언어 코드
+            output_path: 번역 SRT 파일 경로
+            progress_callback: 초안 번역 진행 상황 콜백
+            refine_progress_callback: 정제 진행 상황 콜백 (백그라운드 스레드에서 호출)
+
+        Returns:
+            정제 작업 상태 (초안은 반환 시점에 이미 파일에 있음)
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍 또는 빈 자막
+            RuntimeError: 초안 번역 엔진 오류
+        """
+        for translator in (self._draft_translator, self._refine_translator):
+            if not translator.is_language_pair_supported(subtitle.language, target_language):
+                raise ValueError(
+                    f"{_engine_version(translator)} does not support "
+                    f"{subtitle.language} -> {target_language}"
+                )
+
+        draft = [
+            dataclasses.replace(cue, provenance=DRAFT_TIER)
+            for cue in self._draft_translator.translate_stream(
+                subtitle, target_language, progress_callback
+            )
+        ]
+        file = TieredSubtitleFile(output_path, engines={
+            DRAFT_TIER: _engine_version(self._draft_translator),
+            REFINED_TIER: _engine_version(self._refine_translator),
+        })
+        file.write(draft)
+
+        job = TieredTranslationJob(file, len(draft))
+        threading.Thread(
+            target=self._refine,
+            args=(job, subtitle, target_language, refine_progress_callback),
+            name="tiered-refine",
+            daemon=True,
+        ).start()
+        return job
+
+    def _refine(
+        self,
+        job: TieredTranslationJob,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback],
+    ) -> None:
+        """정제 번역 스트림을 받아 swap_every개마다 파일 교체 (백그라운드 스레드)"""
+        pending: Dict[int, SubtitleCue] = {}
+        index = 0
+        try:
+            for cue in self._refine_translator.translate_stream(
+                subtitle, target_language, progress_callback
+            ):
+                if index >= job.total_cues:
+                    raise RuntimeError(
+                        f"Refinement returned more cues than the draft ({job.total_cues})"
+                    )
+                pending[index] = dataclasses.replace(cue, provenance=REFINED_TIER)
+                index += 1
+                if len(pending) >= self._swap_every:
+                    job.file.replace(pending)
+                    job._refined_cues += len(pending)
+                    pending = {}
+            job.file.replace(pending)
+            job._refined_cues += len(pending)
+        except Exception as e:
+            # 실패 전까지 정제된 큐는 반영하고, 나머지는 초안으로 남김
+            try:
+                job.file.replace(pending)
+                job._refined_cues += len(pending)
+            finally:
+                job._error = e
+        finally:
+            job._done.set()
+
+
+def _engine_version(translator: SubtitleTranslatorPort) -> str:
+    return getattr(translator, "engine_version", type(translator).__name__)
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    temp_path.write_text(content, encoding="utf-8")
+    os.replace(temp_path, path)
@@ -0,0 +1,364 @@
+"""Translation Daemon - 모델을 상주시킨 채 여러 클라이언트 요청을 묶어 번역하는 로컬 HTTP 서버.
+
+엔드포인트 (JSON):
+    GET  /health     -> {"engine_version": str}
+    GET  /health?source=en&target=ko -> {"engine_version": str} (언어 쌍별 캐시 키 버전)
+    GET  /languages  -> {"languages": [str, ...]}
+    GET  /supports?source=en&target=ko -> {"supported": bool}
+    POST /translate  {"source_language", "target_language", "texts": [...]}
+                     -> {"translations": [...]}
+"""
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_DAEMON_HOST = "127.0.0.1"
+DEFAULT_DAEMON_PORT = 8765
+DEFAULT_DAEMON_URL = f"http://{DEFAULT_DAEMON_HOST}:{DEFAULT_DAEMON_PORT}"
+# 첫 요청 도착 후 다른 클라이언트 요청을 기다리는 시간
+DEFAULT_BATCH_WINDOW_MS = 20
+# 한 번에 엔진으로 넘길 최대 텍스트 수
+DEFAULT_MAX_BATCH_TEXTS = 512
+
+
+@dataclass
+class _PendingRequest:
+    """디스패처 대기열의 번역 요청 하나"""
+    source_language: str
+    target_language: str
+    texts: List[str]
+    future: Future = field(default_factory=Future)
+
+
+@dataclass
+class _EngineCall:
+    """디스패처 스레드에서 실행할 엔진 조회 (지원 언어 확인 등)"""
+    function: Callable[[object], object]
+    future: Future = field(default_factory=Future)
+
+
+_QueueItem = Union[_PendingRequest, _EngineCall, None]
+
+
+class BatchDispatcher:
+    """여러 클라이언트의 번역 요청을 짧은 시간 창 동안 모아 언어 쌍별로 한 번에 번역
+
+    번역과 엔진 조회(call())는 모두 디스패처 스레드 하나에서만 실행되므로
+    엔진은 스레드 안전할 필요가 없다.
+    """
+
+    def __init__(
+        self,
+        engine: object,
+        batch_window_ms: int = DEFAULT_BATCH_WINDOW_MS,
+        max_batch_texts: int = DEFAULT_MAX_BATCH_TEXTS,
+    ) -> None:
+        """
+        Args:
+            engine: translate_texts(texts, source, target)를 제공하는 번역 엔진
+                (예: ArgosTranslatorAdapter)
+            batch_window_ms: 요청을 모으는 시간 창
+            max_batch_texts: 모을 최대 텍스트 수 (도달 시 즉시 번역)
+        """
+        if batch_window_ms < 0:
+            raise ValueError("batch_window_ms cannot be negative")
+        if max_batch_texts < 1:
+            raise ValueError("max_batch_texts must be at least 1")
+
+        self._engine = engine
+        self._batch_window = batch_window_ms / 1000
+        self._max_batch_texts = max_batch_texts
+        self._queue: "queue.Queue[_QueueItem]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="translation-dispatcher", daemon=True
+        )
+        self._thread.start()
+        # 엔진 호출 횟수 (배치 효과 확인용)
+        self.engine_calls = 0
+
+    def submit(
+        self, source_language: str, target_language: str, texts: List[str]
+    ) -> Future:
+        """번역 요청을 대기열에 넣고 결과 Future 반환"""
+        request = _PendingRequest(source_language, target_language, list(texts))
+        self._queue.put(request)
+        return request.future
+
+    def translate(
+        self, source_language: str, target_language: str, texts: List[str]
+    ) -> List[str]:
+        """번역 요청 후 결과를 기다려 반환 (엔진 예외는 그대로 전달)"""
+        return self.submit(source_language, target_language, texts).result()
+
+    def call(self, function: Callable[[object], object]) -> object:
+        """디스패처 스레드에서 function(engine)을 실행하고 결과 반환 (예외는 그대로 전달)"""
+        engine_call = _EngineCall(function)
+        self._queue.put(engine_call)
+        return engine_call.future.result()
+
+    def close(self) -> None:
+        """디스패처 스레드 종료 (대기 중인 요청은 처리 후 종료)"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            if isinstance(first, _EngineCall):
+                self._execute(first)
+                continue
+
+            pending, calls, stop = self._collect(first)
+            self._dispatch(pending)
+            for engine_call in calls:
+                self._execute(engine_call)
+            if stop:
+                return
+
+    def _collect(
+        self, first: _PendingRequest
+    ) -> Tuple[List[_PendingRequest], List[_EngineCall], bool]:
+        """시간 창이 끝나거나 최대 텍스트 수에 도달할 때까지 요청을 모음
+
+        시간 창이 지나도 이미 대기열에 쌓인 요청(이전 번역 중 도착한 요청)은 함께 묶는다.
+        그 사이 도착한 엔진 조회는 번역 후 실행하도록 따로 모은다.
+
+        Returns:
+            (모은 요청 리스트, 엔진 조회 리스트, 종료 신호 수신 여부)
+        """
+        pending = [first]
+        calls: List[_EngineCall] = []
+        count = len(first.texts)
+        deadline = time.monotonic() + self._batch_window
+        while count < self._max_batch_texts:
+            timeout = deadline - time.monotonic()
+            try:
+                if timeout > 0:
+                    request = self._queue.get(timeout=timeout)
+                else:
+                    request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                return pending, calls, True
+            if isinstance(request, _EngineCall):
+                calls.append(request)
+                continue
+            pending.append(request)
+            count += len(request.texts)
+        return pending, calls, False
+
+    def _execute(self, engine_call: _EngineCall) -> None:
+        """엔진 조회 실행 후 결과/예외를 Future에 전달"""
+        try:
+            engine_call.future.set_result(engine_call.function(self._engine))
+        except Exception as e:
+            engine_call.future.set_exception(e)
+
+    def _dispatch(self, pending: List[_PendingRequest]) -> None:
+        """언어 쌍별로 텍스트를 이어 붙여 엔진을 한 번 호출하고 결과를 나눠줌"""
+        by_pair: Dict[Tuple[str, str], List[_PendingRequest]] = {}
+        for request in pending:
+            by_pair.setdefault(
+                (request.source_language, request.target_language), []
+            ).append(request)
+
+        for (source_language, target_language), requests in by_pair.items():
+            texts = [text for request in requests for text in request.texts]
+            try:
+                self.engine_calls += 1
+                translated = self._engine.translate_texts(
+                    texts, source_language, target_language
+                )
+            except Exception as e:
+                for request in requests:
+                    request.future.set_exception(e)
+                continue
+
+            start = 0
+            for request in requests:
+                end = start + len(request.texts)
+                request.future.set_result(translated[start:end])
+                start = end
+
+
+class TranslationDaemon:
+    """번역 엔진을 상주시키는 localhost HTTP 서버"""
+
+    def __init__(
+        self,
+        engine: object,
+        host: str = DEFAULT_DAEMON_HOST,
+        port: int = DEFAULT_DAEMON_PORT,
+        batch_window_ms: int = DEFAULT_BATCH_WINDOW_MS,
+        max_batch_texts: int = DEFAULT_MAX_BATCH_TEXTS,
+    ) -> None:
+        """
+        Args:
+            engine: translate_texts / list_supported_languages /
+                is_language_pair_supported / engine_version을 제공하는 엔진
+                (예: ArgosTranslatorAdapter)
+            host: 바인딩 주소 (기본값: 127.0.0.1 - 로컬 전용)
+            port: 포트 (0이면 임의 포트)
+            batch_window_ms: 요청을 모으는 시간 창
+            max_batch_texts: 한 번에 번역할 최대 텍스트 수
+        """
+        self.engine = engine
+        self.dispatcher = BatchDispatcher(engine, batch_window_ms, max_batch_texts)
+        self._server = ThreadingHTTPServer((host, port), _DaemonRequestHandler)
+        self._server.daemon_threads = True
+        self._server.translation_daemon = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """클라이언트 접속 URL"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def engine_version(self) -> str:
+        """엔진 버전 (클라이언트 캐시 키에 사용)"""
+        return getattr(self.engine, "engine_version", type(self.engine).__name__)
+
+    def engine_version_for(self, source_language: str, target_language: str) -> str:
+        """언어 쌍별 엔진 버전 (엔진이 제공하지 않으면 engine_version)
+
+        엔진의 engine_version_for는 모델 상태를 읽으므로 디스패처 스레드에서 호출한다.
+        클라이언트 번역 메모리가 같은 엔진을 직접 쓸 때와 같은 키를 쓰게 한다.
+        """
+        if not hasattr(self.engine, "engine_version_for"):
+            return self.engine_version
+        return self.dispatcher.call(
+            lambda engine: engine.engine_version_for(source_language, target_language)
+        )
+
+    def warm_up(self, language_pairs: Iterable[Tuple[str, str]]) -> None:
+        """지정 언어 쌍의 모델을 미리 로드 (짧은 문장을 한 번 번역)
+
+        Raises:
+            ValueError: 지원하지 않는 언어 쌍
+        """
+        for source_language, target_language in language_pairs:
+            self.dispatcher.translate(source_language, target_language, ["Hello."])
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서버 실행 (shutdown() 호출 시 반환)"""
+        self._server.serve_forever()
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 서버 실행"""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="translation-daemon", daemon=True
+        )
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        """서버와 디스패처 종료"""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        self.dispatcher.close()
+
+
+class _DaemonRequestHandler(BaseHTTPRequestHandler):
+    """TranslationDaemon HTTP 요청 처리기"""
+
+    server_version = "TranslationDaemon/1.0"
+
+    @property
+    def translation_daemon(self) -> TranslationDaemon:
+        return self.server.translation_daemon
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path == "/health":
+            query = parse_qs(url.query)
+            if "source" not in query or "target" not in query:
+                self._send_json(200, {"engine_version": self.translation_daemon.engine_version})
+                return
+            try:
+                version = self.translation_daemon.engine_version_for(
+                    query["source"][0], query["target"][0]
+                )
+            except Exception as e:
+                self._send_json(500, {"error": f"Engine query failed: {e}"})
+                return
+            self._send_json(200, {"engine_version": version})
+        elif url.path == "/languages":
+            # 엔진은 디스패처 스레드에서만 호출
+            try:
+                languages = self.translation_daemon.dispatcher.call(
+                    lambda engine: engine.list_supported_languages()
+                )
+            except Exception as e:
+                self._send_json(500, {"error": f"Engine query failed: {e}"})
+                return
+            self._send_json(200, {"languages": languages})
+        elif url.path == "/supports":
+            query = parse_qs(url.query)
+            source = query.get("source", [""])[0]
+            target = query.get("target", [""])[0]
+            try:
+                supported = self.translation_daemon.dispatcher.call(
+                    lambda engine: engine.is_language_pair_supported(source, target)
+                )
+            except Exception as e:
+                self._send_json(500, {"error": f"Engine query failed: {e}"})
+                return
+            self._send_json(200, {"supported": bool(supported)})
+        else:
+            self._send_json(404, {"error": f"Unknown path: {url.path}"})
+
+    def do_POST(self) -> None:
+        if urlparse(self.path).path != "/translate":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+            payload = json.loads(self.rfile.read(length).decode("utf-8"))
+            source_language = payload["source_language"]
+            target_language = payload["target_language"]
+            texts = payload["texts"]
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                raise ValueError("texts must be a list of strings")
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {"error": f"Invalid request: {e}"})
+            return
+
+        try:
+            translations = self.translation_daemon.dispatcher.translate(
+                source_language, target_language, texts
+            )
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": f"Translation failed: {e}"})
+            return
+
+        self._send_json(200, {"translations": translations})
+
+    def log_message(self, format: str, *args) -> None:
+        """요청마다 stderr 로그를 남기지 않음"""
+
+    def _send_json(self, status: int, body: dict) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
@@ -0,0 +1,237 @@
+"""Translation Journal - 중단된 번역을 이어서 진행하기 위한 큐 단위 진행 기록."""
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import IO, Iterator, List, Optional
+
+from src.application.ports.subtitle_translator import (
+    ProgressCallback,
+    SubtitleTranslatorPort,
+)
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, format_srt, parse_srt
+from src.infrastructure.translators.srt_cues import load_subtitle_text
+
+_JOURNAL_VERSION = 1
+
+
+def journal_path_for(output_path: Path) -> Path:
+    """최종 SRT 경로 옆의 저널 경로 ("<이름>.journal.jsonl")"""
+    return output_path.with_name(f"{output_path.stem}.journal.jsonl")
+
+
+def hash_subtitle_text(subtitle_text: str) -> str:
+    """원본 자막 텍스트의 SHA-256 해시"""
+    return hashlib.sha256(subtitle_text.encode("utf-8")).hexdigest()
+
+
+class TranslationJournal:
+    """완료된 번역 큐를 한 줄씩 추가 기록하는 JSON Lines 저널
+
+    첫 줄은 헤더(입력 해시, 언어 쌍)이고 이후 줄은 번역 완료된 큐다.
+    큐마다 즉시 flush하므로 프로세스가 죽어도 마지막 완료 큐까지 남는다.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        input_hash: str,
+        source_language: str,
+        target_language: str,
+    ) -> None:
+        """
+        Args:
+            path: 저널 파일 경로
+            input_hash: 원본 자막 해시 (hash_subtitle_text)
+            source_language: 원본 언어 코드
+            target_language: 목표 언어 코드
+        """
+        self.path = path
+        self._header = {
+            "version": _JOURNAL_VERSION,
+            "input_hash": input_hash,
+            "source_language": source_language,
+            "target_language": target_language,
+        }
+        self._file: Optional[IO[str]] = None
+
+    def load(self) -> List[SubtitleCue]:
+        """헤더가 일치하는 기존 저널의 완료 큐 목록 (없거나 불일치면 빈 리스트)
+
+        중간에 잘린 마지막 줄은 무시한다.
+        """
+        try:
+            lines = self.path.read_text(encoding="utf-8").split("\n")
+        except FileNotFoundError:
+            return []
+
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            return []
+        if header != self._header:
+            return []
+
+        cues: List[SubtitleCue] = []
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+                cues.append(SubtitleCue(
+                    number=record["number"],
+                    timestamp=record["timestamp"],
+                    text=record["text"],
+                ))
+            except (ValueError, KeyError, TypeError):
+                break
+        return cues
+
+    def start(self, completed: List[SubtitleCue]) -> None:
+        """저널을 헤더와 완료 큐로 다시 쓰고 추가 기록용으로 엶
+
+        Args:
+            completed: 이어서 진행할 때 유지할 완료 큐 (load 결과)
+        """
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w", encoding="utf-8")
+        self._file.write(json.dumps(self._header) + "\n")
+        for cue in completed:
+            self._write(cue)
+        self._file.flush()
+
+    def append(self, cue: SubtitleCue) -> None:
+        """번역 완료 큐 하나를 기록하고 즉시 flush"""
+        if self._file is None:
+            raise RuntimeError("Journal is not started")
+        self._write(cue)
+        self._file.flush()
+
+    def close(self) -> None:
+        """파일만 닫음 (저널은 남겨둠)"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self) -> None:
+        """저널을 닫고 삭제"""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def _write(self, cue: SubtitleCue) -> None:
+        record = {"number": cue.number, "timestamp": cue.timestamp, "text": cue.text}
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+class ResumableTranslatorAdapter(SubtitleTranslatorPort):
+    """진행 저널을 기록하고, 같은 입력/언어 쌍이면 마지막 완료 큐 다음부터 이어서 번역
+
+    번역이 끝까지 완료되면 저널을 삭제한다.
+    """
+
+    def __init__(
+        self,
+        translator: SubtitleTranslatorPort,
+        journal_path: Path,
+        resume: bool = True,
+    ) -> None:
+        """
+        Args:
+            translator: 실제 번역을 수행할 포트 구현체
+            journal_path: 저널 파일 경로 (보통 journal_path_for(출력 경로))
+            resume: False면 기존 저널을 무시하고 처음부터 번역
+        """
+        self._translator = translator
+        self._journal_path = journal_path
+        self._resume = resume
+        self.resumed_cues = 0
+
+    def translate(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Subtitle:
+        """저널을 이용해 (필요하면 이어서) 번역
+
+        Raises:
+            ValueError: 자막 내용이 없거나 파싱 가능한 큐가 없는 경우
+        """
+        translated_cues = list(
+            self.translate_stream(subtitle, target_language, progress_callback)
+        )
+        return subtitle.with_translation(format_srt(translated_cues), target_language)
+
+    def translate_stream(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterator[SubtitleCue]:
+        """저널의 완료 큐를 먼저 yield한 뒤 남은 큐만 내부 번역기로 번역
+
+        Raises:
+            ValueError: 자막 내용이 없거나 파싱 가능한 큐가 없는 경우
+        """
+        subtitle_text = load_subtitle_text(subtitle)
+        cues = parse_srt(subtitle_text)
+        if not cues:
+            raise ValueError("No valid subtitle cues found after parsing")
+
+        journal = TranslationJournal(
+            self._journal_path,
+            hash_subtitle_text(subtitle_text),
+            subtitle.language,
+            target_language,
+        )
+        completed = journal.load() if self._resume else []
+        # 저널 큐가 원본 앞부분과 어긋나면(수동 편집 등) 처음부터 다시 번역
+        if len(completed) > len(cues) or any(
+            (done.number, done.timestamp) != (cue.number, cue.timestamp)
+            for done, cue in zip(completed, cues)
+        ):
+            completed = []
+        self.resumed_cues = len(completed)
+
+        journal.start(completed)
+        try:
+            if completed and progress_callback:
+                progress_callback(
+                    f"이전 작업 이어서 번역: {len(completed)}/{len(cues)}개 큐 복구", 0.0
+                )
+            yield from completed
+
+            remaining = cues[len(completed):]
+            if remaining:
+                request = Subtitle(
+                    video_id=subtitle.video_id,
+                    language=subtitle.language,
+                    format="srt",
+                    text=format_srt(remaining),
+                    source=subtitle.source,
+                )
+                for cue in self._translator.translate_stream(
+                    request, target_language, progress_callback=progress_callback
+                ):
+                    journal.append(cue)
+                    yield cue
+            elif progress_callback:
+                progress_callback("번역 완료!", 100.0)
+        except BaseException:
+            journal.close()
+            raise
+
+        journal.discard()
+
+    def list_supported_languages(self) -> List[str]:
+        """내부 번역기의 지원 언어 목록"""
+        return self._translator.list_supported_languages()
+
+    def is_language_pair_supported(
+        self, source_language: str, target_language: str
+    ) -> bool:
+        """내부 번역기의 언어 쌍 지원 여부"""
+        return self._translator.is_language_pair_supported(
+            source_language, target_language
+        )
@@ -0,0 +1,430 @@
+"""Translation Memory - SQLite 기반 큐 단위 번역 캐시."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from src.application.ports.subtitle_translator import (
+    ProgressCallback,
+    SubtitleTranslatorPort,
+)
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, format_srt
+from src.infrastructure.translators.engine_router import TranslatorRouter
+from src.infrastructure.translators.srt_cues import (
+    load_subtitle_text,
+    normalize_cue_text,
+    parse_srt_cues,
+)
+
+# 기본 최대 저장 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 삭제)
+DEFAULT_MAX_ENTRIES = 200_000
+# 문장 병합 묶음을 한 항목으로 저장할 때 큐 텍스트/번역 사이에 넣는 구분 줄
+_GROUP_SEPARATOR = "\n␞\n"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    source_language TEXT NOT NULL,
+    target_language TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    source_text TEXT NOT NULL,
+    translated_text TEXT NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (source_language, target_language, engine, source_text)
+);
+CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations (last_used);
+"""
+
+
+@dataclass(slots=True)
+class TranslationMemoryStats:
+    """번역 메모리 적중 통계"""
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """조회 대비 적중 비율 (조회가 없으면 0.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SqliteTranslationMemory:
+    """(원본 언어, 목표 언어, 엔진 버전, 정규화 텍스트) 키의 디스크 번역 캐시
+
+    항목 수가 max_entries를 넘으면 LRU 순서로 삭제한다.
+    여러 스레드(GUI 워커 등)에서 공유할 수 있도록 내부 잠금을 사용한다.
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Args:
+            db_path: SQLite 파일 경로 (상위 디렉토리는 자동 생성)
+            max_entries: 최대 저장 항목 수
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db_path = db_path
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT MAX(last_used) FROM translations").fetchone()
+        self._clock = row[0] or 0
+        self.stats = TranslationMemoryStats()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def get_many(
+        self,
+        source_language: str,
+        target_language: str,
+        engine: str,
+        texts: Sequence[str],
+    ) -> Dict[str, str]:
+        """캐시된 번역 조회 (적중 항목은 최근 사용으로 갱신)
+
+        Args:
+            texts: 조회할 원본 텍스트 (내부에서 정규화)
+
+        Returns:
+            {정규화 텍스트: 번역 텍스트} - 적중한 항목만 포함
+        """
+        keys = list(dict.fromkeys(normalize_cue_text(text) for text in texts))
+        found: Dict[str, str] = {}
+
+        with self._lock:
+            for key in keys:
+                row = self._conn.execute(
+                    "SELECT translated_text FROM translations "
+                    "WHERE source_language = ? AND target_language = ? "
+                    "AND engine = ? AND source_text = ?",
+                    (source_language, target_language, engine, key),
+                ).fetchone()
+                if row is None:
+                    self.stats.misses += 1
+                    continue
+
+                self.stats.hits += 1
+                found[key] = row[0]
+                self._clock += 1
+                self._conn.execute(
+                    "UPDATE translations SET last_used = ? "
+                    "WHERE source_language = ? AND target_language = ? "
+                    "AND engine = ? AND source_text = ?",
+                    (self._clock, source_language, target_language, engine, key),
+                )
+            self._conn.commit()
+
+        return found
+
+    def put_many(
+        self,
+        source_language: str,
+        target_language: str,
+        engine: str,
+        translations: Mapping[str, str],
+    ) -> None:
+        """번역 결과 저장 후 용량 초과분 LRU 삭제
+
+        Args:
+            translations: {원본 텍스트: 번역 텍스트} (원본은 내부에서 정규화)
+        """
+        with self._lock:
+            for text, translated_text in translations.items():
+                self._clock += 1
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO translations "
+                    "(source_language, target_language, engine, source_text, "
+                    "translated_text, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        source_language,
+                        target_language,
+                        engine,
+                        normalize_cue_text(text),
+                        translated_text,
+                        self._clock,
+                    ),
+                )
+            self._evict()
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM translations")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        """max_entries 초과분을 last_used 오름차순으로 삭제 (잠금 보유 상태에서 호출)"""
+        count = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        overflow = count - self._max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM translations WHERE rowid IN ("
+                "SELECT rowid FROM translations ORDER BY last_used ASC LIMIT ?)",
+                (overflow,),
+            )
+
+
+class CachingTranslatorAdapter(SubtitleTranslatorPort):
+    """번역 메모리를 앞에 둔 SubtitleTranslatorPort 래퍼
+
+    캐시에 없는 큐만 모아 내부 번역기에 한 번 전달하고,
+    모든 큐가 적중하면 내부 번역기를 호출하지 않는다.
+    TranslatorRouter는 작업마다 다른 엔진을 고르므로 감쌀 수 없다
+    (라우터 아래에서 엔진마다 따로 감싼다).
+    """
+
+    def __init__(
+        self,
+        translator: SubtitleTranslatorPort,
+        memory: SqliteTranslationMemory,
+        engine_version: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            translator: 실제 번역을 수행할 포트 구현체
+            memory: 번역 메모리
+            engine_version: 캐시 키에 쓰일 엔진/모델 버전 (None이면
+                translator.engine_version_for(원본, 목표), translator.engine_version
+                또는 클래스 이름 순으로 사용)
+
+        Raises:
+            ValueError: translator가 TranslatorRouter인 경우
+        """
+        if isinstance(translator, TranslatorRouter):
+            raise ValueError(
+                "TranslatorRouter picks a different engine per job and cannot be cached "
+                "as one engine; wrap each engine with CachingTranslatorAdapter instead"
+            )
+        self._translator = translator
+        self._memory = memory
+        self._engine_version = engine_version
+
+    @property
+    def stats(self) -> TranslationMemoryStats:
+        """번역 메모리 적중 통계"""
+        return self._memory.stats
+
+    @property
+    def engine_version(self) -> str:
+        """내부 번역기의 엔진 이름 (TranslatorRouter가 캐시된 엔진을 구분하는 데 사용)"""
+        if self._engine_version:
+            return self._engine_version
+        return getattr(self._translator, "engine_version", type(self._translator).__name__)
+
+    def _engine_version_for(self, source_language: str, target_language: str) -> str:
+        """언어 쌍의 캐시 키 엔진 버전 (번역기가 언어 쌍별 버전을 제공하면 그것을 사용)"""
+        if self._engine_version:
+            return self._engine_version
+        version_for = getattr(self._translator, "engine_version_for", None)
+        if version_for is not None:
+            return version_for(source_language, target_language)
+        return getattr(self._translator, "engine_version", type(self._translator).__name__)
+
+    def translate(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Subtitle:
+        """캐시 적중 큐는 그대로 사용하고 나머지만 내부 번역기로 번역
+
+        Raises:
+            ValueError: 자막 내용이 없거나 파싱 가능한 큐가 없는 경우
+            RuntimeError: 내부 번역기가 요청과 다른 개수의 큐를 반환한 경우
+        """
+        translated_cues = list(
+            self.translate_stream(subtitle, target_language, progress_callback)
+        )
+        return subtitle.with_translation(format_srt(translated_cues), target_language)
+
+    def translate_stream(
+        self,
+        subtitle: Subtitle,
+        target_language: str,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Iterator[SubtitleCue]:
+        """캐시 적중 큐는 즉시, 미적중 큐는 내부 번역기 스트림에서 도착하는 대로 yield
+
+        Raises:
+            ValueError: 자막 내용이 없거나 파싱 가능한 큐가 없는 경우
+            RuntimeError: 내부 번역기가 요청과 다른 개수의 큐를 반환한 경우
+        """
+        subtitle_text = load_subtitle_text(subtitle)
+        cues = parse_srt_cues(subtitle_text)
+        if not cues:
+            raise ValueError("No valid subtitle cues found after parsing")
+
+        source_language = subtitle.language
+        engine_version = self._engine_version_for(source_language, target_language)
+        groups, merging = self._plan_units(cues)
+        keys = [
+            normalize_cue_text(_GROUP_SEPARATOR.join(cues[i]["text"] for i in group))
+            for group in groups
+        ]
+        cached = {
+            key: translated_text
+            for key, translated_text in self._memory.get_many(
+                source_language, target_language, engine_version, keys
+            ).items()
+            if translated_text.count(_GROUP_SEPARATOR) == key.count(_GROUP_SEPARATOR)
+        }
+
+        # 미적중 단위는 키 기준으로 한 번씩만 요청. 문장 병합 시에는 원본에서 연속한
+        # 미적중 묶음끼리만 한 요청으로 보내 내부 번역기가 같은 묶음을 다시 만들게 함
+        runs: List[List[int]] = []
+        current: List[int] = []
+        requested = set()
+        for index, key in enumerate(keys):
+            if key in cached or key in requested:
+                if merging and current:
+                    runs.append(current)
+                    current = []
+                continue
+            requested.add(key)
+            current.append(index)
+        if current:
+            runs.append(current)
+
+        if progress_callback:
+            missing_cues = sum(len(groups[index]) for run in runs for index in run)
+            progress_callback(
+                f"번역 메모리: {len(cues) - missing_cues}개 적중, {missing_cues}개 번역 필요",
+                0.0,
+            )
+
+        translated = (
+            self._stream_runs(
+                subtitle, cues, groups, keys, runs,
+                target_language, engine_version, progress_callback,
+            )
+            if runs
+            else iter(())
+        )
+        for group, key in zip(groups, keys):
+            # 원본 순서를 지키기 위해 필요한 단위가 도착할 때까지 내부 스트림을 소비
+            while key not in cached:
+                unit_key, translated_text = next(translated)
+                cached[unit_key] = translated_text
+            for index, text in zip(group, cached[key].split(_GROUP_SEPARATOR)):
+                cue = cues[index]
+                yield SubtitleCue(number=cue["number"], timestamp=cue["timestamp"], text=text)
+
+        # 남은 내부 스트림을 마저 소비해 개수 검증과 메모리 저장을 마침
+        for unit_key, translated_text in translated:
+            cached[unit_key] = translated_text
+
+        if not runs and progress_callback:
+            progress_callback("번역 완료!", 100.0)
+
+    def list_supported_languages(self) -> List[str]:
+        """내부 번역기의 지원 언어 목록"""
+        return self._translator.list_supported_languages()
+
+    def is_language_pair_supported(
+        self, source_language: str, target_language: str
+    ) -> bool:
+        """내부 번역기의 언어 쌍 지원 여부"""
+        return self._translator.is_language_pair_supported(
+            source_language, target_language
+        )
+
+    def _plan_units(self, cues: List[dict]) -> Tuple[List[Tuple[int, ...]], bool]:
+        """캐시 단위 결정
+
+        내부 번역기가 문장 병합 계획(plan_sentence_groups)을 제공하면 병합 묶음 전체를
+        한 항목으로 캐시한다. 조각 하나의 번역은 그 문장 안에서만 맞기 때문이다.
+
+        Returns:
+            (단위별 큐 인덱스, 문장 병합 여부)
+        """
+        plan = getattr(self._translator, "plan_sentence_groups", None)
+        sentence_groups = plan(cues) if plan is not None else None
+        if sentence_groups is None:
+            return [(i,) for i in range(len(cues))], False
+        return [group.cue_indices for group in sentence_groups], True
+
+    def _stream_runs(
+        self,
+        subtitle: Subtitle,
+        cues: List[dict],
+        groups: List[Tuple[int, ...]],
+        keys: List[str],
+        runs: List[List[int]],
+        target_language: str,
+        engine_version: str,
+        progress_callback: Optional[ProgressCallback],
+    ) -> Iterator[Tuple[str, str]]:
+        """미적중 단위만 담은 SRT를 요청(run)마다 내부 번역기 스트림으로 번역
+
+        요청이 끝날 때마다 결과를 메모리에 저장한다.
+
+        Args:
+            cues: 원본 큐 (요청에는 정규화 텍스트와 원래 타임스탬프 사용)
+            groups: 단위별 큐 인덱스
+            keys: 단위별 캐시 키
+            runs: 요청마다 보낼 단위 인덱스
+            engine_version: 저장에 쓸 캐시 키 엔진 버전
+
+        Yields:
+            (캐시 키, 번역 텍스트 - 묶음이면 큐별 번역을 구분 줄로 연결) - 원본 순서
+        """
+        for run in runs:
+            indices = [index for unit in run for index in groups[unit]]
+            request_cues = [
+                SubtitleCue(
+                    number=str(number),
+                    timestamp=cues[index]["timestamp"],
+                    text=normalize_cue_text(cues[index]["text"]),
+                )
+                for number, index in enumerate(indices, start=1)
+            ]
+            request = Subtitle(
+                video_id=subtitle.video_id,
+                language=subtitle.language,
+                format="srt",
+                text=format_srt(request_cues),
+                source=subtitle.source,
+            )
+
+            translations: Dict[str, str] = {}
+            unit_texts: List[str] = []
+            units = iter(run)
+            unit = next(units)
+            received = 0
+            for cue in self._translator.translate_stream(
+                request, target_language, progress_callback=progress_callback
+            ):
+                received += 1
+                if received > len(indices):
+                    continue
+                unit_texts.append(cue.text)
+                if len(unit_texts) == len(groups[unit]):
+                    translations[keys[unit]] = _GROUP_SEPARATOR.join(unit_texts)
+                    yield keys[unit], translations[keys[unit]]
+                    unit_texts = []
+                    unit = next(units, None)
+
+            if received != len(indices):
+                raise RuntimeError(
+                    f"Translator returned {received} cues for "
+                    f"{len(indices)} requested cues"
+                )
+
+            self._memory.put_many(
+                subtitle.language, target_language, engine_version, translations
+            )
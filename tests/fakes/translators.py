@@ -0,0 +1,58 @@
+"""Fake translators shared by tests."""
+import threading
+
+from src.application.ports.subtitle_translator import SubtitleTranslatorPort
+from src.infrastructure.translators.srt_cues import parse_srt_cues
+
+
+class RecordingTranslator(SubtitleTranslatorPort):
+    """Fake translator that records every cue text it receives."""
+
+    engine_version = "fake-1"
+
+    def __init__(self):
+        self.requested_texts = []
+
+    def translate(self, subtitle, target_language, progress_callback=None):
+        cues = parse_srt_cues(subtitle.text)
+        self.requested_texts.append([cue["text"] for cue in cues])
+        blocks = [
+            f"{cue['number']}\n{cue['timestamp']}\n[{target_language}] {cue['text']}"
+            for cue in cues
+        ]
+        return subtitle.with_translation("\n\n".join(blocks) + "\n", target_language)
+
+    def list_supported_languages(self):
+        return ["en", "ko"]
+
+    def is_language_pair_supported(self, source_language, target_language):
+        return True
+
+
+class FakeEngine:
+    """Records each translate_texts call; blocks until released if gated."""
+
+    engine_version = "fake-engine-1"
+
+    def __init__(self, gate=None):
+        self.calls = []
+        self.gate = gate
+        self.entered = threading.Event()
+
+    def engine_version_for(self, source_language, target_language):
+        return f"{self.engine_version}/{source_language}-{target_language}"
+
+    def translate_texts(self, texts, source_language, target_language):
+        self.entered.set()
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        if target_language == "xx":
+            raise ValueError("Translation from en to xx is not supported.")
+        self.calls.append((source_language, target_language, list(texts)))
+        return [f"[{target_language}] {text}" for text in texts]
+
+    def list_supported_languages(self):
+        return ["en", "ko"]
+
+    def is_language_pair_supported(self, source_language, target_language):
+        return (source_language, target_language) == ("en", "ko")
@@ -1,9 +1,14 @@
 """Mock Unit Tests for ArgosTranslatorAdapter."""
+import math
+import time
 from unittest.mock import MagicMock, Mock, patch
 from pathlib import Path
 
 import pytest
 
+# argostranslate가 없는 설치(NLLB/Gemini 전용)에서는 Argos 어댑터 테스트를 건너뜀
+pytest.importorskip("argostranslate")
+
 from src.domain.entities.subtitle import Subtitle
 from src.domain.value_objects.video_id import VideoId
 
@@ -56,13 +61,14 @@ class TestArgosTranslatorAdapter:
     """ArgosTranslatorAdapter unit tests (with mocks)."""
 
     def test_initialization(self, mock_argostranslate):
-        """Test adapter initialization."""
+        """Test adapter initialization never touches the network."""
         from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
 
         adapter = ArgosTranslatorAdapter()
 
-        # Verify package index was updated
-        mock_argostranslate.package.update_package_index.assert_called_once()
+        # Package index refresh is lazy and opt-in
+        mock_argostranslate.package.update_package_index.assert_not_called()
+        mock_argostranslate.translate.get_installed_languages.assert_not_called()
 
     def test_translate_subtitle_with_text(self, mock_argostranslate, sample_subtitle):
         """Test translating subtitle with text content."""
@@ -225,8 +231,10 @@ Multi-line text
         assert "2\n00:00:02,500 --> 00:00:05,000\nSecond subtitle" in result
         assert result.count("\n\n") >= 1  # Cues separated by blank lines
 
-    def test_initialization_package_index_failure(self, mock_argostranslate):
-        """Test adapter initialization when package index update fails."""
+    def test_initialization_package_index_failure(
+        self, mock_argostranslate, sample_subtitle, tmp_path
+    ):
+        """Test opted-in translation when package index update fails."""
         from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
 
         # Mock package index update to raise exception
@@ -235,8 +243,15 @@ Multi-line text
         )
 
         # Should not raise, just print warning
-        adapter = ArgosTranslatorAdapter()
-        assert adapter is not None
+        adapter = ArgosTranslatorAdapter(
+            refresh_package_index=True,
+            index_stamp_path=tmp_path / "index.stamp",
+        )
+        result = adapter.translate(sample_subtitle, "ko")
+
+        assert result.language == "ko"
+        mock_argostranslate.package.update_package_index.assert_called_once()
+        assert not (tmp_path / "index.stamp").exists()
 
     def test_translate_empty_subtitle_text(self, mock_argostranslate):
         """Test translation with empty subtitle text."""
@@ -286,3 +301,1054 @@ Multi-line text
 
         with pytest.raises(ValueError, match="No valid subtitle cues found after parsing"):
             adapter.translate(malformed_subtitle, "ko")
+
+
+class FakePackageTranslation:
+    """Stand-in for argostranslate.translate.PackageTranslation."""
+
+    def __init__(self):
+        self.pkg = Mock()
+        self.pkg.target_prefix = ""
+        self.pkg.tokenizer.encode = Mock(side_effect=lambda text: text.split())
+        self.pkg.tokenizer.decode = Mock(side_effect=lambda tokens: " ".join(tokens))
+
+        self.batch_calls = []
+
+        def translate_batch(tokenized, **kwargs):
+            self.batch_calls.append(tokenized)
+            return [Mock(hypotheses=[["[KO]"] + tokens]) for tokens in tokenized]
+
+        self.translator = Mock()
+        self.translator.translate_batch = Mock(side_effect=translate_batch)
+
+
+def _make_numbered_subtitle(count):
+    blocks = [
+        f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},500\nLine {i}"
+        for i in range(1, count + 1)
+    ]
+    return Subtitle(
+        video_id=VideoId("test1234567"),
+        language="en",
+        format="srt",
+        text="\n\n".join(blocks) + "\n",
+    )
+
+
+class TestArgosBatchedTranslation:
+    """Batched translation through the CTranslate2 translator."""
+
+    def _use_package_translation(self, mock_argostranslate, package_translation):
+        for lang in mock_argostranslate.translate.get_installed_languages.return_value:
+            lang.get_translation = Mock(return_value=package_translation)
+
+    def test_invalid_batch_size(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        with pytest.raises(ValueError, match="batch_size must be at least 1"):
+            ArgosTranslatorAdapter(batch_size=0)
+
+    def test_package_translation_is_batched_in_order(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        package_translation = FakePackageTranslation()
+        self._use_package_translation(mock_argostranslate, package_translation)
+
+        with patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ):
+            adapter = ArgosTranslatorAdapter(batch_size=4)
+            result = adapter.translate(_make_numbered_subtitle(10), "ko")
+
+        # 10 cues in batches of 4 -> 3 model calls
+        assert [len(call) for call in package_translation.batch_calls] == [4, 4, 2]
+        cues = adapter._parse_srt_cues(result.text)
+        assert [cue["text"] for cue in cues] == [f"[KO] Line {i}" for i in range(1, 11)]
+
+    def test_multiline_cue_is_translated_per_line(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        package_translation = FakePackageTranslation()
+        adapter = ArgosTranslatorAdapter()
+
+        with patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ):
+            translated = adapter._translate_batch(
+                package_translation, ["First line\nSecond line", "Single"]
+            )
+
+        assert translated == ["[KO] First line\n[KO] Second line", "[KO] Single"]
+        assert len(package_translation.batch_calls) == 1
+
+    def test_sentences_in_a_line_are_translated_separately(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        package_translation = FakePackageTranslation()
+        adapter = ArgosTranslatorAdapter()
+
+        with patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ):
+            translated = adapter._translate_batch(
+                package_translation, ["Stop. Look at Mr. Kim!\nOkay"]
+            )
+
+        # 줄 안의 문장마다 모델 입력이 하나씩 (약어 뒤에서는 나누지 않음)
+        assert package_translation.batch_calls == [
+            [["Stop."], ["Look", "at", "Mr.", "Kim!"], ["Okay"]]
+        ]
+        assert translated == ["[KO] Stop. [KO] Look at Mr. Kim!\n[KO] Okay"]
+
+    def test_length_buckets_restore_original_order(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        package_translation = FakePackageTranslation()
+        adapter = ArgosTranslatorAdapter(batch_size=2, max_batch_tokens=6)
+        texts = ["a b c", "x", "d e f", "y"]
+
+        with patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ):
+            translated = adapter._translate_batch(package_translation, texts)
+
+        # Short lines are batched together, long lines share the next batch
+        assert package_translation.batch_calls == [
+            [["x"], ["y"]],
+            [["a", "b", "c"], ["d", "e", "f"]],
+        ]
+        assert translated == ["[KO] a b c", "[KO] x", "[KO] d e f", "[KO] y"]
+        assert adapter.last_stats.padding_ratio == 0.0
+
+    def test_padding_ratio_without_bucketing(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        package_translation = FakePackageTranslation()
+        adapter = ArgosTranslatorAdapter()
+
+        with patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ):
+            adapter._translate_batch(package_translation, ["a b c", "x", "d e f", "y"])
+
+        # 8 real tokens padded to 4 x 3 = 12
+        assert adapter.last_stats.real_tokens == 8
+        assert adapter.last_stats.padded_tokens == 12
+        assert adapter.last_stats.padding_ratio == pytest.approx(4 / 12)
+
+    def test_invalid_max_batch_tokens(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        with pytest.raises(ValueError, match="max_batch_tokens cannot be negative"):
+            ArgosTranslatorAdapter(max_batch_tokens=-1)
+
+    def test_protected_markup_is_not_sent_to_the_model(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        package_translation = FakePackageTranslation()
+        adapter = ArgosTranslatorAdapter(protect_markup=True)
+
+        with patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ):
+            translated = adapter._translate_batch(
+                package_translation, ["{\\an8}<i>JOHN: Hello</i>", "♪♪\nGood night"]
+            )
+
+        assert package_translation.batch_calls == [[["Hello"], ["Good", "night"]]]
+        assert translated == ["{\\an8}<i>JOHN: [KO] Hello</i>", "♪♪\n[KO] Good night"]
+        assert adapter.last_stats.protected_chars == 22
+
+    def test_progress_is_reported_per_batch(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        adapter = ArgosTranslatorAdapter(batch_size=3)
+        progress_calls = []
+
+        adapter.translate(
+            _make_numbered_subtitle(7),
+            "ko",
+            progress_callback=lambda message, percent: progress_calls.append(message),
+        )
+
+        batch_messages = [m for m in progress_calls if m.startswith("번역 중... (") and "/" in m]
+        assert batch_messages == ["번역 중... (3/7)", "번역 중... (6/7)", "번역 중... (7/7)"]
+
+
+class FakeCTranslate2:
+    """Stand-in for the ctranslate2 module recording Translator options.
+
+    With per_example_delay, a call costs one round per inter_threads sub-batches
+    of max_batch_size examples, like CTranslate2's parallel translators.
+    """
+
+    def __init__(self, slow_intra_threads=(), per_example_delay=0.0):
+        self.loaded = []
+        self.max_batch_sizes = []
+        self.slow_intra_threads = slow_intra_threads
+        self.per_example_delay = per_example_delay
+
+    def Translator(self, model_path, **options):
+        self.loaded.append((model_path, options))
+        delay = 0.02 if options["intra_threads"] in self.slow_intra_threads else 0.0
+        inter_threads = options["inter_threads"]
+
+        def translate_batch(tokenized, max_batch_size=0, **kwargs):
+            self.max_batch_sizes.append(max_batch_size)
+            sub_batches = math.ceil(len(tokenized) / (max_batch_size or len(tokenized)))
+            rounds = math.ceil(sub_batches / inter_threads)
+            time.sleep(delay + self.per_example_delay * max_batch_size * rounds)
+            return [Mock(hypotheses=[["[KO]"] + tokens]) for tokens in tokenized]
+
+        return Mock(
+            translate_batch=Mock(side_effect=translate_batch),
+            num_translators=inter_threads,
+        )
+
+
+class TestArgosThreading:
+    """CTranslate2 thread counts and compute type."""
+
+    def _package_translation(self, mock_argostranslate):
+        package_translation = FakePackageTranslation()
+        package_translation.translator = None
+        package_translation.pkg.package_path = Path("/models/en_ko")
+        for lang in mock_argostranslate.translate.get_installed_languages.return_value:
+            lang.get_translation = Mock(return_value=package_translation)
+        mock_argostranslate.settings.device = "cpu"
+        mock_argostranslate.settings.inter_threads = 1
+        mock_argostranslate.settings.intra_threads = 0
+        mock_argostranslate.settings.compute_type = "auto"
+        return package_translation
+
+    def test_invalid_thread_counts(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        with pytest.raises(ValueError, match="cannot be negative"):
+            ArgosTranslatorAdapter(intra_threads=-1)
+
+    def test_explicit_options_load_a_private_model(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        package_translation = self._package_translation(mock_argostranslate)
+        ctranslate2 = FakeCTranslate2()
+
+        with patch.dict("sys.modules", {"ctranslate2": ctranslate2}), patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ):
+            adapter = ArgosTranslatorAdapter(intra_threads=2, compute_type="int8")
+            adapter.translate(_make_numbered_subtitle(3), "ko")
+            adapter.translate(_make_numbered_subtitle(3), "ko")
+
+        assert ctranslate2.loaded == [(
+            str(Path("/models/en_ko/model")),
+            {"device": "cpu", "inter_threads": 1, "intra_threads": 2, "compute_type": "int8"},
+        )]
+        # Argos' shared translator is left untouched
+        assert package_translation.translator is None
+
+    def test_batches_are_split_across_parallel_translators(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        self._package_translation(mock_argostranslate)
+        ctranslate2 = FakeCTranslate2()
+
+        with patch.dict("sys.modules", {"ctranslate2": ctranslate2}), patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ):
+            adapter = ArgosTranslatorAdapter(batch_size=8, inter_threads=4, intra_threads=1)
+            adapter.translate(_make_numbered_subtitle(7), "ko")
+
+        # 7개 입력을 번역기 4개가 나눠 처리하도록 max_batch_size=2
+        assert ctranslate2.max_batch_sizes == [2]
+
+    def test_autotune_benefits_from_inter_threads(self, mock_argostranslate, tmp_path):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+        from src.infrastructure.translators.thread_tuning import ThreadingConfig
+
+        self._package_translation(mock_argostranslate)
+        ctranslate2 = FakeCTranslate2(per_example_delay=0.002)
+        single, parallel = ThreadingConfig(1, 4, "default"), ThreadingConfig(4, 1, "default")
+
+        with patch.dict("sys.modules", {"ctranslate2": ctranslate2}), patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ):
+            adapter = ArgosTranslatorAdapter()
+            best = adapter.autotune_threading(
+                [f"Line {i}" for i in range(16)], "en", "ko",
+                cache_path=tmp_path / "autotune.json", candidates=[single, parallel],
+            )
+
+        assert best == parallel
+
+    def test_autotune_applies_and_caches_fastest_config(self, mock_argostranslate, tmp_path):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+        from src.infrastructure.translators.thread_tuning import ThreadingConfig
+
+        self._package_translation(mock_argostranslate)
+        ctranslate2 = FakeCTranslate2(slow_intra_threads={4})
+        slow, fast = ThreadingConfig(1, 4, "default"), ThreadingConfig(2, 2, "int8")
+        samples = [f"Line {i}" for i in range(5)]
+
+        with patch.dict("sys.modules", {"ctranslate2": ctranslate2}), patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ):
+            adapter = ArgosTranslatorAdapter()
+            best = adapter.autotune_threading(
+                samples, "en", "ko", cache_path=tmp_path / "autotune.json",
+                candidates=[slow, fast],
+            )
+            assert best == fast
+            assert adapter.threading_config == fast
+            assert len(ctranslate2.loaded) == 2
+
+            other = ArgosTranslatorAdapter()
+            other.autotune_threading(
+                samples, "en", "ko", cache_path=tmp_path / "autotune.json",
+                candidates=[slow, fast],
+            )
+
+        # The second adapter reused the cached result without benchmarking
+        assert other.threading_config == fast
+        assert len(ctranslate2.loaded) == 2
+
+
+class TestArgosModelVariants:
+    """Per-job model variant selection from the registry."""
+
+    def _package_translation(self, mock_argostranslate):
+        package_translation = FakePackageTranslation()
+        package_translation.translator = None
+        package_translation.pkg.package_path = Path("/models/en_ko")
+        package_translation.pkg.from_code = "en"
+        package_translation.pkg.to_code = "ko"
+        for lang in mock_argostranslate.translate.get_installed_languages.return_value:
+            lang.get_translation = Mock(return_value=package_translation)
+        mock_argostranslate.settings.device = "cpu"
+        mock_argostranslate.settings.inter_threads = 1
+        mock_argostranslate.settings.intra_threads = 0
+        mock_argostranslate.settings.compute_type = "auto"
+        return package_translation
+
+    def test_selected_variant_is_loaded_and_measured(self, mock_argostranslate, tmp_path):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+        from src.infrastructure.translators.model_registry import ModelRegistry, ModelVariant
+
+        self._package_translation(mock_argostranslate)
+        registry = ModelRegistry(tmp_path / "model_registry.json")
+        registry.register(ModelVariant("full", "en", "ko"))
+        registry.register(ModelVariant(
+            "int8", "en", "ko", model_path="/models/en_ko_int8", compute_type="int8",
+        ))
+        ctranslate2 = FakeCTranslate2()
+
+        with patch.dict("sys.modules", {"ctranslate2": ctranslate2}), patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ):
+            adapter = ArgosTranslatorAdapter(model_registry=registry, model_variant="int8")
+            adapter.translate(_make_numbered_subtitle(4), "ko")
+
+        model_path, options = ctranslate2.loaded[0]
+        assert model_path == str(Path("/models/en_ko_int8"))
+        assert options["compute_type"] == "int8"
+        int8 = registry.select("en", "ko", "int8")
+        assert int8.runs == 1
+        assert int8.cues_per_second > 0
+        assert registry.select("en", "ko", "full").runs == 0
+
+    def test_throughput_counts_model_inputs_without_load_time(
+        self, mock_argostranslate, tmp_path
+    ):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+        from src.infrastructure.translators.model_registry import ModelRegistry, ModelVariant
+
+        self._package_translation(mock_argostranslate)
+        registry = ModelRegistry(tmp_path / "model_registry.json")
+        registry.register(ModelVariant("full", "en", "ko"))
+        # Each batch call sleeps 0.02s; loading the model sleeps 0.5s
+        ctranslate2 = FakeCTranslate2(slow_intra_threads=(0,))
+        load = ctranslate2.Translator
+
+        def slow_load(model_path, **options):
+            time.sleep(0.5)
+            return load(model_path, **options)
+
+        ctranslate2.Translator = slow_load
+        blocks = [
+            f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},500\nHello"
+            for i in range(1, 5)
+        ]
+        subtitle = Subtitle(
+            video_id=VideoId("test1234567"),
+            language="en",
+            format="srt",
+            text="\n\n".join(blocks) + "\n",
+        )
+
+        with patch.dict("sys.modules", {"ctranslate2": ctranslate2}), patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ), patch.object(registry, "record_throughput") as record:
+            adapter = ArgosTranslatorAdapter(
+                model_registry=registry, model_variant="full", intra_threads=0
+            )
+            adapter.translate(subtitle, "ko")
+
+        # Four identical cues reach the model as one text in one 0.02s batch
+        (variant, cues_per_second), _ = record.call_args
+        assert variant.name == "full"
+        assert 20 < cues_per_second <= 50
+
+    def test_engine_version_per_pair_tracks_model_and_compute_type(
+        self, mock_argostranslate, tmp_path
+    ):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+        from src.infrastructure.translators.model_registry import ModelRegistry, ModelVariant
+
+        package_translation = self._package_translation(mock_argostranslate)
+        package_translation.pkg.package_version = "1.1"
+        registry = ModelRegistry(tmp_path / "model_registry.json")
+        registry.register(ModelVariant("full", "en", "ko"))
+        registry.register(ModelVariant(
+            "int8", "en", "ko", model_path="/models/en_ko_int8", compute_type="int8",
+        ))
+
+        with patch(
+            "src.infrastructure.translators.argos_translator.PackageTranslation",
+            FakePackageTranslation,
+        ):
+            default = ArgosTranslatorAdapter().engine_version_for("en", "ko")
+            float32 = ArgosTranslatorAdapter(compute_type="float32").engine_version_for("en", "ko")
+            full = ArgosTranslatorAdapter(
+                model_registry=registry, model_variant="full"
+            ).engine_version_for("en", "ko")
+            int8 = ArgosTranslatorAdapter(
+                model_registry=registry, model_variant="int8"
+            ).engine_version_for("en", "ko")
+            package_translation.pkg.package_version = "1.2"
+            upgraded = ArgosTranslatorAdapter().engine_version_for("en", "ko")
+
+        assert "en-ko@1.1" in default and default.endswith("/ct2-auto")
+        assert float32.endswith("/ct2-float32")
+        assert "+full/ct2-auto" in full
+        assert "+int8(/models/en_ko_int8)/ct2-int8" in int8
+        assert len({default, float32, full, int8, upgraded}) == 5
+
+    def test_engine_version_for_unsupported_pair_falls_back(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        adapter = ArgosTranslatorAdapter(merge_sentences=True)
+
+        assert adapter.engine_version_for("en", "xx") == adapter.engine_version
+        assert adapter.engine_version.endswith("/merge")
+
+    def test_unknown_variant_fails_before_translation(self, mock_argostranslate, tmp_path):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+        from src.infrastructure.translators.model_registry import ModelRegistry, ModelVariant
+
+        registry = ModelRegistry(tmp_path / "model_registry.json")
+        registry.register(ModelVariant("full", "en", "ko"))
+        adapter = ArgosTranslatorAdapter(model_registry=registry, model_variant="tiny")
+
+        with pytest.raises(ValueError, match="'tiny' is not registered"):
+            adapter.translate(_make_numbered_subtitle(2), "ko")
+
+
+class TestArgosDeduplication:
+    """Repeated cue texts are translated once and fanned back out."""
+
+    def test_repeated_cues_translated_once(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        mock_translator = mock_argostranslate.translate.get_installed_languages.return_value[0] \
+            .get_translation.return_value
+        subtitle = Subtitle(
+            video_id=VideoId("test1234567"),
+            language="en",
+            format="srt",
+            text=(
+                "1\n00:00:00,000 --> 00:00:01,000\nThank you.\n\n"
+                "2\n00:00:01,000 --> 00:00:02,000\n♪\n\n"
+                "3\n00:00:02,000 --> 00:00:03,000\nThank  you. \n\n"
+                "4\n00:00:03,000 --> 00:00:04,000\n♪\n"
+            ),
+        )
+
+        adapter = ArgosTranslatorAdapter()
+        result = adapter.translate(subtitle, "ko")
+
+        assert [c.args[0] for c in mock_translator.translate.call_args_list] == ["Thank you.", "♪"]
+        cues = adapter._parse_srt_cues(result.text)
+        assert [cue["text"] for cue in cues] == [
+            "[KO] Thank you.", "[KO] ♪", "[KO] Thank you.", "[KO] ♪"
+        ]
+        assert [cue["number"] for cue in cues] == ["1", "2", "3", "4"]
+        assert adapter.last_stats.cues == 4
+        assert adapter.last_stats.model_inputs == 2
+        assert adapter.last_stats.dedup_saved == 2
+
+    def test_deduplicate_texts_keeps_line_breaks(self):
+        from src.infrastructure.translators.srt_cues import deduplicate_texts
+
+        unique, mapping = deduplicate_texts(["A\nB", "A \n B", "A B"])
+
+        assert unique == ["A\nB", "A B"]
+        assert mapping == [0, 0, 1]
+
+
+class TestArgosLanguageIndex:
+    """Language-pair resolution is indexed and cached."""
+
+    def test_installed_languages_loaded_once_across_calls(self, mock_argostranslate, sample_subtitle):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        adapter = ArgosTranslatorAdapter()
+        adapter.translate(sample_subtitle, "ko")
+        adapter.translate(sample_subtitle, "ko")
+        assert adapter.is_language_pair_supported("en", "ko")
+        adapter.list_supported_languages()
+
+        mock_argostranslate.translate.get_installed_languages.assert_called_once()
+        en = mock_argostranslate.translate.get_installed_languages.return_value[0]
+        en.get_translation.assert_called_once()
+
+    def test_index_rebuilt_when_package_dir_changes(self, mock_argostranslate, tmp_path):
+        import os
+
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        package_dir = tmp_path / "packages"
+        package_dir.mkdir()
+        mock_argostranslate.settings.package_dirs = [package_dir]
+
+        adapter = ArgosTranslatorAdapter()
+        assert adapter.is_language_pair_supported("en", "ko")
+        assert adapter.is_language_pair_supported("en", "ko")
+        assert mock_argostranslate.translate.get_installed_languages.call_count == 1
+
+        # Simulate a package install/removal touching the package directory
+        stat = package_dir.stat()
+        os.utime(package_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        mock_argostranslate.translate.get_installed_languages.return_value = []
+
+        assert adapter.is_language_pair_supported("en", "ko") is False
+        assert mock_argostranslate.translate.get_installed_languages.call_count == 2
+
+    def test_invalidate_language_index(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        adapter = ArgosTranslatorAdapter()
+        assert adapter.list_supported_languages() == ["en", "ko"]
+
+        mock_argostranslate.translate.get_installed_languages.return_value = []
+        assert adapter.list_supported_languages() == ["en", "ko"]
+
+        adapter.invalidate_language_index()
+        assert adapter.list_supported_languages() == []
+
+
+class TestArgosPackageIndexRefresh:
+    """Package index refresh is lazy, opt-in and TTL-bounded."""
+
+    def test_opt_in_refreshes_once_on_first_translate(
+        self, mock_argostranslate, sample_subtitle, tmp_path
+    ):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        stamp = tmp_path / "cache" / "index.stamp"
+        adapter = ArgosTranslatorAdapter(refresh_package_index=True, index_stamp_path=stamp)
+        mock_argostranslate.package.update_package_index.assert_not_called()
+
+        adapter.translate(sample_subtitle, "ko")
+        adapter.translate(sample_subtitle, "ko")
+
+        mock_argostranslate.package.update_package_index.assert_called_once()
+        assert stamp.exists()
+
+    def test_refresh_skipped_within_ttl(self, mock_argostranslate, tmp_path):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        stamp = tmp_path / "index.stamp"
+        stamp.touch()
+        adapter = ArgosTranslatorAdapter(index_ttl_seconds=3600, index_stamp_path=stamp)
+
+        assert adapter.refresh_package_index() is False
+        mock_argostranslate.package.update_package_index.assert_not_called()
+
+        assert adapter.refresh_package_index(force=True) is True
+        mock_argostranslate.package.update_package_index.assert_called_once()
+
+    def test_refresh_after_ttl_expires(self, mock_argostranslate, tmp_path):
+        import os
+
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        stamp = tmp_path / "index.stamp"
+        stamp.touch()
+        os.utime(stamp, (0, 0))
+        adapter = ArgosTranslatorAdapter(index_ttl_seconds=3600, index_stamp_path=stamp)
+
+        assert adapter.refresh_package_index() is True
+        mock_argostranslate.package.update_package_index.assert_called_once()
+
+
+class InProcessPoolExecutor:
+    """ProcessPoolExecutor stand-in that runs the worker code in-process."""
+
+    instances = []
+
+    def __init__(self, max_workers, mp_context=None, initializer=None, initargs=()):
+        self.max_workers = max_workers
+        self.initargs = initargs
+        self.mapped_shards = []
+        self.shutdown_called = False
+        initializer(*initargs)
+        InProcessPoolExecutor.instances.append(self)
+
+    def map(self, fn, iterable):
+        shards = list(iterable)
+        self.mapped_shards.extend(shards)
+        return [fn(shard) for shard in shards]
+
+    def shutdown(self, wait=True):
+        self.shutdown_called = True
+
+
+class TestArgosShardedTranslation:
+    """Multi-process sharded translation mode."""
+
+    @pytest.fixture(autouse=True)
+    def in_process_pool(self):
+        InProcessPoolExecutor.instances = []
+        with patch(
+            "src.infrastructure.translators.argos_translator.ProcessPoolExecutor",
+            InProcessPoolExecutor,
+        ):
+            yield
+
+    def test_invalid_worker_settings(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            ArgosTranslatorAdapter(workers=0)
+        with pytest.raises(ValueError, match="threads_per_worker cannot be negative"):
+            ArgosTranslatorAdapter(threads_per_worker=-1)
+
+    def test_shards_are_contiguous_and_merged_in_order(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        adapter = ArgosTranslatorAdapter(batch_size=2, workers=2, threads_per_worker=3)
+        result = adapter.translate(_make_numbered_subtitle(11), "ko")
+
+        pool = InProcessPoolExecutor.instances[0]
+        assert pool.max_workers == 2
+        assert pool.initargs == ("en", "ko", 2, 3, 0, False, None, None, None)
+        assert [len(shard) for shard in pool.mapped_shards] == [2, 2, 2, 2, 2, 1]
+        assert sum(pool.mapped_shards, []) == [f"Line {i}" for i in range(1, 12)]
+        cues = adapter._parse_srt_cues(result.text)
+        assert [cue["text"] for cue in cues] == [f"[KO] Line {i}" for i in range(1, 12)]
+        assert mock_argostranslate.settings.intra_threads == 3
+
+    def test_auto_threads_split_cores_between_workers(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        with patch("src.infrastructure.translators.thread_tuning.os.cpu_count", return_value=8):
+            adapter = ArgosTranslatorAdapter(batch_size=1, workers=4)
+            adapter.translate(_make_numbered_subtitle(4), "ko")
+
+        pool = InProcessPoolExecutor.instances[0]
+        assert pool.initargs[3] == 2
+        assert mock_argostranslate.settings.intra_threads == 2
+
+    def test_pool_reused_per_language_pair(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        adapter = ArgosTranslatorAdapter(batch_size=2, workers=2)
+        adapter.translate(_make_numbered_subtitle(5), "ko")
+        adapter.translate(_make_numbered_subtitle(6), "ko")
+        assert len(InProcessPoolExecutor.instances) == 1
+
+        # A different language pair needs workers with a different model
+        subtitle = _make_numbered_subtitle(5)
+        adapter.translate(
+            Subtitle(video_id=subtitle.video_id, language="ko", format="srt", text=subtitle.text),
+            "en",
+        )
+        assert len(InProcessPoolExecutor.instances) == 2
+        assert InProcessPoolExecutor.instances[0].shutdown_called
+
+        adapter.close()
+        assert InProcessPoolExecutor.instances[1].shutdown_called
+
+    def test_small_input_stays_in_process(self, mock_argostranslate, sample_subtitle):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        adapter = ArgosTranslatorAdapter(workers=4)
+        adapter.translate(sample_subtitle, "ko")
+
+        assert InProcessPoolExecutor.instances == []
+
+    def test_split_into_shards(self):
+        from src.infrastructure.translators.argos_translator import _split_into_shards
+
+        assert _split_into_shards(list("abcdefg"), 3) == [["a", "b", "c"], ["d", "e"], ["f", "g"]]
+        assert _split_into_shards(["a"], 4) == [["a"]]
+
+
+class TestArgosSentenceMerging:
+    """Sentence-aware merging in the adapter translation path."""
+
+    def test_fragments_translated_once_and_redistributed(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        mock_translator = mock_argostranslate.translate.get_installed_languages.return_value[0] \
+            .get_translation.return_value
+        subtitle = Subtitle(
+            video_id=VideoId("test1234567"),
+            language="en",
+            format="srt",
+            text=(
+                "1\n00:00:00,000 --> 00:00:01,000\nso what we\n\n"
+                "2\n00:00:01,000 --> 00:00:02,000\nwill do is cook.\n\n"
+                "3\n00:00:02,000 --> 00:00:03,000\nThanks.\n"
+            ),
+        )
+
+        adapter = ArgosTranslatorAdapter(merge_sentences=True)
+        result = adapter.translate(subtitle, "ko")
+
+        assert [c.args[0] for c in mock_translator.translate.call_args_list] == [
+            "so what we will do is cook.",
+            "Thanks.",
+        ]
+        cues = adapter._parse_srt_cues(result.text)
+        assert [cue["timestamp"] for cue in cues] == [
+            "00:00:00,000 --> 00:00:01,000",
+            "00:00:01,000 --> 00:00:02,000",
+            "00:00:02,000 --> 00:00:03,000",
+        ]
+        assert " ".join(cue["text"] for cue in cues[:2]) == "[KO] so what we will do is cook."
+        assert cues[2]["text"] == "[KO] Thanks."
+        assert adapter.last_stats.merge_saved == 1
+
+
+class TestArgosStreaming:
+    """translate_stream yields cues as each batch completes."""
+
+    def test_cues_are_yielded_before_later_batches_run(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        mock_translator = mock_argostranslate.translate.get_installed_languages.return_value[0] \
+            .get_translation.return_value
+        adapter = ArgosTranslatorAdapter(batch_size=2)
+
+        stream = adapter.translate_stream(_make_numbered_subtitle(5), "ko")
+        first = next(stream)
+
+        assert first.number == "1"
+        assert first.timestamp == "00:00:01,000 --> 00:00:01,500"
+        assert first.text == "[KO] Line 1"
+        # only the first batch has been translated so far
+        assert mock_translator.translate.call_count == 2
+
+        rest = list(stream)
+        assert [cue.number for cue in rest] == ["2", "3", "4", "5"]
+        assert mock_translator.translate.call_count == 5
+
+    def test_translate_matches_stream(self, mock_argostranslate):
+        from src.domain.value_objects.subtitle_cue import format_srt
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        adapter = ArgosTranslatorAdapter(batch_size=3)
+        subtitle = _make_numbered_subtitle(7)
+
+        streamed = format_srt(list(adapter.translate_stream(subtitle, "ko")))
+
+        assert adapter.translate(subtitle, "ko").text == streamed
+
+    def test_stream_validates_before_translating(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        adapter = ArgosTranslatorAdapter()
+        empty = Subtitle(
+            video_id=VideoId("test1234567"), language="en", format="srt", text="  "
+        )
+
+        with pytest.raises(ValueError, match="cannot be empty"):
+            next(adapter.translate_stream(empty, "ko"))
+
+
+class TestArgosTranslateTexts:
+    """Plain-text entry point used by the translation daemon."""
+
+    def test_translate_texts_deduplicates(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        mock_translator = mock_argostranslate.translate.get_installed_languages.return_value[0] \
+            .get_translation.return_value
+        adapter = ArgosTranslatorAdapter()
+
+        result = adapter.translate_texts(["Hello", "World", "Hello"], "en", "ko")
+
+        assert result == ["[KO] Hello", "[KO] World", "[KO] Hello"]
+        assert mock_translator.translate.call_count == 2
+
+    def test_translate_texts_unsupported_pair(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        adapter = ArgosTranslatorAdapter()
+
+        with pytest.raises(ValueError, match="is not supported"):
+            adapter.translate_texts(["Hello"], "en", "xx")
+
+
+class TestArgosFastPath:
+    """Non-linguistic cues skip the translation model."""
+
+    def _subtitle(self, *texts):
+        blocks = [
+            f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},500\n{text}"
+            for i, text in enumerate(texts, start=1)
+        ]
+        return Subtitle(
+            video_id=VideoId("test1234567"),
+            language="en",
+            format="srt",
+            text="\n\n".join(blocks) + "\n",
+        )
+
+    def test_fast_path_cues_are_not_translated(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        mock_translator = mock_argostranslate.translate.get_installed_languages.return_value[0] \
+            .get_translation.return_value
+        adapter = ArgosTranslatorAdapter(fast_path=True)
+
+        result = adapter.translate(
+            self._subtitle("[Music]", "Hello", "♪♪", "(laughs)", "World", "[Music]"), "ko"
+        )
+
+        cues = adapter._parse_srt_cues(result.text)
+        assert [cue["text"] for cue in cues] == [
+            "[음악]", "[KO] Hello", "♪♪", "[웃음]", "[KO] World", "[음악]",
+        ]
+        assert [c.args[0] for c in mock_translator.translate.call_args_list] == ["Hello", "World"]
+        assert adapter.last_stats.fast_path_cues == 4
+
+    def test_fast_path_and_sound_tags_do_not_share_cache(self, mock_argostranslate, tmp_path):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+        from src.infrastructure.translators.translation_memory import (
+            CachingTranslatorAdapter,
+            SqliteTranslationMemory,
+        )
+
+        memory = SqliteTranslationMemory(tmp_path / "memory.sqlite3")
+        try:
+            fast = CachingTranslatorAdapter(ArgosTranslatorAdapter(fast_path=True), memory)
+            assert "[음악]" in fast.translate(self._subtitle("[Music]"), "ko").text
+
+            plain = CachingTranslatorAdapter(ArgosTranslatorAdapter(), memory)
+            assert "[KO] [Music]" in plain.translate(self._subtitle("[Music]"), "ko").text
+
+            custom = CachingTranslatorAdapter(
+                ArgosTranslatorAdapter(fast_path=True, sound_tags={"ko": {"music": "♪"}}),
+                memory,
+            )
+            assert "♪" in custom.translate(self._subtitle("[Music]"), "ko").text
+            assert memory.stats.hits == 0
+        finally:
+            memory.close()
+
+    def test_fast_path_is_opt_in(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        adapter = ArgosTranslatorAdapter()
+        result = adapter.translate(self._subtitle("[Music]"), "ko")
+
+        assert adapter._parse_srt_cues(result.text)[0]["text"] == "[KO] [Music]"
+        assert adapter.last_stats.fast_path_cues == 0
+
+    def test_fast_path_only_subtitle(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        adapter = ArgosTranslatorAdapter(fast_path=True, sound_tags={"ko": {"music": "[음악]"}})
+
+        assert adapter.translate_texts(["[Music]", "42", "[Music]"], "en", "ko") == [
+            "[음악]", "42", "[음악]",
+        ]
+        result = adapter.translate(self._subtitle("[Music]", "(laughs)"), "ko")
+        assert [cue["text"] for cue in adapter._parse_srt_cues(result.text)] == [
+            "[음악]", "[KO] (laughs)",
+        ]
+
+    def test_translate_many_uses_fast_path_shared_by_all_targets(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        en_ko = _tagging_translator("ko")
+        en_ja = _tagging_translator("ja")
+        _install_language_pairs(mock_argostranslate, {("en", "ko"): en_ko, ("en", "ja"): en_ja})
+        adapter = ArgosTranslatorAdapter(fast_path=True)
+
+        results = adapter.translate_many(self._subtitle("♪♪", "[Music]", "Hi"), ["ko", "ja"])
+
+        # "[Music]" has no Japanese mapping, so both targets translate it
+        assert [cue["text"] for cue in adapter._parse_srt_cues(results["ko"].text)] == [
+            "♪♪", "[ko] [Music]", "[ko] Hi",
+        ]
+        assert [cue["text"] for cue in adapter._parse_srt_cues(results["ja"].text)] == [
+            "♪♪", "[ja] [Music]", "[ja] Hi",
+        ]
+        assert adapter.last_stats.fast_path_cues == 1
+
+
+class FakeCompositeTranslation:
+    """Stand-in for argostranslate.translate.CompositeTranslation (pivot pair)."""
+
+    def translate(self, text):
+        raise AssertionError("pivot pairs must be translated hop by hop")
+
+
+def _install_language_pairs(mock_argostranslate, pairs):
+    """Install languages whose get_translation looks up {(src, tgt): translation}."""
+    codes = sorted({code for pair in pairs for code in pair})
+    languages = []
+    for code in codes:
+        lang = Mock()
+        lang.code = code
+        lang.get_translation = Mock(
+            side_effect=lambda to_lang, code=code: pairs.get((code, to_lang.code))
+        )
+        languages.append(lang)
+    mock_argostranslate.translate.get_installed_languages.return_value = languages
+
+
+def _tagging_translator(tag):
+    translator = Mock()
+    translator.translate = Mock(side_effect=lambda text: f"[{tag}] {text}")
+    return translator
+
+
+class TestArgosTranslateMany:
+    """Multi-target fan-out sharing the English pivot stage."""
+
+    def test_pivot_stage_is_shared_across_targets(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        ja_en = _tagging_translator("en")
+        en_ko = _tagging_translator("ko")
+        en_zh = _tagging_translator("zh")
+        _install_language_pairs(mock_argostranslate, {
+            ("ja", "en"): ja_en,
+            ("en", "ko"): en_ko,
+            ("en", "zh"): en_zh,
+            ("ja", "ko"): FakeCompositeTranslation(),
+            ("ja", "zh"): FakeCompositeTranslation(),
+        })
+        subtitle = Subtitle(
+            video_id=VideoId("test1234567"),
+            language="ja",
+            format="srt",
+            text=(
+                "1\n00:00:01,000 --> 00:00:02,000\nこんにちは\n\n"
+                "2\n00:00:02,000 --> 00:00:03,000\nありがとう\n\n"
+                "3\n00:00:03,000 --> 00:00:04,000\nこんにちは\n"
+            ),
+        )
+
+        with patch(
+            "src.infrastructure.translators.argos_translator.CompositeTranslation",
+            FakeCompositeTranslation,
+        ):
+            adapter = ArgosTranslatorAdapter()
+            results = adapter.translate_many(subtitle, ["ko", "zh", "en", "ko"])
+
+        assert list(results) == ["ko", "zh", "en"]
+        # ja -> en runs once per unique text, shared by ko, zh and en
+        assert ja_en.translate.call_count == 2
+        ko_cues = adapter._parse_srt_cues(results["ko"].text)
+        assert [cue["text"] for cue in ko_cues] == [
+            "[ko] [en] こんにちは", "[ko] [en] ありがとう", "[ko] [en] こんにちは",
+        ]
+        assert adapter._parse_srt_cues(results["en"].text)[1]["text"] == "[en] ありがとう"
+        assert results["zh"].language == "zh"
+        assert results["zh"].source_language == "ja"
+
+    def test_unsupported_target_fails_before_translating(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        mock_translator = mock_argostranslate.translate.get_installed_languages.return_value[0] \
+            .get_translation.return_value
+        adapter = ArgosTranslatorAdapter()
+        subtitle = _make_numbered_subtitle(2)
+
+        with pytest.raises(ValueError, match="to xx is not supported"):
+            adapter.translate_many(subtitle, ["ko", "xx"])
+        mock_translator.translate.assert_not_called()
+
+
+class TestArgosPivotCache:
+    """Explicit English pivot with a per-document intermediate cache."""
+
+    def _install(self, mock_argostranslate):
+        translators = {
+            ("ja", "en"): _tagging_translator("en"),
+            ("en", "ko"): _tagging_translator("ko"),
+            ("en", "zh"): _tagging_translator("zh"),
+            ("ja", "ko"): FakeCompositeTranslation(),
+            ("ja", "zh"): FakeCompositeTranslation(),
+        }
+        _install_language_pairs(mock_argostranslate, translators)
+        return translators
+
+    def _subtitle(self, text):
+        return Subtitle(
+            video_id=VideoId("test1234567"),
+            language="ja",
+            format="srt",
+            text=f"1\n00:00:01,000 --> 00:00:02,000\n{text}\n",
+        )
+
+    def test_second_target_only_pays_second_hop(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        translators = self._install(mock_argostranslate)
+
+        with patch(
+            "src.infrastructure.translators.argos_translator.CompositeTranslation",
+            FakeCompositeTranslation,
+        ):
+            adapter = ArgosTranslatorAdapter()
+            ko = adapter.translate(self._subtitle("こんにちは"), "ko")
+            zh = adapter.translate(self._subtitle("こんにちは"), "zh")
+            adapter.translate(self._subtitle("さようなら"), "ko")
+
+        assert "[ko] [en] こんにちは" in ko.text
+        assert "[zh] [en] こんにちは" in zh.text
+        # the second document is a different source, so it pays the first hop again
+        assert translators[("ja", "en")].translate.call_count == 2
+        assert translators[("en", "ko")].translate.call_count == 2
+
+    def test_direct_pairs_do_not_pivot(self, mock_argostranslate):
+        from src.infrastructure.translators.argos_translator import ArgosTranslatorAdapter
+
+        translators = self._install(mock_argostranslate)
+        adapter = ArgosTranslatorAdapter()
+
+        assert adapter._plan_hops("en", "ko") == [("en", "ko")]
+        with patch(
+            "src.infrastructure.translators.argos_translator.CompositeTranslation",
+            FakeCompositeTranslation,
+        ):
+            assert adapter._plan_hops("ja", "ko") == [("ja", "en"), ("en", "ko")]
+        assert translators[("ja", "en")].translate.call_count == 0
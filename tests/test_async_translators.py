@@ -0,0 +1,228 @@
+"""Unit Tests for ExecutorTranslatorAdapter and AsyncDaemonTranslatorClient."""
+import asyncio
+import threading
+
+import pytest
+
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.async_translators import (
+    AsyncDaemonTranslatorClient,
+    ExecutorTranslatorAdapter,
+)
+from src.infrastructure.translators.daemon_client import DaemonTranslatorClient
+from src.infrastructure.translators.srt_cues import parse_srt_cues
+from src.infrastructure.translators.translation_daemon import TranslationDaemon
+from tests.fakes.translators import FakeEngine, RecordingTranslator
+
+
+def _make_subtitle(*texts):
+    blocks = [
+        f"{i}\n00:00:0{i},000 --> 00:00:0{i},500\n{text}"
+        for i, text in enumerate(texts, start=1)
+    ]
+    return Subtitle(
+        video_id=VideoId("test1234567"),
+        language="en",
+        format="srt",
+        text="\n\n".join(blocks) + "\n",
+    )
+
+
+class BlockingStreamTranslator(RecordingTranslator):
+    """Yields one cue per release of its gate and records how many it produced."""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.gate = threading.Semaphore(0)
+        self.produced = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def translate_stream(self, subtitle, target_language, progress_callback=None):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            self.started.set()
+            for cue in super().translate_stream(subtitle, target_language):
+                self.gate.acquire(timeout=5)
+                self.produced += 1
+                yield cue
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestExecutorTranslatorAdapter:
+    """Executor-backed async adapter."""
+
+    def test_translate_async_runs_off_loop(self):
+        adapter = ExecutorTranslatorAdapter(RecordingTranslator())
+        progress = []
+
+        async def main():
+            loop_thread = threading.get_ident()
+
+            def on_progress(message, percent):
+                progress.append(threading.get_ident() == loop_thread)
+
+            return await adapter.translate_async(
+                _make_subtitle("One", "Two"), "ko", progress_callback=on_progress
+            )
+
+        result = asyncio.run(main())
+        adapter.close()
+
+        cues = parse_srt_cues(result.text)
+        assert [cue["text"] for cue in cues] == ["[ko] One", "[ko] Two"]
+        # progress callbacks are delivered on the event loop thread
+        assert progress and all(progress)
+
+    def test_concurrency_is_bounded(self):
+        inner = BlockingStreamTranslator()
+        adapter = ExecutorTranslatorAdapter(inner, max_concurrency=1)
+
+        async def main():
+            tasks = [
+                asyncio.create_task(adapter.translate_async(_make_subtitle("A"), "ko"))
+                for _ in range(3)
+            ]
+            for _ in range(3):
+                inner.gate.release()
+            return await asyncio.gather(*tasks)
+
+        results = asyncio.run(main())
+        adapter.close()
+
+        assert len(results) == 3
+        assert inner.max_active == 1
+
+    def test_thread_safe_translator_runs_concurrently(self):
+        inner = BlockingStreamTranslator()
+        inner.thread_safe = True
+        adapter = ExecutorTranslatorAdapter(inner, max_concurrency=2)
+
+        async def main():
+            tasks = [
+                asyncio.create_task(adapter.translate_async(_make_subtitle("A"), "ko"))
+                for _ in range(2)
+            ]
+            for _ in range(500):
+                if inner.active == 2:
+                    break
+                await asyncio.sleep(0.01)
+            inner.gate.release()
+            inner.gate.release()
+            return await asyncio.gather(*tasks)
+
+        results = asyncio.run(main())
+        adapter.close()
+
+        assert len(results) == 2
+        assert inner.max_active == 2
+
+    def test_concurrency_requires_thread_safe_translator(self):
+        with pytest.raises(ValueError, match="not thread-safe"):
+            ExecutorTranslatorAdapter(RecordingTranslator(), max_concurrency=2)
+
+        adapter = ExecutorTranslatorAdapter(DaemonTranslatorClient(), max_concurrency=2)
+        adapter.close()
+
+    def test_cancellation_stops_worker(self):
+        inner = BlockingStreamTranslator()
+        adapter = ExecutorTranslatorAdapter(inner)
+
+        async def main():
+            task = asyncio.create_task(
+                adapter.translate_async(_make_subtitle("A", "B", "C", "D"), "ko")
+            )
+            await asyncio.get_running_loop().run_in_executor(None, inner.started.wait, 5)
+            task.cancel()
+            await asyncio.sleep(0)
+            # let the worker finish the cue it is on, then it must stop
+            inner.gate.release()
+            inner.gate.release()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        adapter.close()
+
+        assert inner.produced < 4
+        assert inner.active == 0
+
+    def test_language_queries(self):
+        adapter = ExecutorTranslatorAdapter(RecordingTranslator())
+
+        async def main():
+            return (
+                await adapter.list_supported_languages_async(),
+                await adapter.is_language_pair_supported_async("en", "ko"),
+            )
+
+        assert asyncio.run(main()) == (["en", "ko"], True)
+        adapter.close()
+
+    def test_invalid_max_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+            ExecutorTranslatorAdapter(RecordingTranslator(), max_concurrency=0)
+
+
+@pytest.fixture
+def daemon():
+    daemon = TranslationDaemon(FakeEngine(), port=0, batch_window_ms=0)
+    daemon.start()
+    yield daemon
+    daemon.shutdown()
+
+
+class TestAsyncDaemonTranslatorClient:
+    """Native asyncio client against a running daemon."""
+
+    def test_many_subtitles_on_one_loop(self, daemon):
+        client = AsyncDaemonTranslatorClient(daemon.url, chunk_size=2)
+
+        async def main():
+            return await asyncio.gather(
+                client.translate_async(_make_subtitle("One", "Two", "Three"), "ko"),
+                client.translate_async(_make_subtitle("Four"), "ko"),
+            )
+
+        first, second = asyncio.run(main())
+
+        assert [cue["text"] for cue in parse_srt_cues(first.text)] == [
+            "[ko] One", "[ko] Two", "[ko] Three",
+        ]
+        assert parse_srt_cues(second.text)[0]["text"] == "[ko] Four"
+
+    def test_language_queries(self, daemon):
+        client = AsyncDaemonTranslatorClient(daemon.url)
+
+        async def main():
+            return (
+                await client.list_supported_languages_async(),
+                await client.is_language_pair_supported_async("en", "ja"),
+            )
+
+        assert asyncio.run(main()) == (["en", "ko"], False)
+
+    def test_pair_version_matches_sync_client(self, daemon):
+        client = AsyncDaemonTranslatorClient(daemon.url)
+
+        version = asyncio.run(client.engine_version_for_async("en", "ko"))
+
+        assert version == DaemonTranslatorClient(daemon.url).engine_version_for("en", "ko")
+        assert version == FakeEngine().engine_version_for("en", "ko")
+
+    def test_unsupported_pair_raises_value_error(self, daemon):
+        client = AsyncDaemonTranslatorClient(daemon.url)
+
+        with pytest.raises(ValueError, match="not supported"):
+            asyncio.run(client.translate_async(_make_subtitle("One"), "xx"))
+
+    def test_invalid_url(self):
+        with pytest.raises(ValueError, match="Unsupported daemon URL"):
+            AsyncDaemonTranslatorClient("unix:///tmp/daemon.sock")
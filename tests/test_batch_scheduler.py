@@ -0,0 +1,33 @@
+"""Unit Tests for length-bucketed batch planning."""
+from src.infrastructure.translators.batch_scheduler import (
+    padded_token_count,
+    plan_length_buckets,
+)
+
+
+class TestPlanLengthBuckets:
+    """Greedy bucketing under a token budget."""
+
+    def test_similar_lengths_are_grouped(self):
+        buckets = plan_length_buckets([10, 1, 9, 2, 1], max_batch_size=8, max_batch_tokens=20)
+
+        assert buckets == [[1, 4, 3], [2, 0]]
+
+    def test_every_index_is_planned_exactly_once(self):
+        lengths = [5, 3, 8, 1, 1, 7, 2, 6]
+        buckets = plan_length_buckets(lengths, max_batch_size=3, max_batch_tokens=16)
+
+        assert sorted(sum(buckets, [])) == list(range(len(lengths)))
+        assert all(len(bucket) <= 3 for bucket in buckets)
+        assert all(
+            padded_token_count([lengths[i] for i in bucket]) <= 16
+            for bucket in buckets
+            if len(bucket) > 1
+        )
+
+    def test_oversized_input_gets_its_own_bucket(self):
+        assert plan_length_buckets([50, 2], max_batch_size=4, max_batch_tokens=10) == [[1], [0]]
+
+    def test_empty_input(self):
+        assert plan_length_buckets([], max_batch_size=4, max_batch_tokens=10) == []
+        assert padded_token_count([]) == 0
@@ -0,0 +1,215 @@
+"""Unit Tests for CTranslate2TranslatorAdapter (fake ctranslate2/sentencepiece modules)."""
+import sys
+import types
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.ctranslate2_translator import (
+    CTranslate2TranslatorAdapter,
+)
+
+
+class FakeSentencePieceProcessor:
+    """공백 단위 토크나이저 (SentencePiece 대체)"""
+
+    instances = []
+
+    def __init__(self, model_file):
+        self.model_file = model_file
+        FakeSentencePieceProcessor.instances.append(self)
+
+    def encode(self, lines, out_type=str):
+        return [line.split() for line in lines]
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+class FakeTranslator:
+    """입력 토큰을 대문자로 바꿔 돌려주는 CTranslate2 Translator 대체"""
+
+    instances = []
+
+    def __init__(self, model_path, **options):
+        self.model_path = model_path
+        self.options = options
+        self.calls = []
+        FakeTranslator.instances.append(self)
+
+    def translate_batch(self, sources, target_prefix=None, **options):
+        self.calls.append({"sources": sources, "target_prefix": target_prefix, **options})
+        results = []
+        for index, tokens in enumerate(sources):
+            words = [t.upper() for t in tokens if t != "</s>" and "_" not in t]
+            prefix = list(target_prefix[index]) if target_prefix else []
+            results.append(SimpleNamespace(hypotheses=[prefix + words]))
+        return results
+
+
+@pytest.fixture
+def fake_ct2(monkeypatch):
+    """ctranslate2/sentencepiece 가짜 모듈 등록"""
+    FakeTranslator.instances = []
+    FakeSentencePieceProcessor.instances = []
+    monkeypatch.setitem(
+        sys.modules, "ctranslate2", types.SimpleNamespace(Translator=FakeTranslator)
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "sentencepiece",
+        types.SimpleNamespace(SentencePieceProcessor=FakeSentencePieceProcessor),
+    )
+    return FakeTranslator
+
+
+@pytest.fixture
+def subtitle():
+    srt_content = """1
+00:00:00,000 --> 00:00:02,000
+hello world
+
+2
+00:00:02,500 --> 00:00:05,000
+good morning
+see you
+
+3
+00:00:05,500 --> 00:00:07,000
+hello   world
+"""
+    return Subtitle(
+        video_id=VideoId("test1234567"),
+        language="en",
+        format="srt",
+        text=srt_content,
+    )
+
+
+class TestCTranslate2TranslatorAdapter:
+
+    def test_nllb_translation_uses_language_tokens(self, fake_ct2, subtitle, tmp_path):
+        adapter = CTranslate2TranslatorAdapter(tmp_path, beam_size=2, max_batch_tokens=512)
+
+        result = adapter.translate(subtitle, "ko")
+
+        assert result.language == "ko"
+        assert result.source_language == "en"
+        assert "HELLO WORLD" in result.text
+        assert "GOOD MORNING\nSEE YOU" in result.text
+
+        call = fake_ct2.instances[0].calls[0]
+        # 중복 큐는 한 번만, 여러 줄 큐는 줄 단위로 번역
+        assert call["sources"] == [
+            ["eng_Latn", "hello", "world", "</s>"],
+            ["eng_Latn", "good", "morning", "</s>"],
+            ["eng_Latn", "see", "you", "</s>"],
+        ]
+        assert call["target_prefix"] == [["kor_Hang"]] * 3
+        assert call["beam_size"] == 2
+        assert call["max_batch_size"] == 512
+        assert call["batch_type"] == "tokens"
+
+    def test_translate_stream_yields_per_batch(self, fake_ct2, subtitle, tmp_path):
+        adapter = CTranslate2TranslatorAdapter(tmp_path, batch_size=1)
+
+        cues = list(adapter.translate_stream(subtitle, "ko"))
+
+        assert [cue.number for cue in cues] == ["1", "2", "3"]
+        assert cues[2].text == "HELLO WORLD"
+        assert len(fake_ct2.instances[0].calls) == 2
+
+    def test_engine_version_includes_decoding_options(self, tmp_path):
+        base = CTranslate2TranslatorAdapter(tmp_path)
+        versions = {
+            base.engine_version,
+            CTranslate2TranslatorAdapter(tmp_path, compute_type="int8").engine_version,
+            CTranslate2TranslatorAdapter(tmp_path, beam_size=1).engine_version,
+        }
+
+        assert len(versions) == 3
+        assert base.engine_version == CTranslate2TranslatorAdapter(tmp_path).engine_version
+
+    def test_model_loads_once_with_options(self, fake_ct2, subtitle, tmp_path):
+        adapter = CTranslate2TranslatorAdapter(
+            tmp_path, compute_type="int8", inter_threads=2, intra_threads=4
+        )
+
+        adapter.translate(subtitle, "ko")
+        adapter.translate(subtitle, "ja")
+
+        assert len(fake_ct2.instances) == 1
+        assert fake_ct2.instances[0].options == {
+            "device": "cpu", "compute_type": "int8", "inter_threads": 2, "intra_threads": 4,
+        }
+        # NLLB는 원본/목표 토크나이저 공유
+        assert len(FakeSentencePieceProcessor.instances) == 1
+        assert FakeSentencePieceProcessor.instances[0].model_file.endswith(
+            "sentencepiece.bpe.model"
+        )
+
+    def test_marian_uses_pair_tokenizers_without_prefix(self, fake_ct2, subtitle, tmp_path):
+        adapter = CTranslate2TranslatorAdapter(
+            tmp_path, model_family="marian", language_pair=("en", "ko")
+        )
+
+        result = adapter.translate(subtitle, "ko")
+
+        assert "HELLO WORLD" in result.text
+        call = fake_ct2.instances[0].calls[0]
+        assert call["target_prefix"] is None
+        assert call["sources"][0] == ["hello", "world", "</s>"]
+        assert [Path(sp.model_file).name for sp in FakeSentencePieceProcessor.instances] == [
+            "source.spm", "target.spm",
+        ]
+
+    def test_translate_texts_preserves_order_and_blank_lines(self, fake_ct2, tmp_path):
+        adapter = CTranslate2TranslatorAdapter(tmp_path)
+
+        result = adapter.translate_texts(["hi there", "", "hi there"], "en", "ko")
+
+        assert result == ["HI THERE", "", "HI THERE"]
+
+    def test_language_support(self, tmp_path):
+        nllb = CTranslate2TranslatorAdapter(tmp_path)
+        marian = CTranslate2TranslatorAdapter(
+            tmp_path, model_family="marian", language_pair=("en", "ko")
+        )
+
+        assert nllb.is_language_pair_supported("en", "ko")
+        assert nllb.is_language_pair_supported("eng_Latn", "fra_Latn")
+        assert not nllb.is_language_pair_supported("en", "en")
+        assert not nllb.is_language_pair_supported("en", "xx")
+        assert marian.is_language_pair_supported("en", "ko")
+        assert not marian.is_language_pair_supported("ko", "en")
+        assert marian.list_supported_languages() == ["en", "ko"]
+
+    def test_unsupported_pair_raises_before_loading(self, fake_ct2, subtitle, tmp_path):
+        adapter = CTranslate2TranslatorAdapter(
+            tmp_path, model_family="marian", language_pair=("en", "ja")
+        )
+
+        with pytest.raises(ValueError, match="not supported"):
+            adapter.translate(subtitle, "ko")
+        assert fake_ct2.instances == []
+
+    @pytest.mark.parametrize("kwargs, message", [
+        ({"model_family": "t5"}, "Unsupported model family"),
+        ({"model_family": "marian"}, "language_pair is required"),
+        ({"batch_size": 0}, "batch_size"),
+        ({"max_batch_tokens": 0}, "max_batch_tokens"),
+        ({"beam_size": 0}, "beam_size"),
+    ])
+    def test_invalid_options(self, tmp_path, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            CTranslate2TranslatorAdapter(tmp_path, **kwargs)
+
+    def test_missing_dependencies_raise_import_error(self, monkeypatch, subtitle, tmp_path):
+        monkeypatch.setitem(sys.modules, "ctranslate2", None)
+        adapter = CTranslate2TranslatorAdapter(tmp_path)
+
+        with pytest.raises(ImportError, match="pip install ctranslate2 sentencepiece"):
+            adapter.translate(subtitle, "ko")
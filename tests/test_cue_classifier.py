@@ -0,0 +1,66 @@
+"""Unit Tests for the rule-based fast-path cue classifier."""
+import json
+
+import pytest
+
+from src.infrastructure.translators.cue_classifier import (
+    FastPathClassifier,
+    load_sound_tags,
+)
+
+
+class TestFastPathClassifier:
+    """Cues that do not need the translation model."""
+
+    def test_sound_tags_are_mapped(self):
+        classifier = FastPathClassifier()
+
+        assert classifier.classify("[Music]", "ko") == "[음악]"
+        assert classifier.classify("(laughs)", "ko") == "[웃음]"
+        assert classifier.classify("[ APPLAUSE ]", "ko") == "[박수]"
+        assert classifier.classify("♪ [Music] ♪", "ko") == "♪ [음악] ♪"
+
+    def test_non_linguistic_cues_pass_through(self):
+        classifier = FastPathClassifier()
+
+        for text in ["♪♪", "1984", "...", "?!", "- 3, 2, 1"]:
+            assert classifier.classify(text, "ko") == text
+
+    def test_speech_and_unknown_tags_need_the_model(self):
+        classifier = FastPathClassifier()
+
+        assert classifier.classify("Hello there", "ko") is None
+        assert classifier.classify("[door slams]", "ko") is None
+        assert classifier.classify("[Music]", "ja") is None
+        # Every line of a multi-line cue must take the fast path
+        assert classifier.classify("[Music]\nHello", "ko") is None
+        assert classifier.classify("[Music]\n♪♪", "ko") == "[음악]\n♪♪"
+
+    def test_custom_table(self):
+        classifier = FastPathClassifier({"ja": {"Music": "［音楽］"}})
+
+        assert classifier.classify("[music]", "ja") == "［音楽］"
+        assert classifier.classify("[Music]", "ko") is None
+
+
+class TestLoadSoundTags:
+    """JSON mapping table."""
+
+    def test_file_entries_extend_defaults(self, tmp_path):
+        path = tmp_path / "sound_tags.json"
+        path.write_text(
+            json.dumps({"ko": {"door slams": "[문 닫히는 소리]"}}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+
+        classifier = FastPathClassifier(load_sound_tags(path))
+
+        assert classifier.classify("[Door slams]", "ko") == "[문 닫히는 소리]"
+        assert classifier.classify("[Music]", "ko") == "[음악]"
+
+    def test_invalid_table(self, tmp_path):
+        path = tmp_path / "sound_tags.json"
+        path.write_text('{"ko": ["music"]}', encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Invalid sound tag table"):
+            load_sound_tags(path)
@@ -0,0 +1,225 @@
+"""Unit Tests for the throughput-aware TranslatorRouter."""
+import pytest
+
+from src.application.ports.subtitle_translator import SubtitleTranslatorPort
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import parse_srt
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.engine_router import TranslatorRouter
+from src.infrastructure.translators.srt_cues import parse_srt_cues
+from src.infrastructure.translators.translation_memory import (
+    CachingTranslatorAdapter,
+    SqliteTranslationMemory,
+)
+
+
+class NamedEngine(SubtitleTranslatorPort):
+    """Fake engine tagging cues with its name; optionally fails or supports only some pairs."""
+
+    def __init__(self, name, targets=("ko",), fail=False, error=None):
+        self.engine_version = name
+        self.targets = targets
+        self.error = error or (RuntimeError(f"{name} crashed") if fail else None)
+        self.calls = 0
+
+    def translate(self, subtitle, target_language, progress_callback=None):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        blocks = [
+            f"{cue['number']}\n{cue['timestamp']}\n[{self.engine_version}] {cue['text']}"
+            for cue in parse_srt_cues(subtitle.text)
+        ]
+        return subtitle.with_translation("\n\n".join(blocks) + "\n", target_language)
+
+    def list_supported_languages(self):
+        return ["en", *self.targets]
+
+    def is_language_pair_supported(self, source_language, target_language):
+        return source_language == "en" and target_language in self.targets
+
+
+def _subtitle(count=3):
+    blocks = [
+        f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},500\nline {i}"
+        for i in range(1, count + 1)
+    ]
+    return Subtitle(
+        video_id=VideoId("test1234567"),
+        language="en",
+        format="srt",
+        text="\n\n".join(blocks) + "\n",
+    )
+
+
+class TestRank:
+
+    def test_falls_back_when_preferred_engine_lacks_pair(self):
+        router = TranslatorRouter([NamedEngine("llm", targets=("ja",)), NamedEngine("argos")])
+
+        assert router.rank("en", "ko", 10) == ["argos"]
+        assert router.rank("en", "ja", 10) == ["llm"]
+
+    def test_unsupported_pair_everywhere(self):
+        router = TranslatorRouter([NamedEngine("argos")])
+
+        with pytest.raises(ValueError, match="en -> fr"):
+            router.rank("en", "fr", 10)
+
+    def test_deadline_skips_slow_engine(self):
+        router = TranslatorRouter(
+            [NamedEngine("llm"), NamedEngine("nllb"), NamedEngine("argos")],
+            deadline_seconds=10,
+        )
+        router.record("llm", "en", "ko", cue_count=100, seconds=100)  # 1 cue/s
+        router.record("nllb", "en", "ko", cue_count=100, seconds=5)  # 20 cues/s
+        router.record("argos", "en", "ko", cue_count=100, seconds=1)  # 100 cues/s
+
+        # 작은 작업은 선호 엔진이 마감 안에 끝냄
+        assert router.rank("en", "ko", 5)[0] == "llm"
+        # 큰 작업은 마감을 맞추는 다음 선호 엔진
+        assert router.rank("en", "ko", 150) == ["nllb", "argos", "llm"]
+        # 아무도 못 맞추면 가장 빠른 엔진부터
+        assert router.rank("en", "ko", 5000) == ["argos", "nllb", "llm"]
+
+    def test_deadline_per_call_overrides_default(self):
+        router = TranslatorRouter(
+            [NamedEngine("llm"), NamedEngine("argos")], deadline_seconds=1000
+        )
+        router.record("llm", "en", "ko", cue_count=100, seconds=100)  # 1 cue/s
+        router.record("argos", "en", "ko", cue_count=100, seconds=1)  # 100 cues/s
+
+        assert router.rank("en", "ko", 50) == ["llm", "argos"]
+        assert router.rank("en", "ko", 50, deadline_seconds=10) == ["argos", "llm"]
+        with pytest.raises(ValueError, match="deadline_seconds"):
+            router.rank("en", "ko", 50, deadline_seconds=0)
+
+    def test_unmeasured_engine_is_tried(self):
+        router = TranslatorRouter([NamedEngine("llm"), NamedEngine("argos")], deadline_seconds=1)
+        router.record("argos", "en", "ko", cue_count=100, seconds=1)
+
+        assert router.rank("en", "ko", 50)[0] == "llm"
+
+    def test_failing_engine_is_demoted_and_window_forgets(self):
+        router = TranslatorRouter(
+            [NamedEngine("llm"), NamedEngine("argos")], stats_window=2
+        )
+        router.record("llm", "en", "ko", 0, 0.0, succeeded=False)
+
+        assert router.stats("llm", "en", "ko").failure_rate == 1.0
+        assert router.rank("en", "ko", 10) == ["argos", "llm"]
+
+        router.record("llm", "en", "ko", 10, 1.0)
+        router.record("llm", "en", "ko", 10, 1.0)
+        stats = router.stats("llm", "en", "ko")
+        assert (stats.runs, stats.failures, stats.cues_per_second) == (2, 0, 10.0)
+        assert router.rank("en", "ko", 10) == ["llm", "argos"]
+
+
+class TestTranslatorRouter:
+
+    def test_translate_records_throughput(self):
+        router = TranslatorRouter([NamedEngine("argos")])
+
+        result = router.translate(_subtitle(3), "ko")
+
+        assert [cue.text for cue in parse_srt(result.text)] == [
+            f"[argos] line {i}" for i in range(1, 4)
+        ]
+        assert router.last_engine == "argos"
+        stats = router.stats("argos", "en", "ko")
+        assert stats.runs == 1
+        assert stats.cues_per_second is not None
+
+    def test_runtime_failure_falls_back_to_next_engine(self):
+        llm = NamedEngine("llm", fail=True)
+        router = TranslatorRouter([llm, NamedEngine("argos")])
+
+        result = router.translate(_subtitle(2), "ko")
+
+        assert parse_srt(result.text)[0].text == "[argos] line 1"
+        assert router.stats("llm", "en", "ko").failures == 1
+        # 실패율이 높아진 엔진은 다음 작업부터 뒤로 밀림
+        router.translate(_subtitle(2), "ko")
+        assert llm.calls == 1
+
+    @pytest.mark.parametrize("error", [
+        ImportError("No module named 'google'"),
+        OSError("model directory not found"),
+        ValueError("unsupported model option"),
+    ])
+    def test_setup_failure_falls_back_to_next_engine(self, error):
+        router = TranslatorRouter([NamedEngine("llm", error=error), NamedEngine("argos")])
+
+        result = router.translate(_subtitle(2), "ko")
+
+        assert parse_srt(result.text)[0].text == "[argos] line 1"
+        assert router.last_engine == "argos"
+        assert router.stats("llm", "en", "ko").failures == 1
+
+    def test_failure_after_first_cue_is_raised(self):
+        class BreakingEngine(NamedEngine):
+            def translate_stream(self, subtitle, target_language, progress_callback=None):
+                cues = super().translate_stream(subtitle, target_language, progress_callback)
+                yield next(cues)
+                raise OSError("connection lost")
+
+        router = TranslatorRouter([BreakingEngine("llm"), NamedEngine("argos")])
+        stream = router.translate_stream(_subtitle(2), "ko")
+
+        assert next(stream).text == "[llm] line 1"
+        with pytest.raises(OSError, match="connection lost"):
+            next(stream)
+        assert router.stats("llm", "en", "ko").failures == 1
+
+    def test_translate_with_per_call_deadline(self):
+        router = TranslatorRouter([NamedEngine("llm"), NamedEngine("argos")])
+        router.record("llm", "en", "ko", cue_count=100, seconds=100)
+        router.record("argos", "en", "ko", cue_count=100, seconds=1)
+
+        router.translate(_subtitle(20), "ko", deadline_seconds=1)
+
+        assert router.last_engine == "argos"
+
+    def test_all_engines_fail(self):
+        router = TranslatorRouter([NamedEngine("llm", fail=True), NamedEngine("argos", fail=True)])
+
+        with pytest.raises(RuntimeError, match="llm crashed.*argos crashed"):
+            router.translate(_subtitle(1), "ko")
+
+    def test_supported_languages_are_union(self):
+        router = TranslatorRouter([NamedEngine("llm", targets=("ja",)), NamedEngine("argos")])
+
+        assert router.list_supported_languages() == ["en", "ja", "ko"]
+        assert router.is_language_pair_supported("en", "ko")
+        assert not router.is_language_pair_supported("en", "fr")
+
+    def test_duplicate_engine_names(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            TranslatorRouter([NamedEngine("argos"), NamedEngine("argos")])
+
+    def test_router_cannot_be_cached_as_one_engine(self, tmp_path):
+        router = TranslatorRouter([NamedEngine("llm"), NamedEngine("argos")])
+        memory = SqliteTranslationMemory(tmp_path / "memory.sqlite3")
+
+        with pytest.raises(ValueError, match="wrap each engine"):
+            CachingTranslatorAdapter(router, memory)
+
+    def test_engines_cached_below_router_keep_separate_entries(self, tmp_path):
+        memory = SqliteTranslationMemory(tmp_path / "memory.sqlite3")
+        llm, argos = NamedEngine("llm"), NamedEngine("argos")
+        router = TranslatorRouter([
+            CachingTranslatorAdapter(llm, memory),
+            CachingTranslatorAdapter(argos, memory),
+        ])
+
+        assert router.engine_names == ["llm", "argos"]
+        router.translate(_subtitle(2), "ko")
+        router.record("llm", "en", "ko", cue_count=1, seconds=1, succeeded=False)
+        router.record("llm", "en", "ko", cue_count=1, seconds=1, succeeded=False)
+        translated = router.translate(_subtitle(2), "ko")
+
+        # The fallback engine gets its own translations, not the llm cache entries
+        assert router.last_engine == "argos"
+        assert "[argos] line 1" in translated.text
+        assert argos.calls == 1
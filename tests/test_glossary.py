@@ -0,0 +1,177 @@
+"""Unit Tests for the glossary trie and GlossaryTranslatorAdapter."""
+from pathlib import Path
+
+import pytest
+
+from src.application.ports.subtitle_translator import SubtitleTranslatorPort
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import parse_srt
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.glossary import (
+    Glossary,
+    GlossaryTranslatorAdapter,
+    load_glossary,
+    merge_glossaries,
+)
+from src.infrastructure.translators.srt_cues import parse_srt_cues
+
+RULES_PATH = Path(__file__).parent.parent / "rules.md"
+
+
+class EchoTranslator(SubtitleTranslatorPort):
+    """Fake translator that tags cue text and keeps placeholders."""
+
+    engine_version = "echo-1"
+
+    def __init__(self, drop_placeholders=False):
+        self.requests = []
+        self.drop_placeholders = drop_placeholders
+
+    def translate(self, subtitle, target_language, progress_callback=None):
+        cues = parse_srt_cues(subtitle.text)
+        self.requests.append([cue["text"] for cue in cues])
+        blocks = []
+        for cue in cues:
+            text = cue["text"]
+            if self.drop_placeholders:
+                text = text.replace("⟪0⟫", "")
+            blocks.append(f"{cue['number']}\n{cue['timestamp']}\n[{target_language}] {text}")
+        return subtitle.with_translation("\n\n".join(blocks) + "\n", target_language)
+
+    def list_supported_languages(self):
+        return ["en", "ko", "ja"]
+
+    def is_language_pair_supported(self, source_language, target_language):
+        return True
+
+
+def _subtitle(*texts):
+    blocks = [
+        f"{i}\n00:00:0{i},000 --> 00:00:0{i},500\n{text}"
+        for i, text in enumerate(texts, start=1)
+    ]
+    return Subtitle(
+        video_id=VideoId("test1234567"),
+        language="en",
+        format="srt",
+        text="\n\n".join(blocks) + "\n",
+    )
+
+
+class TestGlossary:
+
+    def test_longest_match_and_case_insensitive(self):
+        glossary = Glossary({"Deep": "깊은", "deep learning": "딥러닝", "API": "API"})
+
+        protected = glossary.protect("Deep Learning via an api")
+
+        assert protected.text == "⟪0⟫ via an ⟪1⟫"
+        assert protected.sources == ("Deep Learning", "api")
+        assert protected.targets == ("딥러닝", "API")
+
+    def test_terms_match_on_word_boundaries_only(self):
+        glossary = Glossary({"AI": "AI", "Library": "라이브러리"})
+
+        assert glossary.find("She said Libraryish things") == []
+        assert glossary.find("AI, library.") == [(0, 2, "AI"), (4, 11, "라이브러리")]
+
+    def test_inject_restores_terms_and_appends_dropped(self):
+        protected = Glossary({"Gemini": "제미나이", "Python": "파이썬"}).protect(
+            "Gemini loves Python"
+        )
+
+        assert protected.inject("⟪ 1 ⟫를 좋아하는 ⟪0⟫") == ("파이썬를 좋아하는 제미나이", 0)
+        assert protected.inject("⟪0⟫는 좋아해요") == ("제미나이는 좋아해요 파이썬", 1)
+        assert protected.inject("⟪0⟫ ⟪1⟫", restore_source=True) == ("Gemini Python", 0)
+
+    def test_large_text_is_single_scan(self):
+        glossary = Glossary({"neural network": "신경망"})
+
+        text = "a neural network " * 20_000
+
+        assert len(glossary.find(text)) == 20_000
+
+
+class TestLoadGlossary:
+
+    def test_tsv_file(self, tmp_path):
+        path = tmp_path / "glossary.tsv"
+        path.write_text("# 프로젝트 용어집\nOpenAI\t오픈AI\n\nClaude\t클로드\n", encoding="utf-8")
+
+        glossary = load_glossary(path)
+
+        assert glossary.terms == {"OpenAI": "오픈AI", "Claude": "클로드"}
+
+    def test_invalid_tsv_line(self, tmp_path):
+        path = tmp_path / "glossary.tsv"
+        path.write_text("OpenAI 오픈AI\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="line 1"):
+            load_glossary(path)
+
+    def test_rules_md_technical_terms(self):
+        glossary = load_glossary(RULES_PATH)
+
+        assert glossary.terms["Machine Learning"] == "머신러닝"
+        assert glossary.terms["Repository"] == "저장소"
+
+    def test_merge_later_wins(self):
+        merged = merge_glossaries([
+            Glossary({"Repository": "저장소", "API": "API"}),
+            Glossary({"Repository": "레포"}),
+        ])
+
+        assert merged.terms == {"Repository": "레포", "API": "API"}
+
+    def test_merge_rejects_mixed_languages(self):
+        with pytest.raises(ValueError, match="different languages"):
+            merge_glossaries([Glossary({}, "ko"), Glossary({}, "ja")])
+
+
+class TestGlossaryTranslatorAdapter:
+
+    def test_protects_before_and_injects_after(self):
+        inner = EchoTranslator()
+        adapter = GlossaryTranslatorAdapter(inner, Glossary({"Kubernetes": "쿠버네티스"}))
+
+        result = adapter.translate(_subtitle("Deploy to Kubernetes", "hello"), "ko")
+
+        assert inner.requests == [["Deploy to ⟪0⟫", "hello"]]
+        assert [cue.text for cue in parse_srt(result.text)] == [
+            "[ko] Deploy to 쿠버네티스", "[ko] hello",
+        ]
+        assert adapter.injected_terms == 1
+        assert adapter.missing_terms == 0
+
+    def test_dropped_placeholder_is_counted(self):
+        adapter = GlossaryTranslatorAdapter(
+            EchoTranslator(drop_placeholders=True), Glossary({"Kubernetes": "쿠버네티스"})
+        )
+
+        result = adapter.translate(_subtitle("Kubernetes rocks"), "ko")
+
+        assert parse_srt(result.text)[0].text == "[ko]  rocks 쿠버네티스"
+        assert adapter.missing_terms == 1
+
+    def test_other_target_languages_pass_through(self):
+        inner = EchoTranslator()
+        adapter = GlossaryTranslatorAdapter(inner, Glossary({"Kubernetes": "쿠버네티스"}))
+
+        adapter.translate(_subtitle("Kubernetes"), "ja")
+
+        assert inner.requests == [["Kubernetes"]]
+
+    def test_translate_many_protects_only_glossary_language(self):
+        inner = EchoTranslator()
+        adapter = GlossaryTranslatorAdapter(inner, Glossary({"Kubernetes": "쿠버네티스"}))
+
+        results = adapter.translate_many(_subtitle("on Kubernetes"), ["ja", "ko", "fr"])
+
+        # 다른 언어에는 자리표시자 없이 원본 문맥 그대로 전달
+        assert inner.requests == [["on ⟪0⟫"], ["on Kubernetes"], ["on Kubernetes"]]
+        assert list(results) == ["ja", "ko", "fr"]
+        assert parse_srt(results["ko"].text)[0].text == "[ko] on 쿠버네티스"
+        assert parse_srt(results["ja"].text)[0].text == "[ja] on Kubernetes"
+        assert parse_srt(results["fr"].text)[0].text == "[fr] on Kubernetes"
+        assert results["ja"].source_language == "en"
+        assert adapter.injected_terms == 1
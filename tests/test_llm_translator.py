@@ -0,0 +1,243 @@
+"""Unit Tests for ChunkedLlmTranslatorAdapter against a local mock Gemini server."""
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.llm_translator import (
+    ChunkedLlmTranslatorAdapter,
+    GeminiRestClient,
+    parse_chunk_response,
+    plan_chunks,
+)
+from src.infrastructure.translators.srt_cues import parse_srt_cues
+
+_CUES_SECTION = "[자막 큐]\n"
+_MARKER_RE = re.compile(r"^\[\[(\d+)\]\] .*$", re.MULTILINE)
+
+
+class MockGemini:
+    """generateContent 모의 서버: 큐 텍스트를 "[ko] "를 붙여 되돌려 줌
+
+    - drop_once: 처음 한 번은 해당 큐 블록을 빼고 응답 (검증 실패 유도)
+    - fail_once: 처음 한 번은 해당 큐가 든 요청에 500 응답
+    """
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.drop_once = set()
+        self.fail_once = set()
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.api_keys = set()
+        self._lock = threading.Lock()
+
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                self._reply(200, {"models": [
+                    {"name": "models/embedding-001", "supportedGenerationMethods": ["embedContent"]},
+                    {"name": "models/gemini-test", "supportedGenerationMethods": ["generateContent"]},
+                ]})
+
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                body = json.loads(self.rfile.read(length))
+                prompt = body["contents"][0]["parts"][0]["text"]
+                status, payload = mock._handle(self.path, self.headers, prompt)
+                self._reply(status, payload)
+
+            def _reply(self, status, payload):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def _handle(self, path, headers, prompt):
+        cue_text = prompt.split(_CUES_SECTION, 1)[1]
+        ids = {int(i) for i in _MARKER_RE.findall(cue_text)}
+        with self._lock:
+            self.requests.append((path, sorted(ids)))
+            self.api_keys.add(headers.get("x-goog-api-key"))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            fail = ids & self.fail_once
+            self.fail_once -= fail
+            drop = ids & self.drop_once
+            self.drop_once -= drop
+        try:
+            time.sleep(self.delay)
+            if fail:
+                return 500, {"error": {"message": "internal"}}
+
+            blocks = []
+            for block in cue_text.strip().split("\n\n"):
+                marker, text = block.split("\n", 1)
+                if int(_MARKER_RE.match(marker).group(1)) in drop:
+                    continue
+                blocks.append(f"{marker}\n[ko] {text}")
+            answer = "```\n" + "\n\n".join(blocks) + "\n```"
+            return 200, {"candidates": [{"content": {"parts": [{"text": answer}]}}]}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def gemini():
+    server = MockGemini()
+    yield server
+    server.close()
+
+
+def _make_subtitle(count):
+    blocks = [
+        f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},500\nline number {i}"
+        for i in range(1, count + 1)
+    ]
+    return Subtitle(
+        video_id=VideoId("test1234567"),
+        language="en",
+        format="srt",
+        text="\n\n".join(blocks) + "\n",
+    )
+
+
+def _adapter(server, **kwargs):
+    client = GeminiRestClient("test-key", model="gemini-test", base_url=server.url)
+    kwargs.setdefault("retry_delay", 0)
+    return ChunkedLlmTranslatorAdapter(client, rules="해요체", **kwargs)
+
+
+class TestChunkPlanning:
+
+    def test_chunks_respect_token_budget_and_order(self):
+        cues = parse_srt_cues(_make_subtitle(10).text)
+
+        chunks = plan_chunks(cues, max_chunk_tokens=40)
+
+        assert [cue_id for chunk in chunks for cue_id in chunk.cue_ids] == list(range(1, 11))
+        assert len(chunks) > 1
+        assert [chunk.index for chunk in chunks] == list(range(len(chunks)))
+
+    def test_oversized_cue_gets_its_own_chunk(self):
+        cues = parse_srt_cues(_make_subtitle(3).text)
+
+        chunks = plan_chunks(cues, max_chunk_tokens=1)
+
+        assert [chunk.cue_ids for chunk in chunks] == [[1], [2], [3]]
+
+    def test_parse_rejects_changed_timestamp(self):
+        chunk = plan_chunks(parse_srt_cues(_make_subtitle(1).text), 100)[0]
+
+        with pytest.raises(RuntimeError, match="Timestamp of cue 1"):
+            parse_chunk_response("[[1]] 00:00:09,000 --> 00:00:09,500\n안녕", chunk)
+        assert parse_chunk_response(
+            "[[1]] 00:00:01,000 --> 00:00:01,500\n안녕\n", chunk
+        ) == ["안녕"]
+
+
+class TestChunkedLlmTranslatorAdapter:
+
+    def test_translates_all_chunks_in_order(self, gemini):
+        adapter = _adapter(gemini, max_chunk_tokens=40)
+
+        result = adapter.translate(_make_subtitle(12), "ko")
+
+        cues = parse_srt_cues(result.text)
+        assert [cue["number"] for cue in cues] == [str(i) for i in range(1, 13)]
+        assert cues[11]["text"] == "[ko] line number 12"
+        assert cues[11]["timestamp"] == "00:00:12,000 --> 00:00:12,500"
+        assert len(gemini.requests) > 1
+        assert gemini.requests[0][0] == "/v1beta/models/gemini-test:generateContent"
+        assert gemini.api_keys == {"test-key"}
+        assert adapter.engine_version.startswith("gemini/gemini-test+rules-")
+
+    def test_engine_version_changes_with_rules(self):
+        client = GeminiRestClient("test-key", model="gemini-test")
+
+        plain = ChunkedLlmTranslatorAdapter(client)
+        polite = ChunkedLlmTranslatorAdapter(client, rules="해요체")
+        casual = ChunkedLlmTranslatorAdapter(client, rules="반말")
+
+        # 규칙이 바뀌면 번역 메모리 캐시 키도 바뀜
+        assert plain.engine_version == "gemini/gemini-test"
+        assert polite.engine_version != casual.engine_version
+        assert polite.engine_version == ChunkedLlmTranslatorAdapter(
+            client, rules="해요체\n"
+        ).engine_version
+
+    def test_concurrency_is_limited(self):
+        server = MockGemini(delay=0.1)
+        try:
+            adapter = _adapter(server, max_chunk_tokens=1, max_concurrency=3)
+            adapter.translate(_make_subtitle(9), "ko")
+        finally:
+            server.close()
+
+        assert len(server.requests) == 9
+        assert 1 < server.max_in_flight <= 3
+
+    def test_only_failed_chunks_are_retried(self, gemini):
+        gemini.drop_once = {2}
+        gemini.fail_once = {5}
+        adapter = _adapter(gemini, max_chunk_tokens=1)
+
+        result = adapter.translate(_make_subtitle(6), "ko")
+
+        assert "[ko] line number 2" in result.text
+        requested = [ids for _, ids in gemini.requests]
+        assert sorted(requested) == [[1], [2], [2], [3], [4], [5], [5], [6]]
+
+    def test_gives_up_after_max_attempts(self, gemini):
+        gemini.drop_once = {1}
+        adapter = _adapter(gemini, max_attempts=1)
+
+        with pytest.raises(RuntimeError, match="missing \\[1\\]"):
+            adapter.translate(_make_subtitle(2), "ko")
+
+    def test_stream_yields_cues_in_order(self, gemini):
+        adapter = _adapter(gemini, max_chunk_tokens=1, max_concurrency=4)
+
+        cues = list(adapter.translate_stream(_make_subtitle(8), "ko"))
+
+        assert [cue.number for cue in cues] == [str(i) for i in range(1, 9)]
+
+    def test_unsupported_target_language(self, gemini):
+        adapter = _adapter(gemini)
+
+        with pytest.raises(ValueError, match="not supported"):
+            adapter.translate(_make_subtitle(1), "ja")
+        assert gemini.requests == []
+
+
+class TestGeminiRestClient:
+
+    def test_list_models_filters_generate_content(self, gemini):
+        client = GeminiRestClient("test-key", base_url=gemini.url)
+
+        assert client.list_models() == ["gemini-test"]
+
+    def test_empty_api_key_is_rejected(self):
+        with pytest.raises(ValueError, match="api_key"):
+            GeminiRestClient("")
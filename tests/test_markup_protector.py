@@ -0,0 +1,52 @@
+"""Unit Tests for subtitle markup protection."""
+from src.infrastructure.translators.markup_protector import (
+    protect_line,
+    protect_text,
+    restore_text,
+)
+
+
+class TestProtectLine:
+    """Splitting markup away from translatable text."""
+
+    def test_leading_and_trailing_markup_are_removed(self):
+        line = protect_line("{\\an8}<i>JOHN: Where are you?</i>")
+
+        assert line.prefix == "{\\an8}<i>JOHN: "
+        assert line.text == "Where are you?"
+        assert line.suffix == "</i>"
+        assert line.restore("어디 있어?") == "{\\an8}<i>JOHN: 어디 있어?</i>"
+
+    def test_inline_markup_and_urls_become_placeholders(self):
+        line = protect_line("Go to https://example.com/a <b>now</b>!")
+
+        assert line.text == "Go to ⟦0⟧ ⟦1⟧now⟦2⟧!"
+        assert line.spans == ("https://example.com/a", "<b>", "</b>")
+        assert line.restore("⟦0⟧ 로 ⟦1⟧지금⟦2⟧ 가!") == "https://example.com/a 로 <b>지금</b> 가!"
+
+    def test_music_notes_are_kept_outside_the_model_input(self):
+        line = protect_line("♪ La la la ♪")
+
+        assert (line.prefix, line.text, line.suffix) == ("♪ ", "La la la", " ♪")
+
+    def test_markup_only_lines_need_no_translation(self):
+        for text in ["♪♪", "<i>♪</i>", "https://example.com", "1984", ""]:
+            line = protect_line(text)
+            assert line.needs_translation is False
+            assert line.restore(line.text) == text
+
+    def test_dropped_placeholders_are_appended_and_duplicates_removed(self):
+        line = protect_line("I <b>really</b> mean it")
+
+        assert line.restore("정말 ⟦ 0 ⟧진심이야 ⟦0⟧") == "정말 <b>진심이야 </b>"
+
+
+class TestProtectText:
+    """Multi-line cues."""
+
+    def test_only_translatable_lines_consume_translations(self):
+        lines = protect_text("♪♪\n- MARY: Hello <i>there</i>")
+
+        assert [line.text for line in lines if line.needs_translation] == ["Hello ⟦0⟧there"]
+        restored = restore_text(lines, iter(["안녕 ⟦0⟧거기"]))
+        assert restored == "♪♪\n- MARY: 안녕 <i>거기</i>"
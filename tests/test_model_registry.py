@@ -0,0 +1,71 @@
+"""Unit Tests for the translation model variant registry."""
+import pytest
+
+from src.infrastructure.translators.model_registry import (
+    FASTEST_VARIANT,
+    ModelRegistry,
+    ModelVariant,
+)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = ModelRegistry(tmp_path / "model_registry.json")
+    registry.register(ModelVariant("full", "en", "ko"))
+    registry.register(ModelVariant("int8", "en", "ko", compute_type="int8"))
+    registry.register(ModelVariant("distilled", "en", "ko", model_path="/models/en_ko_small"))
+    return registry
+
+
+class TestModelRegistry:
+    """Registering, selecting and measuring model variants."""
+
+    def test_select_by_name(self, registry):
+        variant = registry.select("en", "ko", "int8")
+
+        assert variant.compute_type == "int8"
+        assert registry.select("en", "ja", "int8") is None
+        with pytest.raises(ValueError, match="'tiny' is not registered"):
+            registry.select("en", "ko", "tiny")
+
+    def test_fastest_uses_measured_throughput(self, registry):
+        # Without measurements the last registered (lightest) variant is used
+        assert registry.select("en", "ko", FASTEST_VARIANT).name == "distilled"
+
+        registry.record_throughput(registry.select("en", "ko", "distilled"), 20.0)
+        registry.record_throughput(registry.select("en", "ko", "full"), 10.0)
+        registry.record_throughput(registry.select("en", "ko", "int8"), 40.0)
+
+        assert registry.select("en", "ko", FASTEST_VARIANT).name == "int8"
+
+    def test_fastest_tries_unmeasured_variants_first(self, registry):
+        for name, cues_per_second in (("full", 10.0), ("int8", 40.0), ("distilled", 20.0)):
+            registry.record_throughput(registry.select("en", "ko", name), cues_per_second)
+        registry.register(ModelVariant("tiny", "en", "ko", model_path="/models/en_ko_tiny"))
+
+        # 나중에 등록된 변형은 측정되기 전까지 먼저 시도
+        assert registry.select("en", "ko", FASTEST_VARIANT).name == "tiny"
+        registry.record_throughput(registry.select("en", "ko", "tiny"), 30.0)
+        assert registry.select("en", "ko", FASTEST_VARIANT).name == "int8"
+
+    def test_throughput_is_smoothed_and_persisted(self, registry, tmp_path):
+        int8 = registry.select("en", "ko", "int8")
+        registry.record_throughput(int8, 40.0)
+        registry.record_throughput(int8, 50.0)
+
+        reloaded = ModelRegistry(tmp_path / "model_registry.json").select("en", "ko", "int8")
+        assert reloaded.cues_per_second == pytest.approx(43.0)
+        assert reloaded.runs == 2
+
+    def test_re_registering_keeps_measurements(self, registry):
+        registry.record_throughput(registry.select("en", "ko", "int8"), 40.0)
+        registry.register(ModelVariant("int8", "en", "ko", compute_type="int8_float32"))
+
+        variant = registry.select("en", "ko", "int8")
+        assert variant.compute_type == "int8_float32"
+        assert variant.cues_per_second == 40.0
+        assert [v.name for v in registry.variants("en", "ko")] == ["full", "int8", "distilled"]
+
+    def test_reserved_name(self, registry):
+        with pytest.raises(ValueError, match="Invalid model variant name"):
+            registry.register(ModelVariant(FASTEST_VARIANT, "en", "ko"))
@@ -0,0 +1,154 @@
+"""Unit Tests for the coalescing ProgressBus."""
+import io
+import threading
+
+import pytest
+
+from src.application.ports.progress_sink import ProgressEvent, ProgressSink
+from src.infrastructure.progress.progress_bus import (
+    ConsoleProgressSink,
+    ProgressBus,
+    ProgressMetricsSink,
+    format_progress_event,
+)
+
+
+class RecordingSink(ProgressSink):
+    """Records every delivered event; optionally blocks until released."""
+
+    def __init__(self, gate=None):
+        self.events = []
+        self.gate = gate
+        self.entered = threading.Event()
+        self.closed = False
+
+    def handle(self, event):
+        self.entered.set()
+        if self.gate is not None:
+            assert self.gate.wait(timeout=5)
+        self.events.append(event)
+
+    def close(self):
+        self.closed = True
+
+
+class FailingSink(ProgressSink):
+
+    def handle(self, event):
+        raise RuntimeError("sink broke")
+
+
+class TestProgressBus:
+
+    def test_coalesces_to_max_frequency_and_keeps_last(self):
+        sink = RecordingSink()
+        with ProgressBus(max_hz=5) as bus:
+            bus.subscribe(sink)
+            for done in range(1, 1001):
+                bus.publish("translate", done=done, total=1000)
+
+        assert bus.published == 1000
+        assert len(sink.events) < 10
+        assert sink.events[-1].done == 1000
+        assert sink.events[-1].percent == 100.0
+        assert sink.closed
+
+    def test_slow_sink_does_not_block_publisher(self):
+        gate = threading.Event()
+        sink = RecordingSink(gate)
+        bus = ProgressBus(max_hz=1000)
+        bus.subscribe(sink)
+
+        bus.publish("translate", done=1, total=3)
+        assert sink.entered.wait(timeout=5)
+        # 수신자가 멈춰 있어도 publish는 바로 반환하고 최신 상태만 남김
+        bus.publish("translate", done=2, total=3)
+        bus.publish("translate", done=3, total=3)
+        gate.set()
+        bus.close()
+
+        assert [event.done for event in sink.events] == [1, 3]
+
+    def test_stages_are_kept_separately(self):
+        sink = RecordingSink()
+        with ProgressBus(max_hz=1) as bus:
+            bus.subscribe(sink)
+            bus.publish("download", percent=100.0, message="done")
+            bus.publish("translate", done=5, total=10)
+            bus.publish("translate", done=6, total=10)
+
+        latest = {event.stage: event for event in sink.events}
+        assert latest["download"].message == "done"
+        assert latest["translate"].done == 6
+
+    def test_rate_and_eta(self):
+        sink = RecordingSink()
+        with ProgressBus() as bus:
+            bus.subscribe(sink)
+            bus.publish("translate", done=0, total=100)
+            threading.Event().wait(0.05)
+            bus.publish("translate", done=50, total=100)
+
+        event = sink.events[-1]
+        assert event.rate is not None and event.rate > 0
+        assert event.eta_seconds == pytest.approx(50 / event.rate)
+
+    def test_callback_adapter_and_failing_sink(self):
+        metrics = ProgressMetricsSink()
+        with ProgressBus() as bus:
+            bus.subscribe(FailingSink())
+            bus.subscribe(metrics)
+            bus.callback("engine")("모델 로딩", 20.0)
+
+        event = metrics.latest("engine")
+        assert (event.message, event.percent) == ("모델 로딩", 20.0)
+        assert metrics.counts() == {"engine": 1}
+        assert bus.sink_errors == 1
+
+    def test_publish_after_close_is_ignored(self):
+        bus = ProgressBus()
+        bus.close()
+        bus.publish("translate", done=1)
+
+        assert bus.published == 0
+
+    def test_invalid_max_hz(self):
+        with pytest.raises(ValueError, match="max_hz"):
+            ProgressBus(max_hz=0)
+
+
+class TestProgressMetricsSink:
+
+    def test_summary_per_stage(self):
+        metrics = ProgressMetricsSink()
+        metrics.handle(ProgressEvent(stage="engine", message="모델 로딩", percent=20.0))
+        metrics.handle(ProgressEvent(
+            stage="translate", done=100, total=300, rate=50.0, elapsed_seconds=2.0,
+        ))
+        metrics.handle(ProgressEvent(
+            stage="translate", done=300, total=300, rate=37.5, elapsed_seconds=8.0,
+        ))
+
+        assert metrics.summary() == [
+            "engine: 20.0% 0.0s (갱신 1회)",
+            "translate: 300/300 8.0s 37.5/s (갱신 2회)",
+        ]
+
+
+class TestConsoleProgressSink:
+
+    def test_format(self):
+        event = ProgressEvent(
+            stage="translate", message="배치 3", done=120, total=300,
+            percent=40.0, rate=35.25, eta_seconds=5.1,
+        )
+
+        assert format_progress_event(event) == (
+            "[translate]  40.0% 120/300 35.2/s 남은 시간 5s 배치 3"
+        )
+
+    def test_writes_line(self):
+        stream = io.StringIO()
+        ConsoleProgressSink(stream).handle(ProgressEvent(stage="embed", percent=100.0))
+
+        assert stream.getvalue() == "[embed] 100.0%\n"
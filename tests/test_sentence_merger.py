@@ -0,0 +1,98 @@
+"""Unit Tests for sentence-aware cue merging and redistribution."""
+from src.infrastructure.translators.sentence_merger import (
+    merge_cues_into_sentences,
+    redistribute_translation,
+    split_sentences,
+)
+from src.infrastructure.translators.srt_cues import parse_srt_timestamp
+
+
+def _cue(number, start, end, text):
+    return {
+        "number": str(number),
+        "timestamp": f"00:00:{start:06.3f} --> 00:00:{end:06.3f}".replace(".", ","),
+        "text": text,
+    }
+
+
+def test_parse_srt_timestamp():
+    assert parse_srt_timestamp("01:02:03,004 --> 01:02:05,500") == (3723004, 3725500)
+    assert parse_srt_timestamp("00:00:01.000 --> 00:00:02.000") == (1000, 2000)
+    assert parse_srt_timestamp("not a timestamp") is None
+
+
+def test_fragments_merged_until_sentence_end():
+    cues = [
+        _cue(1, 0, 1, "so what we are"),
+        _cue(2, 1, 2.5, "going to do today"),
+        _cue(3, 2.5, 3, "is cook."),
+        _cue(4, 3, 4, "Next sentence."),
+    ]
+
+    groups = merge_cues_into_sentences(cues)
+
+    assert [group.cue_indices for group in groups] == [(0, 1, 2), (3,)]
+    assert groups[0].text == "so what we are going to do today is cook."
+    assert groups[0].durations == (1000, 1500, 500)
+
+
+def test_gap_sound_tags_and_limits_break_sentences():
+    cues = [
+        _cue(1, 0, 1, "and then"),
+        _cue(2, 5, 6, "much later"),  # gap > 1s
+        _cue(3, 6, 7, "[Music]"),
+        _cue(4, 7, 8, "one"),
+        _cue(5, 8, 9, "two"),
+        _cue(6, 9, 10, "three"),
+        _cue(7, 10, 11, "four"),
+    ]
+
+    groups = merge_cues_into_sentences(cues, max_cues=3)
+
+    assert [group.cue_indices for group in groups] == [(0,), (1,), (2,), (3, 4, 5), (6,)]
+
+
+def test_single_cue_group_keeps_line_breaks():
+    cues = [_cue(1, 0, 1, "First line\nsecond line.")]
+
+    groups = merge_cues_into_sentences(cues)
+
+    assert groups[0].text == "First line\nsecond line."
+
+
+def test_redistribute_by_duration():
+    assert redistribute_translation("a bb ccc dddd eeeee ffffff", [3000, 1000]) == [
+        "a bb ccc dddd eeeee",
+        "ffffff",
+    ]
+    assert redistribute_translation("오늘은 날씨가 정말 좋네요", [1000, 1000, 1000]) == [
+        "오늘은",
+        "날씨가 정말",
+        "좋네요",
+    ]
+
+
+def test_redistribute_without_spaces_splits_characters():
+    pieces = redistribute_translation("今日はいい天気ですね", [1000, 2000])
+
+    assert "".join(pieces) == "今日はいい天気ですね"
+    assert all(pieces)
+
+
+def test_redistribute_never_returns_empty_cues():
+    assert redistribute_translation("네", [1000, 2000]) == ["네", "…"]
+    assert redistribute_translation("one two", [0, 0]) == ["one", "two"]
+
+
+def test_split_sentences_within_a_line():
+    assert split_sentences("Hello there. How are you? I'm fine!") == [
+        "Hello there.", "How are you?", "I'm fine!",
+    ]
+    assert split_sentences('He said "Go." Then he left.') == ['He said "Go."', "Then he left."]
+
+
+def test_split_sentences_keeps_abbreviations_and_decimals():
+    assert split_sentences("Mr. Smith paid 3.5 dollars. e.g. this") == [
+        "Mr. Smith paid 3.5 dollars. e.g. this"
+    ]
+    assert split_sentences("Dr. Who is here. Run!") == ["Dr. Who is here.", "Run!"]
@@ -0,0 +1,86 @@
+"""Unit Tests for cue streaming (translate_stream and SrtStreamWriter)."""
+import pytest
+
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.srt_cues import SrtStreamWriter
+from src.infrastructure.translators.translation_memory import (
+    CachingTranslatorAdapter,
+    SqliteTranslationMemory,
+)
+from tests.fakes.translators import RecordingTranslator
+
+
+def _make_subtitle(*texts):
+    blocks = [
+        f"{i}\n00:00:0{i},000 --> 00:00:0{i},500\n{text}"
+        for i, text in enumerate(texts, start=1)
+    ]
+    return Subtitle(
+        video_id=VideoId("test1234567"),
+        language="en",
+        format="srt",
+        text="\n\n".join(blocks) + "\n",
+    )
+
+
+@pytest.fixture
+def memory(tmp_path):
+    memory = SqliteTranslationMemory(tmp_path / "memory.sqlite3")
+    yield memory
+    memory.close()
+
+
+class TestStreaming:
+    """translate_stream on the port default and the caching wrapper."""
+
+    def test_port_default_splits_translate_result(self):
+        cues = list(RecordingTranslator().translate_stream(_make_subtitle("One", "Two"), "ko"))
+
+        assert [(cue.number, cue.text) for cue in cues] == [("1", "[ko] One"), ("2", "[ko] Two")]
+
+    def test_hits_are_yielded_before_inner_translator_runs(self, memory):
+        inner = RecordingTranslator()
+        adapter = CachingTranslatorAdapter(inner, memory)
+        adapter.translate(_make_subtitle("Intro"), "ko")
+
+        stream = adapter.translate_stream(_make_subtitle("Intro", "Hello"), "ko")
+        first = next(stream)
+
+        assert first.text == "[ko] Intro"
+        assert inner.requested_texts == [["Intro"]]
+        assert [cue.text for cue in stream] == ["[ko] Hello"]
+        assert inner.requested_texts == [["Intro"], ["Hello"]]
+        assert memory.get_many("en", "ko", "fake-1", ["Hello"]) == {"Hello": "[ko] Hello"}
+
+
+class TestSrtStreamWriter:
+    """Incremental .partial.srt writer."""
+
+    def test_writes_partial_file_then_commits(self, tmp_path):
+        output_path = tmp_path / "out" / "abc.srt"
+        with SrtStreamWriter(output_path) as writer:
+            writer.write(SubtitleCue("1", "00:00:01,000 --> 00:00:02,000", "하나"))
+            partial = tmp_path / "out" / "abc.partial.srt"
+            assert partial.read_text(encoding="utf-8") == (
+                "1\n00:00:01,000 --> 00:00:02,000\n하나\n"
+            )
+            writer.write(SubtitleCue("2", "00:00:02,000 --> 00:00:03,000", "둘"))
+
+        assert not partial.exists()
+        assert output_path.read_text(encoding="utf-8") == (
+            "1\n00:00:01,000 --> 00:00:02,000\n하나\n\n"
+            "2\n00:00:02,000 --> 00:00:03,000\n둘\n"
+        )
+        assert writer.count == 2
+
+    def test_failure_keeps_partial_file(self, tmp_path):
+        output_path = tmp_path / "abc.srt"
+        with pytest.raises(RuntimeError):
+            with SrtStreamWriter(output_path) as writer:
+                writer.write(SubtitleCue("1", "00:00:01,000 --> 00:00:02,000", "하나"))
+                raise RuntimeError("boom")
+
+        assert not output_path.exists()
+        assert (tmp_path / "abc.partial.srt").exists()
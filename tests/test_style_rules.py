@@ -0,0 +1,162 @@
+"""Unit Tests for the rules.md style rule post-processor."""
+from pathlib import Path
+
+import pytest
+
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, parse_srt
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.style_rules import (
+    StyleRule,
+    StyleRuleEngine,
+    StyleRuleTranslatorAdapter,
+    format_rewrite_report,
+    load_style_rules,
+)
+from tests.fakes.translators import RecordingTranslator
+
+RULES_PATH = Path(__file__).parent.parent / "rules.md"
+
+
+class TestLoadStyleRules:
+
+    def test_loads_project_rules_table(self):
+        rules = load_style_rules(RULES_PATH)
+
+        assert StyleRule("것이다", "거예요") in rules
+        assert StyleRule("하는 바이다", "해요") in rules
+        assert StyleRule(
+            "에 있어서", "에서", clause_end=False,
+            preceding=("교육", "경우", "측면", "과정", "관계"),
+        ) in rules
+
+    def test_condition_column(self, tmp_path):
+        path = tmp_path / "rules.md"
+        path.write_text(
+            "### 금칙어 대체 가이드\n"
+            "| 금칙어 | 대체 표현 | 적용 조건 |\n"
+            "|---|---|---|\n"
+            "| ~것이다 | ~거예요 | |\n"
+            "| ~되어지다 | ~되다 | 어디서나 |\n",
+            encoding="utf-8",
+        )
+
+        assert load_style_rules(path) == [
+            StyleRule("것이다", "거예요"),
+            StyleRule("되어지다", "되다", clause_end=False),
+        ]
+
+    def test_unknown_condition_raises(self, tmp_path):
+        path = tmp_path / "rules.md"
+        path.write_text(
+            "### 금칙어 대체 가이드\n| a | b | c |\n|---|---|---|\n| 것이다 | 거예요 | 가끔 |\n",
+            encoding="utf-8",
+        )
+
+        with pytest.raises(ValueError, match="가끔"):
+            load_style_rules(path)
+
+    def test_missing_section_raises(self, tmp_path):
+        path = tmp_path / "rules.md"
+        path.write_text("# 번역 기준\n\n| a | b |\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="not found"):
+            load_style_rules(path)
+
+
+class TestStyleRuleEngine:
+
+    def test_rewrites_every_occurrence_and_reports_positions(self):
+        engine = StyleRuleEngine(load_style_rules(RULES_PATH))
+
+        text, rewrites = engine.rewrite("교육에 있어서 중요한 것이다.\n감사하는 바이다", "7")
+
+        assert text == "교육에서 중요한 거예요.\n감사해요"
+        assert [(r.original, r.replacement) for r in rewrites] == [
+            ("에 있어서", "에서"), ("것이다", "거예요"), ("하는 바이다", "해요"),
+        ]
+        assert rewrites[0].start == 2
+        assert format_rewrite_report(rewrites)[1] == "#7: 것이다 -> 거예요"
+
+    @pytest.mark.parametrize("text", [
+        "지금 집에 있어서 못 가요",
+        "책상 위에 있어서 먹었어요",
+        "이것이다음 단계예요",
+        "그건 할 것이다가 말았어요",
+    ])
+    def test_leaves_other_meanings_unchanged(self, text):
+        engine = StyleRuleEngine(load_style_rules(RULES_PATH))
+
+        assert engine.rewrite(text) == (text, [])
+
+    def test_clause_end_before_punctuation_and_quotes(self):
+        engine = StyleRuleEngine(load_style_rules(RULES_PATH))
+
+        text, _ = engine.rewrite('"좋은 것이다." 그리고 중요한 것이다, 아마도\n새 것이다')
+
+        assert text == '"좋은 거예요." 그리고 중요한 거예요, 아마도\n새 거예요'
+
+    def test_longest_pattern_wins_at_same_position(self):
+        engine = StyleRuleEngine([StyleRule("되어", "돼"), StyleRule("되어지다", "되다")])
+
+        assert engine.rewrite("만들어지고 되어지다")[0] == "만들어지고 되다"
+
+    def test_apply_keeps_unchanged_cues(self):
+        engine = StyleRuleEngine([StyleRule("것이다", "거예요")])
+        cues = [
+            SubtitleCue("1", "00:00:00,000 --> 00:00:01,000", "좋은 것이다"),
+            SubtitleCue("2", "00:00:01,000 --> 00:00:02,000", "안녕하세요"),
+        ]
+
+        rewritten, rewrites = engine.apply(cues)
+
+        assert rewritten[0].text == "좋은 거예요"
+        assert rewritten[1] is cues[1]
+        assert len(rewrites) == 1
+
+    def test_large_file_single_pass(self):
+        engine = StyleRuleEngine(load_style_rules(RULES_PATH))
+        cues = [
+            SubtitleCue(str(i), "00:00:00,000 --> 00:00:01,000", f"{i}번째 것이다")
+            for i in range(10_000)
+        ]
+
+        rewritten, rewrites = engine.apply(cues)
+
+        assert len(rewrites) == 10_000
+        assert rewritten[-1].text == "9999번째 거예요"
+
+    def test_empty_rules_are_noop(self):
+        assert StyleRuleEngine([]).rewrite("것이다") == ("것이다", [])
+
+
+class TestStyleRuleTranslatorAdapter:
+
+    def _subtitle(self, *texts):
+        blocks = [
+            f"{i}\n00:00:0{i},000 --> 00:00:0{i},500\n{text}"
+            for i, text in enumerate(texts, start=1)
+        ]
+        return Subtitle(
+            video_id=VideoId("test1234567"),
+            language="en",
+            format="srt",
+            text="\n\n".join(blocks) + "\n",
+        )
+
+    def test_post_processes_target_language_only(self):
+        engine = StyleRuleEngine([StyleRule("[ko]", "[한국어]", clause_end=False)])
+        adapter = StyleRuleTranslatorAdapter(RecordingTranslator(), engine)
+
+        korean = adapter.translate(self._subtitle("a", "b"), "ko")
+        assert [cue.text for cue in parse_srt(korean.text)] == ["[한국어] a", "[한국어] b"]
+        assert [r.cue_number for r in adapter.rewrites] == ["1", "2"]
+
+        japanese = adapter.translate(self._subtitle("a"), "ja")
+        assert parse_srt(japanese.text)[0].text == "[ja] a"
+        assert adapter.rewrites == []
+
+    def test_engine_version_passes_through(self):
+        adapter = StyleRuleTranslatorAdapter(RecordingTranslator(), StyleRuleEngine([]))
+
+        assert adapter.engine_version == "fake-1"
@@ -0,0 +1,66 @@
+"""Unit Tests for CTranslate2 threading auto-tune helpers."""
+import pytest
+
+from src.infrastructure.translators.thread_tuning import (
+    AutotuneCache,
+    ThreadingConfig,
+    autotune,
+    candidate_configs,
+    default_threads_per_worker,
+)
+
+
+class TestCandidateConfigs:
+    """Thread splits that never oversubscribe the host."""
+
+    def test_splits_fit_the_core_count(self):
+        configs = candidate_configs(8, compute_types=("default",))
+
+        assert [(c.inter_threads, c.intra_threads) for c in configs] == [
+            (1, 8), (2, 4), (4, 2), (8, 1),
+        ]
+
+    def test_single_core_host(self):
+        assert candidate_configs(1, compute_types=("int8",)) == [ThreadingConfig(1, 1, "int8")]
+
+
+class TestDefaultThreadsPerWorker:
+    """Shard workers split the cores instead of each using all of them."""
+
+    def test_cores_are_divided_among_workers(self):
+        assert default_threads_per_worker(4, cpu_count=16) == 4
+        assert default_threads_per_worker(3, cpu_count=8) == 2
+        assert default_threads_per_worker(1, cpu_count=8) == 8
+
+    def test_at_least_one_thread(self):
+        assert default_threads_per_worker(8, cpu_count=2) == 1
+
+
+class TestAutotune:
+    """Benchmarking and the on-disk cache."""
+
+    def test_fastest_config_is_cached(self, tmp_path):
+        cache = AutotuneCache(tmp_path / "autotune.json")
+        candidates = [ThreadingConfig(1, 4, "default"), ThreadingConfig(2, 2, "int8")]
+        rates = {candidates[0]: 10.0, candidates[1]: 25.0}
+        benchmarked = []
+
+        def benchmark(config):
+            benchmarked.append(config)
+            return rates[config]
+
+        assert autotune(benchmark, candidates, cache, "host|en-ko") == candidates[1]
+        assert autotune(benchmark, candidates, cache, "host|en-ko") == candidates[1]
+        # The second call is served from disk
+        assert benchmarked == candidates
+        assert AutotuneCache(tmp_path / "autotune.json").get("host|en-ko") == candidates[1]
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        path = tmp_path / "autotune.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert AutotuneCache(path).get("host|en-ko") is None
+
+    def test_no_candidates(self, tmp_path):
+        with pytest.raises(ValueError, match="At least one threading candidate"):
+            autotune(lambda config: 1.0, [], AutotuneCache(tmp_path / "a.json"), "key")
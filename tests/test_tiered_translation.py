@@ -0,0 +1,122 @@
+"""Unit Tests for two-tier (draft + background refinement) translation."""
+import threading
+
+import pytest
+
+from src.application.ports.subtitle_translator import SubtitleTranslatorPort
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue, parse_srt
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.srt_cues import parse_srt_cues
+from src.infrastructure.translators.tiered_translation import (
+    DRAFT_TIER,
+    REFINED_TIER,
+    TieredSubtitleFile,
+    TieredTranslator,
+    read_provenance,
+)
+from tests.fakes.translators import RecordingTranslator
+
+
+class SlowRefiner(SubtitleTranslatorPort):
+    """Refinement fake: waits for the gate before streaming, optionally fails after N cues."""
+
+    engine_version = "refiner-1"
+
+    def __init__(self, gate=None, fail_after=None):
+        self.gate = gate
+        self.fail_after = fail_after
+
+    def translate(self, subtitle, target_language, progress_callback=None):
+        raise NotImplementedError
+
+    def translate_stream(self, subtitle, target_language, progress_callback=None):
+        if self.gate is not None:
+            assert self.gate.wait(timeout=5)
+        for index, cue in enumerate(parse_srt_cues(subtitle.text)):
+            if self.fail_after is not None and index >= self.fail_after:
+                raise RuntimeError("refinement engine crashed")
+            yield SubtitleCue(cue["number"], cue["timestamp"], f"[refined] {cue['text']}")
+
+    def list_supported_languages(self):
+        return ["en", "ko"]
+
+    def is_language_pair_supported(self, source_language, target_language):
+        return target_language == "ko"
+
+
+def _subtitle(count):
+    blocks = [
+        f"{i}\n00:00:{i:02d},000 --> 00:00:{i:02d},500\nline {i}"
+        for i in range(1, count + 1)
+    ]
+    return Subtitle(
+        video_id=VideoId("test1234567"),
+        language="en",
+        format="srt",
+        text="\n\n".join(blocks) + "\n",
+    )
+
+
+class TestTieredTranslator:
+
+    def test_draft_is_written_before_refinement(self, tmp_path):
+        gate = threading.Event()
+        output_path = tmp_path / "video.srt"
+        tiered = TieredTranslator(RecordingTranslator(), SlowRefiner(gate), swap_every=2)
+
+        job = tiered.translate(_subtitle(5), "ko", output_path)
+
+        # 초안은 정제가 시작되기 전에 이미 파일에 있음
+        assert not job.done
+        assert [cue.text for cue in parse_srt(output_path.read_text(encoding="utf-8"))] == [
+            f"[ko] line {i}" for i in range(1, 6)
+        ]
+        assert read_provenance(output_path) == [DRAFT_TIER] * 5
+
+        gate.set()
+        assert job.wait(timeout=5)
+        assert job.error is None
+        assert job.refined_cues == 5
+        assert [cue.text for cue in parse_srt(output_path.read_text(encoding="utf-8"))] == [
+            f"[refined] line {i}" for i in range(1, 6)
+        ]
+        assert read_provenance(output_path) == [REFINED_TIER] * 5
+        assert [cue.provenance for cue in job.file.cues] == [REFINED_TIER] * 5
+
+    def test_failed_refinement_keeps_remaining_draft(self, tmp_path):
+        output_path = tmp_path / "video.srt"
+        tiered = TieredTranslator(RecordingTranslator(), SlowRefiner(fail_after=3), swap_every=2)
+
+        job = tiered.translate(_subtitle(5), "ko", output_path)
+
+        assert job.wait(timeout=5)
+        assert isinstance(job.error, RuntimeError)
+        assert job.refined_cues == 3
+        assert read_provenance(output_path) == [REFINED_TIER] * 3 + [DRAFT_TIER] * 2
+        texts = [cue.text for cue in parse_srt(output_path.read_text(encoding="utf-8"))]
+        assert texts[2] == "[refined] line 3"
+        assert texts[3] == "[ko] line 4"
+
+    def test_unsupported_refinement_pair_fails_before_draft(self, tmp_path):
+        output_path = tmp_path / "video.srt"
+        tiered = TieredTranslator(RecordingTranslator(), SlowRefiner())
+
+        with pytest.raises(ValueError, match="refiner-1"):
+            tiered.translate(_subtitle(1), "ja", output_path)
+        assert not output_path.exists()
+
+    def test_invalid_swap_every(self):
+        with pytest.raises(ValueError, match="swap_every"):
+            TieredTranslator(RecordingTranslator(), SlowRefiner(), swap_every=0)
+
+
+class TestTieredSubtitleFile:
+
+    def test_replace_out_of_range(self, tmp_path):
+        file = TieredSubtitleFile(tmp_path / "video.srt")
+        file.write([SubtitleCue("1", "00:00:00,000 --> 00:00:01,000", "a", DRAFT_TIER)])
+
+        with pytest.raises(IndexError):
+            file.replace({1: SubtitleCue("2", "00:00:01,000 --> 00:00:02,000", "b")})
+        assert not list(tmp_path.glob("*.tmp"))
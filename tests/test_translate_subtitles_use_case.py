@@ -217,3 +217,23 @@ class TestTranslateSubtitlesUseCaseIntegration:
 
         assert result.language == "ko"
         assert fake_translator.translate_args[2] is None
+
+
+class TestTranslateSubtitlesUseCaseMany:
+    """execute_many / port default translate_many."""
+
+    def test_execute_many_returns_one_subtitle_per_language(self, sample_subtitle):
+        translator = FakeSubtitleTranslator()
+        use_case = TranslateSubtitlesUseCase(translator)
+
+        results = use_case.execute_many(sample_subtitle, ["ko", "ja", "ko"])
+
+        assert list(results) == ["ko", "ja"]
+        assert results["ja"].language == "ja"
+        assert results["ja"].text.startswith("[Translated to ja]")
+
+    def test_execute_many_requires_targets(self, sample_subtitle):
+        use_case = TranslateSubtitlesUseCase(FakeSubtitleTranslator())
+
+        with pytest.raises(ValueError, match="At least one target language"):
+            use_case.execute_many(sample_subtitle, [])
@@ -0,0 +1,169 @@
+"""Unit Tests for TranslationDaemon, BatchDispatcher and DaemonTranslatorClient."""
+import threading
+
+import pytest
+
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.daemon_client import DaemonTranslatorClient
+from src.infrastructure.translators.srt_cues import parse_srt_cues
+from src.infrastructure.translators.translation_daemon import (
+    BatchDispatcher,
+    TranslationDaemon,
+)
+from src.infrastructure.translators.translation_memory import (
+    CachingTranslatorAdapter,
+    SqliteTranslationMemory,
+)
+from tests.fakes.translators import FakeEngine
+
+
+def _make_subtitle(*texts):
+    blocks = [
+        f"{i}\n00:00:0{i},000 --> 00:00:0{i},500\n{text}"
+        for i, text in enumerate(texts, start=1)
+    ]
+    return Subtitle(
+        video_id=VideoId("test1234567"),
+        language="en",
+        format="srt",
+        text="\n\n".join(blocks) + "\n",
+    )
+
+
+@pytest.fixture
+def daemon():
+    daemon = TranslationDaemon(FakeEngine(), port=0, batch_window_ms=0)
+    daemon.start()
+    yield daemon
+    daemon.shutdown()
+
+
+class TestBatchDispatcher:
+    """Cross-request batching."""
+
+    def test_concurrent_requests_share_one_engine_call(self):
+        gate = threading.Event()
+        engine = FakeEngine(gate=gate)
+        dispatcher = BatchDispatcher(engine, batch_window_ms=0)
+
+        # The first request occupies the engine; the next two queue up behind it.
+        first = dispatcher.submit("en", "ko", ["warm"])
+        assert engine.entered.wait(timeout=5)
+        second = dispatcher.submit("en", "ko", ["a", "b"])
+        third = dispatcher.submit("en", "ko", ["c"])
+        gate.set()
+
+        assert first.result(timeout=5) == ["[ko] warm"]
+        assert second.result(timeout=5) == ["[ko] a", "[ko] b"]
+        assert third.result(timeout=5) == ["[ko] c"]
+        assert engine.calls[-1] == ("en", "ko", ["a", "b", "c"])
+        assert dispatcher.engine_calls == 2
+        dispatcher.close()
+
+    def test_pairs_are_batched_separately(self):
+        gate = threading.Event()
+        engine = FakeEngine(gate=gate)
+        dispatcher = BatchDispatcher(engine, batch_window_ms=0)
+
+        dispatcher.submit("en", "ko", ["warm"])
+        assert engine.entered.wait(timeout=5)
+        ko = dispatcher.submit("en", "ko", ["a"])
+        ja = dispatcher.submit("en", "ja", ["b"])
+        gate.set()
+
+        assert ko.result(timeout=5) == ["[ko] a"]
+        assert ja.result(timeout=5) == ["[ja] b"]
+        dispatcher.close()
+
+    def test_engine_error_is_propagated(self):
+        dispatcher = BatchDispatcher(FakeEngine())
+
+        with pytest.raises(ValueError, match="not supported"):
+            dispatcher.translate("en", "xx", ["a"])
+        dispatcher.close()
+
+    def test_engine_queries_run_on_the_dispatcher_thread(self):
+        gate = threading.Event()
+        engine = FakeEngine(gate=gate)
+        dispatcher = BatchDispatcher(engine, batch_window_ms=0)
+
+        # 번역 중에 들어온 조회는 번역이 끝난 뒤 같은 스레드에서 실행
+        pending = dispatcher.submit("en", "ko", ["warm"])
+        assert engine.entered.wait(timeout=5)
+        threads = []
+        query = threading.Thread(target=lambda: threads.append(dispatcher.call(
+            lambda engine: threading.current_thread().name
+        )))
+        query.start()
+        gate.set()
+        query.join(timeout=5)
+
+        assert pending.result(timeout=5) == ["[ko] warm"]
+        assert threads == ["translation-dispatcher"]
+
+        def failing_query(engine):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            dispatcher.call(failing_query)
+        dispatcher.close()
+
+    def test_invalid_max_batch_texts(self):
+        with pytest.raises(ValueError, match="max_batch_texts must be at least 1"):
+            BatchDispatcher(FakeEngine(), max_batch_texts=0)
+
+
+class TestDaemonTranslatorClient:
+    """Client adapter against a running daemon."""
+
+    def test_translate_through_daemon(self, daemon):
+        client = DaemonTranslatorClient(daemon.url, chunk_size=2)
+
+        result = client.translate(_make_subtitle("One", "Two", "Three"), "ko")
+
+        cues = parse_srt_cues(result.text)
+        assert [cue["text"] for cue in cues] == ["[ko] One", "[ko] Two", "[ko] Three"]
+        assert cues[2]["timestamp"] == "00:00:03,000 --> 00:00:03,500"
+        assert result.language == "ko"
+        # 3 cues in chunks of 2 -> two HTTP requests
+        assert [call[2] for call in daemon.engine.calls] == [["One", "Two"], ["Three"]]
+
+    def test_connect_reads_engine_version(self, daemon):
+        client = DaemonTranslatorClient.connect(daemon.url)
+
+        assert client is not None
+        assert client.engine_version == "fake-engine-1"
+        assert client.list_supported_languages() == ["en", "ko"]
+        assert client.is_language_pair_supported("en", "ko") is True
+        assert client.is_language_pair_supported("en", "ja") is False
+
+    def test_pair_version_matches_in_process_engine(self, daemon, tmp_path):
+        client = DaemonTranslatorClient(daemon.url)
+
+        in_process = FakeEngine().engine_version_for("en", "ko")
+        assert client.engine_version_for("en", "ko") == in_process
+        assert client.engine_version_for("en", "ja") == "fake-engine-1/en-ja"
+
+        # 데몬 경로의 번역 메모리도 언어 쌍별 키로 저장
+        memory = SqliteTranslationMemory(tmp_path / "memory.sqlite3")
+        try:
+            CachingTranslatorAdapter(client, memory).translate(_make_subtitle("One"), "ko")
+            assert memory.get_many("en", "ko", "fake-engine-1/en-ko", ["One"]) == {
+                "One": "[ko] One"
+            }
+        finally:
+            memory.close()
+
+    def test_connect_returns_none_without_daemon(self):
+        stopped = TranslationDaemon(FakeEngine(), port=0)
+        url = stopped.url
+        stopped.shutdown()
+
+        assert DaemonTranslatorClient.connect(url) is None
+
+    def test_unsupported_pair_raises_value_error(self, daemon):
+        client = DaemonTranslatorClient(daemon.url)
+
+        with pytest.raises(ValueError, match="not supported"):
+            client.translate(_make_subtitle("One"), "xx")
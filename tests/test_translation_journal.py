@@ -0,0 +1,115 @@
+"""Unit Tests for TranslationJournal and ResumableTranslatorAdapter."""
+import pytest
+
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.subtitle_cue import SubtitleCue
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.translation_journal import (
+    ResumableTranslatorAdapter,
+    TranslationJournal,
+    journal_path_for,
+)
+from tests.fakes.translators import RecordingTranslator
+
+
+def _make_subtitle(*texts):
+    blocks = [
+        f"{i}\n00:00:0{i},000 --> 00:00:0{i},500\n{text}"
+        for i, text in enumerate(texts, start=1)
+    ]
+    return Subtitle(
+        video_id=VideoId("test1234567"),
+        language="en",
+        format="srt",
+        text="\n\n".join(blocks) + "\n",
+    )
+
+
+class FailingTranslator(RecordingTranslator):
+    """Streams cues but dies after a fixed number of them."""
+
+    def __init__(self, fail_after):
+        super().__init__()
+        self.fail_after = fail_after
+
+    def translate_stream(self, subtitle, target_language, progress_callback=None):
+        for i, cue in enumerate(super().translate_stream(subtitle, target_language)):
+            if i == self.fail_after:
+                raise RuntimeError("out of memory")
+            yield cue
+
+
+class TestTranslationJournal:
+    """TranslationJournal unit tests."""
+
+    def test_journal_path_is_next_to_output(self, tmp_path):
+        assert journal_path_for(tmp_path / "abc.srt") == tmp_path / "abc.journal.jsonl"
+
+    def test_load_requires_matching_header(self, tmp_path):
+        path = tmp_path / "abc.journal.jsonl"
+        journal = TranslationJournal(path, "hash1", "en", "ko")
+        journal.start([])
+        journal.append(SubtitleCue("1", "00:00:01,000 --> 00:00:01,500", "하나"))
+        journal.close()
+
+        assert [cue.text for cue in journal.load()] == ["하나"]
+        assert TranslationJournal(path, "hash2", "en", "ko").load() == []
+        assert TranslationJournal(path, "hash1", "en", "ja").load() == []
+
+    def test_truncated_last_line_is_ignored(self, tmp_path):
+        path = tmp_path / "abc.journal.jsonl"
+        journal = TranslationJournal(path, "hash1", "en", "ko")
+        journal.start([SubtitleCue("1", "00:00:01,000 --> 00:00:01,500", "하나")])
+        journal.close()
+        with path.open("a", encoding="utf-8") as f:
+            f.write('{"number": "2", "timest')
+
+        assert [cue.number for cue in journal.load()] == ["1"]
+
+
+class TestResumableTranslatorAdapter:
+    """ResumableTranslatorAdapter unit tests."""
+
+    def test_resumes_after_last_completed_cue(self, tmp_path):
+        journal_path = tmp_path / "abc.journal.jsonl"
+        subtitle = _make_subtitle("One", "Two", "Three", "Four")
+
+        failing = ResumableTranslatorAdapter(FailingTranslator(fail_after=2), journal_path)
+        with pytest.raises(RuntimeError, match="out of memory"):
+            list(failing.translate_stream(subtitle, "ko"))
+        assert journal_path.exists()
+
+        inner = RecordingTranslator()
+        adapter = ResumableTranslatorAdapter(inner, journal_path)
+        result = adapter.translate(subtitle, "ko")
+
+        assert inner.requested_texts == [["Three", "Four"]]
+        assert adapter.resumed_cues == 2
+        assert "4\n00:00:04,000 --> 00:00:04,500\n[ko] Four" in result.text
+        assert result.text.startswith("1\n00:00:01,000 --> 00:00:01,500\n[ko] One")
+        assert not journal_path.exists()
+
+    def test_changed_input_starts_over(self, tmp_path):
+        journal_path = tmp_path / "abc.journal.jsonl"
+        failing = ResumableTranslatorAdapter(FailingTranslator(fail_after=1), journal_path)
+        with pytest.raises(RuntimeError):
+            list(failing.translate_stream(_make_subtitle("One", "Two"), "ko"))
+
+        inner = RecordingTranslator()
+        adapter = ResumableTranslatorAdapter(inner, journal_path)
+        adapter.translate(_make_subtitle("Uno", "Dos"), "ko")
+
+        assert inner.requested_texts == [["Uno", "Dos"]]
+        assert adapter.resumed_cues == 0
+
+    def test_resume_disabled_ignores_journal(self, tmp_path):
+        journal_path = tmp_path / "abc.journal.jsonl"
+        subtitle = _make_subtitle("One", "Two")
+        failing = ResumableTranslatorAdapter(FailingTranslator(fail_after=1), journal_path)
+        with pytest.raises(RuntimeError):
+            list(failing.translate_stream(subtitle, "ko"))
+
+        inner = RecordingTranslator()
+        ResumableTranslatorAdapter(inner, journal_path, resume=False).translate(subtitle, "ko")
+
+        assert inner.requested_texts == [["One", "Two"]]
@@ -0,0 +1,175 @@
+"""Unit Tests for SqliteTranslationMemory and CachingTranslatorAdapter."""
+import pytest
+
+from src.domain.entities.subtitle import Subtitle
+from src.domain.value_objects.video_id import VideoId
+from src.infrastructure.translators.sentence_merger import merge_cues_into_sentences
+from src.infrastructure.translators.srt_cues import parse_srt_cues
+from src.infrastructure.translators.translation_memory import (
+    CachingTranslatorAdapter,
+    SqliteTranslationMemory,
+)
+from tests.fakes.translators import RecordingTranslator
+
+
+def _make_subtitle(*texts):
+    blocks = [
+        f"{i}\n00:00:0{i},000 --> 00:00:0{i},500\n{text}"
+        for i, text in enumerate(texts, start=1)
+    ]
+    return Subtitle(
+        video_id=VideoId("test1234567"),
+        language="en",
+        format="srt",
+        text="\n\n".join(blocks) + "\n",
+    )
+
+
+@pytest.fixture
+def memory(tmp_path):
+    memory = SqliteTranslationMemory(tmp_path / "tm" / "memory.sqlite3")
+    yield memory
+    memory.close()
+
+
+class TestSqliteTranslationMemory:
+    """SqliteTranslationMemory unit tests."""
+
+    def test_put_and_get_uses_normalized_text(self, memory):
+        memory.put_many("en", "ko", "fake-1", {"Thank  you. ": "감사합니다."})
+
+        found = memory.get_many("en", "ko", "fake-1", ["Thank you.", "Unknown"])
+
+        assert found == {"Thank you.": "감사합니다."}
+        assert memory.stats.hits == 1
+        assert memory.stats.misses == 1
+        assert memory.stats.hit_rate == 0.5
+
+    def test_key_includes_languages_and_engine(self, memory):
+        memory.put_many("en", "ko", "fake-1", {"Hello": "안녕하세요"})
+
+        assert memory.get_many("en", "ja", "fake-1", ["Hello"]) == {}
+        assert memory.get_many("en", "ko", "fake-2", ["Hello"]) == {}
+
+    def test_lru_eviction(self, tmp_path):
+        memory = SqliteTranslationMemory(tmp_path / "memory.sqlite3", max_entries=2)
+        memory.put_many("en", "ko", "e", {"a": "A"})
+        memory.put_many("en", "ko", "e", {"b": "B"})
+        memory.get_many("en", "ko", "e", ["a"])  # "a" becomes most recently used
+        memory.put_many("en", "ko", "e", {"c": "C"})
+
+        assert len(memory) == 2
+        assert memory.get_many("en", "ko", "e", ["a", "b", "c"]) == {"a": "A", "c": "C"}
+        memory.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        db_path = tmp_path / "memory.sqlite3"
+        first = SqliteTranslationMemory(db_path)
+        first.put_many("en", "ko", "e", {"[Music]": "[음악]"})
+        first.close()
+
+        second = SqliteTranslationMemory(db_path)
+        assert second.get_many("en", "ko", "e", ["[Music]"]) == {"[Music]": "[음악]"}
+        second.close()
+
+    def test_invalid_max_entries(self, tmp_path):
+        with pytest.raises(ValueError, match="max_entries must be at least 1"):
+            SqliteTranslationMemory(tmp_path / "memory.sqlite3", max_entries=0)
+
+
+class TestCachingTranslatorAdapter:
+    """CachingTranslatorAdapter unit tests."""
+
+    def test_only_misses_reach_inner_translator(self, memory):
+        inner = RecordingTranslator()
+        adapter = CachingTranslatorAdapter(inner, memory)
+
+        adapter.translate(_make_subtitle("Intro", "Hello"), "ko")
+        result = adapter.translate(_make_subtitle("Intro", "New line", "Intro"), "ko")
+
+        assert inner.requested_texts == [["Intro", "Hello"], ["New line"]]
+        cues = parse_srt_cues(result.text)
+        assert [cue["text"] for cue in cues] == ["[ko] Intro", "[ko] New line", "[ko] Intro"]
+        assert [cue["timestamp"] for cue in cues][2] == "00:00:03,000 --> 00:00:03,500"
+        assert result.language == "ko"
+        assert result.source_language == "en"
+
+    def test_full_hit_skips_inner_translator(self, memory):
+        inner = RecordingTranslator()
+        adapter = CachingTranslatorAdapter(inner, memory)
+        adapter.translate(_make_subtitle("[Music]"), "ko")
+
+        progress = []
+        adapter.translate(
+            _make_subtitle("[Music]"),
+            "ko",
+            progress_callback=lambda message, percent: progress.append(percent),
+        )
+
+        assert len(inner.requested_texts) == 1
+        assert progress[-1] == 100.0
+        assert adapter.stats.hits == 1
+
+    def test_engine_version_defaults_to_translator_attribute(self, memory):
+        inner = RecordingTranslator()
+        CachingTranslatorAdapter(inner, memory).translate(_make_subtitle("Hello"), "ko")
+
+        assert memory.get_many("en", "ko", "fake-1", ["Hello"]) == {"Hello": "[ko] Hello"}
+
+    def test_engine_version_for_pair_is_preferred(self, memory):
+        class PerPairTranslator(RecordingTranslator):
+            model = "v1"
+
+            def engine_version_for(self, source_language, target_language):
+                return f"fake-{source_language}-{target_language}-{self.model}"
+
+        inner = PerPairTranslator()
+        adapter = CachingTranslatorAdapter(inner, memory)
+        adapter.translate(_make_subtitle("Hello"), "ko")
+        assert memory.get_many("en", "ko", "fake-en-ko-v1", ["Hello"]) == {"Hello": "[ko] Hello"}
+
+        # 언어 쌍의 모델이 바뀌면 이전 번역을 재사용하지 않음
+        inner.model = "v2"
+        adapter.translate(_make_subtitle("Hello"), "ko")
+        assert len(inner.requested_texts) == 2
+
+    def test_merged_sentences_are_cached_as_whole_groups(self, memory):
+        class MergingTranslator(RecordingTranslator):
+            def plan_sentence_groups(self, cues):
+                return merge_cues_into_sentences(cues)
+
+        inner = MergingTranslator()
+        adapter = CachingTranslatorAdapter(inner, memory)
+
+        first = adapter.translate(_make_subtitle("Hello.", "Wait for", "me.", "Bye."), "ko")
+        assert [cue["text"] for cue in parse_srt_cues(first.text)] == [
+            "[ko] Hello.", "[ko] Wait for", "[ko] me.", "[ko] Bye.",
+        ]
+        # 조각은 묶음 단위로만 저장되어 다른 문맥에서 재사용되지 않음
+        assert memory.get_many("en", "ko", "fake-1", ["me."]) == {}
+
+        inner.requested_texts.clear()
+        adapter.translate(
+            _make_subtitle("New one", "starts here.", "Hello.", "Other", "words.", "me."), "ko"
+        )
+        # 적중 큐로 끊긴 미적중 묶음은 원본에서 연속한 큐끼리만 따로 요청
+        assert inner.requested_texts == [
+            ["New one", "starts here."], ["Other", "words.", "me."],
+        ]
+
+        inner.requested_texts.clear()
+        result = adapter.translate(_make_subtitle("Wait for", "me.", "Bye."), "ko")
+        assert inner.requested_texts == []
+        assert parse_srt_cues(result.text)[1]["text"] == "[ko] me."
+
+    def test_mismatched_cue_count_raises(self, memory):
+        class DroppingTranslator(RecordingTranslator):
+            def translate(self, subtitle, target_language, progress_callback=None):
+                return subtitle.with_translation(
+                    "1\n00:00:01,000 --> 00:00:01,500\nonly one\n", target_language
+                )
+
+        adapter = CachingTranslatorAdapter(DroppingTranslator(), memory)
+
+        with pytest.raises(RuntimeError, match="returned 1 cues for 2 requested cues"):
+            adapter.translate(_make_subtitle("One", "Two"), "ko")
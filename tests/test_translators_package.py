@@ -0,0 +1,43 @@
+"""Unit Tests for the src.infrastructure.translators package exports."""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run(code):
+    # argostranslate import를 막은 새 인터프리터에서 실행
+    script = "import sys\nsys.modules['argostranslate'] = None\n" + code
+    return subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def test_package_imports_without_argostranslate():
+    result = _run(
+        "from src.infrastructure.translators import CTranslate2TranslatorAdapter, TranslatorRouter\n"
+        "assert 'src.infrastructure.translators.argos_translator' not in sys.modules\n"
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_argos_adapter_import_reports_missing_dependency():
+    result = _run("from src.infrastructure.translators import ArgosTranslatorAdapter\n")
+
+    assert result.returncode != 0
+    assert "pip install argostranslate" in result.stderr
+
+
+def test_unknown_attribute():
+    import src.infrastructure.translators as translators
+
+    with pytest.raises(AttributeError, match="NoSuchAdapter"):
+        translators.NoSuchAdapter